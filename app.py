@@ -34,7 +34,7 @@ def is_flask_reloader() -> bool:
 
 def initialize_services() -> None:
     """Initialize PDF processing service - ONLY in main process."""
-    global pdf_service, processor_available
+    global pdf_service, processor_available, cleanup_scheduler
 
     if not is_flask_reloader():
         print("Initializing PDF Processing Service...")
@@ -42,6 +42,10 @@ def initialize_services() -> None:
             pdf_service = create_pdf_service_from_env(app_config)
             print("PDF Processing Service initialized successfully")
             processor_available = True
+            # Track existing outputs for expiry and quota eviction (None when file cleanup is disabled)
+            cleanup_scheduler = pdf_service.get(FileCleanupScheduler)
+            if cleanup_scheduler:
+                cleanup_scheduler.start()
         except Exception as e:
             print(f"CRITICAL: PDF Service initialization failed: {e}")
             pdf_service = None
@@ -27,15 +27,37 @@ class SystemConfig:
     # File handling
     upload_folder: str = "uploads"
     audio_folder: str = "audio_outputs"
+    scratch_dir: str = ""  # Where per-job scratch workspaces are created, e.g. /dev/shm ("" = system temp directory)
     max_file_size_mb: int = 100
 
     # Processing settings
     enable_text_cleaning: bool = True
     enable_natural_formatting: bool = True
+    enable_page_artifact_stripping: bool = True  # Drop headers/footers/page numbers locally before LLM cleaning
+    enable_quality_routing: bool = True  # Skip LLM cleaning for pages that already score as clean
+    quality_routing_threshold: float = 0.85  # Pages scoring below this (0-1) are sent to the LLM
+    parallel_text_threshold_chars: int = 10_000_000  # Format/split larger texts on a process pool (0 = never)
+    parallel_text_workers: int = 0  # Processes for parallel text processing (0 = one per CPU)
     enable_async_audio: bool = True
+    enable_job_admission: bool = True  # Queue conversions and run the shortest estimated jobs first
+    max_concurrent_jobs: int = 2  # Conversions running at once; later uploads wait in the admission queue
+    job_aging_rate: float = 1.0  # Seconds of priority a waiting job gains per second waited (0 = pure SJF)
+    page_throughput_state_file: str = "data/page_throughput.json"  # Learned seconds per page, for estimates
+    job_deadline_seconds: float = 0.0  # Cancel conversions running longer than this (0 = no deadline)
 
     # Audio processing parallelism - how many chunks AudioEngine processes simultaneously
     audio_concurrent_chunks: int = 4
+    enable_adaptive_audio_concurrency: bool = True  # AIMD-adjust concurrent TTS calls from latency, errors, CPU
+    tts_priority_chunks: int = 1  # First chunks of each job served ahead of other jobs' queued chunks
+    audio_chunk_max_attempts: int = 3  # TTS attempts per chunk before the job fails
+    audio_chunk_backoff_seconds: float = 1.0  # First retry delay; doubles per retry, jittered
+    audio_chunk_deadline_seconds: float = 180.0  # Time a chunk may take across all its attempts
+    audio_hedge_percentile: float = 90.0  # Send a duplicate request past this peer latency percentile (0 = off)
+    enable_chunk_journal: bool = True  # Persist finished TTS chunks so interrupted conversions resume
+    chunk_journal_folder: str = "data/chunk_journals"
+    chunk_journal_max_age_hours: int = 24  # Journals of jobs never resumed are deleted after this
+    audio_memory_budget_mb: int = 64  # Chunk audio a job keeps in memory; older chunks are spilled to disk
+    audio_spill_dir: str = ""  # Where spilled chunk audio goes ("" = the job's scratch workspace)
 
     # Text chunk configuration - different optimal sizes for different APIs
     chunk_size: int = 20000  # Legacy setting
@@ -45,7 +67,7 @@ class SystemConfig:
     enable_file_cleanup: bool = True
     max_file_age_hours: float = 24.0  # Clean up files older than 24 hours
     auto_cleanup_interval_hours: float = 6.0  # Run cleanup every 6 hours
-    max_disk_usage_mb: int = 1000  # Maximum disk usage before forced cleanup
+    max_disk_usage_mb: int = 1000  # Outputs beyond this are evicted, least recently accessed first
 
     # TTS API configuration - applies to any TTS provider (Gemini, Piper, etc.)
     tts_concurrent_requests: int = 4  # How many simultaneous TTS API calls
@@ -61,6 +83,18 @@ class SystemConfig:
     # LLM API configuration - for text cleaning (separate from TTS)
     llm_concurrent_requests: int = 3  # How many simultaneous LLM calls for text cleaning
     llm_request_delay_seconds: float = 0.5  # Delay between LLM requests
+    llm_request_timeout_seconds: float = 120.0  # HTTP timeout per LLM request
+    llm_base_url: Optional[str] = None  # Override the Gemini API endpoint (proxies, local stub servers)
+
+    # LLM resilience - circuit breaker and per-job time budget for text cleaning
+    llm_failure_threshold: int = 3  # Consecutive failed/slow calls before the circuit opens
+    llm_latency_threshold_seconds: float = 120.0  # Calls slower than this count as failures
+    llm_circuit_reset_seconds: float = 60.0  # How long the circuit stays open before a probe
+    llm_time_budget_seconds: float = 600.0  # Per-job LLM time allowance (0 = unlimited)
+
+    # Adaptive LLM chunk sizing - learns reliable/fast input sizes per model
+    llm_adaptive_chunking: bool = True
+    llm_chunk_sizing_state_file: str = "data/llm_chunk_sizing.json"  # Learned model, persisted across restarts
 
     # Piper specific
     piper_model_name: str = "en_US-lessac-medium"
@@ -87,6 +121,10 @@ class SystemConfig:
     # Text processing
     audio_target_chunk_size: int = 3000
     audio_max_chunk_size: int = 5000
+    enable_balanced_audio_chunking: bool = True  # Size TTS chunks evenly across audio_concurrent_chunks workers
+    audio_first_chunk_size: int = 400  # Small leading TTS chunk so audio starts fast (0 disables)
+    enable_sentence_dedup: bool = True  # Synthesize sentences repeated across the document only once
+    sentence_dedup_min_chars: int = 24  # Shorter repeated sentences are synthesized inline
 
     def __post_init__(self) -> None:
         """Initialize immutable defaults for None values (backwards compatibility)."""
@@ -155,6 +193,7 @@ class SystemConfig:
             # App settings
             upload_folder=get_config("files.upload_folder", "uploads"),
             audio_folder=get_config("files.audio_folder", "audio_outputs"),
+            scratch_dir=get_config("files.scratch_dir", ""),
             max_file_size_mb=cls._parse_int_value(
                 get_config("files.max_file_size_mb", 20), 20, min_val=1, max_val=1000
             ),
@@ -163,6 +202,24 @@ class SystemConfig:
             enable_natural_formatting=cls._parse_bool_value(
                 get_config("text_processing.enable_natural_formatting", True), True
             ),
+            enable_page_artifact_stripping=cls._parse_bool_value(
+                get_config("text_processing.enable_page_artifact_stripping", True), True
+            ),
+            enable_quality_routing=cls._parse_bool_value(
+                get_config("text_processing.quality_routing.enabled", True), True
+            ),
+            quality_routing_threshold=cls._parse_float_value(
+                get_config("text_processing.quality_routing.threshold", 0.85), 0.85, min_val=0.0, max_val=1.0
+            ),
+            parallel_text_threshold_chars=cls._parse_int_value(
+                get_config("text_processing.parallel_text.threshold_chars", 10_000_000),
+                10_000_000,
+                min_val=0,
+                max_val=1_000_000_000,
+            ),
+            parallel_text_workers=cls._parse_int_value(
+                get_config("text_processing.parallel_text.workers", 0), 0, min_val=0, max_val=64
+            ),
             chunk_size=cls._parse_int_value(
                 get_config("text_processing.chunk_size", 4000), 4000, min_val=1000, max_val=100000
             ),
@@ -175,11 +232,66 @@ class SystemConfig:
             audio_max_chunk_size=cls._parse_int_value(
                 get_config("text_processing.audio_max_chunk_size", 3000), 3000, min_val=100, max_val=20000
             ),
+            enable_balanced_audio_chunking=cls._parse_bool_value(
+                get_config("text_processing.balanced_audio_chunking.enabled", True), True
+            ),
+            audio_first_chunk_size=cls._parse_int_value(
+                get_config("text_processing.balanced_audio_chunking.first_chunk_size", 400),
+                400,
+                min_val=0,
+                max_val=5000,
+            ),
+            enable_sentence_dedup=cls._parse_bool_value(
+                get_config("text_processing.sentence_dedup.enabled", True), True
+            ),
+            sentence_dedup_min_chars=cls._parse_int_value(
+                get_config("text_processing.sentence_dedup.min_sentence_chars", 24), 24, min_val=1, max_val=5000
+            ),
             # Performance
             enable_async_audio=cls._parse_bool_value(get_config("performance.enable_async_audio", True), True),
+            enable_job_admission=cls._parse_bool_value(get_config("performance.job_admission.enabled", True), True),
+            max_concurrent_jobs=cls._parse_int_value(
+                get_config("performance.job_admission.max_concurrent_jobs", 2), 2, min_val=1, max_val=32
+            ),
+            job_aging_rate=cls._parse_float_value(
+                get_config("performance.job_admission.aging_rate", 1.0), 1.0, min_val=0.0, max_val=1000.0
+            ),
+            page_throughput_state_file=get_config(
+                "performance.job_admission.throughput_state_file", "data/page_throughput.json"
+            ),
+            job_deadline_seconds=cls._parse_float_value(
+                get_config("performance.job_deadline_seconds", 0.0), 0.0, min_val=0.0, max_val=86400.0
+            ),
             audio_concurrent_chunks=cls._parse_int_value(
                 get_config("audio.concurrent_chunks", 4), 4, min_val=1, max_val=20
             ),
+            enable_adaptive_audio_concurrency=cls._parse_bool_value(
+                get_config("audio.adaptive_concurrency", True), True
+            ),
+            tts_priority_chunks=cls._parse_int_value(
+                get_config("audio.scheduler.priority_chunks", 1), 1, min_val=0, max_val=20
+            ),
+            audio_chunk_max_attempts=cls._parse_int_value(
+                get_config("audio.chunk_retries.max_attempts", 3), 3, min_val=1, max_val=10
+            ),
+            audio_chunk_backoff_seconds=cls._parse_float_value(
+                get_config("audio.chunk_retries.backoff_seconds", 1.0), 1.0, min_val=0.0, max_val=60.0
+            ),
+            audio_chunk_deadline_seconds=cls._parse_float_value(
+                get_config("audio.chunk_retries.deadline_seconds", 180.0), 180.0, min_val=1.0, max_val=3600.0
+            ),
+            audio_hedge_percentile=cls._parse_float_value(
+                get_config("audio.chunk_retries.hedge_percentile", 90.0), 90.0, min_val=0.0, max_val=100.0
+            ),
+            enable_chunk_journal=cls._parse_bool_value(get_config("audio.chunk_journal.enabled", True), True),
+            chunk_journal_folder=get_config("audio.chunk_journal.folder", "data/chunk_journals"),
+            chunk_journal_max_age_hours=cls._parse_int_value(
+                get_config("audio.chunk_journal.max_age_hours", 24), 24, min_val=1, max_val=720
+            ),
+            audio_memory_budget_mb=cls._parse_int_value(
+                get_config("audio.memory_budget_mb", 64), 64, min_val=0, max_val=4096
+            ),
+            audio_spill_dir=get_config("audio.spill_dir", ""),
             # TTS API settings
             tts_concurrent_requests=cls._parse_int_value(
                 get_config("tts.concurrent_requests", 4), 4, min_val=1, max_val=10
@@ -206,6 +318,24 @@ class SystemConfig:
             llm_request_delay_seconds=cls._parse_float_value(
                 get_config("llm.request_delay_seconds", 0.5), 0.5, min_val=0.1, max_val=5.0
             ),
+            llm_request_timeout_seconds=cls._parse_float_value(
+                get_config("llm.request_timeout_seconds", 120.0), 120.0, min_val=1.0, max_val=600.0
+            ),
+            llm_base_url=get_config("llm.base_url"),
+            llm_failure_threshold=cls._parse_int_value(
+                get_config("llm.circuit_breaker.failure_threshold", 3), 3, min_val=1, max_val=20
+            ),
+            llm_latency_threshold_seconds=cls._parse_float_value(
+                get_config("llm.circuit_breaker.latency_threshold_seconds", 120.0), 120.0, min_val=1.0, max_val=600.0
+            ),
+            llm_circuit_reset_seconds=cls._parse_float_value(
+                get_config("llm.circuit_breaker.reset_seconds", 60.0), 60.0, min_val=1.0, max_val=3600.0
+            ),
+            llm_time_budget_seconds=cls._parse_float_value(
+                get_config("llm.time_budget_seconds", 600.0), 600.0, min_val=0.0, max_val=86400.0
+            ),
+            llm_adaptive_chunking=cls._parse_bool_value(get_config("llm.adaptive_chunking.enabled", True), True),
+            llm_chunk_sizing_state_file=get_config("llm.adaptive_chunking.state_file", "data/llm_chunk_sizing.json"),
             # Gemini TTS specific settings
             gemini_api_key=get_config("secrets.google_ai_api_key"),
             gemini_model_name=get_config("tts.gemini.model_name", "gemini-2.5-flash-preview-tts"),
@@ -250,7 +380,7 @@ class SystemConfig:
         if self.tts_engine == TTSEngine.GEMINI:
             if not self.gemini_api_key:
                 raise ValueError(
-                    "GOOGLE_AI_API_KEY is required when TTS_ENGINE=gemini. " "Please set this environment variable."
+                    "GOOGLE_AI_API_KEY is required when TTS_ENGINE=gemini. Please set this environment variable."
                 )
             if self.gemini_api_key == "YOUR_GOOGLE_AI_API_KEY":
                 raise ValueError("Please set a valid GOOGLE_AI_API_KEY (not the placeholder value)")
@@ -0,0 +1,145 @@
+# domain/audio/audio_buffer.py - Memory-Budgeted Chunk Audio Buffer
+"""Holds the synthesized chunk audio of one job within a memory budget.
+The most recently finished chunks stay in RAM; once they exceed the budget the oldest are
+spilled to a scratch directory. The combined WAV is streamed to disk one chunk at a time,
+so a long document never has all of its audio, or a second combined copy, in memory.
+"""
+
+from collections import OrderedDict
+from collections.abc import Sequence
+import io
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Optional
+import wave
+
+DEFAULT_MEMORY_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+class SpillingAudioBuffer:
+    """Chunk audio by index, at most memory_budget_bytes of it in memory and the rest on disk.
+
+    Thread-safe: chunks are added from the event loop thread (async synthesis) or the request
+    thread (sync synthesis). Call close() to delete the spilled files.
+    """
+
+    def __init__(
+        self,
+        memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+        scratch_dir: Optional[str] = None,
+        job_name: str = "job",
+    ):
+        """Initialize the buffer.
+
+        Args:
+            memory_budget_bytes: Chunk audio kept in memory before the oldest chunks are spilled (0 = spill all)
+            scratch_dir: Directory the job's spill directory is created in (None = system temp directory)
+            job_name: Used in the spill directory's name
+        """
+        self.memory_budget_bytes = max(0, memory_budget_bytes)
+        self.scratch_dir = scratch_dir
+        self.job_name = job_name
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[int, bytes] = OrderedDict()  # Oldest first
+        self._memory_bytes = 0
+        self._spilled: dict[int, str] = {}  # Chunk index -> spill file
+        self._directory: Optional[str] = None  # Created on the first spill
+        self._peak_memory_bytes = 0
+        self._spilled_bytes = 0
+
+    def put(self, index: int, audio: bytes) -> None:
+        """Store a chunk's audio, spilling the oldest chunks in memory while over budget."""
+        with self._lock:
+            self._discard(index)
+            self._memory[index] = audio
+            self._memory_bytes += len(audio)
+            while self._memory_bytes > self.memory_budget_bytes and self._memory:
+                self._spill_oldest()
+            self._peak_memory_bytes = max(self._peak_memory_bytes, self._memory_bytes)
+
+    def get(self, index: int) -> bytes:
+        """A chunk's audio, read back from disk if it was spilled.
+
+        Raises:
+            KeyError: When no audio was stored for the chunk
+        """
+        with self._lock:
+            audio = self._memory.get(index)
+            path = self._spilled.get(index)
+        if audio is not None:
+            return audio
+        if path is None:
+            raise KeyError(index)
+        with open(path, "rb") as f:
+            return f.read()
+
+    def __contains__(self, index: object) -> bool:
+        """Whether audio was stored for the chunk."""
+        with self._lock:
+            return index in self._memory or index in self._spilled
+
+    def write_wav(self, path: str, indices: Sequence[int]) -> None:
+        """Write the chunks at indices, in order, as one WAV file, holding one spilled chunk in memory at a time.
+
+        A single chunk is written as-is; several are joined with the first chunk's WAV parameters.
+
+        Raises:
+            KeyError: When a chunk has no audio
+            wave.Error: When a chunk is not a WAV file
+        """
+        if len(indices) == 1:
+            with open(path, "wb") as f:
+                f.write(self.get(indices[0]))
+            return
+
+        with wave.open(path, "wb") as output_wav:
+            for position, index in enumerate(indices):
+                with wave.open(io.BytesIO(self.get(index)), "rb") as chunk_wav:
+                    if position == 0:
+                        output_wav.setparams(chunk_wav.getparams())
+                    output_wav.writeframes(chunk_wav.readframes(chunk_wav.getnframes()))
+
+    def stats(self) -> dict[str, Any]:
+        """Memory budget, peak chunk audio held in memory and how much was spilled."""
+        with self._lock:
+            return {
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "peak_memory_bytes": self._peak_memory_bytes,
+                "spilled_chunks": len(self._spilled),
+                "spilled_bytes": self._spilled_bytes,
+            }
+
+    def close(self) -> None:
+        """Drop the audio in memory and delete the spill directory."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._spilled.clear()
+            directory, self._directory = self._directory, None
+        if directory:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def _spill_oldest(self) -> None:
+        """Move the oldest chunk in memory to the spill directory (lock held)."""
+        index, audio = self._memory.popitem(last=False)
+        self._memory_bytes -= len(audio)
+        if self._directory is None:
+            if self.scratch_dir:
+                os.makedirs(self.scratch_dir, exist_ok=True)
+            self._directory = tempfile.mkdtemp(prefix=f"audio_spill_{self.job_name}_", dir=self.scratch_dir or None)
+        path = os.path.join(self._directory, f"chunk_{index}.wav")
+        with open(path, "wb") as f:
+            f.write(audio)
+        self._spilled[index] = path
+        self._spilled_bytes += len(audio)
+
+    def _discard(self, index: int) -> None:
+        """Forget any audio already stored for index (lock held)."""
+        audio = self._memory.pop(index, None)
+        if audio is not None:
+            self._memory_bytes -= len(audio)
+        path = self._spilled.pop(index, None)
+        if path is not None:
+            os.remove(path)
@@ -6,18 +6,42 @@ Replaces: AudioGenerationService, AudioGenerationCoordinator, AudioProcessor, Au
 from abc import ABC, abstractmethod
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+import random
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
+from ..cancellation import JobCancelledError, cancellable_sleep, check_cancelled, run_subprocess
+from ..container.event_loop import BackgroundEventLoop
 from ..errors import Result, audio_generation_error
 from ..interfaces import IFileManager, ITTSEngine
 from ..models import TimedAudioResult
 from ..text.chunking_strategy import ChunkingMode, ChunkingService, create_chunking_service
+from ..workspace import current_workspace, publish_file, scratch_path
+from .audio_buffer import DEFAULT_MEMORY_BUDGET_BYTES, SpillingAudioBuffer
+from .chunk_journal import ChunkJournal, ChunkJournalStore
+from .hedged_retry import ChunkRetryPolicy, PeerLatencies
+from .synthesis_plan import DEFAULT_MIN_DEDUP_CHARS, SynthesisPlan, plan_synthesis
+from .tts_scheduler import FairShareScheduler, create_tts_limiter
 
 if TYPE_CHECKING:
     from .timing_engine import ITimingEngine
 
 
+@dataclass(frozen=True)
+class ChunkAudio:
+    """Audio synthesized for one chunk (None when synthesis failed) and how long it took."""
+
+    audio: Optional[bytes]
+    seconds: float
+    buffered: bool = False  # The audio was handed to the job's SpillingAudioBuffer instead of kept here
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the chunk has audio, here or in the buffer."""
+        return self.buffered or bool(self.audio)
+
+
 class IAudioEngine(ABC):
     """Unified interface for all audio operations."""
 
@@ -60,6 +84,15 @@ class AudioEngine(IAudioEngine):
         audio_max_chunk_size: int = 3000,
         enable_async: bool = True,
         chunking_service: Optional[ChunkingService] = None,
+        enable_sentence_dedup: bool = True,
+        dedup_min_sentence_chars: int = DEFAULT_MIN_DEDUP_CHARS,
+        adaptive_concurrency: bool = True,
+        retry_policy: Optional[ChunkRetryPolicy] = None,
+        chunk_journal: Optional[ChunkJournalStore] = None,
+        event_loop: Optional[BackgroundEventLoop] = None,
+        scheduler: Optional[FairShareScheduler] = None,
+        audio_memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+        audio_spill_dir: Optional[str] = None,
     ):
         self.tts_engine = tts_engine
         self.file_manager = file_manager
@@ -69,7 +102,21 @@ class AudioEngine(IAudioEngine):
         self.audio_max_chunk_size = audio_max_chunk_size
         self.enable_async = enable_async
         self.chunking_service = chunking_service or create_chunking_service(ChunkingMode.SENTENCE_BASED)
+        self.enable_sentence_dedup = enable_sentence_dedup  # Synthesize repeated sentences once per job
+        self.dedup_min_sentence_chars = dedup_min_sentence_chars
         self.base_delay = self._get_base_delay_for_engine()
+        # TTS calls of every job share one fair-share scheduler (the container's, shared with TimingEngine)
+        self.concurrency = scheduler or FairShareScheduler(
+            create_tts_limiter(tts_engine, max_concurrent, adaptive=adaptive_concurrency)
+        )
+        self.retry_policy = retry_policy or ChunkRetryPolicy()
+        self._rng = random.Random()  # noqa: S311 - backoff jitter, not security sensitive
+        self.chunk_journal = chunk_journal  # Persists finished chunks so interrupted jobs resume
+        # Async work of every job runs on one long-lived loop (the container's, shared with other services)
+        self.event_loop = event_loop or BackgroundEventLoop(name="audio-engine")
+        # Per job, chunk audio beyond this many bytes is spilled to audio_spill_dir (default: the job's workspace)
+        self.audio_memory_budget_bytes = audio_memory_budget_bytes
+        self.audio_spill_dir = audio_spill_dir
 
         print("🔍 AudioEngine: Initialized with chunk sizes:")
         print(f"  - audio_target_chunk_size: {self.audio_target_chunk_size}")
@@ -95,56 +142,97 @@ class AudioEngine(IAudioEngine):
         max_chunk_size = self.audio_target_chunk_size
         print(f"🔍 AudioEngine: Using max_chunk_size = {max_chunk_size} (from self.audio_target_chunk_size)")
 
-        processed_chunks = self.chunking_service.process_chunks(text_chunks, max_chunk_size)
+        # Worker count lets balancing strategies size chunks for the real parallelism
+        processed_chunks = self.chunking_service.process_chunks(
+            text_chunks, max_chunk_size, concurrency=self.concurrency.limit if self.enable_async else 1
+        )
         print(f"AudioEngine: Processing {len(processed_chunks)} chunks (max size: {max_chunk_size} chars)")
         print(f"🔍 AudioEngine: After rechunking, chunk sizes: {[len(chunk) for chunk in processed_chunks]}")
 
-        # Generate audio using sync or async based on config
-        if self.enable_async:
-            print("AudioEngine: Using async processing for simple audio generation")
-            audio_chunks = self._generate_chunks_with_new_async_interface(processed_chunks)
-        else:
-            print("AudioEngine: Using synchronous processing for simple audio generation")
-            audio_chunks = self._generate_chunks_sync(processed_chunks)
+        # Synthesize each repeated sentence once and splice its audio back wherever it recurs
+        plan = self._plan_synthesis(processed_chunks)
+
+        # Resume chunks an interrupted run already synthesized; journal the rest as they finish
+        journal = self._open_journal(output_filename, plan.units)
+        # Finished chunks' audio stays within the memory budget; older chunks are spilled to disk
+        workspace = current_workspace()
+        spill_dir = self.audio_spill_dir or (workspace.directory if workspace else None)
+        buffer = SpillingAudioBuffer(self.audio_memory_budget_bytes, spill_dir, output_filename)
+        try:
+            return self._generate_buffered_audio(plan, journal, buffer, output_filename)
+        finally:
+            buffer.close()
 
-        if not audio_chunks:
+    def _generate_buffered_audio(
+        self,
+        plan: SynthesisPlan,
+        journal: Optional[ChunkJournal],
+        buffer: SpillingAudioBuffer,
+        output_filename: str,
+    ) -> TimedAudioResult:
+        """Synthesize the plan's units into buffer and encode them, in playback order, as one MP3."""
+        with self.concurrency.job(output_filename) as job:
+            unit_audio, resumed_count = self._synthesize_units(plan.units, journal, buffer)
+
+        dedup_info = plan.to_debug_info([chunk.seconds for chunk in unit_audio])
+
+        # A chunk that failed every retry would leave a hole in the audiobook: fail the job instead
+        missing = [
+            i + 1 for i, (unit, chunk) in enumerate(zip(plan.units, unit_audio)) if unit.strip() and not chunk.succeeded
+        ]
+        if missing:
+            print(f"AudioEngine: No audio for chunk(s) {missing} after retries, not producing incomplete audio")
+            return TimedAudioResult(
+                audio_files=[], combined_mp3=None, timing_data=None, debug_info={"missing_chunks": missing}
+            )
+
+        playback = [index for index in plan.order if index in buffer]
+        if not playback:
             print("AudioEngine: No successful audio chunks generated")
             return TimedAudioResult(audio_files=[], combined_mp3=None, timing_data=None)
 
         try:
-            # Combine audio chunks
-            combined_audio = self._combine_wav_chunks(audio_chunks)
-            audio_data = combined_audio
-
-            if not audio_data:
-                return TimedAudioResult(audio_files=[], combined_mp3=None, timing_data=None)
+            # Stream the chunks into one WAV (TTS engines typically generate WAV), one chunk in memory at a time
+            output_dir = self.file_manager.get_output_dir()
+            temp_wav_path = scratch_path(f"{output_filename}_temp.wav", output_dir)
+            buffer.write_wav(temp_wav_path, playback)
 
-            # Save audio file as WAV first (since TTS engines typically generate WAV)
-            temp_wav_filename = f"{output_filename}_temp.wav"
-            temp_wav_path = self.file_manager.save_output_file(audio_data, temp_wav_filename)
-
-            if not temp_wav_path:
-                return TimedAudioResult(audio_files=[], combined_mp3=None, timing_data=None)
-
-            # Convert WAV to MP3 using ffmpeg
+            # Convert WAV to MP3 using ffmpeg, in the job's workspace, then publish the finished MP3
             mp3_filename = f"{output_filename}_simple.mp3"
-            mp3_path = Path(self.file_manager.get_output_dir()) / mp3_filename
+            mp3_path = Path(output_dir) / mp3_filename
+            encoded_path = scratch_path(mp3_filename, output_dir)
 
-            conversion_result = self._convert_wav_to_mp3(temp_wav_path, str(mp3_path))
-
-            # Clean up temporary WAV file
             try:
-                Path(temp_wav_path).unlink()
-            except (OSError, FileNotFoundError):
-                # Ignore file cleanup errors - temporary files may already be removed
-                pass
+                conversion_result = self._convert_wav_to_mp3(temp_wav_path, encoded_path)
+                if conversion_result.is_success:
+                    publish_file(encoded_path, str(mp3_path))
+            except JobCancelledError:
+                # ffmpeg was killed mid-write: do not leave a truncated MP3 behind
+                Path(encoded_path).unlink(missing_ok=True)
+                raise
+            finally:
+                # Clean up temporary WAV file
+                try:
+                    Path(temp_wav_path).unlink()
+                except (OSError, FileNotFoundError):
+                    # Ignore file cleanup errors - temporary files may already be removed
+                    pass
 
             if conversion_result.is_success:
                 print(f"AudioEngine: Simple audio generated and converted to MP3: {mp3_filename}")
+                if journal:
+                    journal.discard()
                 return TimedAudioResult(
                     audio_files=[mp3_filename],
                     combined_mp3=mp3_filename,
                     timing_data=None,  # No timing data needed for simple generation
+                    debug_info={
+                        "sentence_dedup": dedup_info,
+                        "tts_concurrency": self.concurrency_metrics(),
+                        "tts_queue": job.stats(),
+                        "resumed_chunks": resumed_count,
+                        "audio_buffer": buffer.stats(),
+                    },
                 )
             else:
                 print(f"AudioEngine: MP3 conversion failed: {conversion_result.error}")
@@ -154,75 +242,169 @@ class AudioEngine(IAudioEngine):
             print(f"AudioEngine: Simple audio generation failed: {e}")
             return TimedAudioResult(audio_files=[], combined_mp3=None, timing_data=None)
 
-    def _generate_chunks_with_new_async_interface(self, processed_chunks: list[str]) -> list[bytes]:
-        """Generate audio chunks using the new async interface with true parallelism."""
-        import asyncio
+    def _plan_synthesis(self, chunks: list[str]) -> SynthesisPlan:
+        """Plan which texts to synthesize, deduplicating repeated sentences when enabled."""
+        if not self.enable_sentence_dedup:
+            return SynthesisPlan.identity(chunks)
+
+        plan = plan_synthesis(chunks, self.dedup_min_sentence_chars)
+        if plan.reused_count:
+            print(
+                f"♻️ AudioEngine: {plan.reused_count} repeated sentence(s) reuse earlier audio "
+                f"({plan.chars_saved} chars not synthesized)"
+            )
+        return plan
+
+    def _open_journal(self, output_filename: str, units: list[str]) -> Optional[ChunkJournal]:
+        """Open the job's chunk journal (None when journaling is disabled or unavailable)."""
+        if self.chunk_journal is None:
+            return None
+        return self.chunk_journal.open(output_filename, units, self._tts_identity())
+
+    def _tts_identity(self) -> str:
+        """TTS engine, model and voice; journaled audio is only reused for the same voice."""
+        config = getattr(self.tts_engine, "config", None)
+        parts = [type(self.tts_engine).__name__]
+        for source in (self.tts_engine, config):
+            for attr in ("model_name", "voice_name"):
+                value = getattr(source, attr, None)
+                if isinstance(value, str):
+                    parts.append(value)
+        return ":".join(parts)
+
+    def _synthesize_units(
+        self, units: list[str], journal: Optional[ChunkJournal], buffer: SpillingAudioBuffer
+    ) -> tuple[list[ChunkAudio], int]:
+        """Audio for every unit, in buffer, synthesizing only those the journal has no audio for.
+
+        Returns one result per unit, in order, and how many units were resumed from the journal.
+        """
+        completed = journal.completed() if journal else {}
+        unit_audio = {}
+        for i, (audio, seconds) in completed.items():
+            buffer.put(i, audio)
+            unit_audio[i] = ChunkAudio(None, seconds, buffered=True)
+        completed_count = len(completed)
+        del completed  # Resumed audio now lives in the buffer only
+        pending = [i for i in range(len(units)) if i not in unit_audio]
+        if unit_audio:
+            print(f"♻️ AudioEngine: Resuming job, {len(unit_audio)}/{len(units)} chunk(s) already synthesized")
+
+        def record(k: int, chunk: ChunkAudio) -> ChunkAudio:
+            if not chunk.audio:
+                return chunk
+            if journal:
+                journal.record(pending[k], chunk.audio, chunk.seconds)
+            buffer.put(pending[k], chunk.audio)
+            return ChunkAudio(None, chunk.seconds, buffered=True)
 
-        # Create and run async processing
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            audio_chunks = loop.run_until_complete(self._process_chunks_async(processed_chunks))
-            return audio_chunks
-        finally:
-            loop.close()
+        # Generate audio using sync or async based on config
+        pending_units = [units[i] for i in pending]
+        if pending_units and self.enable_async:
+            print("AudioEngine: Using async processing for simple audio generation")
+            unit_audio.update(zip(pending, self._generate_chunks_with_new_async_interface(pending_units, record)))
+        elif pending_units:
+            print("AudioEngine: Using synchronous processing for simple audio generation")
+            unit_audio.update(zip(pending, self._generate_chunks_sync(pending_units, record)))
+
+        return [unit_audio.get(i, ChunkAudio(None, 0.0)) for i in range(len(units))], completed_count
+
+    def _generate_chunks_with_new_async_interface(
+        self, processed_chunks: list[str], on_chunk: Optional[Callable[[int, ChunkAudio], ChunkAudio]] = None
+    ) -> list[ChunkAudio]:
+        """Generate audio chunks using the new async interface with true parallelism.
+
+        on_chunk is called with (index, result) as soon as each chunk's audio is ready and returns
+        the result to keep for the chunk (e.g. with its audio moved to a buffer); it runs on the
+        event loop thread.
+        """
+        return self.event_loop.run(self._process_chunks_async(processed_chunks, on_chunk))
+
+    def _generate_chunks_sync(
+        self, processed_chunks: list[str], on_chunk: Optional[Callable[[int, ChunkAudio], ChunkAudio]] = None
+    ) -> list[ChunkAudio]:
+        """Generate audio chunks synchronously - simpler and more reliable (one result per chunk)."""
+        import time
 
-    def _generate_chunks_sync(self, processed_chunks: list[str]) -> list[bytes]:
-        """Generate audio chunks synchronously - simpler and more reliable."""
         audio_chunks = []
 
         for i, chunk in enumerate(processed_chunks, 1):
             print(f"🎵 AudioEngine: Processing chunk {i}/{len(processed_chunks)} ({len(chunk)} chars)")
 
-            result = self.tts_engine.generate_audio_data(chunk)
+            deadline = time.monotonic() + self.retry_policy.deadline_seconds
+            for attempt in range(self.retry_policy.max_attempts):
+                check_cancelled()
+                # Holds a slot of the shared budget; sequential calls say nothing about congestion
+                with self.concurrency.slot_sync(work=len(chunk), adjust=False) as permit:
+                    chunk_start = time.monotonic()
+                    result = self.tts_engine.generate_audio_data(chunk)
+                    chunk_time = time.monotonic() - chunk_start
+                    permit.record(result.is_success, chunk_time)
+                if result.is_success:
+                    break
+
+                delay = self.retry_policy.backoff(attempt, self._rng)
+                if attempt + 1 >= self.retry_policy.max_attempts or time.monotonic() + delay >= deadline:
+                    break
+                print(f"🔁 Chunk {i} failed ({result.error}), retrying in {delay:.1f}s")
+                cancellable_sleep(delay)
+
             if result.is_success:
-                audio_chunks.append(result.value)
                 print(f"✅ Chunk {i} completed ({len(result.value)} bytes)")
+                chunk_audio = ChunkAudio(result.value, chunk_time)
+                audio_chunks.append(on_chunk(i - 1, chunk_audio) if on_chunk is not None else chunk_audio)
             else:
+                audio_chunks.append(ChunkAudio(None, chunk_time))
                 print(f"❌ Chunk {i} failed: {result.error}")
 
         return audio_chunks
 
-    async def _process_chunks_async(self, processed_chunks: list[str]) -> list[bytes]:
+    async def _process_chunks_async(
+        self, processed_chunks: list[str], on_chunk: Optional[Callable[[int, ChunkAudio], ChunkAudio]] = None
+    ) -> list[ChunkAudio]:
         """Actually async method that processes chunks in parallel."""
         import time
 
         start_time = time.time()
         print(f"🚀 AudioEngine: Starting parallel processing of {len(processed_chunks)} chunks at {start_time:.2f}")
 
-        # Create tasks for parallel execution
-        tasks = []
+        # Create tasks for parallel execution (empty chunks get no request)
+        peers = PeerLatencies(self.retry_policy.hedge_percentile, self.retry_policy.min_hedge_peers)
+
+        async def synthesize(i: int, chunk: str) -> ChunkAudio:
+            result = await self._synthesize_chunk_async(chunk, i + 1, len(processed_chunks), peers)
+            if on_chunk is not None and result.audio:
+                return on_chunk(i, result)
+            return result
+
+        task_indexes = []
+        limited_tasks = []
         for i, chunk in enumerate(processed_chunks):
             if not chunk.strip():
                 continue
-            task = self._process_single_chunk_async(chunk, i + 1, len(processed_chunks))
-            tasks.append(task)
-
-        # Execute all tasks concurrently with rate limiting
-        semaphore = asyncio.Semaphore(self.max_concurrent)  # Use existing max_concurrent setting
-        limited_tasks = [self._limited_chunk_processing(semaphore, task) for task in tasks]
+            task_indexes.append(i)
+            limited_tasks.append(synthesize(i, chunk))
 
+        # Execute all tasks concurrently, as many at a time as the adaptive limit allows
         results = await asyncio.gather(*limited_tasks, return_exceptions=True)
+        # A cancelled job's chunks fail with JobCancelledError: cancel the job, not just those chunks
+        check_cancelled()
 
         end_time = time.time()
         total_time = end_time - start_time
         print(f"⏱️  AudioEngine: Parallel processing completed in {total_time:.2f} seconds")
 
-        # Filter successful results (immutable) - cast is safe because we filter out non-bytes
-        audio_chunks: list[bytes] = [
-            result
-            for result in results
-            if not isinstance(result, Exception) and result is not None and isinstance(result, bytes)
-        ]
-
-        # Handle failed chunks logging
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
+        # One result per input chunk, in order; failed or skipped chunks have no audio
+        audio_chunks = [ChunkAudio(None, 0.0)] * len(processed_chunks)
+        for i, result in zip(task_indexes, results):
+            if isinstance(result, ChunkAudio):
+                audio_chunks[i] = result
+            elif isinstance(result, Exception):
                 print(f"AudioEngine: Chunk {i+1} failed with exception: {result}")
 
+        successful = sum(1 for chunk in audio_chunks if chunk.succeeded)
         print(
-            f"✅ AudioEngine: Successfully processed {len(audio_chunks)}/"
-            f"{len(processed_chunks)} chunks in {total_time:.2f}s"
+            f"✅ AudioEngine: Successfully processed {successful}/{len(processed_chunks)} chunks in {total_time:.2f}s"
         )
         if len(processed_chunks) > 1:
             avg_time_per_chunk = total_time / len(processed_chunks)
@@ -231,15 +413,90 @@ class AudioEngine(IAudioEngine):
             print(f"🔥 Async speedup: {speedup:.1f}x faster than sequential processing")
         return audio_chunks
 
-    async def _limited_chunk_processing(self, semaphore: asyncio.Semaphore, task: Any) -> Optional[bytes]:
-        """Apply semaphore limiting to chunk processing."""
-        async with semaphore:
-            result = await task
+    async def _synthesize_chunk_async(
+        self, chunk: str, chunk_num: int, total_chunks: int, peers: PeerLatencies
+    ) -> ChunkAudio:
+        """Synthesize one chunk, retrying failures with jittered backoff until the chunk's deadline."""
+        loop = asyncio.get_running_loop()
+        deadline: Optional[float] = None
+        result = ChunkAudio(None, 0.0)
+
+        for attempt in range(self.retry_policy.max_attempts):
+            result, deadline = await self._hedged_attempt(chunk, chunk_num, total_chunks, peers, deadline)
+            if result.audio:
+                peers.record(len(chunk), result.seconds)
+                return result
+
+            delay = self.retry_policy.backoff(attempt, self._rng)
+            if attempt + 1 >= self.retry_policy.max_attempts or loop.time() + delay >= deadline:
+                break
+            print(f"🔁 Chunk {chunk_num} failed, retry {attempt + 2}/{self.retry_policy.max_attempts} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+        print(f"❌ Chunk {chunk_num} failed after {attempt + 1} attempt(s)")
+        return result
+
+    async def _hedged_attempt(
+        self, chunk: str, chunk_num: int, total_chunks: int, peers: PeerLatencies, deadline: Optional[float]
+    ) -> tuple[ChunkAudio, float]:
+        """One attempt at a chunk; a duplicate request is sent if it straggles, and the first audio wins.
+
+        The chunk's deadline starts when its first attempt gets a concurrency slot (time spent
+        queued is not counted). Returns the result and the deadline.
+        """
+        loop = asyncio.get_running_loop()
+        started = asyncio.Event()
+        pending = {asyncio.ensure_future(self._limited_chunk_processing(chunk, chunk_num, total_chunks, started))}
+        result = ChunkAudio(None, 0.0)
+        try:
+            start_waiter = asyncio.ensure_future(started.wait())
+            await asyncio.wait({*pending, start_waiter}, return_when=asyncio.FIRST_COMPLETED)
+            start_waiter.cancel()
+
+            if deadline is None:
+                deadline = loop.time() + self.retry_policy.deadline_seconds
+            hedge_delay = peers.hedge_delay(len(chunk))
+            hedge_at = loop.time() + hedge_delay if hedge_delay is not None else None
+
+            while pending:
+                wake_at = min(deadline, hedge_at) if hedge_at is not None else deadline
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(0.0, wake_at - loop.time()), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = task.result()
+                    if result.audio:
+                        return result, deadline
+
+                if loop.time() >= deadline:
+                    print(f"⏰ Chunk {chunk_num} passed its {self.retry_policy.deadline_seconds:.0f}s deadline")
+                    break
+                if hedge_at is not None and loop.time() >= hedge_at and pending:
+                    print(f"🪁 Chunk {chunk_num} slower than peers ({hedge_delay:.1f}s), sending a hedged request")
+                    pending.add(asyncio.ensure_future(self._limited_chunk_processing(chunk, chunk_num, total_chunks)))
+                    hedge_at = None
+
+            return result, deadline
+        finally:
+            # Cancel the losing or overdue requests and wait for them to hand back their slots
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _limited_chunk_processing(
+        self, chunk: str, chunk_num: int, total_chunks: int, started: Optional[asyncio.Event] = None
+    ) -> ChunkAudio:
+        """Apply adaptive concurrency limiting to chunk processing (sets started once the slot is held)."""
+        async with self.concurrency.slot(work=len(chunk)) as permit:
+            if started is not None:
+                started.set()
+            result = await self._process_single_chunk_async(chunk, chunk_num, total_chunks)
+            permit.record(result.audio is not None, result.seconds)
             # Add small delay for rate limiting
             await asyncio.sleep(self.base_delay)
-            return result  # type: ignore[no-any-return]
+            return result
 
-    async def _process_single_chunk_async(self, chunk: str, chunk_num: int, total_chunks: int) -> Optional[bytes]:
+    async def _process_single_chunk_async(self, chunk: str, chunk_num: int, total_chunks: int) -> ChunkAudio:
         """Process a single chunk asynchronously."""
         import time
 
@@ -254,22 +511,20 @@ class AudioEngine(IAudioEngine):
 
             if result.is_success and result.value:
                 print(f"✅ Chunk {chunk_num} completed in {chunk_time:.2f}s ({len(result.value)} bytes)")
-                return result.value
+                return ChunkAudio(result.value, chunk_time)
             else:
                 error_msg = result.error if result.is_failure else "No audio data"
                 print(f"❌ Chunk {chunk_num} failed in {chunk_time:.2f}s: {error_msg}")
-                return None
+                return ChunkAudio(None, chunk_time)
         except Exception as e:
             chunk_end = time.time()
             chunk_time = chunk_end - chunk_start
             print(f"💥 Chunk {chunk_num} exception in {chunk_time:.2f}s: {e}")
-            return None
+            return ChunkAudio(None, chunk_time)
 
     def process_audio_file(self, file_path: str) -> Result[float]:
         """Get audio file duration using ffprobe or fallback."""
         try:
-            import subprocess
-
             # Validate file path for security
             path_obj = Path(file_path)
             if not path_obj.is_file() or path_obj.is_symlink():
@@ -278,7 +533,7 @@ class AudioEngine(IAudioEngine):
             # Try ffprobe first (most accurate)
             cmd = ["ffprobe", "-v", "quiet", "-show_entries", "format=duration", "-of", "csv=p=0", file_path]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = run_subprocess(cmd, text=True, timeout=30)
             if result.returncode == 0 and result.stdout.strip():
                 duration = float(result.stdout.strip())
                 return Result.success(duration)
@@ -292,44 +547,6 @@ class AudioEngine(IAudioEngine):
         except Exception as e:
             return Result.failure(audio_generation_error(f"Failed to get audio duration: {e}"))
 
-    def _combine_wav_chunks(self, audio_chunks: list[bytes]) -> bytes:
-        """Combine multiple WAV audio chunks into a single WAV file."""
-        try:
-            import io
-            import wave
-
-            if not audio_chunks:
-                return b""
-
-            if len(audio_chunks) == 1:
-                return audio_chunks[0]
-
-            # Read the first chunk to get audio parameters
-            first_chunk = io.BytesIO(audio_chunks[0])
-            with wave.open(first_chunk, "rb") as first_wav:
-                params = first_wav.getparams()
-
-            # Create output buffer
-            output_buffer = io.BytesIO()
-
-            # Write combined WAV file
-            with wave.open(output_buffer, "wb") as output_wav:
-                output_wav.setparams(params)
-
-                # Append audio data from each chunk
-                for chunk_data in audio_chunks:
-                    chunk_buffer = io.BytesIO(chunk_data)
-                    with wave.open(chunk_buffer, "rb") as chunk_wav:
-                        frames = chunk_wav.readframes(chunk_wav.getnframes())
-                        output_wav.writeframes(frames)
-
-            return output_buffer.getvalue()
-
-        except Exception as e:
-            print(f"AudioEngine: Error combining audio chunks: {e}")
-            # Fallback: return the first chunk if combination fails
-            return audio_chunks[0] if audio_chunks else b""
-
     def combine_audio_files(self, file_paths: list[str], output_path: str) -> Result[str]:
         """Combine multiple audio files using ffmpeg."""
         if not file_paths:
@@ -366,8 +583,6 @@ class AudioEngine(IAudioEngine):
     def _execute_ffmpeg_combination(self, file_paths: list[str], output_path: str) -> Result[str]:
         """Execute ffmpeg command to combine multiple audio files."""
         try:
-            import subprocess
-
             list_file_result = self._prepare_ffmpeg_command(file_paths, output_path)
             if list_file_result.is_failure:
                 assert list_file_result.error is not None
@@ -378,14 +593,18 @@ class AudioEngine(IAudioEngine):
 
             cmd = ["ffmpeg", "-f", "concat", "-safe", "0", "-i", list_file, "-c", "copy", output_path, "-y"]
 
-            result = subprocess.run(cmd, capture_output=True, timeout=300)
-
-            # Clean up list file
             try:
-                Path(list_file).unlink()
-            except (OSError, FileNotFoundError):
-                # Ignore file cleanup errors - temporary files may already be removed
-                pass
+                result = run_subprocess(cmd, timeout=300)
+            except JobCancelledError:
+                Path(output_path).unlink(missing_ok=True)
+                raise
+            finally:
+                # Clean up list file
+                try:
+                    Path(list_file).unlink()
+                except (OSError, FileNotFoundError):
+                    # Ignore file cleanup errors - temporary files may already be removed
+                    pass
 
             if result.returncode == 0:
                 return Result.success(output_path)
@@ -398,7 +617,7 @@ class AudioEngine(IAudioEngine):
     def _prepare_ffmpeg_command(self, file_paths: list[str], output_path: str) -> Result[str]:
         """Create temporary file list for ffmpeg concatenation."""
         try:
-            list_file = output_path + ".list"
+            list_file = scratch_path(f"{Path(output_path).name}.list", str(Path(output_path).parent))
             with Path(list_file).open("w") as f:
                 for file_path in file_paths:
                     f.write(f"file '{file_path}'\n")
@@ -455,15 +674,12 @@ class AudioEngine(IAudioEngine):
     async def _generate_audio_files_concurrent(
         self, valid_chunks: list[tuple[int, str]], output_name: str, output_dir: str
     ) -> list[str]:
-        """Generate audio files for all valid chunks concurrently."""
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-
+        """Generate audio files for all valid chunks concurrently (limited by the adaptive concurrency limit)."""
         # Create tasks for each chunk
         tasks = []
         for i, (_, text_chunk) in enumerate(valid_chunks):
             filename = f"{output_name}_part{i + 1:02d}.wav"
-            task = self._generate_single_audio_file(semaphore, text_chunk, filename, output_dir, i + 1)
+            task = self._generate_single_audio_file(text_chunk, filename, output_dir, i + 1)
             tasks.append(task)
 
         # Execute all tasks concurrently
@@ -480,10 +696,10 @@ class AudioEngine(IAudioEngine):
         return audio_files
 
     async def _generate_single_audio_file(
-        self, semaphore: asyncio.Semaphore, text_chunk: str, filename: str, output_dir: str, chunk_number: int
+        self, text_chunk: str, filename: str, output_dir: str, chunk_number: int
     ) -> Optional[str]:
         """Generate a single audio file with rate limiting."""
-        async with semaphore:
+        async with self.concurrency.slot(work=len(text_chunk)) as permit:
             try:
                 # Apply rate limiting
                 if self.base_delay > 0:
@@ -491,9 +707,11 @@ class AudioEngine(IAudioEngine):
 
                 # Use thread pool for blocking TTS operations
                 loop = asyncio.get_event_loop()
+                call_start = loop.time()
                 with ThreadPoolExecutor() as executor:
                     future = executor.submit(self._call_tts_engine, text_chunk)
                     audio_result = await loop.run_in_executor(None, lambda: future.result())
+                permit.record(audio_result.is_success and bool(audio_result.value), loop.time() - call_start)
 
                 if audio_result.is_failure:
                     print(f"AudioEngine: TTS failed for chunk {chunk_number}: {audio_result.error}")
@@ -516,6 +734,8 @@ class AudioEngine(IAudioEngine):
                     return None
 
             except Exception as e:
+                if permit.outcome is None:
+                    permit.record(False, 0.0)
                 print(f"AudioEngine: Failed to generate chunk {chunk_number}: {e}")
                 return None
 
@@ -526,6 +746,10 @@ class AudioEngine(IAudioEngine):
         except Exception as e:
             return Result.failure(audio_generation_error(f"TTS engine call failed: {e!s}"))
 
+    def concurrency_metrics(self) -> dict[str, Any]:
+        """Current TTS concurrency limit and the latency, error and CPU signals driving it."""
+        return self.concurrency.metrics()
+
     def _get_base_delay_for_engine(self) -> float:
         """Get base delay for rate limiting based on TTS engine."""
         engine_name = self.tts_engine.__class__.__name__.lower()
@@ -540,8 +764,6 @@ class AudioEngine(IAudioEngine):
     def _convert_wav_to_mp3(self, wav_path: str, mp3_path: str) -> Result[str]:
         """Convert WAV file to MP3 using ffmpeg."""
         try:
-            import subprocess
-
             # Validate input file path for security
             if not Path(wav_path).is_file() or Path(wav_path).is_symlink():
                 return Result.failure(audio_generation_error(f"Invalid or unsafe input file path: {wav_path}"))
@@ -561,7 +783,7 @@ class AudioEngine(IAudioEngine):
                 "-y",  # Overwrite if exists
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = run_subprocess(cmd, text=True, timeout=60)
 
             if result.returncode == 0:
                 return Result.success(mp3_path)
@@ -0,0 +1,189 @@
+# domain/audio/chunk_journal.py - Crash-Safe Chunk Journal
+"""Per-job journal of synthesized TTS chunks, so a conversion interrupted by a crash or
+redeploy resumes with only the chunks that were not finished.
+
+Chunk audio is content-addressed (hash of TTS identity and chunk text) and written atomically;
+a chunk counts as done only once an fsynced log line with its size and digest points at it,
+so torn log lines and half-written audio files are ignored on resume.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Optional
+
+_PLAN_FILE = "plan.json"
+_LOG_FILE = "chunks.jsonl"
+_AUDIO_DIR = "chunks"
+
+
+def chunk_hash(text: str, tts_identity: str) -> str:
+    """Content hash of a chunk: the same text spoken by the same voice gives the same audio."""
+    return hashlib.sha256(f"{tts_identity}\0{text}".encode()).hexdigest()
+
+
+class ChunkJournal:
+    """Durable record of one job's chunk plan and the audio of every chunk completed so far.
+
+    Thread-safe: chunks may be recorded from the event loop and from worker threads.
+    """
+
+    def __init__(self, directory: str, job_name: str, units: list[str], tts_identity: str):
+        self.directory = directory
+        self.job_name = job_name
+        self.hashes = [chunk_hash(unit, tts_identity) for unit in units]
+        self.tts_identity = tts_identity
+        self._lock = threading.Lock()
+        self._completed: dict[str, tuple[str, float]] = {}  # {hash: (audio path, seconds)}
+
+        os.makedirs(os.path.join(directory, _AUDIO_DIR), exist_ok=True)
+        self._remove_partial_writes()
+        self._load_log()
+        self._write_plan()
+
+    def completed(self) -> dict[int, tuple[bytes, float]]:
+        """Audio and synthesis seconds of the plan's chunks that a previous run finished, by index."""
+        resumed: dict[int, tuple[bytes, float]] = {}
+        for index, digest in enumerate(self.hashes):
+            entry = self._completed.get(digest)
+            if entry is None:
+                continue
+            try:
+                with open(entry[0], "rb") as f:
+                    resumed[index] = (f.read(), entry[1])
+            except OSError:
+                continue
+        return resumed
+
+    def record(self, index: int, audio: bytes, seconds: float) -> None:
+        """Persist a finished chunk's audio; recording the same chunk again is harmless."""
+        digest = self.hashes[index]
+        audio_path = os.path.join(self.directory, _AUDIO_DIR, f"{digest}.wav")
+        entry = {"hash": digest, "bytes": len(audio), "sha256": hashlib.sha256(audio).hexdigest(), "seconds": seconds}
+        try:
+            with self._lock:
+                if digest in self._completed:
+                    return
+                self._write_atomically(audio_path, audio)
+                with open(os.path.join(self.directory, _LOG_FILE), "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._completed[digest] = (audio_path, seconds)
+        except OSError as e:
+            print(f"⚠️ ChunkJournal: Could not record chunk {index + 1} of {self.job_name}: {e}")
+
+    def progress(self) -> dict[str, Any]:
+        """Completed and total chunk counts for this job's plan."""
+        done = sum(1 for digest in self.hashes if digest in self._completed)
+        return {"job": self.job_name, "completed_chunks": done, "total_chunks": len(self.hashes)}
+
+    def discard(self) -> None:
+        """Delete the journal once its job's output has been written."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _load_log(self) -> None:
+        """Rebuild the completed set from the log, trusting only entries whose audio verifies."""
+        log_path = os.path.join(self.directory, _LOG_FILE)
+        if not os.path.exists(log_path):
+            return
+        with open(log_path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    digest = str(entry["hash"])
+                    audio_path = os.path.join(self.directory, _AUDIO_DIR, f"{digest}.wav")
+                    if self._audio_matches(audio_path, int(entry["bytes"]), str(entry["sha256"])):
+                        self._completed[digest] = (audio_path, float(entry.get("seconds", 0.0)))
+                except (ValueError, KeyError, TypeError):
+                    continue  # Torn write from a crash mid-append
+
+    def _write_plan(self) -> None:
+        """Record the chunk plan this run is working on."""
+        plan = {"job": self.job_name, "tts": self.tts_identity, "chunks": self.hashes, "updated": time.time()}
+        try:
+            self._write_atomically(os.path.join(self.directory, _PLAN_FILE), json.dumps(plan).encode())
+        except OSError as e:
+            print(f"⚠️ ChunkJournal: Could not save chunk plan of {self.job_name}: {e}")
+
+    def _remove_partial_writes(self) -> None:
+        """Delete temp files left by a run that died mid-write."""
+        audio_dir = os.path.join(self.directory, _AUDIO_DIR)
+        for directory in (self.directory, audio_dir):
+            for name in os.listdir(directory):
+                if name.endswith(".tmp"):
+                    try:
+                        os.remove(os.path.join(directory, name))
+                    except OSError:
+                        pass  # Already gone
+
+    @staticmethod
+    def _audio_matches(path: str, size: int, sha256: str) -> bool:
+        """Whether an audio file is complete and unchanged."""
+        try:
+            if os.path.getsize(path) != size:
+                return False
+            with open(path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest() == sha256
+        except OSError:
+            return False
+
+    @staticmethod
+    def _write_atomically(path: str, content: bytes) -> None:
+        """Write a file so that readers see either the old file or the complete new one."""
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+class ChunkJournalStore:
+    """Directory of chunk journals, one per job, keyed by the job's output name."""
+
+    def __init__(self, root: str, max_age_hours: float = 24.0):
+        self.root = os.path.abspath(root)
+        self.max_age_hours = max_age_hours
+
+    def open(self, job_name: str, units: list[str], tts_identity: str) -> Optional[ChunkJournal]:
+        """Open (or resume) the journal of a job; None if the journal directory is unusable."""
+        self.prune()
+        try:
+            journal = ChunkJournal(self._job_directory(job_name), job_name, units, tts_identity)
+        except OSError as e:
+            print(f"⚠️ ChunkJournal: Journal unavailable for {job_name}, running without resume: {e}")
+            return None
+        return journal
+
+    def prune(self) -> int:
+        """Delete journals of jobs that were abandoned more than max_age_hours ago."""
+        if self.max_age_hours <= 0 or not os.path.isdir(self.root):
+            return 0
+        cutoff = time.time() - self.max_age_hours * 3600
+        removed = 0
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            try:
+                if os.path.isdir(path) and os.path.getmtime(path) < cutoff:
+                    shutil.rmtree(path)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def _job_directory(self, job_name: str) -> str:
+        """Filesystem-safe, collision-free directory for a job name."""
+        slug = re.sub(r"[^A-Za-z0-9_-]+", "_", job_name)[:60]
+        digest = hashlib.sha256(job_name.encode()).hexdigest()[:12]
+        return os.path.join(self.root, f"{slug}-{digest}")
@@ -0,0 +1,265 @@
+# domain/audio/concurrency_controller.py - Adaptive TTS Concurrency
+"""AIMD (additive increase, multiplicative decrease) limit on concurrent TTS calls.
+The limit grows while calls are fast and successful and the CPU has room, and is cut
+when errors, latency spikes or CPU overload show the engine is saturated.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import math
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+def system_cpu_load() -> Optional[float]:
+    """One-minute load average per CPU (None where the platform does not report it)."""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+
+@dataclass
+class ConcurrencyPermit:
+    """A granted slot; record the call outcome on it before leaving the slot."""
+
+    sequence: int  # Acquisition order, used to apply at most one decrease per round of calls
+    work: float  # Size of the call (e.g. characters); latency is expected to grow with it
+    started: float
+    outcome: Optional[tuple[bool, float]] = None  # (success, latency seconds)
+
+    def record(self, success: bool, latency_seconds: float) -> None:
+        """Report how the call went."""
+        self.outcome = (success, latency_seconds)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Async concurrency limit adjusted by AIMD from per-call latency, error rate and CPU load.
+
+    Each successful call finishing while at least half the limit is in use adds
+    additive_increase / limit, so a busy limit grows by about one per round of calls. A failed
+    call while the error rate is above error_rate_threshold, a call slower than
+    latency_tolerance times the latency expected for its size (a running linear fit over
+    uncongested calls), or CPU load above cpu_load_threshold multiplies the limit by
+    decrease_factor, at most once per round (calls that started before the last decrease do
+    not cut it again).
+
+    One limiter may be shared by jobs running on different event loops and threads.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        latency_tolerance: float = 2.0,
+        error_rate_threshold: float = 0.1,
+        cpu_load_threshold: Optional[float] = None,
+        additive_increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        ewma_alpha: float = 0.2,
+        cpu_load: Callable[[], Optional[float]] = system_cpu_load,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Concurrent calls allowed before anything has been observed
+            min_limit: The limit never drops below this
+            max_limit: The limit never grows above this
+            latency_tolerance: Latency above this multiple of the expected latency for the call size is congestion
+            error_rate_threshold: Failures only cut the limit while the error rate EWMA is above this
+            cpu_load_threshold: Load per CPU above which the limit is cut and below which it may grow
+                (None ignores CPU load, for remote engines)
+            additive_increase: Growth of the limit per round of successful calls
+            decrease_factor: Multiplier applied to the limit on congestion
+            ewma_alpha: Weight of the newest observation in the latency and error rate averages
+            cpu_load: Source of the current load per CPU (injectable for tests)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.latency_tolerance = latency_tolerance
+        self.error_rate_threshold = error_rate_threshold
+        self.cpu_load_threshold = cpu_load_threshold
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self.ewma_alpha = ewma_alpha
+        self._cpu_load = cpu_load
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+        self._in_flight = 0
+        self._sequence = 0
+        self._last_decrease_sequence = -1
+        self._latency_moments: Optional[list[float]] = None  # EWMAs of work, latency, work², work·latency
+        self._error_rate = 0.0
+        self._last_cpu_load: Optional[float] = None
+        self._increases = 0
+        self._decreases = 0
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent calls allowed."""
+        with self._lock:
+            return int(self._limit)
+
+    @asynccontextmanager
+    async def slot(self, work: float = 1.0) -> AsyncIterator[ConcurrencyPermit]:
+        """Hold one concurrency slot for a call.
+
+        A call that raises counts as failed and one that records nothing as successful; a
+        cancelled call returns its slot without affecting the limit.
+        """
+        permit = await self.acquire(work)
+        try:
+            yield permit
+        except asyncio.CancelledError:
+            self.release(permit, adjust=False)
+            raise
+        except Exception:
+            if permit.outcome is None:
+                permit.record(False, self._clock() - permit.started)
+            self.release(permit)
+            raise
+        self.release(permit)
+
+    async def acquire(self, work: float = 1.0) -> ConcurrencyPermit:
+        """Wait until a call may start under the current limit (first come, first served)."""
+        loop = asyncio.get_running_loop()
+        woken = False
+        while True:
+            with self._lock:
+                if self._in_flight < int(self._limit) and (woken or not self._waiters):
+                    return self._grant(work)
+                waiter: asyncio.Future[None] = loop.create_future()
+                if woken:
+                    self._waiters.appendleft((loop, waiter))  # Lost the slot to a newcomer; keep its place
+                else:
+                    self._waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+                    elif self._in_flight < int(self._limit):
+                        self._wake_next()  # Pass on the wake-up this waiter received
+                raise
+            woken = True
+
+    def try_acquire(self, work: float = 1.0) -> Optional[ConcurrencyPermit]:
+        """Take a slot if one is free right now, ignoring queued waiters (for callers that queue themselves)."""
+        with self._lock:
+            if self._in_flight < int(self._limit):
+                return self._grant(work)
+            return None
+
+    def release(self, permit: ConcurrencyPermit, adjust: bool = True) -> None:
+        """Return the slot and, unless adjust is False, adjust the limit from the recorded outcome."""
+        success, latency = permit.outcome or (True, self._clock() - permit.started)
+        cpu_load = self._cpu_load() if adjust and self.cpu_load_threshold is not None else None
+        with self._lock:
+            self._in_flight -= 1
+            if adjust:
+                self._adjust(permit, success, latency, cpu_load)
+            for _ in range(int(self._limit) - self._in_flight):
+                if not self._wake_next():
+                    break
+
+    def metrics(self) -> dict[str, Any]:
+        """Current limit and the signals driving it."""
+        with self._lock:
+            return {
+                "limit": int(self._limit),
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "in_flight": self._in_flight,
+                "waiting": len(self._waiters),
+                "error_rate": round(self._error_rate, 4),
+                "expected_latency_per_unit": self._expected_latency_per_unit(),
+                "cpu_load": self._last_cpu_load,
+                "increases": self._increases,
+                "decreases": self._decreases,
+            }
+
+    def _grant(self, work: float) -> ConcurrencyPermit:
+        """Take a slot (lock held)."""
+        self._in_flight += 1
+        self._sequence += 1
+        return ConcurrencyPermit(sequence=self._sequence, work=max(work, 1.0), started=self._clock())
+
+    def _wake_next(self) -> bool:
+        """Wake the oldest live waiter (lock held); False when nobody is waiting."""
+        while self._waiters:
+            loop, waiter = self._waiters.popleft()
+            if loop.is_closed():
+                continue
+            loop.call_soon_threadsafe(_resolve, waiter)
+            return True
+        return False
+
+    def _adjust(self, permit: ConcurrencyPermit, success: bool, latency: float, cpu_load: Optional[float]) -> None:
+        """Apply AIMD to the limit for one finished call (lock held)."""
+        self._error_rate += self.ewma_alpha * ((0.0 if success else 1.0) - self._error_rate)
+        self._last_cpu_load = cpu_load
+
+        expected = self._expected_latency(permit.work)
+        slow = expected is not None and latency > expected * self.latency_tolerance
+        failing = not success and self._error_rate > self.error_rate_threshold
+        overloaded = cpu_load is not None and self.cpu_load_threshold is not None and cpu_load > self.cpu_load_threshold
+
+        if success and not slow:
+            # Only uncongested calls teach the latency model; slow ones would hide congestion
+            self._learn_latency(permit.work, latency)
+
+        if slow or failing or overloaded:
+            if permit.sequence > self._last_decrease_sequence:
+                self._limit = max(float(self.min_limit), math.floor(self._limit * self.decrease_factor))
+                self._last_decrease_sequence = self._sequence
+                self._decreases += 1
+        elif success and (self._in_flight + 1) * 2 >= self._limit and self._limit < self.max_limit:
+            # Only grow a limit that is actually being used (at least half of it was in flight)
+            self._limit = min(float(self.max_limit), self._limit + self.additive_increase / self._limit)
+            self._increases += 1
+
+    def _learn_latency(self, work: float, latency: float) -> None:
+        """Fold one uncongested call into the running moments of the latency fit (lock held)."""
+        sample = [work, latency, work * work, work * latency]
+        if self._latency_moments is None:
+            self._latency_moments = sample
+            return
+        for i, value in enumerate(sample):
+            self._latency_moments[i] += self.ewma_alpha * (value - self._latency_moments[i])
+
+    def _expected_latency(self, work: float) -> Optional[float]:
+        """Latency expected for a call of this size, from a + b * work fitted to recent calls (lock held)."""
+        if self._latency_moments is None:
+            return None
+        mean_work, mean_latency, mean_work_sq, mean_cross = self._latency_moments
+        variance = mean_work_sq - mean_work * mean_work
+        if variance <= (0.01 * mean_work) ** 2:
+            return mean_latency  # All recent calls were about the same size
+        slope = max(0.0, (mean_cross - mean_work * mean_latency) / variance)
+        intercept = mean_latency - slope * mean_work
+        return max(intercept + slope * work, mean_latency * 0.1)
+
+    def _expected_latency_per_unit(self) -> Optional[float]:
+        """Expected latency per unit of work at the typical call size, for metrics (lock held)."""
+        if self._latency_moments is None or self._latency_moments[0] <= 0:
+            return None
+        expected = self._expected_latency(self._latency_moments[0])
+        return round(expected / self._latency_moments[0], 6) if expected is not None else None
+
+
+def _resolve(waiter: "asyncio.Future[None]") -> None:
+    """Complete a waiter future on its own loop."""
+    if not waiter.done():
+        waiter.set_result(None)
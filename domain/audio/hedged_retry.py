@@ -0,0 +1,62 @@
+# domain/audio/hedged_retry.py - Chunk Retries and Hedged Requests
+"""Retry policy for TTS chunks: jittered exponential backoff, a per-chunk deadline, and
+hedged duplicate requests for chunks running slower than their peers.
+"""
+
+from dataclasses import dataclass
+import math
+import random
+import threading
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ChunkRetryPolicy:
+    """How hard to try for each TTS chunk.
+
+    Attributes:
+        max_attempts: Attempts per chunk, including the first (1 disables retries)
+        backoff_seconds: Base delay before the first retry; doubles for each further retry
+        max_backoff_seconds: Upper bound on a single backoff delay
+        deadline_seconds: Time a chunk may take from the start of its first attempt; attempts
+            still running then are cancelled and no further retries start
+        hedge_percentile: Peer latency percentile after which a duplicate request is sent
+            (0 disables hedging)
+        min_hedge_peers: Successful peer chunks needed before hedging starts
+    """
+
+    max_attempts: int = 3
+    backoff_seconds: float = 1.0
+    max_backoff_seconds: float = 30.0
+    deadline_seconds: float = 180.0
+    hedge_percentile: float = 90.0
+    min_hedge_peers: int = 5
+
+    def backoff(self, retry: int, rng: random.Random) -> float:
+        """Delay before retry number `retry` (0-based): half fixed, half random ("equal jitter")."""
+        ceiling = min(self.max_backoff_seconds, self.backoff_seconds * (2**retry))
+        return ceiling / 2 + rng.uniform(0, ceiling / 2)
+
+
+class PeerLatencies:
+    """Synthesis latency per character of the chunks of one job, for hedging decisions."""
+
+    def __init__(self, percentile: float, min_peers: int):
+        self.percentile = percentile
+        self.min_peers = min_peers
+        self._lock = threading.Lock()
+        self._seconds_per_char: list[float] = []
+
+    def record(self, chars: int, seconds: float) -> None:
+        """Add a successful chunk's latency."""
+        with self._lock:
+            self._seconds_per_char.append(seconds / max(chars, 1))
+
+    def hedge_delay(self, chars: int) -> Optional[float]:
+        """Seconds after which a chunk of this size is a straggler (None until enough peers finished)."""
+        with self._lock:
+            if self.percentile <= 0 or len(self._seconds_per_char) < self.min_peers:
+                return None
+            ordered = sorted(self._seconds_per_char)
+        rank = min(len(ordered), max(1, math.ceil(self.percentile / 100 * len(ordered))))
+        return ordered[rank - 1] * max(chars, 1)
@@ -0,0 +1,137 @@
+# domain/audio/synthesis_plan.py - Sentence-Level Synthesis Deduplication
+"""Plans TTS synthesis so repeated sentences (running titles, copyright lines, "Continued on
+next page") are synthesized once per job and their audio is replayed wherever they recur.
+"""
+
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+import re
+from typing import Any, Optional, TypeVar
+
+from ..text.sentence_tokenizer import split_sentences
+from ..text.text_artifact import TextArtifact
+
+T = TypeVar("T")
+
+# Sentences shorter than this stay inline: a separate request costs more than re-synthesizing them
+DEFAULT_MIN_DEDUP_CHARS = 24
+
+_TYPOGRAPHIC = str.maketrans({"\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"', "\u2013": "-", "\u2014": "-"})
+_WHITESPACE = re.compile(r"\s+")
+_PAUSE_DOTS = re.compile(r"\.{2,}")  # Natural formatting turns "." into ".." or "..."
+
+
+def normalize_sentence(sentence: str) -> str:
+    """Key under which sentences that would be spoken the same are considered duplicates."""
+    text = sentence.translate(_TYPOGRAPHIC)
+    text = _PAUSE_DOTS.sub(".", text)
+    return _WHITESPACE.sub(" ", text).strip().casefold()
+
+
+@dataclass(frozen=True)
+class SynthesisPlan:
+    """Texts to synthesize once each, and the order in which their audio is played.
+
+    Attributes:
+        units: Text of each synthesis request, in order of first use
+        order: Playback order as indexes into units; a repeated sentence appears more than once
+    """
+
+    units: list[str]
+    order: list[int]
+
+    @classmethod
+    def identity(cls, chunks: Sequence[str]) -> "SynthesisPlan":
+        """Plan that synthesizes every chunk once, in order (no deduplication)."""
+        return cls(units=list(chunks), order=list(range(len(chunks))))
+
+    @property
+    def reused_count(self) -> int:
+        """Playback positions served by audio synthesized for an earlier position."""
+        return len(self.order) - len(set(self.order))
+
+    @property
+    def chars_saved(self) -> int:
+        """Characters that were not sent to the TTS engine thanks to reuse."""
+        return sum(len(self.units[index]) for index in self.order) - sum(len(unit) for unit in self.units)
+
+    def splice(self, unit_results: Sequence[T]) -> list[T]:
+        """Arrange per-unit results (audio, files, durations) in playback order."""
+        return [unit_results[index] for index in self.order]
+
+    def first_occurrences(self) -> list[bool]:
+        """For each playback position, whether its unit is synthesized there (True) or replayed."""
+        seen: set[int] = set()
+        firsts = []
+        for index in self.order:
+            firsts.append(index not in seen)
+            seen.add(index)
+        return firsts
+
+    def to_debug_info(self, unit_seconds: Optional[Sequence[float]] = None) -> dict[str, Any]:
+        """Summarise the savings; unit_seconds (synthesis time per unit) gives the time saved."""
+        info: dict[str, Any] = {
+            "synthesis_units": len(self.units),
+            "playback_segments": len(self.order),
+            "reused_segments": self.reused_count,
+            "chars_saved": self.chars_saved,
+        }
+        if unit_seconds is not None:
+            replays = [index for index, first in zip(self.order, self.first_occurrences()) if not first]
+            info["synthesis_seconds_saved"] = round(sum(unit_seconds[index] for index in replays), 3)
+        return info
+
+
+def plan_synthesis(chunks: Sequence[str], min_sentence_chars: int = DEFAULT_MIN_DEDUP_CHARS) -> SynthesisPlan:
+    """Plan synthesis of TTS chunks so each repeated sentence is synthesized only once.
+
+    Sentences of at least min_sentence_chars that occur more than once in the job (exactly, or
+    after normalize_sentence) are cut out of their chunks into a unit of their own, synthesized
+    at the first occurrence and replayed at the others. Chunks without repeated sentences are
+    kept unchanged. Units cut from a TextArtifact keep its stage record.
+    """
+    chunk_sentences = [split_sentences(chunk) for chunk in chunks]
+    counts = Counter(
+        normalize_sentence(sentence)
+        for sentences in chunk_sentences
+        for sentence in sentences
+        if len(sentence) >= min_sentence_chars
+    )
+    repeated = {key for key, count in counts.items() if count > 1}
+    if not repeated:
+        return SynthesisPlan.identity(chunks)
+
+    units: list[str] = []
+    order: list[int] = []
+    unit_for_key: dict[str, int] = {}
+
+    def add_unit(chunk: str, text: str) -> None:
+        order.append(len(units))
+        units.append(chunk.derive(text) if isinstance(chunk, TextArtifact) else text)
+
+    for chunk, sentences in zip(chunks, chunk_sentences):
+        keys = [normalize_sentence(s) if len(s) >= min_sentence_chars else None for s in sentences]
+        if not repeated.intersection(keys):
+            add_unit(chunk, chunk)
+            continue
+
+        run: list[str] = []
+        for sentence, key in zip(sentences, keys):
+            if key not in repeated:
+                run.append(sentence)
+                continue
+
+            if run:
+                add_unit(chunk, " ".join(run))
+                run = []
+            if key in unit_for_key:
+                order.append(unit_for_key[key])
+            else:
+                unit_for_key[key] = len(units)
+                add_unit(chunk, sentence)
+
+        if run:
+            add_unit(chunk, " ".join(run))
+
+    return SynthesisPlan(units=units, order=order)
@@ -4,18 +4,28 @@ Replaces: GeminiTimestampStrategy, SentenceMeasurementStrategy, EnhancedTimingSt
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+import contextlib
 import dataclasses
 from enum import Enum
 from pathlib import Path
 import time
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 
+from ..cancellation import JobCancelledError, cancellable_sleep, check_cancelled, run_subprocess
+from ..errors import Result
 from ..interfaces import IFileManager, ITTSEngine
 from ..models import TextSegment, TimedAudioResult, TimingMetadata
+from ..text.rewrite_rules import RewriteRule, RuleSet
+from ..workspace import publish_file, scratch_path
+from .synthesis_plan import DEFAULT_MIN_DEDUP_CHARS, SynthesisPlan, plan_synthesis
+from .tts_scheduler import FairShareScheduler
 
 if TYPE_CHECKING:
     from ..text.text_pipeline import ITextPipeline
 
+T = TypeVar("T")
+
 
 @dataclasses.dataclass(frozen=True)
 class ChunkProcessingResult:
@@ -35,6 +45,10 @@ class BatchProcessingResult:
     final_cumulative_time: float
 
 
+# SSML tags (<speak>, <break>, <prosody>, ...) removed, then whitespace collapsed
+SSML_STRIP_RULES = RuleSet(RewriteRule(r"<[^>]+>", "", requires="<"), RewriteRule(r"\s+", " "))
+
+
 class TimingMode(Enum):
     """Available timing modes."""
 
@@ -62,13 +76,19 @@ class TimingEngine(ITimingEngine):
         text_pipeline: Optional["ITextPipeline"] = None,
         mode: TimingMode = TimingMode.ESTIMATION,
         measurement_interval: float = 0.8,
+        enable_sentence_dedup: bool = True,
+        dedup_min_sentence_chars: int = DEFAULT_MIN_DEDUP_CHARS,
+        scheduler: Optional[FairShareScheduler] = None,
     ):
         self.tts_engine = tts_engine
         self.file_manager = file_manager
         self.text_pipeline = text_pipeline
         self.mode = mode
         self.measurement_interval = measurement_interval
+        self.enable_sentence_dedup = enable_sentence_dedup  # Synthesize repeated sentences once per job
+        self.dedup_min_sentence_chars = dedup_min_sentence_chars
         self.last_api_call = 0.0
+        self.scheduler = scheduler  # Shared with AudioEngine so both stay within one TTS budget
 
         # Optimize timing mode for engine capabilities
         if mode == TimingMode.ESTIMATION and not hasattr(tts_engine, "generate_audio_with_timestamps"):
@@ -77,10 +97,12 @@ class TimingEngine(ITimingEngine):
 
     def generate_with_timing(self, text_chunks: list[str], output_filename: str) -> TimedAudioResult:
         """Main entry point - routes to appropriate timing strategy."""
-        if self.mode == TimingMode.ESTIMATION:
-            return self._generate_with_estimation(text_chunks, output_filename)
-        elif self.mode == TimingMode.MEASUREMENT:
-            return self._generate_with_measurement(text_chunks, output_filename)
+        job = self.scheduler.job(output_filename) if self.scheduler else contextlib.nullcontext()
+        with job:
+            if self.mode == TimingMode.ESTIMATION:
+                return self._generate_with_estimation(text_chunks, output_filename)
+            elif self.mode == TimingMode.MEASUREMENT:
+                return self._generate_with_measurement(text_chunks, output_filename)
 
         # This should never be reached with current enum values
         raise ValueError(f"Unsupported timing mode: {self.mode}")
@@ -93,67 +115,95 @@ class TimingEngine(ITimingEngine):
 
         print("TimingEngine: Using estimation mode with native engine timestamps")
 
-        # Process chunks individually to respect size limits
+        # Process chunks individually to respect size limits; repeated sentences are synthesized once
+        plan = self._plan_synthesis(text_chunks)
+        unit_seconds = [0.0] * len(plan.units)
+        unit_outputs: dict[int, tuple[str, list[TextSegment], float]] = {}  # Audio file, segments from 0, duration
         all_audio_files = []
         all_text_segments = []
         cumulative_time = 0.0
 
-        print(f"🔍 TimingEngine: Processing {len(text_chunks)} chunks individually")
+        print(f"🔍 TimingEngine: Processing {len(plan.units)} chunks individually")
 
-        for i, chunk in enumerate(text_chunks):
-            # Enhance text with natural formatting if available
-            enhanced_chunk = self.text_pipeline.enhance_with_natural_formatting(chunk) if self.text_pipeline else chunk
+        try:
+            for i in plan.order:
+                if i in unit_outputs:
+                    # Replay audio already synthesized for this text, with timestamps moved to this position
+                    audio_filename, unit_segments, unit_duration = unit_outputs[i]
+                    all_audio_files.append(audio_filename)
+                    all_text_segments.extend(
+                        dataclasses.replace(segment, start_time=segment.start_time + cumulative_time)
+                        for segment in unit_segments
+                    )
+                    cumulative_time += unit_duration
+                    continue
 
-            print(f"🔍 TimingEngine: Processing chunk {i+1}/{len(text_chunks)} ({len(enhanced_chunk)} chars)")
+                chunk = plan.units[i]
 
-            # Check chunk size
-            if len(enhanced_chunk) > 3000:
-                print(
-                    f"🚨 TimingEngine: Chunk {i+1} too large ({len(enhanced_chunk)} chars), "
-                    f"falling back to measurement mode"
+                # Enhance text with natural formatting if available
+                enhanced_chunk = (
+                    self.text_pipeline.enhance_with_natural_formatting(chunk) if self.text_pipeline else chunk
                 )
-                return self._generate_with_measurement(text_chunks, output_filename)
 
-            if not enhanced_chunk.strip():
-                continue
+                print(f"🔍 TimingEngine: Processing chunk {i+1}/{len(plan.units)} ({len(enhanced_chunk)} chars)")
 
-            try:
-                # Use engine's native timestamping for this chunk
-                result = self.tts_engine.generate_audio_with_timestamps(enhanced_chunk)
+                # Check chunk size
+                if len(enhanced_chunk) > 3000:
+                    print(
+                        f"🚨 TimingEngine: Chunk {i+1} too large ({len(enhanced_chunk)} chars), "
+                        f"falling back to measurement mode"
+                    )
+                    return self._generate_with_measurement(text_chunks, output_filename)
 
-                if result.is_failure:
-                    print(f"TimingEngine: Engine failed for chunk {i+1}: {result.error}")
+                if not enhanced_chunk.strip():
                     continue
 
-                audio_data, text_segments = result.value
+                try:
+                    # Use engine's native timestamping for this chunk
+                    synthesis_start = time.monotonic()
+                    result = self._call_tts(self.tts_engine.generate_audio_with_timestamps, enhanced_chunk)
+                    unit_seconds[i] = time.monotonic() - synthesis_start
+
+                    if result.is_failure:
+                        print(f"TimingEngine: Engine failed for chunk {i+1}: {result.error}")
+                        continue
 
-                if not audio_data:
-                    continue
+                    audio_data, text_segments = result.value
 
-                # Save audio file for this chunk
-                audio_filename = f"{output_filename}_chunk_{i}.mp3"
-                audio_path = self.file_manager.save_output_file(audio_data, audio_filename)
+                    if not audio_data:
+                        continue
 
-                if audio_path:
-                    all_audio_files.append(audio_filename)
+                    # Save audio file for this chunk
+                    audio_filename = f"{output_filename}_chunk_{i}.mp3"
+                    audio_path = self.file_manager.save_output_file(audio_data, audio_filename)
 
-                    # Adjust timestamps for this chunk relative to previous chunks (immutable)
-                    if text_segments:
-                        adjusted_segments = [
-                            dataclasses.replace(segment, start_time=segment.start_time + cumulative_time)
-                            for segment in text_segments
-                        ]
-                        all_text_segments.extend(adjusted_segments)
+                    if audio_path:
+                        all_audio_files.append(audio_filename)
+                        chunk_duration = 0.0
 
-                        # Update cumulative time (using adjusted segments)
-                        chunk_duration = max(
-                            seg.start_time + seg.duration - cumulative_time for seg in adjusted_segments
-                        )
-                        cumulative_time += chunk_duration
+                        # Adjust timestamps for this chunk relative to previous chunks (immutable)
+                        if text_segments:
+                            adjusted_segments = [
+                                dataclasses.replace(segment, start_time=segment.start_time + cumulative_time)
+                                for segment in text_segments
+                            ]
+                            all_text_segments.extend(adjusted_segments)
 
-            except Exception as e:
-                print(f"TimingEngine: Failed to process chunk {i+1}: {e}")
-                continue
+                            # Update cumulative time (using adjusted segments)
+                            chunk_duration = max(
+                                seg.start_time + seg.duration - cumulative_time for seg in adjusted_segments
+                            )
+                            cumulative_time += chunk_duration
+
+                        unit_outputs[i] = (audio_filename, list(text_segments or []), chunk_duration)
+
+                except Exception as e:
+                    print(f"TimingEngine: Failed to process chunk {i+1}: {e}")
+                    continue
+        except JobCancelledError:
+            # Chunk files of a cancelled job will never be served
+            self._remove_files(str(Path(self.file_manager.get_output_dir()) / name) for name in all_audio_files)
+            raise
 
         if not all_audio_files:
             return TimedAudioResult(audio_files=[], combined_mp3=None, timing_data=None)
@@ -178,7 +228,12 @@ class TimingEngine(ITimingEngine):
                 total_duration=total_duration, text_segments=all_text_segments, audio_files=all_audio_files
             )
 
-        return TimedAudioResult(audio_files=all_audio_files, combined_mp3=combined_mp3, timing_data=timing_metadata)
+        return TimedAudioResult(
+            audio_files=all_audio_files,
+            combined_mp3=combined_mp3,
+            timing_data=timing_metadata,
+            debug_info={"sentence_dedup": plan.to_debug_info(unit_seconds)},
+        )
 
     def _generate_with_measurement(self, text_chunks: list[str], output_filename: str) -> TimedAudioResult:
         """Precise timing by measuring actual audio duration (optimal for engines with timestamp support)."""
@@ -188,22 +243,63 @@ class TimingEngine(ITimingEngine):
             print("Warning: No text pipeline available for measurement mode")
             return TimedAudioResult(audio_files=[], combined_mp3=None, timing_data=None)
 
-        print(f"🔍 TimingEngine: Processing {len(text_chunks)} chunks in measurement mode")
+        plan = self._plan_synthesis(text_chunks)
+        print(f"🔍 TimingEngine: Processing {len(plan.units)} chunks in measurement mode")
 
         all_temp_audio_files = []
         all_text_segments = []
         cumulative_time = 0.0
+        unit_seconds = [0.0] * len(plan.units)
+        unit_results: dict[int, tuple[ChunkProcessingResult, float]] = {}  # Result and the time it started at
 
         # Process each text chunk to create audio and timing data
-        for chunk_idx, chunk in enumerate(text_chunks):
-            chunk_result = self._process_text_chunk(chunk, chunk_idx, cumulative_time)
+        try:
+            for chunk_idx, unit_index in enumerate(plan.order):
+                if unit_index in unit_results:
+                    # Replay the temp audio of the first occurrence, shifting its segments to this position
+                    earlier_result, earlier_start = unit_results[unit_index]
+                    shift = cumulative_time - earlier_start
+                    all_temp_audio_files.extend(earlier_result.temp_files)
+                    all_text_segments.extend(
+                        dataclasses.replace(segment, start_time=segment.start_time + shift, chunk_index=chunk_idx)
+                        for segment in earlier_result.text_segments
+                    )
+                    cumulative_time = earlier_result.final_cumulative_time + shift
+                    continue
+
+                synthesis_start = time.monotonic()
+                chunk_result = self._process_text_chunk(plan.units[unit_index], chunk_idx, cumulative_time)
+                unit_seconds[unit_index] = time.monotonic() - synthesis_start
+                unit_results[unit_index] = (chunk_result, cumulative_time)
 
-            all_temp_audio_files.extend(chunk_result.temp_files)
-            all_text_segments.extend(chunk_result.text_segments)
-            cumulative_time = chunk_result.final_cumulative_time
+                all_temp_audio_files.extend(chunk_result.temp_files)
+                all_text_segments.extend(chunk_result.text_segments)
+                cumulative_time = chunk_result.final_cumulative_time
+        except JobCancelledError:
+            self._remove_files(all_temp_audio_files)
+            raise
 
         # Finalize audio output and create timing metadata
-        return self._finalize_audio_output(all_temp_audio_files, all_text_segments, cumulative_time, output_filename)
+        return self._finalize_audio_output(
+            all_temp_audio_files,
+            all_text_segments,
+            cumulative_time,
+            output_filename,
+            debug_info={"sentence_dedup": plan.to_debug_info(unit_seconds)},
+        )
+
+    def _plan_synthesis(self, text_chunks: list[str]) -> SynthesisPlan:
+        """Plan which texts to synthesize, deduplicating repeated sentences when enabled."""
+        if not self.enable_sentence_dedup:
+            return SynthesisPlan.identity(text_chunks)
+
+        plan = plan_synthesis(text_chunks, self.dedup_min_sentence_chars)
+        if plan.reused_count:
+            print(
+                f"♻️ TimingEngine: {plan.reused_count} repeated sentence(s) reuse earlier audio "
+                f"({plan.chars_saved} chars not synthesized)"
+            )
+        return plan
 
     def _process_text_chunk(self, chunk: str, chunk_idx: int, cumulative_time: float) -> ChunkProcessingResult:
         """Process a single text chunk into audio and timing segments."""
@@ -233,16 +329,20 @@ class TimingEngine(ITimingEngine):
         current_cumulative_time = cumulative_time
 
         # Process each batch of sentences
-        for batch_idx, sentence_batch in enumerate(sentence_batches):
-            batch_result = self._process_sentence_batch(
-                sentence_batch, batch_idx, batch_size, chunk_idx, current_cumulative_time
-            )
+        try:
+            for batch_idx, sentence_batch in enumerate(sentence_batches):
+                batch_result = self._process_sentence_batch(
+                    sentence_batch, batch_idx, batch_size, chunk_idx, current_cumulative_time
+                )
 
-            if batch_result.temp_file:
-                temp_audio_files.append(batch_result.temp_file)
+                if batch_result.temp_file:
+                    temp_audio_files.append(batch_result.temp_file)
 
-            text_segments.extend(batch_result.text_segments)
-            current_cumulative_time = batch_result.final_cumulative_time
+                text_segments.extend(batch_result.text_segments)
+                current_cumulative_time = batch_result.final_cumulative_time
+        except JobCancelledError:
+            self._remove_files(temp_audio_files)
+            raise
 
         return ChunkProcessingResult(
             temp_files=temp_audio_files, text_segments=text_segments, final_cumulative_time=current_cumulative_time
@@ -258,14 +358,18 @@ class TimingEngine(ITimingEngine):
 
             # Generate audio for batch
             batch_text = " ".join(sentence_batch)
-            result = self.tts_engine.generate_audio_data(batch_text)
+            result = self._call_tts(self.tts_engine.generate_audio_data, batch_text)
 
             if result.is_success and result.value:
                 audio_data = result.value
                 temp_file = self.file_manager.save_temp_file(audio_data, suffix=".wav")
 
                 # Measure batch duration and distribute across sentences
-                batch_duration = self._measure_audio_duration(temp_file)
+                try:
+                    batch_duration = self._measure_audio_duration(temp_file)
+                except JobCancelledError:
+                    self._remove_files([temp_file])
+                    raise
                 text_segments = self._distribute_batch_duration(
                     sentence_batch, batch_duration, cumulative_time, chunk_idx, batch_idx, batch_size
                 )
@@ -330,10 +434,9 @@ class TimingEngine(ITimingEngine):
         all_text_segments: list["TextSegment"],
         cumulative_time: float,
         output_filename: str,
+        debug_info: Optional[dict[str, Any]] = None,
     ) -> "TimedAudioResult":
         """Combine audio files and create final timing metadata."""
-        import shutil
-
         final_audio_files = []
         print(f"🔍 DEBUG: all_temp_audio_files count: {len(all_temp_audio_files)}")
 
@@ -341,30 +444,34 @@ class TimingEngine(ITimingEngine):
             if len(all_temp_audio_files) > 1:
                 print(f"🔍 DEBUG: Combining {len(all_temp_audio_files)} audio files")
                 combined_path = Path(self.file_manager.get_output_dir()) / f"{output_filename}_combined.mp3"
-                if self._combine_audio_files(all_temp_audio_files, combined_path):
+                # Encode in the job's workspace; only the finished MP3 is published to the output folder
+                encoded_path = scratch_path(combined_path.name, str(combined_path.parent))
+                try:
+                    combined = self._combine_audio_files(all_temp_audio_files, encoded_path)
+                    if combined:
+                        publish_file(encoded_path, str(combined_path))
+                except OSError as e:
+                    print(f"🔍 DEBUG: Failed to publish combined audio: {e}")
+                    combined = False
+                if combined:
                     final_audio_files = [Path(combined_path).name]
                     print(f"🔍 DEBUG: Audio combination successful: {final_audio_files}")
                 else:
                     print("🔍 DEBUG: Audio combination FAILED")
             else:
-                print(f"🔍 DEBUG: Single file copy: {all_temp_audio_files[0]}")
+                print(f"🔍 DEBUG: Single file publish: {all_temp_audio_files[0]}")
                 output_path = Path(self.file_manager.get_output_dir()) / f"{output_filename}.wav"
                 try:
-                    shutil.copy2(all_temp_audio_files[0], output_path)
+                    publish_file(all_temp_audio_files[0], str(output_path))
                     final_audio_files = [Path(output_path).name]
-                    print(f"🔍 DEBUG: Single file copy successful: {final_audio_files}")
+                    print(f"🔍 DEBUG: Single file publish successful: {final_audio_files}")
                 except Exception as e:
-                    print(f"🔍 DEBUG: Failed to copy audio file: {e}")
+                    print(f"🔍 DEBUG: Failed to publish audio file: {e}")
         else:
             print("🔍 DEBUG: No temp audio files to process!")
 
-        # Clean up temporary files
-        for temp_file in all_temp_audio_files:
-            try:
-                if Path(temp_file).exists():
-                    Path(temp_file).unlink()
-            except (OSError, FileNotFoundError):
-                pass
+        # Clean up temporary files (a replayed file is listed more than once)
+        self._remove_files(all_temp_audio_files)
 
         # Create timing metadata for read-along functionality
         timing_metadata = None
@@ -377,6 +484,7 @@ class TimingEngine(ITimingEngine):
             audio_files=final_audio_files,
             combined_mp3=final_audio_files[0] if final_audio_files else None,
             timing_data=timing_metadata,
+            debug_info=debug_info,
         )
 
     def _generate_with_hybrid(self, text_chunks: list[str], output_filename: str) -> TimedAudioResult:
@@ -391,6 +499,17 @@ class TimingEngine(ITimingEngine):
 
         return result
 
+    def _call_tts(self, synthesize: Callable[[str], Result[T]], text: str) -> Result[T]:
+        """Call the TTS engine, waiting for this job's turn at the shared scheduler when there is one."""
+        check_cancelled()
+        if self.scheduler is None:
+            return synthesize(text)
+        with self.scheduler.slot_sync(work=len(text)) as permit:
+            started = time.monotonic()
+            result = synthesize(text)
+            permit.record(result.is_success, time.monotonic() - started)
+            return result
+
     def _apply_rate_limit(self) -> None:
         """Apply rate limiting between API calls."""
         if self.measurement_interval <= 0:
@@ -401,7 +520,7 @@ class TimingEngine(ITimingEngine):
 
         if time_since_last < self.measurement_interval:
             sleep_duration = self.measurement_interval - time_since_last
-            time.sleep(sleep_duration)
+            cancellable_sleep(sleep_duration)
 
         self.last_api_call = time.time()
 
@@ -415,7 +534,7 @@ class TimingEngine(ITimingEngine):
                 return 1.0  # Default fallback for invalid paths
 
             cmd = ["ffprobe", "-v", "quiet", "-show_entries", "format=duration", "-of", "csv=p=0", file_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            result = run_subprocess(cmd, text=True, timeout=10)
 
             if result.returncode == 0 and result.stdout.strip():
                 return float(result.stdout.strip())
@@ -430,25 +549,23 @@ class TimingEngine(ITimingEngine):
         except (OSError, FileNotFoundError):
             return 1.0  # Default fallback
 
+    def _remove_files(self, file_paths: Iterable[str]) -> None:
+        """Delete temporary or partial audio files, ignoring ones already gone (duplicates allowed)."""
+        for file_path in dict.fromkeys(file_paths):
+            with contextlib.suppress(OSError):
+                Path(file_path).unlink(missing_ok=True)
+
     def _strip_ssml(self, text: str) -> str:
         """Remove SSML tags from text for word counting."""
-        import re
-
-        # Remove all SSML tags like <speak>, <break>, <prosody>, etc.
-        clean_text = re.sub(r"<[^>]+>", "", text)
-        # Clean up extra whitespace
-        clean_text = re.sub(r"\s+", " ", clean_text).strip()
-        return clean_text
+        return SSML_STRIP_RULES.apply(text).strip()
 
     def _combine_audio_files(self, file_paths: list[str], output_path: str) -> bool:
         """Combine audio files using ffmpeg."""
         try:
-            import subprocess
-
             print(f"🔍 DEBUG: Combining {len(file_paths)} files to {output_path}")
             print(f"🔍 DEBUG: Input files: {file_paths}")
 
-            list_file = output_path + ".list"
+            list_file = scratch_path(f"{Path(output_path).name}.list", str(Path(output_path).parent))
             with Path(list_file).open("w") as f:
                 for file_path in file_paths:
                     f.write(f"file '{file_path}'\n")
@@ -470,18 +587,22 @@ class TimingEngine(ITimingEngine):
                 "-y",
             ]
             print(f"🔍 DEBUG: Running ffmpeg command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, timeout=300)
+            try:
+                result = run_subprocess(cmd, timeout=300)
+            except JobCancelledError:
+                self._remove_files([str(output_path)])
+                raise
+            finally:
+                try:
+                    Path(list_file).unlink()
+                except (OSError, FileNotFoundError):
+                    # Ignore file cleanup errors - temporary files may already be removed
+                    pass
 
             print(f"🔍 DEBUG: ffmpeg return code: {result.returncode}")
             if result.stderr:
                 print(f"🔍 DEBUG: ffmpeg stderr: {result.stderr.decode()}")
 
-            try:
-                Path(list_file).unlink()
-            except (OSError, FileNotFoundError):
-                # Ignore file cleanup errors - temporary files may already be removed
-                pass
-
             return result.returncode == 0
         except Exception as e:
             print(f"🔍 DEBUG: Audio combination exception: {e}")
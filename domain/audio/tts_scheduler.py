@@ -0,0 +1,290 @@
+# domain/audio/tts_scheduler.py - Process-Wide Fair-Share TTS Scheduler
+"""One TTS concurrency budget for the whole process, shared fairly by all running jobs.
+Calls beyond the budget queue per job and are admitted by start-time fair queuing, so a
+big book cannot starve a small one, and each job's first chunks jump the queue so every
+job starts producing audio quickly.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+import contextvars
+from dataclasses import dataclass
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import Any, Callable, Optional, Union
+
+from ..cancellation import check_cancelled
+from ..interfaces import ITTSEngine
+from .concurrency_controller import AdaptiveConcurrencyLimiter, ConcurrencyPermit
+
+DEFAULT_JOB = "default"
+_RECENT_JOBS = 20  # Finished jobs kept for metrics
+CANCEL_POLL_SECONDS = 0.1  # How often a worker thread queued for a slot checks for job cancellation
+
+_current_job: contextvars.ContextVar[Optional["_JobState"]] = contextvars.ContextVar("tts_job", default=None)
+
+
+def create_tts_limiter(
+    tts_engine: ITTSEngine, max_concurrent: int, adaptive: bool = True
+) -> AdaptiveConcurrencyLimiter:
+    """Create the TTS concurrency limiter; max_concurrent is the starting point.
+
+    Remote engines may back off below max_concurrent but never exceed it. Local engines
+    (Piper) compete for this machine's CPUs, so they may grow up to one call per core while
+    the load allows. Without adaptation the limit stays fixed at max_concurrent.
+    """
+    if not adaptive:
+        return AdaptiveConcurrencyLimiter(max_concurrent, max_concurrent, max_concurrent)
+
+    if "piper" in tts_engine.__class__.__name__.lower():
+        return AdaptiveConcurrencyLimiter(
+            initial_limit=max_concurrent, max_limit=max(max_concurrent, os.cpu_count() or 1), cpu_load_threshold=1.0
+        )
+    return AdaptiveConcurrencyLimiter(initial_limit=max_concurrent, max_limit=max_concurrent)
+
+
+@dataclass(eq=False)
+class _JobState:
+    """Queueing state and wait statistics of one job."""
+
+    name: str
+    weight: float
+    users: int = 0  # Nested or concurrent job() scopes sharing this name
+    requested: int = 0
+    granted: int = 0
+    finish_tag: float = 0.0  # Virtual time at which the job's last queued call finishes
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Calls granted and the time they spent queued."""
+        return {
+            "job": self.name,
+            "chunks": self.granted,
+            "queue_wait_seconds": round(self.wait_seconds, 3),
+            "mean_queue_wait_seconds": round(self.wait_seconds / self.granted, 3) if self.granted else 0.0,
+            "max_queue_wait_seconds": round(self.max_wait_seconds, 3),
+        }
+
+
+@dataclass(eq=False)
+class _Waiter:
+    """A queued call, woken once a slot has been handed to it."""
+
+    job: _JobState
+    work: float
+    enqueued: float
+    start_tag: float
+    wake: Callable[[], None]
+    permit: Optional[ConcurrencyPermit] = None
+    cancelled: bool = False
+
+
+class FairShareScheduler:
+    """Admits TTS calls from all jobs under one adaptive concurrency budget.
+
+    A call gets a slot at once when one is free and nobody is queued. Otherwise it queues
+    with a start tag max(virtual time, job's previous finish tag) and a finish tag start +
+    work / weight, and free slots go to the smallest start tag (start-time fair queuing).
+    The first priority_chunks calls of each job are served before any other queued call.
+
+    Jobs are scoped with job(); calls made inside the scope (including coroutines submitted
+    from it to the shared event loop) are charged to that job. Async callers use slot(),
+    threads use slot_sync().
+    """
+
+    def __init__(
+        self,
+        limiter: AdaptiveConcurrencyLimiter,
+        priority_chunks: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limiter = limiter
+        self.priority_chunks = priority_chunks
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._queue: list[tuple[int, float, int, _Waiter]] = []  # (priority class, start tag, arrival, waiter)
+        self._arrivals = itertools.count()
+        self._virtual_time = 0.0
+        self._jobs: dict[str, _JobState] = {DEFAULT_JOB: _JobState(DEFAULT_JOB, 1.0, users=1)}
+        self._recent_jobs: deque[dict[str, Any]] = deque(maxlen=_RECENT_JOBS)
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent TTS calls allowed across all jobs."""
+        return self.limiter.limit
+
+    @contextmanager
+    def job(self, name: str, weight: float = 1.0) -> Iterator[_JobState]:
+        """Charge TTS calls made inside this scope to the named job."""
+        with self._lock:
+            state = self._jobs.get(name)
+            if state is None:
+                state = self._jobs[name] = _JobState(name, max(weight, 0.01))
+            state.users += 1
+        token = _current_job.set(state)
+        try:
+            yield state
+        finally:
+            _current_job.reset(token)
+            with self._lock:
+                state.users -= 1
+                if state.users == 0:
+                    del self._jobs[name]
+                    self._recent_jobs.append(state.stats())
+
+    @asynccontextmanager
+    async def slot(self, work: float = 1.0) -> AsyncIterator[ConcurrencyPermit]:
+        """Hold one slot for an async TTS call (outcome rules as AdaptiveConcurrencyLimiter.slot)."""
+        permit = await self.acquire(work)
+        try:
+            yield permit
+        except asyncio.CancelledError:
+            self.release(permit, adjust=False)
+            raise
+        except Exception:
+            if permit.outcome is None:
+                permit.record(False, self._clock() - permit.started)
+            self.release(permit)
+            raise
+        self.release(permit)
+
+    @contextmanager
+    def slot_sync(self, work: float = 1.0, adjust: bool = True) -> Iterator[ConcurrencyPermit]:
+        """Hold one slot for a blocking TTS call made from a worker thread.
+
+        With adjust=False the call counts against the budget but its outcome does not move the limit.
+        A job cancelled (or past its deadline) while the call is queued leaves the queue with JobCancelledError.
+        """
+        ready = threading.Event()
+        granted = self._grant_or_enqueue(work, ready.set)
+        if isinstance(granted, _Waiter):
+            try:
+                while not ready.wait(CANCEL_POLL_SECONDS):
+                    check_cancelled()
+            except BaseException:
+                self._abandon(granted)
+                raise
+        permit = granted.permit if isinstance(granted, _Waiter) else granted
+        assert permit is not None
+        try:
+            yield permit
+        except Exception:
+            if permit.outcome is None:
+                permit.record(False, self._clock() - permit.started)
+            self.release(permit, adjust)
+            raise
+        self.release(permit, adjust)
+
+    async def acquire(self, work: float = 1.0) -> ConcurrencyPermit:
+        """Wait for this job's turn at a slot."""
+        loop = asyncio.get_running_loop()
+        ready: asyncio.Future[None] = loop.create_future()
+        granted = self._grant_or_enqueue(work, lambda: loop.call_soon_threadsafe(_resolve, ready))
+        if isinstance(granted, ConcurrencyPermit):
+            return granted
+        try:
+            await ready
+        except asyncio.CancelledError:
+            self._abandon(granted)
+            raise
+        assert granted.permit is not None
+        return granted.permit
+
+    def release(self, permit: ConcurrencyPermit, adjust: bool = True) -> None:
+        """Return a slot and hand free slots to the queued calls whose turn it is."""
+        self.limiter.release(permit, adjust)
+        self._dispatch()
+
+    def job_stats(self, name: str) -> Optional[dict[str, Any]]:
+        """Queue wait statistics of a running or recently finished job."""
+        with self._lock:
+            state = self._jobs.get(name)
+            if state is not None:
+                return state.stats()
+            return next((stats for stats in reversed(self._recent_jobs) if stats["job"] == name), None)
+
+    def metrics(self) -> dict[str, Any]:
+        """The concurrency limit and its signals, plus queueing per running job."""
+        with self._lock:
+            waiting: dict[str, int] = {}
+            for *_, waiter in self._queue:
+                if not waiter.cancelled:
+                    waiting[waiter.job.name] = waiting.get(waiter.job.name, 0) + 1
+            jobs = [dict(state.stats(), waiting=waiting.get(name, 0)) for name, state in self._jobs.items()]
+            recent = list(self._recent_jobs)
+        return dict(self.limiter.metrics(), waiting=sum(waiting.values()), jobs=jobs, recent_jobs=recent)
+
+    def _grant_or_enqueue(self, work: float, wake: Callable[[], None]) -> Union[ConcurrencyPermit, _Waiter]:
+        """Take a free slot when nobody is queued, otherwise join the queue."""
+        state = _current_job.get() or self._jobs[DEFAULT_JOB]
+        now = self._clock()
+        with self._lock:
+            self._drop_cancelled_head()
+            priority = state.requested < self.priority_chunks
+            state.requested += 1
+            start_tag = max(self._virtual_time, state.finish_tag)
+            state.finish_tag = start_tag + max(work, 1.0) / state.weight
+            if not self._queue:
+                permit = self.limiter.try_acquire(work)
+                if permit is not None:
+                    self._virtual_time = start_tag
+                    self._record_wait(state, 0.0)
+                    return permit
+
+            waiter = _Waiter(state, work, now, start_tag, wake)
+            heapq.heappush(self._queue, (0 if priority else 1, start_tag, next(self._arrivals), waiter))
+        return waiter
+
+    def _dispatch(self) -> None:
+        """Hand free slots to queued calls in fair order."""
+        now = self._clock()
+        with self._lock:
+            while True:
+                self._drop_cancelled_head()
+                if not self._queue:
+                    return
+                permit = self.limiter.try_acquire(self._queue[0][3].work)
+                if permit is None:
+                    return
+                waiter = heapq.heappop(self._queue)[3]
+                waiter.permit = permit
+                try:
+                    waiter.wake()
+                except RuntimeError:  # The waiter's event loop has closed
+                    waiter.permit = None
+                    self.limiter.release(permit, adjust=False)
+                    continue
+                self._virtual_time = max(self._virtual_time, waiter.start_tag)
+                self._record_wait(waiter.job, now - waiter.enqueued)
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Take a queued call that stopped waiting out of the running."""
+        with self._lock:
+            waiter.cancelled = True
+            handed = waiter.permit
+        if handed is not None:
+            self.release(handed, adjust=False)  # Pass the slot it was just given to the next call
+
+    def _drop_cancelled_head(self) -> None:
+        """Discard cancelled calls at the front of the queue (lock held)."""
+        while self._queue and self._queue[0][3].cancelled:
+            heapq.heappop(self._queue)
+
+    @staticmethod
+    def _record_wait(state: _JobState, seconds: float) -> None:
+        """Count a granted call and its queue wait (lock held)."""
+        state.granted += 1
+        state.wait_seconds += seconds
+        state.max_wait_seconds = max(state.max_wait_seconds, seconds)
+
+
+def _resolve(ready: "asyncio.Future[None]") -> None:
+    """Complete a waiter future on its own loop."""
+    if not ready.done():
+        ready.set_result(None)
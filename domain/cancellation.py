@@ -0,0 +1,233 @@
+# domain/cancellation.py - Cooperative Job Cancellation
+"""Cancellation tokens for conversion jobs.
+A job's token is set for the duration of the job with cancellation_scope(); code anywhere
+below it (text pipeline, OCR loop, audio and timing engines, TTS providers) calls
+check_cancelled() between units of work, sleeps with cancellable_sleep() and starts
+subprocesses with run_subprocess(), which kills them as soon as the job is cancelled.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import subprocess
+import threading
+import time
+from typing import Any, Callable, Optional, Union
+
+
+class JobCancelledError(BaseException):
+    """Raised inside a job once its token has been cancelled.
+
+    Like asyncio.CancelledError it is a BaseException, so the many `except Exception`
+    fallbacks along the processing path do not turn a cancelled job into a failed
+    chunk that is then retried.
+    """
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class CancellationToken:
+    """Cancellation state of one job, shared by every thread working on it.
+
+    The token is cancelled explicitly with cancel() or implicitly once its deadline passes.
+    Callbacks registered with on_cancel() (e.g. killing a subprocess or cancelling a future)
+    run once, on the thread that cancels.
+    """
+
+    def __init__(self, deadline_seconds: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        """Initialize the token.
+
+        Args:
+            deadline_seconds: Cancel the job this long after the token is created (None or 0 = no deadline)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self._clock = clock
+        self.deadline = clock() + deadline_seconds if deadline_seconds else None
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._reason: Optional[str] = None
+        self._callbacks: dict[int, Callable[[], Any]] = {}
+        self._next_callback = 0
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the job has been cancelled (passing the deadline cancels it)."""
+        if not self._cancelled.is_set() and self.deadline is not None and self._clock() >= self.deadline:
+            self.cancel("deadline exceeded")
+        return self._cancelled.is_set()
+
+    @property
+    def reason(self) -> Optional[str]:
+        """Why the job was cancelled (None while it runs)."""
+        return self._reason
+
+    def remaining_seconds(self) -> Optional[float]:
+        """Seconds until the deadline (None without one)."""
+        return None if self.deadline is None else max(0.0, self.deadline - self._clock())
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """Cancel the job and run the registered callbacks; False if it was already cancelled."""
+        with self._lock:
+            if self._cancelled.is_set():
+                return False
+            self._reason = reason
+            self._cancelled.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        print(f"🛑 Job cancelled: {reason}")
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️ Cancellation callback failed: {e}")
+        return True
+
+    def raise_if_cancelled(self) -> None:
+        """Raise JobCancelledError if the job has been cancelled."""
+        if self.cancelled:
+            raise JobCancelledError(self._reason or "cancelled")
+
+    def on_cancel(self, callback: Callable[[], Any]) -> Callable[[], None]:
+        """Run callback when the job is cancelled (at once if it already is); returns an unregister function."""
+        with self._lock:
+            if not self._cancelled.is_set():
+                key = self._next_callback
+                self._next_callback += 1
+                self._callbacks[key] = callback
+
+                def unregister() -> None:
+                    with self._lock:
+                        self._callbacks.pop(key, None)
+
+                return unregister
+        callback()
+        return lambda: None
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep, waking early and raising JobCancelledError if the job is cancelled meanwhile."""
+        remaining = self.remaining_seconds()
+        if remaining is not None and remaining < seconds:
+            self._cancelled.wait(remaining)
+            self.raise_if_cancelled()  # Passing the deadline cancels the token here
+        self._cancelled.wait(seconds)
+        self.raise_if_cancelled()
+
+    def run_subprocess(
+        self, cmd: list[str], input: Optional[Union[str, bytes]] = None, timeout: Optional[float] = None, **kwargs: Any
+    ) -> "subprocess.CompletedProcess[Any]":
+        """subprocess.run() with captured output whose process is killed when the job is cancelled.
+
+        Raises:
+            JobCancelledError: When the job was cancelled (or passed its deadline) before the process finished
+            subprocess.TimeoutExpired: When the process itself outlived timeout
+        """
+        self.raise_if_cancelled()
+        remaining = self.remaining_seconds()
+        wait = timeout if remaining is None else remaining if timeout is None else min(timeout, remaining)
+
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            **kwargs,
+        )
+        unregister = self.on_cancel(process.kill)
+        try:
+            stdout, stderr = process.communicate(input, timeout=wait)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            self.raise_if_cancelled()
+            raise
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            unregister()
+
+        self.raise_if_cancelled()
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+
+# Token of the job running in the current context (set by cancellation_scope)
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar("job_cancellation", default=None)
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Make token the current job's token for code run in this context."""
+    context_token = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(context_token)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """The current job's token (None outside a job)."""
+    return _current_token.get()
+
+
+def check_cancelled() -> None:
+    """Raise JobCancelledError if the current job has been cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def cancellable_sleep(seconds: float) -> None:
+    """time.sleep() that the current job's cancellation interrupts."""
+    token = _current_token.get()
+    if token is None:
+        time.sleep(seconds)
+    else:
+        token.sleep(seconds)
+
+
+def run_subprocess(
+    cmd: list[str], input: Optional[Union[str, bytes]] = None, timeout: Optional[float] = None, **kwargs: Any
+) -> "subprocess.CompletedProcess[Any]":
+    """subprocess.run(capture_output=True) that the current job's cancellation kills."""
+    token = _current_token.get()
+    if token is None:
+        return subprocess.run(cmd, input=input, capture_output=True, timeout=timeout, **kwargs)
+    return token.run_subprocess(cmd, input=input, timeout=timeout, **kwargs)
+
+
+class CancellationRegistry:
+    """Tokens of running jobs by job id, so a job can be cancelled from another request."""
+
+    def __init__(self, deadline_seconds: Optional[float] = None):
+        self.deadline_seconds = deadline_seconds
+        self._lock = threading.Lock()
+        self._tokens: dict[str, CancellationToken] = {}
+
+    @contextmanager
+    def job(self, job_id: str) -> Iterator[CancellationToken]:
+        """Create the job's token, register it under job_id and make it current while the job runs."""
+        token = CancellationToken(self.deadline_seconds)
+        with self._lock:
+            self._tokens[job_id] = token
+        try:
+            with cancellation_scope(token):
+                yield token
+        finally:
+            with self._lock:
+                if self._tokens.get(job_id) is token:
+                    del self._tokens[job_id]
+
+    def cancel(self, job_id: str, reason: str = "cancelled by user") -> bool:
+        """Cancel a running job; False when no job with this id is running."""
+        with self._lock:
+            token = self._tokens.get(job_id)
+        return token is not None and token.cancel(reason)
+
+    def running_jobs(self) -> list[str]:
+        """Ids of the jobs currently running."""
+        with self._lock:
+            return list(self._tokens)
@@ -0,0 +1,99 @@
+# domain/container/event_loop.py - Shared Background Event Loop
+"""One long-lived asyncio event loop running in a daemon thread, owned by the service container.
+Sync callers (Flask handlers) submit coroutines to it, so every job shares one scheduler and the
+loop-bound limiters, semaphores and connection pools created on it.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+import concurrent.futures
+import threading
+from typing import Any, Optional, TypeVar
+
+from ..cancellation import JobCancelledError, current_token
+
+T = TypeVar("T")
+
+
+class BackgroundEventLoop:
+    """Event loop thread that runs coroutines submitted from any other thread.
+
+    The thread is started on first use and restarted if it has died; it is a daemon thread,
+    so it never keeps the process alive.
+    """
+
+    def __init__(self, name: str = "async-jobs"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, starting the thread if needed."""
+        with self._lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                self._start()
+            assert self._loop is not None
+            return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the loop and return a future for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop and block the calling thread until it finishes.
+
+        The coroutine is cancelled if the wait times out, the caller is interrupted or the
+        caller's job is cancelled.
+
+        Raises:
+            RuntimeError: When called from the loop thread itself, which would deadlock
+            JobCancelledError: When the caller's job was cancelled while the coroutine ran
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(f"BackgroundEventLoop.run() called from its own thread ({self.name})")
+
+        token = current_token()
+        future = self.submit(coro)
+        unregister = token.on_cancel(future.cancel) if token is not None else None
+        try:
+            return future.result(timeout)
+        except concurrent.futures.CancelledError:
+            if token is not None and token.cancelled:
+                raise JobCancelledError(token.reason or "cancelled") from None
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            if unregister is not None:
+                unregister()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the loop and wait for its thread to exit; a later submit starts a new one."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+    def _start(self) -> None:
+        """Create the loop and run it forever in a new daemon thread (caller holds the lock)."""
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run_forever() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run_forever, name=self.name, daemon=True)
+        self._loop = loop
+        self._thread.start()
+        ready.wait()
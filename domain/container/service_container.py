@@ -70,8 +70,15 @@ class ServiceContainer(IServiceContainer):
         """Build all core service factories upfront (immutable pattern)."""
         from domain.audio.audio_engine import AudioEngine, IAudioEngine
         from domain.audio.timing_engine import ITimingEngine, TimingEngine, TimingMode
+        from domain.audio.tts_scheduler import FairShareScheduler
+        from domain.cancellation import CancellationRegistry
+        from domain.container.event_loop import BackgroundEventLoop
+        from domain.document.admission_queue import JobAdmissionQueue
         from domain.text.text_pipeline import ITextPipeline, TextPipeline
+        from infrastructure.file.cleanup_scheduler import FileCleanupScheduler
         from infrastructure.file.file_manager import FileManager
+        from infrastructure.file.timing_store import TimingStore
+        from infrastructure.llm.circuit_breaker_llm_provider import CircuitBreakerLLMProvider
         from infrastructure.llm.gemini_llm_provider import GeminiLLMProvider
         from infrastructure.ocr.tesseract_ocr_provider import TesseractOCRProvider
 
@@ -79,15 +86,34 @@ class ServiceContainer(IServiceContainer):
         factories: dict[Union[type[Any], str], Callable[[], Any]] = {
             # File Manager
             FileManager: lambda: FileManager(
-                upload_folder=self.config.upload_folder, output_folder=self.config.audio_folder
+                upload_folder=self.config.upload_folder,
+                output_folder=self.config.audio_folder,
+                scratch_dir=self.config.scratch_dir or None,
             ),
+            # Expiry and disk-quota eviction of served outputs (None when cleanup is disabled)
+            FileCleanupScheduler: lambda: self._create_file_cleanup_scheduler(),
+            # Compact read-along timing files, parsed once per version
+            TimingStore: lambda: TimingStore(self.config.audio_folder),
+            # Shared event loop thread for all async work (one scheduler, one set of limiters/pools)
+            BackgroundEventLoop: lambda: BackgroundEventLoop(name="service-container"),
             # TTS Engine (factory method)
             "tts_engine": lambda: self._create_tts_engine(),
+            # Process-wide TTS scheduler shared by the audio and timing engines
+            FairShareScheduler: lambda: self._create_tts_scheduler(),
+            # Shortest-job-first admission of conversions (None when disabled)
+            JobAdmissionQueue: lambda: self._create_job_admission_queue(),
+            # Cancellation tokens of running conversions, by job id
+            CancellationRegistry: lambda: CancellationRegistry(
+                deadline_seconds=self.config.job_deadline_seconds or None
+            ),
             # Text Pipeline
             ITextPipeline: lambda: TextPipeline(
                 llm_provider=self.get(GeminiLLMProvider) if self.config.gemini_api_key else None,
                 enable_cleaning=self.config.enable_text_cleaning,
                 enable_natural_formatting=self.config.enable_natural_formatting,
+                llm_time_budget_seconds=self.config.llm_time_budget_seconds,
+                chunk_sizer=self._create_llm_chunk_sizer(),
+                sharded_processor=self._create_sharded_text_processor(),
             ),
             # Timing Engine
             ITimingEngine: lambda: TimingEngine(
@@ -96,6 +122,9 @@ class ServiceContainer(IServiceContainer):
                 text_pipeline=self.get(ITextPipeline),
                 mode=TimingMode.MEASUREMENT if self.config.gemini_use_measurement_mode else TimingMode.ESTIMATION,
                 measurement_interval=self.config.gemini_measurement_mode_interval,
+                enable_sentence_dedup=self.config.enable_sentence_dedup,
+                dedup_min_sentence_chars=self.config.sentence_dedup_min_chars,
+                scheduler=self.get(FairShareScheduler),
             ),
             # Audio Engine
             IAudioEngine: lambda: AudioEngine(
@@ -106,6 +135,16 @@ class ServiceContainer(IServiceContainer):
                 audio_target_chunk_size=self.config.audio_target_chunk_size,
                 audio_max_chunk_size=self.config.audio_max_chunk_size,
                 enable_async=self.config.enable_async_audio,
+                enable_sentence_dedup=self.config.enable_sentence_dedup,
+                dedup_min_sentence_chars=self.config.sentence_dedup_min_chars,
+                adaptive_concurrency=self.config.enable_adaptive_audio_concurrency,
+                retry_policy=self._create_chunk_retry_policy(),
+                chunk_journal=self._create_chunk_journal_store(),
+                event_loop=self.get(BackgroundEventLoop),
+                scheduler=self.get(FairShareScheduler),
+                chunking_service=self._create_audio_chunking_service(),
+                audio_memory_budget_bytes=self.config.audio_memory_budget_mb * 1024 * 1024,
+                audio_spill_dir=self.config.audio_spill_dir or None,
             ),
             # OCR Provider
             TesseractOCRProvider: lambda: TesseractOCRProvider(config=self.config),
@@ -115,12 +154,118 @@ class ServiceContainer(IServiceContainer):
         if self.config.gemini_api_key:
             api_key = self.config.gemini_api_key
             if api_key is not None:  # Type guard for mypy
-                factories[GeminiLLMProvider] = lambda: GeminiLLMProvider(
-                    model_name=self.config.gemini_model_name, api_key=api_key
+                factories[GeminiLLMProvider] = lambda: CircuitBreakerLLMProvider(
+                    GeminiLLMProvider(
+                        model_name=self.config.gemini_model_name,
+                        api_key=api_key,
+                        request_timeout_seconds=self.config.llm_request_timeout_seconds,
+                        base_url=self.config.llm_base_url,
+                    ),
+                    failure_threshold=self.config.llm_failure_threshold,
+                    latency_threshold_seconds=self.config.llm_latency_threshold_seconds,
+                    reset_timeout_seconds=self.config.llm_circuit_reset_seconds,
                 )
 
         return factories
 
+    def _create_llm_chunk_sizer(self) -> Any:
+        """Factory for the adaptive LLM chunk sizer (None when disabled or without an LLM)."""
+        from domain.text.llm_chunk_sizer import AdaptiveChunkSizer
+
+        if not self.config.gemini_api_key or not self.config.llm_adaptive_chunking:
+            return None
+        return AdaptiveChunkSizer(
+            model_name=self.config.gemini_model_name,
+            default_chunk_chars=self.config.llm_chunk_size,
+            state_file=self.config.llm_chunk_sizing_state_file,
+        )
+
+    def _create_tts_scheduler(self) -> Any:
+        """Factory for the fair-share TTS scheduler that all jobs and engines share."""
+        from domain.audio.tts_scheduler import FairShareScheduler, create_tts_limiter
+
+        limiter = create_tts_limiter(
+            self.get("tts_engine"),
+            self.config.audio_concurrent_chunks,
+            adaptive=self.config.enable_adaptive_audio_concurrency,
+        )
+        return FairShareScheduler(limiter, priority_chunks=self.config.tts_priority_chunks)
+
+    def _create_job_admission_queue(self) -> Any:
+        """Factory for the shortest-job-first conversion admission queue (None when disabled)."""
+        from domain.document.admission_queue import JobAdmissionQueue, PageThroughputModel
+
+        if not self.config.enable_job_admission:
+            return None
+        return JobAdmissionQueue(
+            PageThroughputModel(state_file=self.config.page_throughput_state_file),
+            max_concurrent_jobs=self.config.max_concurrent_jobs,
+            aging_rate=self.config.job_aging_rate,
+        )
+
+    def _create_file_cleanup_scheduler(self) -> Any:
+        """Factory for the output folder's cleanup scheduler (None when file cleanup is disabled)."""
+        from infrastructure.file.cleanup_scheduler import FileCleanupScheduler
+        from infrastructure.file.file_manager import FileManager
+
+        if not self.config.enable_file_cleanup:
+            return None
+        file_manager = self.get(FileManager)
+        scheduler = FileCleanupScheduler(
+            file_manager,
+            max_file_age_seconds=int(self.config.max_file_age_hours * 3600),
+            check_interval_seconds=int(self.config.auto_cleanup_interval_hours * 3600),
+            watch_dir=file_manager.get_output_dir(),
+            max_disk_usage_bytes=self.config.max_disk_usage_mb * 1024 * 1024,
+        )
+        # Outputs deleted through the FileManager (e.g. by /admin/cleanup) stop counting towards the quota
+        file_manager.add_deletion_listener(scheduler.untrack)
+        return scheduler
+
+    def _create_chunk_retry_policy(self) -> Any:
+        """Factory for the TTS chunk retry and hedging policy."""
+        from domain.audio.hedged_retry import ChunkRetryPolicy
+
+        return ChunkRetryPolicy(
+            max_attempts=self.config.audio_chunk_max_attempts,
+            backoff_seconds=self.config.audio_chunk_backoff_seconds,
+            deadline_seconds=self.config.audio_chunk_deadline_seconds,
+            hedge_percentile=self.config.audio_hedge_percentile,
+        )
+
+    def _create_chunk_journal_store(self) -> Any:
+        """Factory for the crash-safe TTS chunk journal (None when disabled)."""
+        from domain.audio.chunk_journal import ChunkJournalStore
+
+        if not self.config.enable_chunk_journal:
+            return None
+        return ChunkJournalStore(
+            root=self.config.chunk_journal_folder, max_age_hours=self.config.chunk_journal_max_age_hours
+        )
+
+    def _create_sharded_text_processor(self) -> Any:
+        """Factory for parallel processing of very large texts (None when disabled)."""
+        from domain.text.sharded_text import ShardedTextProcessor
+
+        if self.config.parallel_text_threshold_chars <= 0:
+            return None
+        return ShardedTextProcessor(
+            threshold_chars=self.config.parallel_text_threshold_chars, workers=self.config.parallel_text_workers
+        )
+
+    def _create_audio_chunking_service(self) -> Any:
+        """Factory for the TTS chunking service (balanced across workers unless disabled)."""
+        from domain.text.chunking_strategy import (
+            BalancedChunking,
+            ChunkingMode,
+            ChunkingService,
+            create_chunking_service,
+        )
+
+        if not self.config.enable_balanced_audio_chunking:
+            return create_chunking_service(ChunkingMode.SENTENCE_BASED)
+        return ChunkingService(BalancedChunking(first_chunk_size=self.config.audio_first_chunk_size))
+
     def _create_tts_engine(self) -> Any:
         """Factory for TTS engine based on configuration."""
         from infrastructure.tts.gemini_tts_provider import GeminiTTSProvider
@@ -0,0 +1,328 @@
+# domain/document/admission_queue.py - Shortest-Job-First Conversion Admission
+"""Admits document conversions a few at a time, shortest estimated job first.
+Each job's cost is estimated up front from its page count, how many of those pages need
+OCR, and the per-page throughput measured on earlier jobs. Waiting jobs age, so a big
+book is delayed by small ones that arrive after it, but never starved by them.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from ..cancellation import check_cancelled
+
+# How often a queued job checks whether it was cancelled while waiting for a slot
+CANCEL_POLL_SECONDS = 0.25
+
+
+@dataclass(frozen=True)
+class JobEstimate:
+    """Predicted cost of one conversion."""
+
+    pages: int
+    scanned_pages: int  # Pages without a text layer, which need OCR
+    seconds: float
+
+    @property
+    def text_pages(self) -> int:
+        """Pages with an extractable text layer."""
+        return self.pages - self.scanned_pages
+
+
+class PageThroughputModel:
+    """Seconds per text page and per scanned page, learned from finished conversions.
+
+    Jobs without scanned pages teach the text page rate; whatever a mixed job took beyond
+    its text pages' share is attributed to its scanned pages. Both rates are EWMAs and are
+    persisted as JSON so estimates survive restarts.
+    """
+
+    def __init__(
+        self,
+        state_file: Optional[str] = None,
+        text_page_seconds: float = 3.0,
+        scanned_page_seconds: float = 10.0,
+        ewma_alpha: float = 0.3,
+    ):
+        """Initialize the model.
+
+        Args:
+            state_file: JSON file for the learned rates (None keeps them in memory only)
+            text_page_seconds: Seconds per text page until a job has been measured
+            scanned_page_seconds: Seconds per scanned page until a job has been measured
+            ewma_alpha: Weight of the newest job in each rate
+        """
+        self.state_file = state_file
+        self.ewma_alpha = ewma_alpha
+        self._lock = threading.Lock()
+        self._rates = {"text": text_page_seconds, "scanned": scanned_page_seconds}
+        self._observed = {"text": 0, "scanned": 0}  # Jobs each rate was learned from
+        self._load()
+
+    def estimate(self, pages: int, scanned_pages: int = 0) -> JobEstimate:
+        """Predict how long a conversion of these pages takes."""
+        pages = max(0, pages)
+        scanned_pages = min(max(0, scanned_pages), pages)
+        with self._lock:
+            seconds = (pages - scanned_pages) * self._rates["text"] + scanned_pages * self._rates["scanned"]
+        return JobEstimate(pages=pages, scanned_pages=scanned_pages, seconds=seconds)
+
+    def record(self, estimate: JobEstimate, seconds: float) -> None:
+        """Fold a finished job's measured duration into the rates and persist them."""
+        if estimate.pages <= 0 or seconds <= 0:
+            return
+        with self._lock:
+            if estimate.scanned_pages == 0:
+                self._update("text", seconds / estimate.pages)
+            else:
+                text_share = estimate.text_pages * self._rates["text"]
+                per_scanned_page = max(seconds - text_share, 0.0) / estimate.scanned_pages
+                self._update("scanned", max(per_scanned_page, self._rates["text"]))
+        self._save()
+
+    def rates(self) -> dict[str, Any]:
+        """Current per-page rates and how many jobs they were learned from."""
+        with self._lock:
+            return {
+                "text_page_seconds": round(self._rates["text"], 3),
+                "scanned_page_seconds": round(self._rates["scanned"], 3),
+                "text_jobs_observed": self._observed["text"],
+                "scanned_jobs_observed": self._observed["scanned"],
+            }
+
+    def _update(self, kind: str, seconds_per_page: float) -> None:
+        """Move one rate towards a new observation (lock held); the first observation replaces the default."""
+        if self._observed[kind] == 0:
+            self._rates[kind] = seconds_per_page
+        else:
+            self._rates[kind] += self.ewma_alpha * (seconds_per_page - self._rates[kind])
+        self._observed[kind] += 1
+
+    def _load(self) -> None:
+        """Load learned rates from the JSON file, if present."""
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, encoding="utf-8") as f:
+                state = json.load(f)
+            self._rates = {
+                "text": float(state.get("text_page_seconds", self._rates["text"])),
+                "scanned": float(state.get("scanned_page_seconds", self._rates["scanned"])),
+            }
+            self._observed = {
+                "text": int(state.get("text_jobs_observed", 0)),
+                "scanned": int(state.get("scanned_jobs_observed", 0)),
+            }
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"⚠️ Could not load page throughput state: {e}")
+
+    def _save(self) -> None:
+        """Write the learned rates to the JSON file atomically."""
+        if not self.state_file:
+            return
+        state = dict(self.rates(), version=1)
+        try:
+            directory = os.path.dirname(os.path.abspath(self.state_file))
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(temp_path, self.state_file)
+        except OSError as e:
+            print(f"⚠️ Could not save page throughput state: {e}")
+
+
+@dataclass(eq=False)
+class AdmissionTicket:
+    """One job's place in the admission queue."""
+
+    name: str
+    estimate: JobEstimate
+    arrived: float
+    queue_position: int  # Queued jobs ahead of this one on arrival
+    eta_seconds: float  # Predicted seconds from arrival until the job finishes
+    admitted: Optional[float] = None
+    success: bool = True  # Set False for failed jobs so they do not skew the throughput model
+    cancelled: bool = False
+    _ready: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def running_seconds(self, now: float) -> float:
+        """Seconds since the job was admitted (0 while it waits)."""
+        return now - self.admitted if self.admitted is not None else 0.0
+
+    def to_debug_info(self) -> dict[str, Any]:
+        """Estimate, predicted ETA and actual queue wait of the job."""
+        return {
+            "pages": self.estimate.pages,
+            "scanned_pages": self.estimate.scanned_pages,
+            "estimated_seconds": round(self.estimate.seconds, 1),
+            "queue_position": self.queue_position,
+            "eta_seconds": round(self.eta_seconds, 1),
+            "queue_wait_seconds": round(self.admitted - self.arrived, 3) if self.admitted is not None else None,
+        }
+
+
+class JobAdmissionQueue:
+    """Runs at most max_concurrent_jobs conversions at once; the rest wait, shortest first.
+
+    A waiting job's priority is its estimated seconds minus aging_rate times the seconds it
+    has waited. All waiting jobs age at the same rate, so their order only depends on
+    estimate + aging_rate * arrival time and a heap keyed on that stays correct: a later job
+    overtakes an earlier one only when it is estimated to be shorter by more than aging_rate
+    times the gap between their arrivals. aging_rate=0 is pure shortest-job-first; a very
+    large aging_rate is first come, first served.
+    """
+
+    def __init__(
+        self,
+        throughput: PageThroughputModel,
+        max_concurrent_jobs: int = 2,
+        aging_rate: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.throughput = throughput
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
+        self.aging_rate = max(0.0, aging_rate)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._waiting: list[tuple[float, int, AdmissionTicket]] = []  # (priority key, arrival, ticket)
+        self._arrivals = itertools.count()
+        self._running: list[AdmissionTicket] = []
+        self._completed = 0
+
+    def estimate(self, pages: int, scanned_pages: int = 0) -> JobEstimate:
+        """Predict the cost of a conversion from its page mix."""
+        return self.throughput.estimate(pages, scanned_pages)
+
+    def eta(self, estimate: JobEstimate) -> dict[str, Any]:
+        """Where a job with this estimate would queue if it arrived now, and when it would finish."""
+        with self._lock:
+            position, start = self._predict_start(self._priority(estimate, self._clock()))
+        return {
+            "estimated_seconds": round(estimate.seconds, 1),
+            "queue_position": position,
+            "wait_seconds": round(start, 1),
+            "eta_seconds": round(start + estimate.seconds, 1),
+        }
+
+    @contextmanager
+    def admit(self, name: str, estimate: JobEstimate) -> Iterator[AdmissionTicket]:
+        """Block until it is this job's turn, then hold one of the job slots while it runs.
+
+        A job that finishes normally with ticket.success still True teaches the throughput model.
+        A job cancelled while it waits leaves the queue with JobCancelledError.
+        """
+        ticket = self._enqueue(name, estimate)
+        try:
+            while not ticket._ready.wait(CANCEL_POLL_SECONDS):
+                check_cancelled()
+            check_cancelled()
+        except BaseException:
+            self._abandon(ticket)
+            raise
+
+        try:
+            yield ticket
+        finally:
+            elapsed = ticket.running_seconds(self._clock())
+            self._finish(ticket)
+        if ticket.success:
+            self.throughput.record(estimate, elapsed)
+
+    def metrics(self) -> dict[str, Any]:
+        """Running and waiting jobs, in admission order, plus the learned throughput."""
+        now = self._clock()
+        with self._lock:
+            running = [
+                {
+                    "job": t.name,
+                    "estimated_seconds": round(t.estimate.seconds, 1),
+                    "running_seconds": round(t.running_seconds(now), 1),
+                }
+                for t in self._running
+            ]
+            waiting = [
+                {
+                    "job": t.name,
+                    "estimated_seconds": round(t.estimate.seconds, 1),
+                    "waiting_seconds": round(now - t.arrived, 1),
+                }
+                for _, _, t in sorted(self._waiting)
+                if not t.cancelled
+            ]
+            completed = self._completed
+        return {
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+            "aging_rate": self.aging_rate,
+            "running": running,
+            "waiting": waiting,
+            "completed": completed,
+            "throughput": self.throughput.rates(),
+        }
+
+    def _priority(self, estimate: JobEstimate, arrived: float) -> float:
+        """Static heap key equivalent to estimate minus aging_rate times time waited."""
+        return estimate.seconds + self.aging_rate * arrived
+
+    def _enqueue(self, name: str, estimate: JobEstimate) -> AdmissionTicket:
+        """Admit the job at once if a slot is free and nobody waits, otherwise queue it."""
+        now = self._clock()
+        key = self._priority(estimate, now)
+        with self._lock:
+            position, start = self._predict_start(key)
+            ticket = AdmissionTicket(name, estimate, now, position, start + estimate.seconds)
+            heapq.heappush(self._waiting, (key, next(self._arrivals), ticket))
+            self._dispatch()
+            queued = ticket.admitted is None
+        if queued:
+            print(f"⏳ Job '{name}' queued ({position} job(s) ahead), ETA {ticket.eta_seconds:.0f}s")
+        return ticket
+
+    def _predict_start(self, key: float) -> tuple[int, float]:
+        """Jobs ahead of a job with this priority and the seconds until it would start (lock held).
+
+        Running jobs free their slots after their remaining estimated time; queued jobs ahead
+        of this one then take the earliest free slot in turn.
+        """
+        now = self._clock()
+        free_at = [max(0.0, t.estimate.seconds - t.running_seconds(now)) for t in self._running]
+        free_at += [0.0] * (self.max_concurrent_jobs - len(free_at))
+        heapq.heapify(free_at)
+        ahead = sorted(entry for entry in self._waiting if entry[0] <= key and not entry[2].cancelled)
+        for _, _, ticket in ahead:
+            heapq.heappush(free_at, heapq.heappop(free_at) + ticket.estimate.seconds)
+        return len(ahead), free_at[0]
+
+    def _dispatch(self) -> None:
+        """Admit waiting jobs in priority order while job slots are free (lock held)."""
+        while self._waiting and len(self._running) < self.max_concurrent_jobs:
+            ticket = heapq.heappop(self._waiting)[2]
+            if ticket.cancelled:
+                continue
+            ticket.admitted = self._clock()
+            self._running.append(ticket)
+            ticket._ready.set()
+
+    def _finish(self, ticket: AdmissionTicket) -> None:
+        """Free the job's slot for the next waiting job."""
+        with self._lock:
+            if ticket in self._running:
+                self._running.remove(ticket)
+                self._completed += 1
+            self._dispatch()
+
+    def _abandon(self, ticket: AdmissionTicket) -> None:
+        """Withdraw a job whose caller stopped waiting, passing on a slot it may just have been given."""
+        with self._lock:
+            ticket.cancelled = True
+            if ticket in self._running:
+                self._running.remove(ticket)
+            self._dispatch()
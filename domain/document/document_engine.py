@@ -6,13 +6,19 @@ Replaces: PDFProcessingService, complex text extraction logic.
 from abc import ABC, abstractmethod
 import io
 import os
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import pdfplumber
 
+from ..cancellation import check_cancelled
 from ..errors import audio_generation_error, text_extraction_error
 from ..interfaces import IFileManager, IOCRProvider
 from ..models import PageRange, PDFInfo, ProcessingRequest, ProcessingResult
+from ..text.chunk_planner import pack_pieces
+from ..text.page_artifact_stripper import PageArtifactStripper
+from ..text.sentence_tokenizer import split_sentences
+from ..text.text_artifact import TextArtifact, TransformCostMeter
+from ..text.text_quality_scorer import TextQualityScorer
 
 if TYPE_CHECKING:
     from ..audio.audio_engine import IAudioEngine
@@ -52,10 +58,19 @@ class DocumentEngine(IDocumentEngine):
     Low coupling: Depends only on abstractions (IOCRProvider, IFileManager).
     """
 
-    def __init__(self, ocr_provider: IOCRProvider, file_manager: IFileManager, min_text_threshold: int = 100):
+    def __init__(
+        self,
+        ocr_provider: IOCRProvider,
+        file_manager: IFileManager,
+        min_text_threshold: int = 100,
+        artifact_stripper: Optional[PageArtifactStripper] = None,
+        quality_scorer: Optional[TextQualityScorer] = None,
+    ):
         self.ocr_provider = ocr_provider
         self.file_manager = file_manager
         self.min_text_threshold = min_text_threshold
+        self.artifact_stripper = artifact_stripper  # None disables local header/footer stripping
+        self.quality_scorer = quality_scorer  # None sends every page to LLM cleaning
         print("DocumentEngine initialized and ready.")
 
     def get_pdf_info(self, pdf_path: str) -> PDFInfo:
@@ -66,6 +81,32 @@ class DocumentEngine(IDocumentEngine):
         """Validate page range - delegates to OCR provider."""
         return self.ocr_provider.validate_range(pdf_path, page_range)
 
+    def estimate_page_mix(self, pdf_path: str, page_range: PageRange, sample_pages: int = 20) -> tuple[int, int]:
+        """Count the pages a job will process and estimate how many of them are scanned.
+
+        A page is scanned when its text layer has fewer than min_text_threshold characters (so
+        extract_text will OCR it). Only up to sample_pages evenly spaced pages are inspected and
+        the scanned fraction is scaled to the whole range.
+
+        Returns:
+            (pages to process, estimated scanned pages); (0, 0) for an invalid range
+        """
+        validation = self.validate_page_range(pdf_path, page_range)
+        if not validation.get("valid", False):
+            return 0, 0
+        pages = int(validation["pages_to_process"])
+        first = int(validation["actual_start"]) - 1
+        step = pages / min(pages, max(1, sample_pages))
+        indices = sorted({first + int(i * step) for i in range(min(pages, max(1, sample_pages)))})
+
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                scanned = sum(1 for i in indices if len(pdf.pages[i].chars) < self.min_text_threshold)
+        except Exception as e:
+            print(f"DocumentEngine: Could not classify pages of {pdf_path}: {e}")
+            return pages, 0
+        return pages, round(scanned * pages / len(indices))
+
     def extract_text(self, pdf_path: str, pages: Optional[list[int]] = None) -> list[str]:
         """Extract text from PDF with intelligent OCR fallback.
         Uses direct text extraction first, falls back to OCR for poor quality pages.
@@ -79,6 +120,7 @@ class DocumentEngine(IDocumentEngine):
                 for i in page_indices:
                     if i >= len(pdf.pages):
                         continue
+                    check_cancelled()  # OCR makes every page worth checking
 
                     page = pdf.pages[i]
                     text = self._extract_page_text(page, i + 1)
@@ -112,6 +154,22 @@ class DocumentEngine(IDocumentEngine):
         Returns:
             ProcessingResult with success/failure and audio files
         """
+        # Text transformation work of this job, including stages run or skipped by the audio engines
+        with text_pipeline.track_transform_costs() as transform_costs:
+            return self._process_document(
+                request, audio_engine, text_pipeline, enable_timing, llm_chunk_size, transform_costs
+            )
+
+    def _process_document(
+        self,
+        request: ProcessingRequest,
+        audio_engine: "IAudioEngine",
+        text_pipeline: "ITextPipeline",
+        enable_timing: bool,
+        llm_chunk_size: int,
+        transform_costs: TransformCostMeter,
+    ) -> ProcessingResult:
+        """Run the processing workflow while transform_costs counts text transformations."""
         try:
             print(f"DocumentEngine: Starting processing for {request.pdf_path}")
 
@@ -131,26 +189,53 @@ class DocumentEngine(IDocumentEngine):
             # Combine chunks for efficient LLM processing, then re-chunk for TTS
             print(f"🔬 DocumentEngine: Using optimized chunking strategy (LLM chunk size: {llm_chunk_size})")
 
-            # Step 3a: Combine chunks for LLM processing
-            combined_chunks = self._combine_chunks_for_llm(text_chunks, llm_chunk_size)
-            print(f"   → Combined {len(text_chunks)} original chunks into {len(combined_chunks)} LLM chunks")
-
-            # Step 3b: Process through LLM cleaning
-            cleaned_chunks = []
-            for i, combined_chunk in enumerate(combined_chunks, 1):
+            # Step 3a: Strip page furniture locally so it never reaches the LLM
+            artifact_debug: dict[str, int] = {}
+            if self.artifact_stripper:
+                strip_result = self.artifact_stripper.strip(text_chunks)
+                artifact_debug = strip_result.to_debug_info()
                 print(
-                    f"🔬 DocumentEngine: Processing LLM chunk {i}/{len(combined_chunks)} ({len(combined_chunk)} chars)"
+                    f"   → Stripped page artifacts locally: {strip_result.chars_removed} chars "
+                    f"({strip_result.headers_removed} headers, {strip_result.footers_removed} footers, "
+                    f"{strip_result.page_numbers_removed} page numbers, "
+                    f"{strip_result.reference_markers_removed} reference markers)"
                 )
-                print(f"   Combined text preview: '{combined_chunk[:100]}...'")
+                if strip_result.pages:
+                    text_chunks = strip_result.pages
+
+            # Step 3b: Score pages locally; only low-quality runs of pages go to the LLM
+            page_runs, routing_debug = self._route_pages_by_quality(text_chunks)
 
-                # Clean the text using LLM
-                print("   → Calling text_pipeline.clean_text()...")
-                cleaned = text_pipeline.clean_text(combined_chunk)
-                print(f"   → Cleaned text ({len(cleaned)} chars): '{cleaned[:100]}...'")
+            # Step 3c: Size LLM chunks from learned latency/failure data (DocumentEngine cleans sequentially)
+            llm_bound_chars = sum(len(page) for needs_llm, run_pages in page_runs if needs_llm for page in run_pages)
+            llm_chunk_size = text_pipeline.recommend_llm_chunk_size(llm_bound_chars, llm_chunk_size, concurrency=1)
 
-                cleaned_chunks.append(cleaned)
+            # Step 3d: Combine LLM-bound runs into LLM chunks and clean (one LLM time budget per job)
+            llm_budget = text_pipeline.create_llm_budget()
+            cleaned_chunks = []
+            llm_chunk_count = 0
+            for needs_llm, run_pages in page_runs:
+                if not needs_llm:
+                    print(f"🔬 DocumentEngine: {len(run_pages)} clean page(s) → local cleanup (LLM skipped)")
+                    cleaned_chunks.append(text_pipeline.clean_text_locally("\n".join(run_pages)))
+                    continue
+
+                combined_chunks = self._combine_chunks_for_llm(run_pages, llm_chunk_size)
+                print(f"   → Combined {len(run_pages)} original chunks into {len(combined_chunks)} LLM chunks")
+
+                for combined_chunk in combined_chunks:
+                    llm_chunk_count += 1
+                    print(f"🔬 DocumentEngine: Processing LLM chunk {llm_chunk_count} ({len(combined_chunk)} chars)")
+                    print(f"   Combined text preview: '{combined_chunk[:100]}...'")
+
+                    # Clean the text using LLM
+                    print("   → Calling text_pipeline.clean_text()...")
+                    cleaned = text_pipeline.clean_text(combined_chunk, llm_budget)
+                    print(f"   → Cleaned text ({len(cleaned)} chars): '{cleaned[:100]}...'")
+
+                    cleaned_chunks.append(cleaned)
 
-            # Step 3c: Re-combine all cleaned text and enhance with natural formatting
+            # Step 3e: Re-combine all cleaned text and enhance with natural formatting
             all_cleaned_text = " ".join(cleaned_chunks)
             print(f"   → Combined all cleaned text: {len(all_cleaned_text)} chars total")
 
@@ -158,16 +243,17 @@ class DocumentEngine(IDocumentEngine):
             enhanced_text = text_pipeline.enhance_with_natural_formatting(all_cleaned_text)
             print(f"   → Enhanced text ({len(enhanced_text)} chars): '{enhanced_text[:100]}...'")
 
-            # Step 3d: Split enhanced text back into optimal chunks for TTS
-            processed_chunks = self._split_for_tts(enhanced_text)
+            # Step 3f: Split enhanced text back into optimal chunks for TTS
+            processed_chunks = self._split_for_tts(enhanced_text, splitter=text_pipeline.split_into_tts_sentences)
             print(f"   → Split enhanced text into {len(processed_chunks)} TTS-optimized chunks")
 
             print(
                 f"DocumentEngine: Processed through optimized pipeline: "
-                f"{len(text_chunks)} → {len(combined_chunks)} → {len(processed_chunks)} chunks"
+                f"{len(text_chunks)} → {llm_chunk_count} LLM → {len(processed_chunks)} chunks"
             )
 
             # 4. Generate audio - choose appropriate method based on timing requirement
+            check_cancelled()
             if enable_timing:
                 print("DocumentEngine: Using timing-aware audio generation")
                 timed_result = audio_engine.generate_with_timing(processed_chunks, request.output_name)
@@ -180,6 +266,11 @@ class DocumentEngine(IDocumentEngine):
                 print(f"🔍 DEBUG: timed_result.audio_files={timed_result.audio_files}")
 
             if not timed_result or not timed_result.audio_files:
+                missing = (timed_result.debug_info or {}).get("missing_chunks") if timed_result else None
+                if missing:
+                    return ProcessingResult.failure_result(
+                        audio_generation_error(f"Audio generation failed for chunk(s) {missing} after retries")
+                    )
                 return ProcessingResult.failure_result(
                     audio_generation_error("Audio generation failed to produce files")
                 )
@@ -194,6 +285,13 @@ class DocumentEngine(IDocumentEngine):
                     "processed_chunks_count": len(processed_chunks),
                     "audio_files_count": len(timed_result.audio_files),
                     "timing_data_available": timed_result.timing_data is not None,
+                    "artifact_stripping": artifact_debug,
+                    "quality_routing": routing_debug,
+                    "llm_chunk_size": llm_chunk_size,
+                    "text_transforms": transform_costs.to_debug_info(),
+                    "sentence_dedup": (timed_result.debug_info or {}).get("sentence_dedup"),
+                    "tts_concurrency": (timed_result.debug_info or {}).get("tts_concurrency"),
+                    "resumed_chunks": (timed_result.debug_info or {}).get("resumed_chunks", 0),
                 },
             )
 
@@ -268,6 +366,34 @@ class DocumentEngine(IDocumentEngine):
                     # Ignore file cleanup errors - temporary files may already be removed
                     pass
 
+    def _route_pages_by_quality(self, pages: list[str]) -> tuple[list[tuple[bool, list[str]]], dict[str, Any]]:
+        """Group consecutive pages into runs that either need LLM cleaning or not.
+
+        Returns:
+            Runs of (needs_llm, pages) in document order, plus routing details for debug_info
+        """
+        if not self.quality_scorer or not pages:
+            return [(True, pages)], {}
+
+        scores = [self.quality_scorer.score(page).score for page in pages]
+        runs: list[tuple[bool, list[str]]] = []
+        for page, page_score in zip(pages, scores):
+            needs_llm = page_score < self.quality_scorer.threshold
+            if runs and runs[-1][0] == needs_llm:
+                runs[-1][1].append(page)
+            else:
+                runs.append((needs_llm, [page]))
+
+        llm_pages = sum(len(run_pages) for needs_llm, run_pages in runs if needs_llm)
+        print(f"   → Quality routing: {llm_pages}/{len(pages)} pages need LLM cleaning")
+
+        return runs, {
+            "threshold": self.quality_scorer.threshold,
+            "llm_pages": llm_pages,
+            "local_pages": len(pages) - llm_pages,
+            "page_scores": [round(page_score, 3) for page_score in scores],
+        }
+
     def _combine_chunks_for_llm(self, text_chunks: list[str], llm_chunk_size: int) -> list[str]:
         """Combine small PDF chunks into larger chunks optimal for LLM processing.
 
@@ -281,79 +407,32 @@ class DocumentEngine(IDocumentEngine):
         if not text_chunks:
             return []
 
-        combined_chunks = []
-        current_chunk = ""
-
-        for chunk in text_chunks:
-            # Check if adding this chunk would exceed the target size
-            if current_chunk and len(current_chunk) + len(chunk) + 1 > llm_chunk_size:
-                # Current chunk is full, start a new one
-                combined_chunks.append(current_chunk.strip())
-                current_chunk = chunk
-            else:
-                # Add to current chunk
-                if current_chunk:
-                    current_chunk += " " + chunk
-                else:
-                    current_chunk = chunk
-
-        # Add the final chunk if it has content
-        if current_chunk.strip():
-            combined_chunks.append(current_chunk.strip())
+        # Greedy packing over page lengths; each combined chunk is joined once
+        combined_chunks = [chunk.strip() for chunk in pack_pieces(text_chunks, llm_chunk_size)]
+        return [chunk for chunk in combined_chunks if chunk]
 
-        return combined_chunks
-
-    def _split_for_tts(self, text: str, target_chunk_size: int = 4000) -> list[str]:
+    def _split_for_tts(
+        self, text: str, target_chunk_size: int = 4000, splitter: Callable[[str], list[str]] = split_sentences
+    ) -> list[str]:
         """Split enhanced text into chunks optimal for TTS processing.
 
         Args:
-            text: Enhanced text with SSML markup
+            text: Enhanced text with natural formatting
             target_chunk_size: Target size for TTS chunks
+            splitter: Sentence splitter (the text pipeline's shards very large text across processes)
 
         Returns:
-            List of chunks optimized for TTS processing
+            List of chunks optimized for TTS processing, carrying the stage record of text
+            (so the timing engine does not format them a second time)
         """
         if not text:
             return []
 
-        # Simple sentence-based splitting that handles SSML markup
-        import re
-
-        # If splitting fails, fall back to simple character-based chunking
-        # Split on sentence boundaries, being careful with SSML tags
-        sentences = re.split(r"([.!?]+(?:\s*(?:<[^>]*>)?\s*))", text)
-
-        # Rejoin sentences with their delimiters
-        sentence_list = []
-        for i in range(0, len(sentences) - 1, 2):
-            sentence = sentences[i]
-            if i + 1 < len(sentences):
-                sentence += sentences[i + 1]
-            sentence_list.append(sentence.strip())
+        # Sentence boundaries from the shared tokenizer (text carries natural formatting, no markup)
+        sentence_list = splitter(text)
 
         # Combine sentences into chunks of target size
-        chunks = []
-        current_chunk = ""
-
-        for sentence in sentence_list:
-            if not sentence:
-                continue
-
-            # Check if adding this sentence would exceed target size
-            if current_chunk and len(current_chunk) + len(sentence) + 1 > target_chunk_size:
-                # Current chunk is full, start a new one
-                chunks.append(current_chunk.strip())
-                current_chunk = sentence
-            else:
-                # Add to current chunk
-                if current_chunk:
-                    current_chunk += " " + sentence
-                else:
-                    current_chunk = sentence
-
-        # Add the final chunk if it has content
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        chunks = pack_pieces(sentence_list, target_chunk_size)
 
         # Fallback: if no chunks created, split by character count
         if not chunks and text.strip():
@@ -363,4 +442,5 @@ class DocumentEngine(IDocumentEngine):
                 if chunk.strip():
                     chunks.append(chunk.strip())
 
-        return chunks
+        # Chunks are cut from text, so they have been through the same stages
+        return [text.derive(chunk) for chunk in chunks] if isinstance(text, TextArtifact) else chunks
@@ -112,6 +112,19 @@ def llm_provider_error(details: Optional[str] = None) -> ApplicationError:
     )
 
 
+LLM_UNAVAILABLE_MESSAGE = "LLM provider unavailable"
+
+
+def llm_unavailable_error(details: Optional[str] = None) -> ApplicationError:
+    """LLM provider error for a call that never reached the model (circuit open, no client)."""
+    return ApplicationError(
+        code=ErrorCode.LLM_PROVIDER_ERROR,
+        message=LLM_UNAVAILABLE_MESSAGE,
+        details=details,
+        retryable=True,
+    )
+
+
 def invalid_page_range_error(details: str) -> ApplicationError:
     return ApplicationError(
         code=ErrorCode.INVALID_PAGE_RANGE, message="Invalid page range", details=details, retryable=False
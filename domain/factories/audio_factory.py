@@ -3,27 +3,44 @@
 Separated from the monolithic service_factory.py for better maintainability.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from application.config.system_config import SystemConfig
     from domain.audio.audio_engine import IAudioEngine
     from domain.audio.timing_engine import ITimingEngine
+    from domain.audio.tts_scheduler import FairShareScheduler
+    from domain.container.event_loop import BackgroundEventLoop
     from domain.interfaces import ITTSEngine
     from domain.text.text_pipeline import ITextPipeline
     from infrastructure.file.file_manager import FileManager
 
 
 def create_audio_engine(
-    config: "SystemConfig", tts_engine: "ITTSEngine", file_manager: "FileManager", timing_engine: "ITimingEngine"
+    config: "SystemConfig",
+    tts_engine: "ITTSEngine",
+    file_manager: "FileManager",
+    timing_engine: "ITimingEngine",
+    event_loop: Optional["BackgroundEventLoop"] = None,
+    scheduler: Optional["FairShareScheduler"] = None,
 ) -> "IAudioEngine":
-    """Create audio engine with chunking service."""
+    """Create audio engine with chunking service, running its async work on event_loop."""
     from domain.audio.audio_engine import AudioEngine
-    from domain.text.chunking_strategy import ChunkingMode, create_chunking_service
+    from domain.audio.chunk_journal import ChunkJournalStore
+    from domain.audio.hedged_retry import ChunkRetryPolicy
+    from domain.text.chunking_strategy import BalancedChunking, ChunkingMode, ChunkingService, create_chunking_service
 
     # Create chunking service based on configuration
-    chunking_mode = ChunkingMode.SENTENCE_BASED  # Could be configurable
-    chunking_service = create_chunking_service(chunking_mode)
+    if config.enable_balanced_audio_chunking:
+        chunking_service = ChunkingService(BalancedChunking(first_chunk_size=config.audio_first_chunk_size))
+    else:
+        chunking_service = create_chunking_service(ChunkingMode.SENTENCE_BASED)
+
+    chunk_journal = None
+    if config.enable_chunk_journal:
+        chunk_journal = ChunkJournalStore(
+            root=config.chunk_journal_folder, max_age_hours=config.chunk_journal_max_age_hours
+        )
 
     print("🔍 AudioFactory: Creating AudioEngine with chunk sizes:")
     print(f"  - audio_target_chunk_size: {config.audio_target_chunk_size}")
@@ -36,12 +53,41 @@ def create_audio_engine(
         max_concurrent=config.audio_concurrent_chunks,
         audio_target_chunk_size=config.audio_target_chunk_size,
         audio_max_chunk_size=config.audio_max_chunk_size,
+        enable_async=config.enable_async_audio,
+        enable_sentence_dedup=config.enable_sentence_dedup,
+        dedup_min_sentence_chars=config.sentence_dedup_min_chars,
+        adaptive_concurrency=config.enable_adaptive_audio_concurrency,
+        retry_policy=ChunkRetryPolicy(
+            max_attempts=config.audio_chunk_max_attempts,
+            backoff_seconds=config.audio_chunk_backoff_seconds,
+            deadline_seconds=config.audio_chunk_deadline_seconds,
+            hedge_percentile=config.audio_hedge_percentile,
+        ),
+        chunk_journal=chunk_journal,
+        event_loop=event_loop,
+        scheduler=scheduler,
         chunking_service=chunking_service,
+        audio_memory_budget_bytes=config.audio_memory_budget_mb * 1024 * 1024,
+        audio_spill_dir=config.audio_spill_dir or None,
+    )
+
+
+def create_tts_scheduler(config: "SystemConfig", tts_engine: "ITTSEngine") -> "FairShareScheduler":
+    """Create the process-wide TTS scheduler shared by the audio and timing engines."""
+    from domain.audio.tts_scheduler import FairShareScheduler, create_tts_limiter
+
+    limiter = create_tts_limiter(
+        tts_engine, config.audio_concurrent_chunks, adaptive=config.enable_adaptive_audio_concurrency
     )
+    return FairShareScheduler(limiter, priority_chunks=config.tts_priority_chunks)
 
 
 def create_timing_engine(
-    config: "SystemConfig", tts_engine: "ITTSEngine", file_manager: "FileManager", text_pipeline: "ITextPipeline"
+    config: "SystemConfig",
+    tts_engine: "ITTSEngine",
+    file_manager: "FileManager",
+    text_pipeline: "ITextPipeline",
+    scheduler: Optional["FairShareScheduler"] = None,
 ) -> "ITimingEngine":
     """Create timing engine with appropriate mode."""
     from domain.audio.timing_engine import TimingEngine, TimingMode
@@ -56,4 +102,7 @@ def create_timing_engine(
         text_pipeline=text_pipeline,
         mode=mode,
         measurement_interval=config.gemini_measurement_mode_interval,
+        enable_sentence_dedup=config.enable_sentence_dedup,
+        dedup_min_sentence_chars=config.sentence_dedup_min_chars,
+        scheduler=scheduler,
     )
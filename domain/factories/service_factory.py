@@ -7,12 +7,16 @@ from typing import Any
 
 from application.config.system_config import SystemConfig
 from domain.audio.audio_engine import IAudioEngine
+from domain.audio.tts_scheduler import FairShareScheduler
+from domain.container.event_loop import BackgroundEventLoop
 from domain.container.service_container import ServiceContainer, create_service_container_builder
 from domain.document.document_engine import DocumentEngine, IDocumentEngine
+from domain.text.page_artifact_stripper import PageArtifactStripper
+from domain.text.text_quality_scorer import TextQualityScorer
 from infrastructure.file.file_manager import FileManager
 from infrastructure.ocr.tesseract_ocr_provider import TesseractOCRProvider
 
-from .audio_factory import create_audio_engine, create_timing_engine
+from .audio_factory import create_audio_engine, create_timing_engine, create_tts_scheduler
 from .text_factory import create_text_pipeline
 from .tts_factory import create_tts_engine
 
@@ -20,42 +24,63 @@ from .tts_factory import create_tts_engine
 def create_complete_audio_engine(config: SystemConfig) -> IAudioEngine:
     """Create audio engine with all dependencies using focused factories."""
     # Create dependencies in order
-    file_manager = FileManager(upload_folder=config.upload_folder, output_folder=config.audio_folder)
+    file_manager = FileManager(
+        upload_folder=config.upload_folder, output_folder=config.audio_folder, scratch_dir=config.scratch_dir or None
+    )
 
     # Create TTS engine and text pipeline (no dependency order required)
     tts_engine = create_tts_engine(config)
     text_pipeline = create_text_pipeline(config)
 
-    # Create timing engine with all dependencies
-    timing_engine = create_timing_engine(config, tts_engine, file_manager, text_pipeline)
+    # Create timing engine with all dependencies (sharing the audio engine's TTS scheduler)
+    scheduler = create_tts_scheduler(config, tts_engine)
+    timing_engine = create_timing_engine(config, tts_engine, file_manager, text_pipeline, scheduler)
 
     # Create final audio engine
-    return create_audio_engine(config, tts_engine, file_manager, timing_engine)
+    return create_audio_engine(config, tts_engine, file_manager, timing_engine, scheduler=scheduler)
 
 
 def create_document_engine(config: SystemConfig) -> IDocumentEngine:
     """Create document engine with dependencies."""
-    file_manager = FileManager(upload_folder=config.upload_folder, output_folder=config.audio_folder)
+    file_manager = FileManager(
+        upload_folder=config.upload_folder, output_folder=config.audio_folder, scratch_dir=config.scratch_dir or None
+    )
 
     ocr_provider = TesseractOCRProvider(config=config)
 
-    return DocumentEngine(ocr_provider=ocr_provider, file_manager=file_manager)
+    artifact_stripper = PageArtifactStripper() if config.enable_page_artifact_stripping else None
+    quality_scorer = None
+    if config.enable_quality_routing:
+        quality_scorer = TextQualityScorer(threshold=config.quality_routing_threshold)
+
+    return DocumentEngine(
+        ocr_provider=ocr_provider,
+        file_manager=file_manager,
+        artifact_stripper=artifact_stripper,
+        quality_scorer=quality_scorer,
+    )
 
 
 def create_complete_service_set(config: SystemConfig) -> dict[str, Any]:
     """Create complete set of consolidated services using focused factories."""
-    # Create shared file manager
-    file_manager = FileManager(upload_folder=config.upload_folder, output_folder=config.audio_folder)
+    # Create shared file manager and the event loop thread all async work runs on
+    file_manager = FileManager(
+        upload_folder=config.upload_folder, output_folder=config.audio_folder, scratch_dir=config.scratch_dir or None
+    )
+    event_loop = BackgroundEventLoop(name="service-container")
 
     # Create TTS engine and text pipeline (no dependency order required)
     tts_engine = create_tts_engine(config)
     text_pipeline = create_text_pipeline(config)
 
+    # One TTS scheduler for every job, whichever engine synthesizes it
+    scheduler = create_tts_scheduler(config, tts_engine)
+
     # Create timing engine with all dependencies
-    timing_engine = create_timing_engine(config, tts_engine, file_manager, text_pipeline)
+    timing_engine = create_timing_engine(config, tts_engine, file_manager, text_pipeline, scheduler)
 
     # Create audio engine with all dependencies
-    audio_engine = create_audio_engine(config, tts_engine, file_manager, timing_engine)
+    audio_engine = create_audio_engine(config, tts_engine, file_manager, timing_engine, event_loop, scheduler)
 
     # Create document engine
     document_engine = create_document_engine(config)
@@ -68,6 +93,8 @@ def create_complete_service_set(config: SystemConfig) -> dict[str, Any]:
         "document_engine": document_engine,
         "tts_engine": tts_engine,
         "timing_engine": timing_engine,
+        "event_loop": event_loop,
+        "tts_scheduler": scheduler,
     }
 
 
@@ -88,6 +115,8 @@ def create_pdf_service_from_env(config: SystemConfig) -> ServiceContainer:
         .register("ITTSEngine", lambda: services["tts_engine"])
         .register("ITimingEngine", lambda: services["timing_engine"])
         .register("IFileManager", lambda: services["file_manager"])
+        .register(BackgroundEventLoop, lambda: services["event_loop"])
+        .register(FairShareScheduler, lambda: services["tts_scheduler"])
         .build()
     )
 
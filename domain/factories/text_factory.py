@@ -10,23 +10,51 @@ if TYPE_CHECKING:
 
 def create_text_pipeline(config: "SystemConfig") -> "ITextPipeline":
     """Create text pipeline with optional LLM provider and natural formatting."""
+    from domain.text.llm_chunk_sizer import AdaptiveChunkSizer
+    from domain.text.sharded_text import ShardedTextProcessor
     from domain.text.text_pipeline import TextPipeline
+    from infrastructure.llm.circuit_breaker_llm_provider import CircuitBreakerLLMProvider
     from infrastructure.llm.gemini_llm_provider import GeminiLLMProvider
 
     llm_provider = None
+    chunk_sizer = None
     if config.gemini_api_key:
         # IMPORTANT: This creates Gemini LLM for text cleaning/enhancement, NOT TTS
         # Uses language models like gemini-1.5-flash, NOT text-to-speech models
-        llm_provider = GeminiLLMProvider(
+        gemini_provider = GeminiLLMProvider(
             api_key=config.gemini_api_key,
             model_name=config.llm_model_name,  # Language model, not TTS model
             min_request_interval=config.llm_request_delay_seconds,
             max_concurrent_requests=config.llm_concurrent_requests,
             requests_per_minute=30,  # Default rate limit
+            request_timeout_seconds=config.llm_request_timeout_seconds,
+            base_url=config.llm_base_url,
+        )
+        # Circuit breaker sends chunks straight to local cleanup while the LLM is failing or slow
+        llm_provider = CircuitBreakerLLMProvider(
+            gemini_provider,
+            failure_threshold=config.llm_failure_threshold,
+            latency_threshold_seconds=config.llm_latency_threshold_seconds,
+            reset_timeout_seconds=config.llm_circuit_reset_seconds,
+        )
+        if config.llm_adaptive_chunking:
+            chunk_sizer = AdaptiveChunkSizer(
+                model_name=config.llm_model_name,
+                default_chunk_chars=config.llm_chunk_size,
+                state_file=config.llm_chunk_sizing_state_file,
+            )
+
+    sharded_processor = None
+    if config.parallel_text_threshold_chars > 0:
+        sharded_processor = ShardedTextProcessor(
+            threshold_chars=config.parallel_text_threshold_chars, workers=config.parallel_text_workers
         )
 
     return TextPipeline(
         llm_provider=llm_provider,  # This is for text processing, not audio generation
         enable_cleaning=config.enable_text_cleaning,
         enable_natural_formatting=config.enable_natural_formatting,
+        llm_time_budget_seconds=config.llm_time_budget_seconds,
+        chunk_sizer=chunk_sizer,
+        sharded_processor=sharded_processor,
     )
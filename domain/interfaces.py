@@ -4,11 +4,13 @@ implementations, facilitating testing and modularity.
 """
 
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
 from enum import Enum, auto
 from typing import Any, Optional
 
 from .errors import Result
 from .models import PageRange, PDFInfo, TextSegment
+from .workspace import JobWorkspace
 
 
 class SSMLCapability(Enum):
@@ -74,6 +76,10 @@ class IFileManager(ABC):
     def get_output_dir(self) -> str:
         """Returns the path to the output directory."""
 
+    @abstractmethod
+    def job_workspace(self, job_name: str) -> AbstractContextManager[JobWorkspace]:
+        """Scratch workspace for a job's intermediate files, current while the job runs and removed when it ends."""
+
 
 class ILLMProvider(ABC):
     """Interface for a Large Language Model provider."""
@@ -92,6 +98,10 @@ class ILLMProvider(ABC):
         For providers that don't support native async, this can wrap the sync method.
         """
 
+    def is_available(self) -> bool:
+        """Check whether the provider currently accepts calls (e.g. circuit breaker closed)."""
+        return True
+
 
 class IOCRProvider(ABC):
     """Interface for an Optical Character Recognition provider."""
@@ -293,6 +293,7 @@ class TimedAudioResult:
     audio_files: list[str]
     combined_mp3: Optional[str]
     timing_data: Optional[TimingMetadata] = None
+    debug_info: Optional[dict[str, Any]] = None  # Generation statistics (e.g. sentence deduplication savings)
 
     @property
     def has_timing_data(self) -> bool:
@@ -0,0 +1,188 @@
+# domain/text/chunk_planner.py - Offset-Based Chunk Planner
+"""Greedy chunk packing over piece lengths using prefix sums.
+Chunk boundaries are found by binary search on cumulative lengths, and each chunk is
+materialised exactly once with a single join, instead of growing strings with +=.
+Also plans worker-balanced chunks for parallel synthesis, where the slowest chunk sets the finish time.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+import heapq
+from itertools import accumulate
+import math
+
+
+def plan_chunk_bounds(lengths: Sequence[int], max_size: int, separator_length: int = 1) -> list[tuple[int, int]]:
+    """Plan greedy chunks over pieces of the given lengths.
+
+    Each chunk is the longest run of consecutive pieces whose joined length (pieces plus one
+    separator between each pair) fits in max_size. A single piece longer than max_size gets
+    a chunk of its own.
+
+    Args:
+        lengths: Length of each piece, in order
+        max_size: Largest joined chunk length allowed
+        separator_length: Length of the separator placed between pieces
+
+    Returns:
+        List of (first, stop) piece index ranges, one per chunk
+    """
+    return _greedy_bounds(_cumulative_lengths(lengths, separator_length), max_size, separator_length)
+
+
+def pack_pieces(pieces: Sequence[str], max_size: int, separator: str = " ") -> list[str]:
+    """Greedily join pieces into chunks no longer than max_size (oversized pieces stand alone)."""
+    bounds = plan_chunk_bounds([len(piece) for piece in pieces], max_size, len(separator))
+    return [separator.join(pieces[first:stop]) for first, stop in bounds]
+
+
+def pack_sentences(sentences: Sequence[str], max_size: int) -> list[str]:
+    """Pack sentences into chunks of at most max_size, splitting oversized sentences by words.
+
+    Runs of sentences that fit are packed together; a sentence longer than max_size closes the
+    current run and is packed word by word on its own.
+    """
+    chunks: list[str] = []
+    run_start = 0
+
+    for index, sentence in enumerate(sentences):
+        if len(sentence) > max_size:
+            chunks.extend(pack_pieces(sentences[run_start:index], max_size))
+            chunks.extend(pack_pieces(sentence.split(), max_size))
+            run_start = index + 1
+
+    chunks.extend(pack_pieces(sentences[run_start:], max_size))
+    return chunks
+
+
+def pack_balanced(
+    sentences: Sequence[str], max_size: int, workers: int, first_chunk_size: int = 0, overhead: int = 0
+) -> list[str]:
+    """Pack sentences into worker-balanced chunks (see plan_balanced_bounds).
+
+    Sentences longer than max_size are first broken into word runs that fit, so every piece
+    can be balanced like a sentence.
+    """
+    pieces: list[str] = []
+    for sentence in sentences:
+        if len(sentence) > max_size:
+            pieces.extend(pack_pieces(sentence.split(), max_size))
+        else:
+            pieces.append(sentence)
+
+    bounds = plan_balanced_bounds([len(piece) for piece in pieces], max_size, workers, first_chunk_size, overhead)
+    return [" ".join(pieces[first:stop]) for first, stop in bounds]
+
+
+def plan_balanced_bounds(
+    lengths: Sequence[int],
+    max_size: int,
+    workers: int,
+    first_chunk_size: int = 0,
+    overhead: int = 0,
+    separator_length: int = 1,
+) -> list[tuple[int, int]]:
+    """Plan chunks that balance synthesis cost across parallel workers.
+
+    An optional small first chunk (at most first_chunk_size) lets output start quickly. The
+    remaining pieces are split into k chunks minimising the largest chunk, so no single chunk
+    becomes the straggler the job waits on. k is chosen by simulating the worker pool over a
+    window of candidates starting at the fewest chunks that respect max_size; the plain greedy
+    plan is one of the candidates, so balancing never predicts a later finish than greedy.
+
+    Args:
+        lengths: Length of each piece, in order
+        max_size: Largest joined chunk length allowed (pieces longer than this stand alone)
+        workers: Chunks synthesised in parallel
+        first_chunk_size: Target length of the leading chunk (0 disables it)
+        overhead: Fixed per-chunk cost in characters (request latency expressed as text length)
+        separator_length: Length of the separator placed between pieces
+
+    Returns:
+        List of (first, stop) piece index ranges, one per chunk
+    """
+    if not lengths:
+        return []
+
+    bounds: list[tuple[int, int]] = []
+    leading_costs: list[float] = []
+    offset = 0
+    if first_chunk_size > 0:
+        first, offset = plan_chunk_bounds(lengths, min(first_chunk_size, max_size), separator_length)[0]
+        bounds.append((first, offset))
+        leading_costs.append(sum(lengths[first:offset]) + separator_length * (offset - first - 1) + overhead)
+
+    rest = lengths[offset:]
+    if not rest:
+        return bounds
+
+    workers = max(1, workers)
+    cumulative = _cumulative_lengths(rest, separator_length)
+
+    # Candidates: the greedy plan itself, then min-max partitions into more and more chunks
+    greedy = _greedy_bounds(cumulative, max_size, separator_length)
+    candidates = [
+        _min_max_partition(cumulative, parts, max_size, separator_length)
+        for parts in range(len(greedy), min(len(rest), len(greedy) + 2 * workers) + 1)
+    ]
+
+    best_plan = greedy
+    best_makespan = math.inf
+    for plan in [*candidates, greedy]:
+        costs = [cumulative[stop] - cumulative[first] - separator_length + overhead for first, stop in plan]
+        makespan = simulate_makespan(leading_costs + costs, workers)
+        if makespan < best_makespan:
+            best_plan, best_makespan = plan, makespan
+
+    return bounds + [(offset + first, offset + stop) for first, stop in best_plan]
+
+
+def simulate_makespan(costs: Sequence[float], workers: int) -> float:
+    """Finish time of chunks dispatched in order to the first free of `workers` workers."""
+    if not costs:
+        return 0.0
+    free_at = [0.0] * max(1, min(workers, len(costs)))
+    for cost in costs:
+        heapq.heappush(free_at, heapq.heappop(free_at) + cost)
+    return max(free_at)
+
+
+def _cumulative_lengths(lengths: Sequence[int], separator_length: int) -> list[int]:
+    """Prefix sums where entry i is the length of pieces[:i] with a separator after each piece."""
+    return [0, *accumulate(length + separator_length for length in lengths)]
+
+
+def _greedy_bounds(cumulative: list[int], max_size: int, separator_length: int) -> list[tuple[int, int]]:
+    """Greedy chunk boundaries over precomputed prefix sums."""
+    piece_count = len(cumulative) - 1
+    bounds = []
+
+    first = 0
+    while first < piece_count:
+        # Joined length of pieces[first:stop] is cumulative[stop] - cumulative[first] - separator_length
+        limit = cumulative[first] + max_size + separator_length
+        stop = max(first + 1, bisect_right(cumulative, limit, first + 1) - 1)
+        bounds.append((first, stop))
+        first = stop
+
+    return bounds
+
+
+def _min_max_partition(
+    cumulative: list[int], parts: int, max_size: int, separator_length: int
+) -> list[tuple[int, int]]:
+    """Split pieces into at most `parts` chunks with the smallest possible largest chunk.
+
+    Binary-searches the chunk length cap: a cap is feasible when greedy packing under it needs
+    no more than `parts` chunks. The cap never exceeds max_size.
+    """
+    total = cumulative[-1] - separator_length
+    high = min(max_size, total)
+    low = min(high, math.ceil((total - separator_length * (parts - 1)) / parts))
+    while low < high:
+        cap = (low + high) // 2
+        if len(_greedy_bounds(cumulative, cap, separator_length)) <= parts:
+            high = cap
+        else:
+            low = cap + 1
+    return _greedy_bounds(cumulative, low, separator_length)
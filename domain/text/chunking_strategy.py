@@ -7,26 +7,34 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Optional
 
+from .chunk_planner import pack_balanced, pack_pieces, pack_sentences
+from .sentence_tokenizer import split_sentences
+
 
 class ChunkingMode(Enum):
     """Available chunking strategies."""
 
     SENTENCE_BASED = "sentence"  # Split on sentences first
     WORD_BASED = "word"  # Split on words if sentences too large
+    BALANCED = "balanced"  # Equal-cost chunks across parallel workers, small first chunk
 
 
 class IChunkingStrategy(ABC):
     """Interface for text chunking strategies."""
 
     @abstractmethod
-    def chunk_text(self, text_chunks: list[str], max_chunk_size: int) -> list[str]:
-        """Split text chunks into optimal sizes for TTS processing."""
+    def chunk_text(self, text_chunks: list[str], max_chunk_size: int, concurrency: int = 1) -> list[str]:
+        """Split text chunks into optimal sizes for TTS processing.
+
+        concurrency is the number of chunks that will be synthesised in parallel; strategies
+        that do not balance work across workers ignore it.
+        """
 
 
 class SentenceBasedChunking(IChunkingStrategy):
     """Sentence-aware chunking that preserves natural speech boundaries."""
 
-    def chunk_text(self, text_chunks: list[str], max_chunk_size: int) -> list[str]:
+    def chunk_text(self, text_chunks: list[str], max_chunk_size: int, concurrency: int = 1) -> list[str]:
         """Split text on sentence boundaries, then words if needed."""
         # Process each chunk and flatten results (immutable)
         return [
@@ -38,64 +46,18 @@ class SentenceBasedChunking(IChunkingStrategy):
         if len(chunk) <= max_chunk_size:
             return [chunk]
 
-        # Split large chunks on sentence boundaries
-        sentences = self._split_sentences(chunk)
-        result_chunks = []
-        current_subchunk = ""
-
-        for sentence in sentences:
-            # If single sentence is too large, split by words
-            if len(sentence) > max_chunk_size:
-                word_chunks = self._split_by_words(sentence, max_chunk_size)
-                # Add current subchunk if it exists
-                if current_subchunk.strip():
-                    result_chunks.append(current_subchunk.strip())
-                    current_subchunk = ""
-                # Add word chunks
-                result_chunks.extend(word_chunks)
-            elif len(current_subchunk) + len(sentence) > max_chunk_size and current_subchunk:
-                # Current sentence would exceed limit, save current subchunk
-                result_chunks.append(current_subchunk.strip())
-                current_subchunk = sentence
-            else:
-                # Add sentence to current subchunk
-                current_subchunk += " " + sentence if current_subchunk else sentence
-
-        # Add final subchunk if it exists
-        if current_subchunk.strip():
-            result_chunks.append(current_subchunk.strip())
-
-        return result_chunks
+        # Split large chunks on sentence boundaries, then words for oversized sentences
+        return pack_sentences(self._split_sentences(chunk), max_chunk_size)
 
     def _split_sentences(self, text: str) -> list[str]:
-        """Split text into sentences using common punctuation."""
-        # Simple sentence splitting - can be enhanced with NLP libraries
-        sentences = text.replace(". ", ".|").replace("! ", "!|").replace("? ", "?|").split("|")
-        return [s.strip() for s in sentences if s.strip()]
-
-    def _split_by_words(self, text: str, max_size: int) -> list[str]:
-        """Split text by words when sentences are too large."""
-        words = text.split()
-        chunks = []
-        current_chunk = ""
-
-        for word in words:
-            if len(current_chunk) + len(word) + 1 > max_size and current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = word
-            else:
-                current_chunk += " " + word if current_chunk else word
-
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
-
-        return chunks
+        """Split text into sentences using the shared tokenizer."""
+        return split_sentences(text)
 
 
 class WordBasedChunking(IChunkingStrategy):
     """Simple word-based chunking for basic splitting."""
 
-    def chunk_text(self, text_chunks: list[str], max_chunk_size: int) -> list[str]:
+    def chunk_text(self, text_chunks: list[str], max_chunk_size: int, concurrency: int = 1) -> list[str]:
         """Split text chunks by words only."""
         # Process each chunk and flatten results (immutable)
         return [
@@ -110,21 +72,38 @@ class WordBasedChunking(IChunkingStrategy):
             return [chunk]
 
         # Split by words
-        words = chunk.split()
-        result_chunks = []
-        current_chunk = ""
+        return pack_pieces(chunk.split(), max_chunk_size)
+
+
+class BalancedChunking(IChunkingStrategy):
+    """Straggler-aware chunking for parallel TTS.
+
+    Greedy packing leaves a tiny tail chunk after every oversized input chunk and ignores how
+    many workers run at once, so the job waits on whichever chunk is longest. This strategy
+    treats all input as one sentence stream, sends a small first chunk so audio starts fast,
+    and sizes the rest to equalise estimated synthesis cost across the workers.
+    """
 
-        for word in words:
-            if len(current_chunk) + len(word) + 1 > max_chunk_size and current_chunk:
-                result_chunks.append(current_chunk.strip())
-                current_chunk = word
-            else:
-                current_chunk += " " + word if current_chunk else word
+    def __init__(self, first_chunk_size: int = 400, request_overhead_chars: int = 250):
+        """Initialize the strategy.
 
-        if current_chunk.strip():
-            result_chunks.append(current_chunk.strip())
+        Args:
+            first_chunk_size: Target length of the leading chunk (0 disables it)
+            request_overhead_chars: Fixed per-request TTS cost, expressed in characters of text
+        """
+        self.first_chunk_size = first_chunk_size
+        self.request_overhead_chars = request_overhead_chars
 
-        return result_chunks
+    def chunk_text(self, text_chunks: list[str], max_chunk_size: int, concurrency: int = 1) -> list[str]:
+        """Split text into worker-balanced chunks on sentence boundaries."""
+        sentences = [sentence for chunk in text_chunks for sentence in split_sentences(chunk)]
+        return pack_balanced(
+            sentences,
+            max_chunk_size,
+            workers=concurrency,
+            first_chunk_size=self.first_chunk_size,
+            overhead=self.request_overhead_chars,
+        )
 
 
 class ChunkingService:
@@ -136,12 +115,12 @@ class ChunkingService:
     def __init__(self, strategy: Optional[IChunkingStrategy] = None):
         self.strategy = strategy or SentenceBasedChunking()
 
-    def process_chunks(self, text_chunks: list[str], max_chunk_size: int) -> list[str]:
+    def process_chunks(self, text_chunks: list[str], max_chunk_size: int, concurrency: int = 1) -> list[str]:
         """Process text chunks using the configured strategy."""
         if not text_chunks:
             return []
 
-        return self.strategy.chunk_text(text_chunks, max_chunk_size)
+        return self.strategy.chunk_text(text_chunks, max_chunk_size, concurrency)
 
     def set_strategy(self, strategy: IChunkingStrategy) -> None:
         """Change chunking strategy."""
@@ -154,6 +133,8 @@ def create_chunking_service(mode: ChunkingMode = ChunkingMode.SENTENCE_BASED) ->
         return ChunkingService(SentenceBasedChunking())
     elif mode == ChunkingMode.WORD_BASED:
         return ChunkingService(WordBasedChunking())
+    elif mode == ChunkingMode.BALANCED:
+        return ChunkingService(BalancedChunking())
 
     # This should never be reached with current enum values
     raise ValueError(f"Unsupported chunking mode: {mode}")
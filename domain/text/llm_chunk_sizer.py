@@ -0,0 +1,299 @@
+# domain/text/llm_chunk_sizer.py - Adaptive LLM Chunk Sizing
+"""Learns which LLM input sizes succeed and how latency scales with size, per model,
+and picks chunk sizes that minimise expected cleaning wall time.
+The learned model is persisted as JSON so it survives restarts.
+"""
+
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Optional
+
+CHARS_PER_TOKEN = 4.0  # Rough local estimate for English prose
+_MAX_SAMPLES = 50  # Recent successful (tokens, latency) pairs kept for the latency fit
+_MAX_CHOICES = 20  # Recent sizing decisions kept for inspection
+_UNSEEN_SUCCESS_PRIOR = 0.9  # Assumed success rate for untried sizes below a known-good size
+_UNKNOWN_SUCCESS_PRIOR = 0.6  # Assumed success rate for untried sizes above anything that has worked
+_FAILURE_MEMORY_SECONDS = 86400.0  # How long a failing size is skipped before being tried whole again
+DEFAULT_RETRY_CHUNK_CHARS = 15000  # Sub-chunk size used for retries until something has been learned
+
+
+def estimate_tokens(char_count: int) -> int:
+    """Estimate LLM tokens for a text length without calling a tokenizer."""
+    return max(1, math.ceil(char_count / CHARS_PER_TOKEN))
+
+
+class AdaptiveChunkSizer:
+    """Per-model chunk size learner for LLM text cleaning.
+
+    Observations are bucketed by candidate chunk size (doubling from the minimum). Each bucket
+    tracks attempts, successes and an EWMA of latency; a least-squares fit of latency against
+    tokens fills in buckets that have not been tried. For a job of N characters run with C
+    concurrent calls, the expected wall time of chunk size s is
+    ceil(ceil(N / s) / C) * latency(s) / success_rate(s), and the cheapest size wins.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        default_chunk_chars: int = 50000,
+        min_chunk_chars: int = 4000,
+        max_chunk_chars: int = 200000,
+        state_file: Optional[str] = None,
+        ewma_alpha: float = 0.3,
+    ):
+        """Initialize the sizer.
+
+        Args:
+            model_name: LLM model the observations belong to
+            default_chunk_chars: Chunk size used until anything has been learned
+            min_chunk_chars: Smallest chunk size considered
+            max_chunk_chars: Largest chunk size considered
+            state_file: JSON file for the learned model (None keeps it in memory only)
+            ewma_alpha: Weight of the newest latency observation per bucket
+        """
+        self.model_name = model_name
+        self.default_chunk_chars = default_chunk_chars
+        self.min_chunk_chars = max(1000, min_chunk_chars)
+        self.max_chunk_chars = max(self.min_chunk_chars, max_chunk_chars)
+        self.state_file = state_file
+        self.ewma_alpha = ewma_alpha
+
+        self._lock = threading.Lock()
+        self._candidates = self._build_candidates()
+        self._buckets: dict[int, dict[str, float]] = {}
+        self._samples: list[tuple[int, float]] = []
+        self._choices: list[dict[str, Any]] = []
+        self._load()
+
+    # --- Learning ---
+
+    def record(self, input_chars: int, latency_seconds: float, success: bool) -> None:
+        """Record the outcome of one LLM cleaning call and persist the updated model."""
+        bucket_size = self._bucket_for(input_chars)
+        with self._lock:
+            bucket = self._buckets.setdefault(
+                bucket_size, {"attempts": 0, "successes": 0, "latency": 0.0, "updated": 0.0}
+            )
+            bucket["attempts"] += 1
+            bucket["updated"] = time.time()
+            if not success:
+                bucket["last_failure"] = bucket["updated"]
+            if success:
+                bucket["successes"] += 1
+                if bucket["latency"] <= 0:
+                    bucket["latency"] = latency_seconds
+                else:
+                    bucket["latency"] += self.ewma_alpha * (latency_seconds - bucket["latency"])
+                self._samples.append((estimate_tokens(input_chars), latency_seconds))
+                del self._samples[:-_MAX_SAMPLES]
+        self._save()
+
+    @property
+    def has_observations(self) -> bool:
+        """Check whether anything has been learned for this model yet."""
+        with self._lock:
+            return bool(self._buckets)
+
+    # --- Decisions ---
+
+    def recommend_chunk_size(self, total_chars: int, concurrency: int = 1) -> int:
+        """Pick the chunk size with the lowest expected wall time for a job.
+
+        Args:
+            total_chars: Characters of text that will be sent to the LLM
+            concurrency: LLM calls that run at the same time for this job
+        """
+        if total_chars <= 0 or not self.has_observations:
+            return self.default_chunk_chars
+
+        concurrency = max(1, concurrency)
+        best_size = self.default_chunk_chars
+        best_seconds = math.inf
+
+        with self._lock:
+            for size in self._candidates:
+                expected = self._expected_wall_time(total_chars, size, concurrency)
+                # Prefer larger chunks on ties: fewer calls, less prompt overhead
+                if expected < best_seconds or (expected == best_seconds and size > best_size):
+                    best_size, best_seconds = size, expected
+
+            if math.isinf(best_seconds):
+                return self.default_chunk_chars
+
+            self._choices.append(
+                {
+                    "time": round(time.time()),
+                    "total_chars": total_chars,
+                    "concurrency": concurrency,
+                    "chunk_chars": best_size,
+                    "expected_seconds": round(best_seconds, 2),
+                }
+            )
+            del self._choices[:-_MAX_CHOICES]
+
+        self._save()
+        print(
+            f"📐 Adaptive LLM chunking: {best_size} chars/chunk for {total_chars} chars "
+            f"(expected {best_seconds:.1f}s, concurrency {concurrency})"
+        )
+        return best_size
+
+    def is_reliable_size(self, input_chars: int) -> bool:
+        """Check whether a whole call of this size is worth attempting.
+
+        Sizes that failed repeatedly and recently are reported unreliable; they are tried whole
+        again once the last failure is older than a day, in case the model has improved.
+        """
+        with self._lock:
+            bucket = self._buckets.get(self._bucket_for(input_chars))
+            if not bucket or bucket["attempts"] < 2:
+                return True
+            # State saved before failures were timestamped separately only has "updated"
+            last_failure = bucket.get("last_failure", bucket.get("updated", 0.0))
+            if time.time() - last_failure > _FAILURE_MEMORY_SECONDS:
+                return True
+            return self._success_rate(self._bucket_for(input_chars)) >= 0.5
+
+    def retry_chunk_size(self, failed_chars: int) -> int:
+        """Pick a sub-chunk size for retrying text that failed (or would fail) as one call."""
+        if not self.has_observations:
+            return DEFAULT_RETRY_CHUNK_CHARS
+
+        smaller = [size for size in self._candidates if size < failed_chars]
+        if not smaller:
+            return self.min_chunk_chars
+
+        with self._lock:
+            return min(
+                smaller,
+                key=lambda size: (self._expected_wall_time(failed_chars, size, 1), -size),
+            )
+
+    # --- Model internals (callers hold the lock) ---
+
+    def _build_candidates(self) -> list[int]:
+        """Candidate chunk sizes: doubling from the minimum, plus the maximum and the default."""
+        candidates = []
+        size = self.min_chunk_chars
+        while size < self.max_chunk_chars:
+            candidates.append(size)
+            size *= 2
+        candidates.append(self.max_chunk_chars)
+        if self.min_chunk_chars <= self.default_chunk_chars <= self.max_chunk_chars:
+            candidates.append(self.default_chunk_chars)
+        return sorted(set(candidates))
+
+    def _bucket_for(self, input_chars: int) -> int:
+        """Map an input size to the smallest candidate that holds it."""
+        for size in self._candidates:
+            if input_chars <= size:
+                return size
+        return self._candidates[-1]
+
+    def _success_rate(self, size: int) -> float:
+        """Estimated probability that a call of this bucket size succeeds."""
+        bucket = self._buckets.get(size)
+        if bucket and bucket["attempts"]:
+            # Laplace-smoothed so one failure does not rule a size out forever
+            return (bucket["successes"] + 1) / (bucket["attempts"] + 2)
+
+        largest_success = max((s for s, b in self._buckets.items() if b["successes"]), default=0)
+        return _UNSEEN_SUCCESS_PRIOR if size <= largest_success else _UNKNOWN_SUCCESS_PRIOR
+
+    def _latency(self, size: int) -> Optional[float]:
+        """Estimated seconds for one successful call of this size (None without any data)."""
+        bucket = self._buckets.get(size)
+        if bucket and bucket["latency"] > 0:
+            return bucket["latency"]
+
+        fit = self._fit_latency()
+        if fit:
+            intercept, slope = fit
+            return max(0.1, intercept + slope * estimate_tokens(size))
+
+        # Single data point: scale proportionally from the nearest measured bucket
+        measured = [(s, b["latency"]) for s, b in self._buckets.items() if b["latency"] > 0]
+        if not measured:
+            return None
+        nearest_size, nearest_latency = min(measured, key=lambda item: abs(item[0] - size))
+        return nearest_latency * size / nearest_size
+
+    def _fit_latency(self) -> Optional[tuple[float, float]]:
+        """Least-squares fit latency = intercept + slope * tokens over recent successes."""
+        if len(self._samples) < 2:
+            return None
+        xs = [tokens for tokens, _ in self._samples]
+        ys = [latency for _, latency in self._samples]
+        mean_x = sum(xs) / len(xs)
+        mean_y = sum(ys) / len(ys)
+        var_x = sum((x - mean_x) ** 2 for x in xs)
+        if var_x == 0:
+            return None
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+        slope = max(0.0, slope)
+        return max(0.0, mean_y - slope * mean_x), slope
+
+    def _expected_wall_time(self, total_chars: int, size: int, concurrency: int) -> float:
+        """Expected seconds to clean `total_chars` in chunks of `size` with `concurrency` parallel calls."""
+        latency = self._latency(size)
+        if latency is None:
+            return math.inf
+        calls = math.ceil(total_chars / size)
+        waves = math.ceil(calls / concurrency)
+        # Expected attempts per chunk is 1 / success rate (failed calls still cost their latency)
+        return waves * latency / self._success_rate(size)
+
+    # --- Persistence ---
+
+    def _load(self) -> None:
+        """Load this model's learned state from the JSON file, if present."""
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, encoding="utf-8") as f:
+                state = json.load(f).get("models", {}).get(self.model_name, {})
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not load LLM chunk sizing state: {e}")
+            return
+
+        self._buckets = {
+            self._bucket_for(int(size)): {k: float(v) for k, v in bucket.items()}
+            for size, bucket in state.get("buckets", {}).items()
+        }
+        self._samples = [(int(tokens), float(latency)) for tokens, latency in state.get("samples", [])]
+        self._choices = list(state.get("choices", []))
+
+    def _save(self) -> None:
+        """Merge this model's state into the shared JSON file atomically."""
+        if not self.state_file:
+            return
+        with self._lock:
+            model_state = {
+                "buckets": {str(size): dict(bucket) for size, bucket in self._buckets.items()},
+                "samples": [list(sample) for sample in self._samples],
+                "choices": list(self._choices),
+            }
+
+        try:
+            directory = os.path.dirname(os.path.abspath(self.state_file))
+            os.makedirs(directory, exist_ok=True)
+
+            state: dict[str, Any] = {"version": 1, "models": {}}
+            if os.path.exists(self.state_file):
+                try:
+                    with open(self.state_file, encoding="utf-8") as f:
+                        state = json.load(f)
+                except ValueError:
+                    pass  # Corrupt file is replaced below
+            state.setdefault("models", {})[self.model_name] = model_state
+
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(temp_path, self.state_file)
+        except OSError as e:
+            print(f"⚠️ Could not save LLM chunk sizing state: {e}")
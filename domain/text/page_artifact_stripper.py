@@ -0,0 +1,169 @@
+# domain/text/page_artifact_stripper.py - Local Page Artifact Removal
+"""Deterministic removal of cross-page PDF artifacts before LLM cleaning.
+Repeating headers/footers, page numbers, reference markers and line-break hyphenation
+are detected locally so they never cost LLM tokens.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+import math
+import re
+
+# Standalone page number lines: "12", "- 12 -", "Page 12", "Page 12 of 40", "12/40", roman numerals
+_PAGE_NUMBER_LINE = re.compile(
+    r"^\s*(?:page\s+)?[-\u2013\u2014]?\s*(?:\d{1,4}|(?=[ivx])x{0,3}(?:ix|iv|v?i{0,3}))"
+    r"\s*[-\u2013\u2014]?\s*(?:(?:of|/)\s*\d{1,4})?\s*$",
+    re.IGNORECASE,
+)
+# Numeric citation markers: [12], [3, 7], [4-6], [1-3, 9]
+_REFERENCE_MARKER = re.compile(r"\s?\[\d{1,3}(?:\s*[-\u2013,]\s*\d{1,3})*\]")
+# Word broken across a line break: "compu-\ntation" → "computation"
+_LINE_BREAK_HYPHEN = re.compile(r"([A-Za-z])-[ \t]*\n[ \t]*([a-z])")
+# Running headers/footers are titles, not sentences
+_SENTENCE_END = re.compile(r"[.!?][\"')\]]?\s*$")
+_DIGITS = re.compile(r"\d+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class ArtifactStripResult:
+    """Cleaned pages plus counts of what was removed."""
+
+    pages: list[str]
+    headers_removed: int = 0
+    footers_removed: int = 0
+    page_numbers_removed: int = 0
+    reference_markers_removed: int = 0
+    hyphenations_joined: int = 0
+    chars_removed: int = 0
+
+    def to_debug_info(self) -> dict[str, int]:
+        """Summarize removals for ProcessingResult.debug_info."""
+        return {
+            "headers_removed": self.headers_removed,
+            "footers_removed": self.footers_removed,
+            "page_numbers_removed": self.page_numbers_removed,
+            "reference_markers_removed": self.reference_markers_removed,
+            "hyphenations_joined": self.hyphenations_joined,
+            "chars_removed": self.chars_removed,
+        }
+
+
+class PageArtifactStripper:
+    """Removes repeating page furniture using cross-page frequency of edge lines.
+
+    The first and last few non-empty lines of every page are normalized (digits masked,
+    case and whitespace folded) and counted across pages. Lines that recur on a large enough
+    share of pages are headers/footers and are dropped wherever they appear at a page edge.
+    """
+
+    def __init__(self, edge_lines: int = 3, min_page_fraction: float = 0.5, min_pages: int = 3):
+        """Initialize the stripper.
+
+        Args:
+            edge_lines: How many non-empty lines at the top/bottom of a page are header/footer candidates
+            min_page_fraction: Share of pages a normalized edge line must appear on to count as repeating
+            min_pages: Minimum page count before frequency analysis is attempted
+        """
+        self.edge_lines = max(1, edge_lines)
+        self.min_page_fraction = min_page_fraction
+        self.min_pages = max(2, min_pages)
+
+    def strip(self, pages: list[str]) -> ArtifactStripResult:
+        """Strip artifacts from per-page text, keeping page order and dropping pages left empty."""
+        page_lines = [page.splitlines() for page in pages]
+
+        repeating_headers: set[str] = set()
+        repeating_footers: set[str] = set()
+        if len(pages) >= self.min_pages:
+            threshold = max(2, math.ceil(self.min_page_fraction * len(pages)))
+            repeating_headers = self._find_repeating(page_lines, from_top=True, threshold=threshold)
+            repeating_footers = self._find_repeating(page_lines, from_top=False, threshold=threshold)
+
+        cleaned_pages = []
+        headers = footers = page_numbers = markers = hyphens = 0
+
+        for lines in page_lines:
+            lines, removed_headers, removed_numbers_top = self._strip_edge(lines, repeating_headers, from_top=True)
+            lines, removed_footers, removed_numbers_bottom = self._strip_edge(lines, repeating_footers, from_top=False)
+            headers += removed_headers
+            footers += removed_footers
+            page_numbers += removed_numbers_top + removed_numbers_bottom
+
+            text = "\n".join(lines)
+            text, joined = _LINE_BREAK_HYPHEN.subn(r"\1\2", text)
+            text, removed_markers = _REFERENCE_MARKER.subn("", text)
+            hyphens += joined
+            markers += removed_markers
+
+            text = text.strip()
+            if text:
+                cleaned_pages.append(text)
+
+        original_chars = sum(len(page) for page in pages)
+        cleaned_chars = sum(len(page) for page in cleaned_pages)
+
+        return ArtifactStripResult(
+            pages=cleaned_pages,
+            headers_removed=headers,
+            footers_removed=footers,
+            page_numbers_removed=page_numbers,
+            reference_markers_removed=markers,
+            hyphenations_joined=hyphens,
+            chars_removed=max(0, original_chars - cleaned_chars),
+        )
+
+    def _find_repeating(self, page_lines: list[list[str]], from_top: bool, threshold: int) -> set[str]:
+        """Find normalized edge lines that recur on at least `threshold` pages."""
+        counts: Counter[str] = Counter()
+        for lines in page_lines:
+            edge = self._edge_candidates(lines, from_top)
+            # Count each normalized line once per page
+            counts.update(
+                {
+                    self._normalize(line)
+                    for line in edge
+                    if not _PAGE_NUMBER_LINE.match(line) and not _SENTENCE_END.search(line)
+                }
+            )
+
+        return {key for key, count in counts.items() if key and count >= threshold}
+
+    def _edge_candidates(self, lines: list[str], from_top: bool) -> list[str]:
+        """Return the first/last `edge_lines` non-empty lines of a page."""
+        ordered = lines if from_top else reversed(lines)
+        candidates = []
+        for line in ordered:
+            if line.strip():
+                candidates.append(line)
+                if len(candidates) >= self.edge_lines:
+                    break
+        return candidates
+
+    def _strip_edge(self, lines: list[str], repeating: set[str], from_top: bool) -> tuple[list[str], int, int]:
+        """Drop repeating lines and page numbers from one edge of a page."""
+        removed_repeating = 0
+        removed_numbers = 0
+        inspected = 0
+        kept = list(lines) if from_top else list(reversed(lines))
+
+        while kept and inspected < self.edge_lines:
+            line = kept[0]
+            if not line.strip():
+                kept.pop(0)
+                continue
+            if _PAGE_NUMBER_LINE.match(line):
+                removed_numbers += 1
+            elif self._normalize(line) in repeating:
+                removed_repeating += 1
+            else:
+                break
+            kept.pop(0)
+            inspected += 1
+
+        return (kept if from_top else list(reversed(kept))), removed_repeating, removed_numbers
+
+    @staticmethod
+    def _normalize(line: str) -> str:
+        """Fold a line so running headers with changing page numbers compare equal."""
+        return _WHITESPACE.sub(" ", _DIGITS.sub("#", line)).strip().lower()
@@ -0,0 +1,125 @@
+# domain/text/rewrite_rules.py - Precompiled Text Rewrite Engine
+"""Declarative regex rewrite rules, compiled once at import and applied in order.
+Rules whose trigger literal is absent skip their scan entirely, and text can be rewritten
+in streaming slices so book-sized input never has to be held in one string.
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+import re
+from typing import Callable, Optional, Union
+
+Replacement = Union[str, Callable[[re.Match[str]], str]]
+
+
+@dataclass(frozen=True)
+class RewriteRule:
+    """One regex substitution, equivalent to re.sub(pattern, replacement, text, flags=flags).
+
+    Attributes:
+        pattern: Regular expression to replace
+        replacement: Template (backreferences allowed) or callable taking the match
+        flags: re flags for the pattern
+        requires: Literal that every match contains; when it is absent the scan is skipped
+        horizon: Longest span (match plus lookaround) the rule needs when streaming slices
+    """
+
+    pattern: str
+    replacement: Replacement
+    flags: int = 0
+    requires: Optional[str] = None
+    horizon: int = 1024
+
+
+class _CompiledRule:
+    """A RewriteRule with its regex compiled once."""
+
+    def __init__(self, rule: RewriteRule):
+        self.rule = rule
+        self.regex = re.compile(rule.pattern, rule.flags)
+        self.replacement = rule.replacement
+        # Templates without escapes are plain strings for re.sub, so streaming can skip expansion
+        self.literal = isinstance(rule.replacement, str) and "\\" not in rule.replacement
+
+    def can_match(self, text: str) -> bool:
+        """Cheap literal check: False only when the rule cannot match anywhere in text."""
+        return self.rule.requires is None or self.rule.requires in text
+
+    def apply(self, text: str) -> str:
+        """Rewrite the whole text."""
+        if not self.can_match(text):
+            return text
+        return self.regex.sub(self.replacement, text)
+
+    def stream(self, slices: Iterable[str]) -> Iterator[str]:
+        """Rewrite text arriving in slices, yielding output incrementally.
+
+        Matches ending within `horizon` characters of the end of the buffered text are held
+        back until more text arrives, so the joined output equals apply() on the joined input
+        as long as no match or lookaround spans more than `horizon` characters.
+        """
+        horizon = self.rule.horizon
+        buffer = ""
+        start = 0  # Characters before `start` were already emitted and remain only as lookbehind context
+        for piece in slices:
+            buffer += piece
+            if len(buffer) - start < 2 * horizon:
+                continue
+            output, cut = self._substitute(buffer, start, len(buffer) - horizon)
+            yield output
+            context = min(cut, horizon)
+            buffer = buffer[cut - context :]
+            start = context
+
+        output, _ = self._substitute(buffer, start, None)
+        yield output
+
+    def _substitute(self, text: str, start: int, limit: Optional[int]) -> tuple[str, int]:
+        """Rewrite text from start up to a cut at or before limit and return (output, cut).
+
+        Matches reaching past limit might still grow with more text, so the cut is placed
+        before them and they are rescanned with the next slice. limit=None rewrites to the end.
+        """
+        cut = len(text) if limit is None else limit
+        parts = []
+        position = start
+        for match in self.regex.finditer(text, start):
+            if limit is not None and match.end() > limit:
+                cut = min(match.start(), limit)
+                break
+            parts.append(text[position : match.start()])
+            parts.append(self._expand(match))
+            position = match.end()
+
+        parts.append(text[position:cut])
+        return "".join(parts), cut
+
+    def _expand(self, match: re.Match[str]) -> str:
+        """Replacement text for one match."""
+        if self.literal:
+            return self.replacement  # type: ignore[return-value]
+        if callable(self.replacement):
+            return self.replacement(match)
+        return match.expand(self.replacement)
+
+
+class RuleSet:
+    """Ordered rewrite rules, compiled once and reused for every text."""
+
+    def __init__(self, *rules: RewriteRule):
+        """Compile the rules; they are applied in the order given."""
+        self.rules = rules
+        self._compiled = [_CompiledRule(rule) for rule in rules]
+
+    def apply(self, text: str) -> str:
+        """Apply every rule to the text in order."""
+        for rule in self._compiled:
+            text = rule.apply(text)
+        return text
+
+    def stream(self, slices: Iterable[str]) -> Iterator[str]:
+        """Apply every rule to text arriving in slices; rules are chained lazily."""
+        stream: Iterable[str] = slices
+        for rule in self._compiled:
+            stream = rule.stream(stream)
+        return (piece for piece in stream if piece)
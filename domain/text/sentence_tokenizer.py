@@ -0,0 +1,83 @@
+# domain/text/sentence_tokenizer.py - Unified Sentence Tokenizer
+"""Single-pass sentence boundary detection shared by every sentence splitter in the app.
+Returns (start, end) character offsets into the original string instead of copies.
+"""
+
+from collections.abc import Iterator
+import re
+from typing import Optional
+
+# Candidate boundary: terminal punctuation, optional closing quotes/brackets, whitespace,
+# then something that can open a sentence (capital, digit, opening quote or bracket)
+_BOUNDARY = re.compile("[.!?]+[\"'\u201d\u2019)\\]]*(\\s+)(?=[A-Z0-9\"'\u201c\u2018(\\[])")
+
+# Words that end with a period but do not end a sentence (case-sensitive: "No. 5" vs "said no.")
+# fmt: off
+ABBREVIATIONS = frozenset({
+    "Dr", "Mr", "Mrs", "Ms", "Prof", "Sr", "Jr", "St", "vs", "al", "cf", "approx", "pp", "No",
+    "Fig", "fig", "Figs", "figs", "Eq", "eq", "Eqs", "eqs", "Vol", "vol", "Ch", "ch", "Sec", "sec",
+    "e.g", "i.e", "E.g", "I.e",
+})
+# fmt: on
+_MAX_ABBREVIATION_LENGTH = max(len(word) for word in ABBREVIATIONS)
+
+
+def iter_sentence_spans(text: str, start: int = 0, end: Optional[int] = None) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) offsets of each sentence in text[start:end], lazily and in one pass.
+
+    Offsets exclude surrounding whitespace, so text[s:e] is the stripped sentence. Boundaries
+    are terminal punctuation followed by whitespace and a sentence opener; abbreviations
+    (Dr., e.g.), initials (J. R. Tolkien) and decimals (3.14) never split.
+    """
+    end = len(text) if end is None else end
+    sentence_start = _skip_whitespace(text, start, end)
+
+    for match in _BOUNDARY.finditer(text, sentence_start, end):
+        terminator_end = match.start(1)
+        if match.group(0)[0] == "." and _is_non_terminal_period(text, match.start(), sentence_start):
+            continue
+
+        if terminator_end > sentence_start:
+            yield sentence_start, terminator_end
+        sentence_start = match.end()
+
+    tail_end = _skip_whitespace_backwards(text, sentence_start, end)
+    if tail_end > sentence_start:
+        yield sentence_start, tail_end
+
+
+def split_sentences(text: str, min_length: int = 1) -> list[str]:
+    """Split text into stripped sentences, dropping those shorter than min_length."""
+    return [text[s:e] for s, e in iter_sentence_spans(text) if e - s >= min_length]
+
+
+def _is_non_terminal_period(text: str, period_index: int, sentence_start: int) -> bool:
+    """Check whether the period at period_index belongs to an abbreviation or an initial."""
+    if text.startswith("..", period_index):
+        return False  # Ellipsis ends a sentence
+
+    word_start = period_index
+    lower_bound = max(sentence_start, period_index - _MAX_ABBREVIATION_LENGTH - 1)
+    while word_start > lower_bound and (text[word_start - 1].isalpha() or text[word_start - 1] == "."):
+        word_start -= 1
+
+    word = text[word_start:period_index]
+    if not word:
+        return False
+    if len(word) == 1 and word.isupper():
+        return True  # Initial such as "J." in "J. R. Tolkien"
+    return word in ABBREVIATIONS
+
+
+def _skip_whitespace(text: str, index: int, end: int) -> int:
+    """Advance index past whitespace, stopping at end."""
+    while index < end and text[index].isspace():
+        index += 1
+    return index
+
+
+def _skip_whitespace_backwards(text: str, start: int, index: int) -> int:
+    """Move index back over trailing whitespace, stopping at start."""
+    while index > start and text[index - 1].isspace():
+        index -= 1
+    return index
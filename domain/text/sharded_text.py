@@ -0,0 +1,128 @@
+# domain/text/sharded_text.py - Sharded Parallel Text Processing
+"""Runs CPU-bound text stages over very large documents on a process pool.
+Text is cut into shards only at seams where the stage gives the same result on the two
+sides as on the joined text, so the stitched output matches a single-process run.
+"""
+
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+import math
+import os
+import re
+from typing import Callable, Optional, TypeVar
+
+from .sentence_tokenizer import iter_sentence_spans
+
+T = TypeVar("T", str, list[str])
+
+# Characters each side of a candidate seam used to verify it; covers the longest rewrite rule horizon
+SEAM_CONTEXT = 8192
+
+# Candidate seams tried around each target position before giving up on that shard boundary
+MAX_SEAM_CANDIDATES = 32
+
+# A lowercase word, a space, and another lowercase word: mid-sentence, away from punctuation
+_WORD_GAP = re.compile(r"[a-z] (?=[a-z])")
+
+
+def word_gap_seams(text: str, position: int) -> Iterator[int]:
+    """Candidate seams between two lowercase words, from position onwards.
+
+    Suits rewrite rules, which look at punctuation and capitals around sentence boundaries.
+    """
+    for match in _WORD_GAP.finditer(text, position):
+        yield match.end()
+
+
+def sentence_seams(text: str, position: int) -> Iterator[int]:
+    """Candidate seams at sentence starts, from position onwards (suits sentence splitting)."""
+    spans = iter_sentence_spans(text, position)
+    next(spans, None)  # The first span may start mid-sentence
+    for start, _ in spans:
+        yield start
+
+
+class ShardedTextProcessor:
+    """Maps a text stage over shards of a large text on a process pool.
+
+    Stages must be picklable top-level functions whose result for a text is the concatenation
+    of their results for its shards (str or list of sentences). Each seam is verified on
+    SEAM_CONTEXT characters either side before it is used, so the stitched output equals the
+    single-process result as long as the stage never looks further than that across a seam.
+    """
+
+    def __init__(self, threshold_chars: int = 10_000_000, workers: int = 0, min_shard_chars: int = 500_000):
+        """Create the processor.
+
+        Args:
+            threshold_chars: Texts at least this long are sharded (0 disables sharding)
+            workers: Worker processes (0 = one per CPU)
+            min_shard_chars: Smallest shard worth a round trip to a worker process
+        """
+        self.threshold_chars = threshold_chars
+        self.workers = workers or os.cpu_count() or 1
+        self.min_shard_chars = min_shard_chars
+
+    def should_shard(self, text: str) -> bool:
+        """Check whether text is large enough to be processed in parallel."""
+        return self.threshold_chars > 0 and self.workers > 1 and len(text) >= self.threshold_chars
+
+    def map_shards(self, text: str, stage: Callable[[str], T], seams: Callable[[str, int], Iterator[int]]) -> list[T]:
+        """Run stage over verified shards of text in parallel; results are in text order.
+
+        Args:
+            text: Text to process
+            stage: Picklable function applied to each shard
+            seams: Candidate seam positions at or after a position (see word_gap_seams, sentence_seams)
+
+        Returns:
+            Per-shard results; joining them gives stage(text)
+        """
+        bounds = self.plan_shards(text, stage, seams)
+        shards = [text[start:end] for start, end in bounds]
+        if len(shards) < 2:
+            return [stage(text)]
+
+        print(f"🔀 ShardedTextProcessor: {len(text)} chars in {len(shards)} shards on {self.workers} processes")
+        try:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(shards))) as pool:
+                return list(pool.map(stage, shards))
+        except Exception as e:
+            print(f"⚠️ ShardedTextProcessor: process pool failed ({e}), processing shards in this process")
+            return [stage(shard) for shard in shards]
+
+    def plan_shards(
+        self, text: str, stage: Callable[[str], T], seams: Callable[[str, int], Iterator[int]]
+    ) -> list[tuple[int, int]]:
+        """Plan (start, end) shard bounds, cutting only at seams the stage is verified not to look across."""
+        shard_chars = max(self.min_shard_chars, math.ceil(len(text) / (self.workers * 2)))
+        cuts = [0]
+        target = shard_chars
+        while target < len(text) - self.min_shard_chars // 2:
+            cut = self._find_seam(text, cuts[-1], target, stage, seams)
+            if cut is None:
+                target += shard_chars
+                continue
+            cuts.append(cut)
+            target = cut + shard_chars
+
+        cuts.append(len(text))
+        return list(zip(cuts, cuts[1:]))
+
+    def _find_seam(
+        self,
+        text: str,
+        previous_cut: int,
+        target: int,
+        stage: Callable[[str], T],
+        seams: Callable[[str, int], Iterator[int]],
+    ) -> Optional[int]:
+        """First candidate seam at or after target where stage(left) + stage(right) == stage(left + right)."""
+        for attempt, cut in enumerate(seams(text, target)):
+            if attempt >= MAX_SEAM_CANDIDATES or cut >= len(text):
+                break
+            left = text[max(previous_cut, cut - SEAM_CONTEXT) : cut]
+            right = text[cut : cut + SEAM_CONTEXT]
+            if stage(left) + stage(right) == stage(left + right):
+                return cut
+        return None
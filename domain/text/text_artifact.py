@@ -0,0 +1,99 @@
+# domain/text/text_artifact.py - Typed Text Artifacts and Transform Costs
+"""Text that remembers which pipeline stages produced it, plus per-job transform cost counters.
+Lets TextPipeline skip a stage that already ran on the same text (e.g. natural formatting
+applied by DocumentEngine and requested again by TimingEngine).
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+
+class TextStage(Enum):
+    """TextPipeline stages that can be recorded on a TextArtifact."""
+
+    CLEANED = "cleaned"  # LLM or local cleanup
+    NATURAL_FORMATTING = "natural_formatting"  # Pause markers and line breaks for TTS
+
+
+class TextArtifact(str):
+    """A string carrying the set of pipeline stages already applied to it.
+
+    Being a str, it flows through every API that takes text. String operations (slicing,
+    joining, concatenation) return plain str, so a stage record never outlives the exact text
+    it was made for; code that knows a derived string is still in the same stages (a chunk cut
+    from enhanced text) carries them over with derive().
+    """
+
+    stages: frozenset[TextStage]
+
+    def __new__(cls, text: str, stages: Iterable[TextStage] = ()) -> "TextArtifact":
+        """Wrap text together with the stages already applied to it."""
+        artifact = super().__new__(cls, text)
+        artifact.stages = frozenset(stages)
+        return artifact
+
+    def has_stage(self, stage: TextStage) -> bool:
+        """Check whether the stage was already applied to this text."""
+        return stage in self.stages
+
+    def derive(self, text: str) -> "TextArtifact":
+        """Wrap text cut from this artifact, keeping its stage record."""
+        return TextArtifact(text, self.stages)
+
+
+def text_stages(text: str) -> frozenset[TextStage]:
+    """Stages recorded on text (none for a plain str)."""
+    return text.stages if isinstance(text, TextArtifact) else frozenset()
+
+
+@dataclass
+class StageCost:
+    """Work done by one pipeline stage within a job."""
+
+    runs: int = 0
+    skipped: int = 0  # Calls answered from the artifact's stage record
+    chars: int = 0  # Input characters actually transformed
+    chars_skipped: int = 0
+    seconds: float = 0.0
+
+
+class TransformCostMeter:
+    """Per-job counters of text transformation work, keyed by stage."""
+
+    def __init__(self):
+        self.stages: dict[TextStage, StageCost] = {}
+
+    def record(self, stage: TextStage, chars: int, seconds: float) -> None:
+        """Count one run of a stage over `chars` characters."""
+        cost = self.stages.setdefault(stage, StageCost())
+        cost.runs += 1
+        cost.chars += chars
+        cost.seconds += seconds
+
+    def record_skip(self, stage: TextStage, chars: int) -> None:
+        """Count one call that was skipped because the stage had already run."""
+        cost = self.stages.setdefault(stage, StageCost())
+        cost.skipped += 1
+        cost.chars_skipped += chars
+
+    @property
+    def total_seconds(self) -> float:
+        """Time spent transforming text across all stages."""
+        return sum(cost.seconds for cost in self.stages.values())
+
+    def to_debug_info(self) -> dict[str, Any]:
+        """Summarise the counters for ProcessingResult.debug_info."""
+        info: dict[str, Any] = {
+            stage.value: {
+                "runs": cost.runs,
+                "skipped": cost.skipped,
+                "chars": cost.chars,
+                "chars_skipped": cost.chars_skipped,
+                "seconds": round(cost.seconds, 4),
+            }
+            for stage, cost in self.stages.items()
+        }
+        info["total_seconds"] = round(self.total_seconds, 4)
+        return info
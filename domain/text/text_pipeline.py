@@ -4,24 +4,117 @@ Replaces: TextCleaningService, AcademicSSMLService (as separate concerns).
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 import re
+import time
 from typing import TYPE_CHECKING, Optional
 
+from ..cancellation import check_cancelled
+from ..errors import LLM_UNAVAILABLE_MESSAGE, ApplicationError
+from .llm_chunk_sizer import AdaptiveChunkSizer
+from .rewrite_rules import RewriteRule, RuleSet
+from .sentence_tokenizer import split_sentences
+from .sharded_text import ShardedTextProcessor, sentence_seams, word_gap_seams
+from .text_artifact import TextArtifact, TextStage, TransformCostMeter, text_stages
+
 if TYPE_CHECKING:
     from ..interfaces import ILLMProvider
 
+# LLM failures that count against an input size: the model ran but timed out or returned nothing
+_MODEL_FAILURE_MARKERS = ("timeout", "timed out", "deadline", "empty response")
+_SLOW_LLM_FAILURE_SECONDS = 10.0  # Other failures this slow were most likely the model struggling with the input
+
+# Local cleanup without LLM, in application order
+BASIC_CLEANUP_RULES = RuleSet(
+    RewriteRule(r"\s+", " "),  # Excessive whitespace (includes form feeds from PDF extraction)
+    RewriteRule(r"[^\x00-\x7F]+", " "),  # Non-ASCII characters
+    RewriteRule(r"\.{3,}", "...", requires="..."),  # Multiple dots
+    RewriteRule(r"-{2,}", "--", requires="--"),  # Multiple dashes
+)
+
+# Natural formatting for TTS engines without SSML support, in application order
+NATURAL_FORMATTING_RULES = RuleSet(
+    # Extra dots after section headers for longer pauses
+    RewriteRule(r"(Abstract|Introduction|Conclusion|References)(\s*[:\.]?\s*)", r"\1\2... ", re.IGNORECASE),
+    # Pause after numbered sections with extra dots
+    RewriteRule(r"(\d+\.\s*[A-Z][^.]*\.)", r"\1.. ", horizon=8192),
+    # Line breaks around major transitions for natural pauses
+    RewriteRule(r"(However|Therefore|Furthermore|Moreover),", r"\n\1,", re.IGNORECASE, requires=","),
+    # Extra comma pause after introductory phrases
+    RewriteRule(
+        r"^(In this paper|In this study|We present|We propose|This work),",
+        r"\1,,",
+        re.IGNORECASE | re.MULTILINE,
+        requires=",",
+    ),
+    # Single dots between sentences become double for slightly longer pauses (ellipses kept)
+    RewriteRule(r"(?<![.])\.(?![.])\s+(?=[A-Z])", ".. ", requires="."),
+    # Commas after "First", "Second", etc. if not already present
+    RewriteRule(
+        r"\b(First|Second|Third|Fourth|Fifth|Finally|Additionally|Specifically)(?!,)\s", r"\1, ", re.IGNORECASE
+    ),
+    # Consistent ellipsis spacing
+    RewriteRule(r"\.{3,}", "... ", requires="..."),
+)
+
+
+def apply_natural_formatting(text: str) -> str:
+    """Apply NATURAL_FORMATTING_RULES (top-level so worker processes can run it on shards)."""
+    return NATURAL_FORMATTING_RULES.apply(text)
+
+
+# Cost meter of the job running in the current context (set by TextPipeline.track_transform_costs)
+_job_transform_costs: ContextVar[Optional[TransformCostMeter]] = ContextVar("job_transform_costs", default=None)
+
+
+@dataclass(frozen=True)
+class LLMTimeBudget:
+    """Wall-clock allowance for LLM cleaning calls within a single job."""
+
+    deadline: float  # time.monotonic() value after which the LLM is no longer called
+
+    @classmethod
+    def start(cls, seconds: float) -> "LLMTimeBudget":
+        """Create a budget that expires `seconds` from now."""
+        return cls(deadline=time.monotonic() + seconds)
+
+    @property
+    def remaining_seconds(self) -> float:
+        """Seconds left before the budget runs out."""
+        return max(0.0, self.deadline - time.monotonic())
+
+    @property
+    def is_exhausted(self) -> bool:
+        """Check whether the deadline has passed."""
+        return time.monotonic() >= self.deadline
+
 
 class ITextPipeline(ABC):
     """Unified interface for text processing operations."""
 
     @abstractmethod
-    def clean_text(self, raw_text: str) -> str:
+    def clean_text(self, raw_text: str, llm_budget: Optional[LLMTimeBudget] = None) -> str:
         """Clean and prepare text for TTS."""
 
     @abstractmethod
-    async def clean_text_async(self, raw_text: str) -> str:
+    async def clean_text_async(self, raw_text: str, llm_budget: Optional[LLMTimeBudget] = None) -> str:
         """Clean and prepare text for TTS asynchronously with rate limiting."""
 
+    @abstractmethod
+    def clean_text_locally(self, raw_text: str) -> str:
+        """Clean text with the local rules only, never calling the LLM."""
+
+    @abstractmethod
+    def recommend_llm_chunk_size(self, total_chars: int, default_size: int, concurrency: int = 1) -> int:
+        """Pick the LLM chunk size for a job of `total_chars` characters."""
+
+    @abstractmethod
+    def create_llm_budget(self) -> Optional[LLMTimeBudget]:
+        """Start a per-job LLM time budget (None when unlimited)."""
+
     @abstractmethod
     def enhance_with_natural_formatting(self, text: str) -> str:
         """Add natural formatting enhancements to text."""
@@ -30,6 +123,14 @@ class ITextPipeline(ABC):
     def split_into_sentences(self, text: str) -> list[str]:
         """Split text into sentences for processing."""
 
+    @abstractmethod
+    def split_into_tts_sentences(self, text: str) -> list[str]:
+        """Split formatted text into every sentence, for packing into TTS chunks."""
+
+    @abstractmethod
+    def track_transform_costs(self) -> AbstractContextManager[TransformCostMeter]:
+        """Count the text transformation work of one job."""
+
 
 class TextPipeline(ITextPipeline):
     """Unified text processing pipeline with high cohesion.
@@ -41,13 +142,31 @@ class TextPipeline(ITextPipeline):
         llm_provider: Optional["ILLMProvider"] = None,
         enable_cleaning: bool = True,
         enable_natural_formatting: bool = True,
+        llm_time_budget_seconds: float = 0.0,
+        chunk_sizer: Optional[AdaptiveChunkSizer] = None,
+        sharded_processor: Optional[ShardedTextProcessor] = None,
     ):
         self.llm_provider = llm_provider
         self.enable_cleaning = enable_cleaning
         self.enable_natural_formatting = enable_natural_formatting
+        self.llm_time_budget_seconds = llm_time_budget_seconds  # Per-job LLM allowance, 0 = unlimited
+        self.chunk_sizer = chunk_sizer  # Learns reliable/fast LLM input sizes; None keeps static sizes
+        self.sharded_processor = sharded_processor  # Parallel formatting/splitting for very large text
+
+    def clean_text(self, raw_text: str, llm_budget: Optional[LLMTimeBudget] = None) -> str:
+        """Clean and prepare text for TTS processing.
+
+        Args:
+            raw_text: Text to clean; a TextArtifact already recorded as cleaned is returned as is
+            llm_budget: Optional per-job LLM time budget; once exhausted the local cleaner is used
+
+        Returns:
+            TextArtifact recording the cleaning stage
+        """
+        return self._run_stage(TextStage.CLEANED, raw_text, lambda text: self._clean_text(text, llm_budget))
 
-    def clean_text(self, raw_text: str) -> str:
-        """Clean and prepare text for TTS processing."""
+    def _clean_text(self, raw_text: str, llm_budget: Optional[LLMTimeBudget]) -> str:
+        """Clean text with the LLM when allowed, falling back to local cleanup."""
         print(f"🔬 TextPipeline.clean_text(): Input {len(raw_text)} chars")
 
         if not self.enable_cleaning or not self.llm_provider:
@@ -57,45 +176,73 @@ class TextPipeline(ITextPipeline):
             print(f"   → Basic cleanup result: {len(result)} chars")
             return result
 
+        if not self._can_use_llm(llm_budget):
+            result = self._basic_text_cleanup(raw_text)
+            print(f"   → Basic cleanup result: {len(result)} chars")
+            return result
+
         try:
             # Use LLM for advanced cleaning
             print(f"   → Using LLM cleaning (provider: {type(self.llm_provider).__name__})")
-            cleaning_prompt = self._generate_cleaning_prompt(raw_text)
-            print(f"   → Generated cleaning prompt ({len(cleaning_prompt)} chars)")
-
-            print("   → Calling LLM API...")
-            result = self.llm_provider.generate_content(cleaning_prompt)
 
-            if result.is_success:
-                cleaned = result.value
-                print(f"   → LLM success: {len(cleaned)} chars returned")
-                # Basic validation of LLM output
-                if (
-                    cleaned and len(cleaned) > len(raw_text) * 0.05
-                ):  # At least 5% of original length (cleaning should reduce size)
-                    print("   → LLM output valid, applying basic cleanup")
-                    final_result = self._basic_text_cleanup(cleaned)
-                    print(f"   → Final result: {len(final_result)} chars")
-                    return final_result
-                else:
-                    print(f"   → LLM output too short ({len(cleaned) if cleaned else 0} chars), trying smaller chunks")
+            if self.chunk_sizer and not self.chunk_sizer.is_reliable_size(len(raw_text)):
+                # This size has mostly failed before - go straight to sub-chunks instead of failing slowly
+                print(f"   → {len(raw_text)} chars is a known-unreliable LLM input size, splitting up front")
             else:
-                print(f"   → LLM failed: {result.error}")
+                cleaning_prompt = self._generate_cleaning_prompt(raw_text)
+                print(f"   → Generated cleaning prompt ({len(cleaning_prompt)} chars)")
+
+                print("   → Calling LLM API...")
+                start_time = time.monotonic()
+                result = self.llm_provider.generate_content(cleaning_prompt)
+                elapsed = time.monotonic() - start_time
+
+                if result.is_success:
+                    cleaned = result.value
+                    print(f"   → LLM success: {len(cleaned)} chars returned")
+                    # Basic validation of LLM output
+                    if (
+                        cleaned and len(cleaned) > len(raw_text) * 0.05
+                    ):  # At least 5% of original length (cleaning should reduce size)
+                        self._record_llm_outcome(len(raw_text), elapsed, success=True)
+                        print("   → LLM output valid, applying basic cleanup")
+                        final_result = self._basic_text_cleanup(cleaned)
+                        print(f"   → Final result: {len(final_result)} chars")
+                        return final_result
+                    else:
+                        print(
+                            f"   → LLM output too short ({len(cleaned) if cleaned else 0} chars), trying smaller chunks"
+                        )
+                        self._record_llm_outcome(len(raw_text), elapsed, success=False)
+                else:
+                    print(f"   → LLM failed: {result.error}")
+                    self._record_llm_failure(len(raw_text), elapsed, result.error)
 
             # If large chunk failed, try processing in smaller pieces
-            if len(raw_text) > 15000:
-                print("   → Attempting retry with smaller chunks (15K chars each)")
-                chunk_size = 15000
+            chunk_size = self.chunk_sizer.retry_chunk_size(len(raw_text)) if self.chunk_sizer else 15000
+            if len(raw_text) > chunk_size:
+                print(f"   → Attempting retry with smaller chunks ({chunk_size} chars each)")
                 cleaned_parts = []
 
                 for i in range(0, len(raw_text), chunk_size):
                     chunk = raw_text[i : i + chunk_size]
                     print(f"     → Processing sub-chunk {i//chunk_size + 1} ({len(chunk)} chars)")
 
+                    if not self._can_use_llm(llm_budget):
+                        cleaned_parts.append(self._basic_text_cleanup(chunk))
+                        continue
+
                     sub_prompt = self._generate_cleaning_prompt(chunk)
+                    start_time = time.monotonic()
                     sub_result = self.llm_provider.generate_content(sub_prompt)
+                    sub_elapsed = time.monotonic() - start_time
+                    sub_succeeded = sub_result.is_success and bool(sub_result.value)
+                    if sub_result.is_success:
+                        self._record_llm_outcome(len(chunk), sub_elapsed, sub_succeeded)
+                    else:
+                        self._record_llm_failure(len(chunk), sub_elapsed, sub_result.error)
 
-                    if sub_result.is_success and sub_result.value:
+                    if sub_succeeded:
                         cleaned_parts.append(sub_result.value)
                         print(f"     → Sub-chunk success: {len(sub_result.value)} chars")
                     else:
@@ -120,26 +267,88 @@ class TextPipeline(ITextPipeline):
             print(f"   → Exception fallback result: {len(fallback_result)} chars")
             return fallback_result
 
-    async def clean_text_async(self, raw_text: str) -> str:
+    def recommend_llm_chunk_size(self, total_chars: int, default_size: int, concurrency: int = 1) -> int:
+        """Pick the LLM chunk size for a job, using learned latency/failure data when available."""
+        if not self.chunk_sizer or not self.enable_cleaning or not self.llm_provider:
+            return default_size
+        return self.chunk_sizer.recommend_chunk_size(total_chars, concurrency)
+
+    def _record_llm_outcome(self, input_chars: int, elapsed: float, success: bool) -> None:
+        """Feed one LLM call's outcome to the adaptive chunk sizer."""
+        if self.chunk_sizer:
+            self.chunk_sizer.record(input_chars, elapsed, success)
+
+    def _record_llm_failure(self, input_chars: int, elapsed: float, error: Optional[ApplicationError]) -> None:
+        """Record a failed LLM call against its input size, but only when the model actually ran.
+
+        Calls refused by the circuit breaker or made without a client say nothing about the
+        size, and neither does a quick transport error; a timeout or a slow failure does.
+        """
+        if error is None or error.message == LLM_UNAVAILABLE_MESSAGE:
+            return
+        details = str(error.details or "").lower()
+        model_ran = any(marker in details for marker in _MODEL_FAILURE_MARKERS)
+        if model_ran or elapsed >= _SLOW_LLM_FAILURE_SECONDS:
+            self._record_llm_outcome(input_chars, elapsed, success=False)
+
+    def create_llm_budget(self) -> Optional[LLMTimeBudget]:
+        """Start a fresh LLM time budget for one job (None when unlimited)."""
+        if self.llm_time_budget_seconds <= 0:
+            return None
+        return LLMTimeBudget.start(self.llm_time_budget_seconds)
+
+    def _can_use_llm(self, llm_budget: Optional[LLMTimeBudget]) -> bool:
+        """Check the job's LLM time budget and the provider's availability (circuit breaker).
+
+        Raises:
+            JobCancelledError: When the job was cancelled, so no further LLM calls are made for it
+        """
+        check_cancelled()
+        if llm_budget is not None and llm_budget.is_exhausted:
+            print("   → LLM time budget exhausted, using basic cleanup")
+            return False
+
+        if self.llm_provider is not None and not self.llm_provider.is_available():
+            print("   → LLM provider unavailable (circuit open), using basic cleanup")
+            return False
+
+        return True
+
+    async def clean_text_async(self, raw_text: str, llm_budget: Optional[LLMTimeBudget] = None) -> str:
         """Clean and prepare text for TTS processing asynchronously."""
-        if not self.enable_cleaning or not self.llm_provider:
+        if self._already_applied(TextStage.CLEANED, raw_text):
+            return raw_text
+
+        started = time.perf_counter()
+        cleaned = await self._clean_text_async(raw_text, llm_budget)
+        return self._finish_stage(TextStage.CLEANED, raw_text, cleaned, started)
+
+    async def _clean_text_async(self, raw_text: str, llm_budget: Optional[LLMTimeBudget]) -> str:
+        """Clean text with the async LLM API when allowed, falling back to local cleanup."""
+        if not self.enable_cleaning or not self.llm_provider or not self._can_use_llm(llm_budget):
             return self._basic_text_cleanup(raw_text)
 
         # Check if async method is available
         if not hasattr(self.llm_provider, "generate_content_async"):
             print("TextPipeline: Async cleaning not available, using sync method")
-            return self.clean_text(raw_text)
+            return self._clean_text(raw_text, llm_budget)
 
         try:
             # Use async LLM for advanced cleaning with rate limiting
             cleaning_prompt = self._generate_cleaning_prompt(raw_text)
+            start_time = time.monotonic()
             result = await self.llm_provider.generate_content_async(cleaning_prompt)
+            elapsed = time.monotonic() - start_time
 
             if result.is_success:
                 cleaned = result.value
                 # Basic validation of LLM output
                 if cleaned and len(cleaned) > len(raw_text) * 0.3:  # At least 30% of original length
+                    self._record_llm_outcome(len(raw_text), elapsed, success=True)
                     return self._basic_text_cleanup(cleaned)
+                self._record_llm_outcome(len(raw_text), elapsed, success=False)
+            else:
+                self._record_llm_failure(len(raw_text), elapsed, result.error)
 
             # Fallback to basic cleaning if LLM fails
             return self._basic_text_cleanup(raw_text)
@@ -149,38 +358,75 @@ class TextPipeline(ITextPipeline):
             return self._basic_text_cleanup(raw_text)
 
     def enhance_with_natural_formatting(self, text: str) -> str:
-        """Add natural formatting for better speech synthesis (Piper-optimized)."""
+        """Add natural formatting for better speech synthesis (Piper-optimized).
+
+        Text already recorded as formatted is returned unchanged, so pause markers such as
+        ".." are never compounded when a later engine asks for formatting again.
+        """
         if not self.enable_natural_formatting:
             return text
 
-        return self._enhance_with_natural_formatting(text)
+        return self._run_stage(TextStage.NATURAL_FORMATTING, text, self._enhance_with_natural_formatting)
 
     def split_into_sentences(self, text: str) -> list[str]:
         """Split text into sentences for individual processing."""
-        # Use text directly since we only generate natural formatting (no markup)
-        clean_text = text
+        # Shared tokenizer handles abbreviations (Dr., Mr., e.g.), initials and decimals;
+        # very short fragments are filtered out
+        return split_sentences(text, min_length=11)
+
+    def split_into_tts_sentences(self, text: str) -> list[str]:
+        """Split formatted text into every sentence (no length filter), sharded when very large."""
+        if self.sharded_processor and self.sharded_processor.should_shard(text):
+            shards = self.sharded_processor.map_shards(text, split_sentences, sentence_seams)
+            return [sentence for shard in shards for sentence in shard]
+        return split_sentences(text)
+
+    def clean_text_locally(self, raw_text: str) -> str:
+        """Clean text with the local rules only (used for spans that are already clean)."""
+        return self._run_stage(TextStage.CLEANED, raw_text, self._basic_text_cleanup)
+
+    @contextmanager
+    def track_transform_costs(self) -> Iterator[TransformCostMeter]:
+        """Count the text transformation work of one job.
+
+        Stages run (or skipped) in this context, including by engines further down the job such
+        as TimingEngine, are recorded in the yielded meter.
+        """
+        meter = TransformCostMeter()
+        token = _job_transform_costs.set(meter)
+        try:
+            yield meter
+        finally:
+            _job_transform_costs.reset(token)
 
-        # Handle abbreviations better - don't split on Dr., Mr., etc.
-        # Basic sentence splitting with common edge cases
-        sentences = re.split(r"(?<!\bDr\.)(?<!\bMr\.)(?<!\bMs\.)(?<!\bProf\.)(?<=[.!?])\s+(?=[A-Z])", clean_text)
+    def _run_stage(self, stage: TextStage, text: str, transform: Callable[[str], str]) -> str:
+        """Apply one stage unless the text already records it, and count the work."""
+        if self._already_applied(stage, text):
+            return text
 
-        # Filter out very short sentences and clean up (immutable)
-        return [sentence.strip() for sentence in sentences if sentence.strip() and len(sentence.strip()) > 10]
+        started = time.perf_counter()
+        return self._finish_stage(stage, text, transform(text), started)
 
-    def _basic_text_cleanup(self, text: str) -> str:
-        """Basic text cleanup without LLM."""
-        # Remove excessive whitespace
-        text = re.sub(r"\s+", " ", text)
+    def _already_applied(self, stage: TextStage, text: str) -> bool:
+        """Check the text's stage record, counting a skip for the current job."""
+        if stage not in text_stages(text):
+            return False
 
-        # Remove common PDF artifacts
-        text = re.sub(r"\f", " ", text)  # Form feed
-        text = re.sub(r"[^\x00-\x7F]+", " ", text)  # Non-ASCII characters
+        meter = _job_transform_costs.get()
+        if meter:
+            meter.record_skip(stage, len(text))
+        return True
 
-        # Clean up punctuation
-        text = re.sub(r"\.{3,}", "...", text)  # Multiple dots
-        text = re.sub(r"-{2,}", "--", text)  # Multiple dashes
+    def _finish_stage(self, stage: TextStage, text: str, result: str, started: float) -> TextArtifact:
+        """Count a completed stage and record it on the result."""
+        meter = _job_transform_costs.get()
+        if meter:
+            meter.record(stage, len(text), time.perf_counter() - started)
+        return TextArtifact(result, text_stages(text) | {stage})
 
-        return text.strip()
+    def _basic_text_cleanup(self, text: str) -> str:
+        """Basic text cleanup without LLM."""
+        return BASIC_CLEANUP_RULES.apply(text).strip()
 
     def _generate_cleaning_prompt(self, text: str) -> str:
         """Generate LLM prompt for text cleaning (optimized for natural speech)."""
@@ -204,69 +450,11 @@ Text:
 {text}"""
 
     def _enhance_with_natural_formatting(self, text: str) -> str:
-        """Apply natural formatting tricks for TTS engines without SSML support."""
-        enhanced = text
-
-        # 1. Add natural emphasis (order matters)
-        enhanced = self._add_natural_emphasis(enhanced)
-
-        # 2. Add academic formatting (universal approach)
-        enhanced = self._add_natural_academic_formatting(enhanced)
-
-        # 3. Enhance punctuation for better rhythm
-        enhanced = self._enhance_punctuation_for_natural_speech(enhanced)
-
-        return enhanced
-
-    def _add_natural_emphasis(self, text: str) -> str:
-        """Add natural emphasis without SSML tags."""
-        # Already quoted text gets natural emphasis from quotes
-        # No changes needed for quoted text as TTS engines naturally emphasize quotes
-
-        # For research papers, we could uppercase key transitional words
-        # But this might sound unnatural, so we'll rely on punctuation
-
-        return text
-
-    def _add_natural_academic_formatting(self, text: str) -> str:
-        """Add natural formatting for academic content without SSML."""
-        # Add extra dots after section headers for longer pauses
-        text = re.sub(
-            r"(Abstract|Introduction|Conclusion|References)(\s*[:\.]?\s*)", r"\1\2... ", text, flags=re.IGNORECASE
-        )
-
-        # Add pause after numbered sections with extra dots
-        text = re.sub(r"(\d+\.\s*[A-Z][^.]*\.)", r"\1.. ", text)
-
-        # Add line breaks around major transitions for natural pauses
-        text = re.sub(r"(However|Therefore|Furthermore|Moreover),", r"\n\1,", text, flags=re.IGNORECASE)
-
-        return text
-
-    def _enhance_punctuation_for_natural_speech(self, text: str) -> str:
-        """Enhance punctuation for better natural speech rhythm."""
-        # Add extra comma pauses where beneficial
-        # After introductory phrases
-        text = re.sub(
-            r"^(In this paper|In this study|We present|We propose|This work),",
-            r"\1,,",
-            text,
-            flags=re.IGNORECASE | re.MULTILINE,
-        )
-
-        # Convert single dots between sentences to double for slightly longer pauses
-        # But preserve ellipsis (...)
-        text = re.sub(r"(?<![.])\.(?![.])\s+(?=[A-Z])", r".. ", text)
-
-        # Add commas after "First", "Second", etc. if not already present
-        text = re.sub(
-            r"\b(First|Second|Third|Fourth|Fifth|Finally|Additionally|Specifically)(?!,)\s",
-            r"\1, ",
-            text,
-            flags=re.IGNORECASE,
-        )
-
-        # Ensure ellipsis has consistent spacing
-        text = re.sub(r"\.{3,}", "... ", text)
-
-        return text
+        """Apply natural formatting tricks for TTS engines without SSML support.
+
+        Quoted text needs no emphasis markup (TTS engines stress quotes naturally); pauses come
+        from the extra dots, commas and line breaks added by NATURAL_FORMATTING_RULES.
+        """
+        if self.sharded_processor and self.sharded_processor.should_shard(text):
+            return "".join(self.sharded_processor.map_shards(text, apply_natural_formatting, word_gap_seams))
+        return apply_natural_formatting(text)
@@ -0,0 +1,195 @@
+# domain/text/text_quality_scorer.py - Local Text Quality Scoring
+"""Fast local text-quality scoring used to decide which spans need LLM cleaning.
+Clean born-digital text scores high and skips the LLM; garbled or OCR-noisy text scores low.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import re
+import statistics
+from typing import ClassVar, Optional
+
+_TOKEN = re.compile(r"\S+")
+_LETTER = re.compile(r"[A-Za-z]")
+_ALPHA_TOKEN = re.compile(r"^[\"'(\[]*([A-Za-z][A-Za-z'\u2019-]*)[\"')\].,;:!?]*$")
+# A plausible English word: capitalized or lowercase, no letter tripled, at least one vowel
+_WORD_SHAPE = re.compile(r"^(?:[A-Z]?[a-z]+|[A-Z]+)(?:['\u2019-][a-z]+)*$")
+_VOWEL = re.compile(r"[aeiouyAEIOUY]")
+_CONSONANT_RUN = re.compile(r"[^aeiouyAEIOUY'\u2019-]{6,}")
+_TRIPLE_LETTER = re.compile(r"([A-Za-z])\1\1")
+_MIXED_ALNUM = re.compile(r"(?:[A-Za-z]\d|\d[A-Za-z])")
+_NOISE_CHAR = re.compile(r"[^\w\s.,;:!?'\"()\[\]{}%&/@#$*+=<>\u2018\u2019\u201c\u201d\u2013\u2014-]")
+_BROKEN_HYPHEN = re.compile(r"[A-Za-z]-\s*\n\s*[a-z]|[a-z]- [a-z]")
+
+# Short function words that fail shape heuristics or are too common to judge
+_COMMON_WORDS = frozenset(
+    {
+        "a",
+        "i",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "had",
+        "has",
+        "have",
+        "he",
+        "her",
+        "his",
+        "in",
+        "is",
+        "it",
+        "its",
+        "my",
+        "no",
+        "not",
+        "of",
+        "on",
+        "or",
+        "our",
+        "she",
+        "so",
+        "than",
+        "that",
+        "the",
+        "their",
+        "them",
+        "they",
+        "this",
+        "to",
+        "was",
+        "we",
+        "were",
+        "what",
+        "when",
+        "which",
+        "who",
+        "will",
+        "with",
+        "you",
+    }
+)
+
+
+@dataclass(frozen=True)
+class QualityScore:
+    """Text quality assessment; every component is in [0, 1] where 1 means clean."""
+
+    score: float
+    word_likeness: float
+    hyphenation: float
+    digit_noise: float
+    line_regularity: float
+    ocr_confidence: Optional[float] = None
+
+
+class TextQualityScorer:
+    """Scores text spans so only low-quality spans are sent to the LLM for cleaning."""
+
+    _WEIGHTS: ClassVar[Mapping[str, float]] = {
+        "word_likeness": 0.45,
+        "hyphenation": 0.15,
+        "digit_noise": 0.2,
+        "line_regularity": 0.2,
+    }
+    _OCR_WEIGHT = 0.25
+
+    def __init__(self, threshold: float = 0.85, min_tokens: int = 20):
+        """Initialize the scorer.
+
+        Args:
+            threshold: Spans scoring below this are routed to the LLM
+            min_tokens: Spans with fewer tokens are too short to judge and always go to the LLM
+        """
+        self.threshold = threshold
+        self.min_tokens = min_tokens
+
+    def score(self, text: str, ocr_confidence: Optional[float] = None) -> QualityScore:
+        """Score a text span.
+
+        Args:
+            text: Text to assess (line breaks preserved for line-length analysis)
+            ocr_confidence: Mean OCR confidence in [0, 1] when the text came from OCR
+        """
+        tokens = _TOKEN.findall(text)
+        if len(tokens) < self.min_tokens:
+            return QualityScore(0.0, 0.0, 0.0, 0.0, 0.0, ocr_confidence)
+
+        components = {
+            "word_likeness": self._word_likeness(tokens),
+            "hyphenation": self._hyphenation(text, len(tokens)),
+            "digit_noise": self._digit_noise(text, tokens),
+            "line_regularity": self._line_regularity(text),
+        }
+
+        weighted = sum(self._WEIGHTS[name] * value for name, value in components.items())
+        total_weight = sum(self._WEIGHTS.values())
+        if ocr_confidence is not None:
+            weighted += self._OCR_WEIGHT * max(0.0, min(1.0, ocr_confidence))
+            total_weight += self._OCR_WEIGHT
+
+        return QualityScore(score=weighted / total_weight, ocr_confidence=ocr_confidence, **components)
+
+    def needs_llm(self, text: str, ocr_confidence: Optional[float] = None) -> bool:
+        """Check whether a span scores below the routing threshold."""
+        return self.score(text, ocr_confidence).score < self.threshold
+
+    def _word_likeness(self, tokens: list[str]) -> float:
+        """Share of letter-bearing tokens that look like real words (a dictionary-free lexicon check)."""
+        lettered = [token for token in tokens if _LETTER.search(token)]
+        if not lettered:
+            return 0.0
+
+        plausible = 0
+        for token in lettered:
+            match = _ALPHA_TOKEN.match(token)
+            if match and self._is_plausible_word(match.group(1)):
+                plausible += 1
+        return plausible / len(lettered)
+
+    @staticmethod
+    def _is_plausible_word(word: str) -> bool:
+        """Check a word against common function words and English letter-shape rules."""
+        if word.lower() in _COMMON_WORDS:
+            return True
+        return (
+            bool(_WORD_SHAPE.match(word))
+            and bool(_VOWEL.search(word))
+            and not _CONSONANT_RUN.search(word)
+            and not _TRIPLE_LETTER.search(word)
+            and len(word) <= 25
+        )
+
+    @staticmethod
+    def _hyphenation(text: str, token_count: int) -> float:
+        """Penalize words broken across lines (≥1 per 50 tokens scores 0)."""
+        broken = len(_BROKEN_HYPHEN.findall(text))
+        return max(0.0, 1.0 - broken * 50 / token_count)
+
+    @staticmethod
+    def _digit_noise(text: str, tokens: list[str]) -> float:
+        """Penalize letter/digit mixtures like 'th1s' and stray symbol characters."""
+        mixed = sum(1 for token in tokens if _MIXED_ALNUM.search(token))
+        noise_chars = len(_NOISE_CHAR.findall(text))
+        mixed_ratio = mixed / len(tokens)
+        noise_ratio = noise_chars / max(1, len(text))
+        return max(0.0, 1.0 - mixed_ratio * 10 - noise_ratio * 20)
+
+    @staticmethod
+    def _line_regularity(text: str) -> float:
+        """Penalize erratic line lengths typical of broken layouts and OCR debris."""
+        lengths = [len(line.strip()) for line in text.splitlines() if line.strip()]
+        if len(lengths) < 3:
+            return 1.0  # Reflowed or single-line text carries no layout signal
+
+        # Ignore the ragged last line of each paragraph by using the median as reference
+        median = statistics.median(lengths)
+        if median == 0:
+            return 0.0
+        variation = statistics.pstdev(lengths) / median
+        return max(0.0, min(1.0, 1.4 - variation))
@@ -0,0 +1,97 @@
+# domain/workspace.py - Job-Scoped Scratch Workspaces
+"""Scratch directories holding one job's intermediate files.
+While a job runs inside workspace_scope(), its intermediates (OCR page images, measurement
+WAVs, the combined WAV, ffmpeg list files, spilled chunk audio) are written to the job's
+workspace instead of the public output folder. The workspace is removed in one operation
+when the job ends; only finished artefacts are moved out of it with publish_file().
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import errno
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+
+class JobWorkspace:
+    """One job's scratch directory."""
+
+    def __init__(self, directory: str, job_name: str = ""):
+        self.directory = directory
+        self.job_name = job_name
+
+    def path(self, name: str) -> str:
+        """Path for an intermediate file called name (only its base name is used)."""
+        return os.path.join(self.directory, os.path.basename(name))
+
+    def save(self, content: bytes, suffix: str = ".tmp") -> str:
+        """Write content to a new uniquely named file in the workspace and return its path."""
+        fd, path = tempfile.mkstemp(suffix=suffix, dir=self.directory)
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        return path
+
+    def cleanup(self) -> None:
+        """Remove the workspace and everything left in it."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+# Workspace of the job running in the current context (set by workspace_scope)
+_current_workspace: ContextVar[Optional[JobWorkspace]] = ContextVar("job_workspace", default=None)
+
+
+@contextmanager
+def workspace_scope(workspace: JobWorkspace) -> Iterator[JobWorkspace]:
+    """Make workspace the current job's workspace for code run in this context, removing it afterwards."""
+    context_token = _current_workspace.set(workspace)
+    try:
+        yield workspace
+    finally:
+        _current_workspace.reset(context_token)
+        workspace.cleanup()
+
+
+def current_workspace() -> Optional[JobWorkspace]:
+    """The current job's workspace (None outside a job)."""
+    return _current_workspace.get()
+
+
+def scratch_path(name: str, fallback_dir: str) -> str:
+    """Path for an intermediate file: in the current job's workspace, or in fallback_dir outside a job."""
+    workspace = _current_workspace.get()
+    if workspace is None:
+        return os.path.join(fallback_dir, os.path.basename(name))
+    return workspace.path(name)
+
+
+def publish_file(path: str, destination: str) -> str:
+    """Move a finished file to destination atomically, so a partial file is never visible there.
+
+    A rename within one filesystem is atomic. A workspace on another filesystem (e.g. tmpfs)
+    is first copied to a hidden temporary file beside destination, which is then renamed.
+    """
+    if os.path.abspath(path) == os.path.abspath(destination):
+        return destination
+    try:
+        os.replace(path, destination)
+        return destination
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(destination)}.", suffix=".partial", dir=os.path.dirname(destination) or None
+    )
+    try:
+        with os.fdopen(fd, "wb") as target, open(path, "rb") as source:
+            shutil.copyfileobj(source, target)
+        shutil.copymode(path, temp_path)
+        os.replace(temp_path, destination)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    os.unlink(path)
+    return destination
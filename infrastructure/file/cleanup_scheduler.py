@@ -1,45 +1,156 @@
 """Background service for managing cleanup of old files.
-Runs in a separate thread to periodically remove expired files.
+Runs in a separate thread to periodically remove expired files, and evicts the least
+recently accessed files early when the watched directory grows past its disk quota.
 """
 
+from dataclasses import dataclass
+import heapq
+import itertools
+import os
 import threading
 import time
+from typing import Any, Callable, Optional
 
 from domain.interfaces import IFileManager
 
 
+@dataclass
+class _TrackedFile:
+    """Deadline, size and last access of one tracked file."""
+
+    deadline: float
+    size: int
+    last_access: float
+    expiry_entry: int  # Sequence number of the file's live entry in the expiry heap
+    access_entry: int  # Sequence number of the file's live entry in the access heap
+
+
 class FileCleanupScheduler:
     """Background thread service for periodic cleanup of expired files.
     Monitors registered files and removes them when they exceed max age.
+
+    Tracked files are indexed by two min-heaps: one by expiry deadline and one by last
+    access. Rescheduling or touching a file pushes a new entry and leaves the old one to be
+    skipped when it surfaces, so every operation is O(log n) however many files are
+    tracked. Files are deleted outside the lock, so serving and scheduling never wait on
+    the file system.
     """
 
-    def __init__(self, file_manager: IFileManager, max_file_age_seconds: int, check_interval_seconds: int):
+    def __init__(
+        self,
+        file_manager: IFileManager,
+        max_file_age_seconds: int,
+        check_interval_seconds: int,
+        watch_dir: Optional[str] = None,
+        max_disk_usage_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
         """Initialize the cleanup scheduler (does not start automatically).
 
         Args:
             file_manager: IFileManager implementation for file operations
             max_file_age_seconds: Maximum file age before deletion
             check_interval_seconds: How often to check for expired files
+            watch_dir: Directory whose files are tracked from a scan on start (None = only scheduled files)
+            max_disk_usage_bytes: Evict least recently accessed files beyond this total size (None = no quota)
+            clock: Wall-clock time source, comparable with file mtimes (injectable for tests)
         """
         self.file_manager = file_manager
         self.max_file_age_seconds = max_file_age_seconds
         self.check_interval_seconds = check_interval_seconds
+        self.watch_dir = os.path.abspath(watch_dir) if watch_dir else None
+        self.max_disk_usage_bytes = max_disk_usage_bytes
+        self._clock = clock
 
         # Thread-safe file tracking
         self._lock = threading.Lock()
-        self._scheduled_files: dict[str, float] = {}  # {filepath: creation_timestamp}
+        self._tracked: dict[str, _TrackedFile] = {}
+        self._expiry_heap: list[tuple[float, int, str]] = []  # (deadline, entry, filepath)
+        self._access_heap: list[tuple[float, int, str]] = []  # (last access, entry, filepath)
+        self._entries = itertools.count()
+        self._total_bytes = 0
+        self._files_removed = 0
+        self._bytes_freed = 0
 
         self._stop_event = threading.Event()
+        self._wake_event = threading.Event()  # Set when the quota is exceeded or on stop
         self._thread = threading.Thread(target=self._cleanup_job, daemon=True)
 
-    def schedule(self, filepath: str) -> None:
-        """Schedule a file for cleanup monitoring."""
+    def schedule(self, filepath: str, size: Optional[int] = None) -> None:
+        """Schedule a file for cleanup monitoring (rescheduling restarts its max age)."""
+        filepath = os.path.abspath(filepath)
+        if size is None:
+            try:
+                size = os.path.getsize(filepath)
+            except OSError:
+                size = 0
+        now = self._clock()
+        with self._lock:
+            self._track(filepath, now + self.max_file_age_seconds, size, now)
+            over_quota = self._over_quota()
+        if over_quota:
+            self._wake_event.set()
+
+    def touch(self, filepath: str) -> None:
+        """Record that a tracked file was accessed, moving it to the back of the eviction order."""
+        filepath = os.path.abspath(filepath)
         with self._lock:
-            self._scheduled_files[filepath] = time.time()
+            tracked = self._tracked.get(filepath)
+            if tracked is None:
+                return
+            tracked.last_access = self._clock()
+            tracked.access_entry = next(self._entries)
+            heapq.heappush(self._access_heap, (tracked.last_access, tracked.access_entry, filepath))
+            self._compact_if_sparse()
+
+    def untrack(self, filepath: str) -> None:
+        """Stop tracking a file deleted by someone else, so it no longer counts towards the quota."""
+        filepath = os.path.abspath(filepath)
+        with self._lock:
+            if filepath in self._tracked:
+                self._untrack(filepath)
+                self._compact_if_sparse()
+
+    def rebuild_from_directory(self) -> int:
+        """Replace the tracked files with the files in watch_dir; returns how many are tracked.
+
+        A file's deadline is its modification time plus the max age; its last access is its
+        access time (its modification time on file systems mounted without atime).
+        """
+        if not self.watch_dir or not os.path.isdir(self.watch_dir):
+            return 0
+        scanned = []
+        with os.scandir(self.watch_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        scanned.append((os.path.abspath(entry.path), stat))
+                except OSError:
+                    continue
+
+        with self._lock:
+            self._tracked.clear()
+            self._total_bytes = 0
+            for filepath, stat in scanned:
+                entry = next(self._entries)
+                self._tracked[filepath] = _TrackedFile(
+                    deadline=stat.st_mtime + self.max_file_age_seconds,
+                    size=stat.st_size,
+                    last_access=max(stat.st_atime, stat.st_mtime),
+                    expiry_entry=entry,
+                    access_entry=entry,
+                )
+                self._total_bytes += stat.st_size
+            self._rebuild_heaps()  # heapify: O(n) for the whole scan
+            return len(self._tracked)
 
     def start(self) -> None:
-        """Start the background cleanup thread."""
+        """Rebuild the tracked files from watch_dir and start the background cleanup thread."""
         if not self._thread.is_alive():
+            tracked = self.rebuild_from_directory()
+            if self.watch_dir:
+                print(f"🧹 FileCleanupScheduler: Tracking {tracked} existing file(s) in {self.watch_dir}")
             self._stop_event.clear()
             self._thread.start()
 
@@ -47,32 +158,132 @@ class FileCleanupScheduler:
         """Stop the background cleanup thread."""
         if self._thread.is_alive():
             self._stop_event.set()
+            self._wake_event.set()
             self._thread.join(timeout=5)
 
+    def run_manual_cleanup(self) -> dict[str, Any]:
+        """Remove expired and over-quota files now; returns what was removed."""
+        removed, freed = self._process_expired_files()
+        return dict(self.stats(), files_removed_now=removed, bytes_freed_now=freed)
+
+    def stats(self) -> dict[str, Any]:
+        """Tracked files, their total size against the quota, and what has been removed so far."""
+        with self._lock:
+            return {
+                "tracked_files": len(self._tracked),
+                "total_bytes": self._total_bytes,
+                "max_disk_usage_bytes": self.max_disk_usage_bytes,
+                "max_file_age_seconds": self.max_file_age_seconds,
+                "files_removed": self._files_removed,
+                "bytes_freed": self._bytes_freed,
+            }
+
     def _cleanup_job(self) -> None:
         """Main cleanup loop running in background thread."""
         while not self._stop_event.is_set():
             try:
                 self._process_expired_files()
-            except Exception:
+            except Exception as e:
                 # Log error but continue running
-                pass
+                print(f"⚠️ FileCleanupScheduler: Cleanup failed: {e}")
+
+            # Wait for the next interval or the next deadline, whichever is sooner; a quota breach wakes us early
+            self._wake_event.wait(self._seconds_until_next_check())
+            self._wake_event.clear()
+
+    def _seconds_until_next_check(self) -> float:
+        """Seconds until the earliest live deadline, capped at the check interval."""
+        with self._lock:
+            self._drop_stale(self._expiry_heap, "expiry_entry")
+            next_deadline = self._expiry_heap[0][0] if self._expiry_heap else None
+        wait = float(self.check_interval_seconds)
+        if next_deadline is not None:
+            wait = min(wait, next_deadline - self._clock())
+        return max(wait, 0.0)
 
-            # Wait for next interval, checking stop event
-            self._stop_event.wait(self.check_interval_seconds)
+    def _process_expired_files(self) -> tuple[int, int]:
+        """Remove expired files, then the least recently accessed ones while over quota.
 
-    def _process_expired_files(self) -> None:
-        """Process and remove expired files."""
-        current_time = time.time()
-        files_to_delete = []
+        Files are picked under the lock and deleted after it is released. Returns how many
+        files were removed and how many bytes that freed.
+        """
+        current_time = self._clock()
+        files_to_delete: list[tuple[str, int]] = []
 
         with self._lock:
-            # Find expired files
-            for filepath, creation_time in list(self._scheduled_files.items()):
-                if (current_time - creation_time) > self.max_file_age_seconds:
-                    files_to_delete.append(filepath)
+            # Expired files, earliest deadline first
+            while True:
+                self._drop_stale(self._expiry_heap, "expiry_entry")
+                if not self._expiry_heap or self._expiry_heap[0][0] > current_time:
+                    break
+                filepath = heapq.heappop(self._expiry_heap)[2]
+                files_to_delete.append((filepath, self._untrack(filepath)))
 
-            # Remove expired files
-            for filepath in files_to_delete:
+            # Least recently accessed files while the quota is exceeded
+            while self._over_quota():
+                self._drop_stale(self._access_heap, "access_entry")
+                if not self._access_heap:
+                    break
+                filepath = heapq.heappop(self._access_heap)[2]
+                files_to_delete.append((filepath, self._untrack(filepath)))
+            self._compact_if_sparse()
+
+        removed = freed = 0
+        for filepath, size in files_to_delete:
+            try:
                 self.file_manager.delete_file(filepath)
-                del self._scheduled_files[filepath]
+                removed += 1
+                freed += size
+            except (OSError, ValueError) as e:
+                print(f"⚠️ FileCleanupScheduler: Could not delete {filepath}: {e}")
+
+        if removed:
+            print(f"🧹 FileCleanupScheduler: Removed {removed} file(s), freed {freed / (1024 * 1024):.1f} MB")
+            with self._lock:
+                self._files_removed += removed
+                self._bytes_freed += freed
+        return removed, freed
+
+    def _track(self, filepath: str, deadline: float, size: int, last_access: float) -> None:
+        """Add or replace a tracked file and push its heap entries (lock held)."""
+        previous = self._tracked.get(filepath)
+        if previous is not None:
+            self._total_bytes -= previous.size
+        tracked = _TrackedFile(deadline, size, last_access, next(self._entries), next(self._entries))
+        self._tracked[filepath] = tracked
+        self._total_bytes += size
+        heapq.heappush(self._expiry_heap, (deadline, tracked.expiry_entry, filepath))
+        heapq.heappush(self._access_heap, (last_access, tracked.access_entry, filepath))
+        self._compact_if_sparse()
+
+    def _untrack(self, filepath: str) -> int:
+        """Stop tracking a file (its heap entries become stale); returns its size (lock held)."""
+        tracked = self._tracked.pop(filepath)
+        self._total_bytes -= tracked.size
+        return tracked.size
+
+    def _over_quota(self) -> bool:
+        """Whether the tracked files exceed the disk quota (lock held)."""
+        return self.max_disk_usage_bytes is not None and self._total_bytes > self.max_disk_usage_bytes
+
+    def _drop_stale(self, heap: list[tuple[float, int, str]], entry_field: str) -> None:
+        """Pop superseded entries off the top of a heap (lock held)."""
+        while heap:
+            _, entry, filepath = heap[0]
+            tracked = self._tracked.get(filepath)
+            if tracked is not None and getattr(tracked, entry_field) == entry:
+                return
+            heapq.heappop(heap)
+
+    def _compact_if_sparse(self) -> None:
+        """Rebuild the heaps once stale entries outnumber live ones, keeping them O(tracked files) (lock held)."""
+        live = len(self._tracked)
+        if len(self._expiry_heap) + len(self._access_heap) > 4 * live + 64:
+            self._rebuild_heaps()
+
+    def _rebuild_heaps(self) -> None:
+        """Rebuild both heaps from the live tracked files (lock held)."""
+        self._expiry_heap = [(t.deadline, t.expiry_entry, path) for path, t in self._tracked.items()]
+        self._access_heap = [(t.last_access, t.access_entry, path) for path, t in self._tracked.items()]
+        heapq.heapify(self._expiry_heap)
+        heapq.heapify(self._access_heap)
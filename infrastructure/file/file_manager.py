@@ -1,21 +1,53 @@
 """Concrete implementation of IFileManager for local file system operations.
 Handles file I/O, directory management, and temporary file creation.
+Temporary files of a running job go to its scratch workspace rather than the output folder,
+and an in-memory index of the output folder serves stats and age-based cleanup.
 """
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 import os
+import re
+import shutil
 import tempfile
+import time
+from typing import Any, Optional
 
 from domain.interfaces import IFileManager
+from domain.workspace import JobWorkspace, current_workspace, workspace_scope
+
+from .output_index import OutputIndex
+
+# Directory under the scratch root holding one workspace per running job
+WORKSPACES_DIRNAME = "pdf2wav_workspaces"
 
 
 class FileManager(IFileManager):
     """Manages file I/O, directory paths, and temporary file creation."""
 
-    def __init__(self, upload_folder: str, output_folder: str):
+    def __init__(
+        self,
+        upload_folder: str,
+        output_folder: str,
+        scratch_dir: Optional[str] = None,
+        index_reconcile_seconds: float = 300.0,
+    ):
+        """Initialize the file manager.
+
+        Args:
+            upload_folder: Directory uploaded PDFs are saved in
+            output_folder: Directory finished audio is served from
+            scratch_dir: Where job workspaces are created, e.g. /dev/shm (None = system temp directory)
+            index_reconcile_seconds: How often the output index is reconciled with a scan of the output folder
+        """
         self.upload_folder = os.path.abspath(upload_folder)
         self.output_folder = os.path.abspath(output_folder)
+        self.workspace_root = os.path.join(os.path.abspath(scratch_dir or tempfile.gettempdir()), WORKSPACES_DIRNAME)
         os.makedirs(self.upload_folder, exist_ok=True)
         os.makedirs(self.output_folder, exist_ok=True)
+        self.output_index = OutputIndex(self.output_folder, index_reconcile_seconds)
+        self._deletion_listeners: list[Callable[[str], None]] = []  # Other indexes of the output folder
+        self._prune_orphaned_workspaces()
 
     def get_output_dir(self) -> str:
         """Returns the absolute path to the output directory."""
@@ -25,8 +57,20 @@ class FileManager(IFileManager):
         """Returns the absolute path to the upload directory."""
         return self.upload_folder
 
+    @contextmanager
+    def job_workspace(self, job_name: str) -> Iterator[JobWorkspace]:
+        """Create a workspace for the job, current while it runs, and remove it in one go when the job ends."""
+        os.makedirs(self.workspace_root, exist_ok=True)
+        safe_name = re.sub(r"[^A-Za-z0-9_-]", "_", job_name)[:40]
+        directory = tempfile.mkdtemp(prefix=f"{os.getpid()}_{safe_name}_", dir=self.workspace_root)
+        with workspace_scope(JobWorkspace(directory, job_name)) as workspace:
+            yield workspace
+
     def save_temp_file(self, content: bytes, suffix: str = ".tmp") -> str:
-        """Saves content to a temporary file and returns its full path."""
+        """Saves content to a temporary file (in the current job's workspace, if any) and returns its full path."""
+        workspace = current_workspace()
+        if workspace is not None:
+            return workspace.save(content, suffix)
         fd, path = tempfile.mkstemp(suffix=suffix, dir=self.output_folder)
         with os.fdopen(fd, "wb") as tmp:
             tmp.write(content)
@@ -44,14 +88,88 @@ class FileManager(IFileManager):
         with open(output_path, "wb") as f:
             f.write(content)
 
+        self.record_output(output_path)
         return output_path
 
+    def record_output(self, filepath: str, job: Optional[str] = None) -> None:
+        """Index an output written or published to the output folder (job defaults to the current job's)."""
+        if job is None:
+            workspace = current_workspace()
+            job = workspace.job_name if workspace else None
+        self.output_index.record(filepath, job)
+
+    def record_access(self, filepath: str) -> None:
+        """Note that an output was served."""
+        self.output_index.touch(filepath)
+
+    def add_deletion_listener(self, listener: Callable[[str], None]) -> None:
+        """Call listener with the path of every output this manager deletes (e.g. to untrack it elsewhere)."""
+        self._deletion_listeners.append(listener)
+
+    def get_stats(self) -> dict[str, Any]:
+        """File count and total size of the output folder, from its index."""
+        return self.output_index.stats()
+
+    def cleanup_old_files(self, max_age_hours: float) -> dict[str, Any]:
+        """Delete outputs created more than max_age_hours ago; only the expired files are visited."""
+        expired = self.output_index.take_older_than(time.time() - max_age_hours * 3600)
+        removed_files = 0
+        bytes_freed = 0
+        errors = []
+        for filepath, indexed in expired:
+            try:
+                if os.path.exists(filepath):
+                    os.remove(filepath)
+                self._notify_deleted(filepath)
+                removed_files += 1
+                bytes_freed += indexed.size
+            except OSError as e:
+                self.output_index.record(filepath, indexed.job)
+                errors.append(f"Failed to remove {os.path.basename(filepath)}: {e!s}")
+
+        return {
+            "files_removed": removed_files,
+            "bytes_freed": bytes_freed,
+            "mb_freed": bytes_freed / (1024 * 1024),
+            "errors": errors,
+            "max_age_hours": max_age_hours,
+        }
+
     def delete_file(self, filepath: str) -> None:
         """Deletes a file if it exists."""
         # Security check: ensure path is within managed directories
         abs_path = os.path.abspath(filepath)
-        if not (abs_path.startswith((self.output_folder, self.upload_folder))):
+        if not (abs_path.startswith((self.output_folder, self.upload_folder, self.workspace_root))):
             raise ValueError(f"Cannot delete file outside managed directories: {filepath}")
 
         if os.path.exists(abs_path):
             os.remove(abs_path)
+        if os.path.dirname(abs_path) == self.output_folder:
+            self.output_index.remove(abs_path)
+            self._notify_deleted(abs_path)
+
+    def _notify_deleted(self, filepath: str) -> None:
+        """Tell the deletion listeners an output is gone."""
+        for listener in self._deletion_listeners:
+            listener(filepath)
+
+    def _prune_orphaned_workspaces(self) -> None:
+        """Remove workspaces left behind by processes that died before their jobs ended."""
+        if not os.path.isdir(self.workspace_root):
+            return
+        for name in os.listdir(self.workspace_root):
+            pid = name.split("_", 1)[0]
+            if pid.isdigit() and not _process_alive(int(pid)):
+                print(f"🧹 FileManager: Removing orphaned job workspace {name}")
+                shutil.rmtree(os.path.join(self.workspace_root, name), ignore_errors=True)
+
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process with this pid is running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Running, but owned by another user
+    return True
@@ -0,0 +1,173 @@
+"""In-memory index of the files in the output folder.
+FileManager updates it as it writes and deletes outputs, so folder statistics are O(1)
+and age-based cleanup is O(expired files) instead of a listdir/stat of every file per
+request. A periodic os.scandir() reconciles it with files changed behind its back.
+"""
+
+from dataclasses import dataclass
+import heapq
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+@dataclass
+class IndexedFile:
+    """What the index knows about one output file."""
+
+    size: int
+    created: float
+    last_access: float
+    job: Optional[str] = None  # Conversion that produced the file, when known
+
+
+class OutputIndex:
+    """Size, creation time, last access and owning job of every file in one directory.
+
+    Running totals make stats() O(1). A min-heap by creation time (stale entries skipped
+    lazily) lets take_older_than() pop just the expired files.
+    """
+
+    def __init__(
+        self, directory: str, reconcile_interval_seconds: float = 300.0, clock: Callable[[], float] = time.time
+    ):
+        """Initialize the index (it is filled by the first reconcile).
+
+        Args:
+            directory: Directory whose files are indexed
+            reconcile_interval_seconds: How stale the index may get before reads rescan the directory
+            clock: Wall-clock time source, comparable with file mtimes (injectable for tests)
+        """
+        self.directory = os.path.abspath(directory)
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._files: dict[str, IndexedFile] = {}
+        self._by_created: list[tuple[float, str]] = []  # (created, name); stale entries are skipped
+        self._total_bytes = 0
+        self._job_files: dict[str, int] = {}  # Indexed files per owning job
+        self._last_reconciled: Optional[float] = None
+
+    def record(self, path: str, job: Optional[str] = None) -> None:
+        """Index a file just written to the directory (keeping its job when job is None)."""
+        name = os.path.basename(path)
+        try:
+            size = os.stat(os.path.join(self.directory, name)).st_size
+        except OSError:
+            return
+        now = self._clock()
+        with self._lock:
+            previous = self._files.get(name)
+            if previous is not None:
+                job = job or previous.job
+                self._forget(name)
+            self._files[name] = IndexedFile(size=size, created=now, last_access=now, job=job)
+            self._total_bytes += size
+            self._count_job(job, 1)
+            heapq.heappush(self._by_created, (now, name))
+
+    def remove(self, path: str) -> None:
+        """Forget a file deleted from the directory."""
+        with self._lock:
+            self._forget(os.path.basename(path))
+
+    def touch(self, path: str) -> None:
+        """Record that a file was accessed (e.g. served)."""
+        with self._lock:
+            indexed = self._files.get(os.path.basename(path))
+            if indexed is not None:
+                indexed.last_access = self._clock()
+
+    def get(self, path: str) -> Optional[IndexedFile]:
+        """The index entry of a file (None when not indexed)."""
+        self.reconcile_if_stale()
+        with self._lock:
+            return self._files.get(os.path.basename(path))
+
+    def take_older_than(self, cutoff: float) -> list[tuple[str, IndexedFile]]:
+        """Remove and return the files created before cutoff, oldest first: O(expired files)."""
+        self.reconcile_if_stale()
+        taken = []
+        with self._lock:
+            while self._by_created and self._by_created[0][0] < cutoff:
+                created, name = heapq.heappop(self._by_created)
+                indexed = self._files.get(name)
+                if indexed is not None and indexed.created == created:
+                    self._forget(name)
+                    taken.append((os.path.join(self.directory, name), indexed))
+        return taken
+
+    def stats(self) -> dict[str, Any]:
+        """File count, total size and number of jobs with files, from the running totals."""
+        self.reconcile_if_stale()
+        with self._lock:
+            return {
+                "total_files": len(self._files),
+                "total_bytes": self._total_bytes,
+                "total_size_mb": self._total_bytes / (1024 * 1024),
+                "jobs": len(self._job_files),
+                "directory": self.directory,
+                "index_age_seconds": round(self._clock() - (self._last_reconciled or self._clock()), 1),
+            }
+
+    def reconcile_if_stale(self) -> None:
+        """Rescan the directory when the last scan is older than the reconcile interval."""
+        last = self._last_reconciled
+        if last is None or self._clock() - last >= self.reconcile_interval_seconds:
+            self.reconcile()
+
+    def reconcile(self) -> dict[str, int]:
+        """Bring the index in line with an os.scandir() of the directory; returns what changed.
+
+        Files written behind the index's back are added with their mtime as creation time;
+        known files keep their creation time, access time and job.
+        """
+        scanned: dict[str, os.stat_result] = {}
+        if os.path.isdir(self.directory):
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            scanned[entry.name] = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+
+        added = removed = 0
+        with self._lock:
+            for name in [name for name in self._files if name not in scanned]:
+                self._forget(name)
+                removed += 1
+            for name, stat in scanned.items():
+                indexed = self._files.get(name)
+                if indexed is None:
+                    self._files[name] = IndexedFile(
+                        size=stat.st_size, created=stat.st_mtime, last_access=max(stat.st_atime, stat.st_mtime)
+                    )
+                    added += 1
+                else:
+                    self._total_bytes -= indexed.size
+                    indexed.size = stat.st_size
+                self._total_bytes += stat.st_size
+            # One O(n) heapify also drops the stale entries left by rewrites and removals
+            self._by_created = [(f.created, name) for name, f in self._files.items()]
+            heapq.heapify(self._by_created)
+            self._last_reconciled = self._clock()
+        return {"added": added, "removed": removed, "total_files": len(scanned)}
+
+    def _forget(self, name: str) -> None:
+        """Drop a file from the index; its heap entry becomes stale (lock held)."""
+        indexed = self._files.pop(name, None)
+        if indexed is not None:
+            self._total_bytes -= indexed.size
+            self._count_job(indexed.job, -1)
+
+    def _count_job(self, job: Optional[str], delta: int) -> None:
+        """Adjust the number of indexed files a job owns (lock held)."""
+        if not job:
+            return
+        count = self._job_files.get(job, 0) + delta
+        if count > 0:
+            self._job_files[job] = count
+        else:
+            self._job_files.pop(job, None)
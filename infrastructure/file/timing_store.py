@@ -0,0 +1,259 @@
+# infrastructure/file/timing_store.py - Compact Read-Along Timing Storage
+"""Compact, windowed storage of read-along timing data.
+Timing is stored column-wise: integer millisecond starts and durations, a table of
+segment types, and the segment texts. Saves write the compact JSON plus a gzipped
+copy, so the file can be served as-is. Parsed tables are cached per version of the
+file, so read-along pages and timing windows don't re-read a long book's JSON on
+every request.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Mapping
+import contextlib
+from dataclasses import dataclass, field
+import gzip
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Optional
+
+from domain.models import TimingMetadata
+
+TIMING_FORMAT = 2  # Format 1 is the former indented list of segment objects ("text_segments")
+DEFAULT_WINDOW_SEGMENTS = 200  # Segments per read-along page load and per window fetch
+
+# Query parameters of a timing window: a time range in seconds, or an index range
+WINDOW_PARAMS: dict[str, Callable[[str], Any]] = {"start": float, "end": float, "first": int, "count": int}
+
+
+def parse_window(args: Mapping[str, str]) -> dict[str, Any]:
+    """The window parameters present in a request's query arguments.
+
+    Raises:
+        ValueError: When a parameter is not a number
+    """
+    return {name: convert(args[name]) for name, convert in WINDOW_PARAMS.items() if name in args}
+
+
+@dataclass
+class TimingTable:
+    """Timing data of one document, column by column (segments sorted by start time)."""
+
+    total_duration: float
+    audio_files: list[str]
+    start_ms: list[int] = field(default_factory=list)
+    duration_ms: list[int] = field(default_factory=list)
+    type_index: list[int] = field(default_factory=list)  # Index into segment_types
+    chunk_index: list[int] = field(default_factory=list)
+    sentence_index: list[int] = field(default_factory=list)
+    text: list[str] = field(default_factory=list)
+    segment_types: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Number of segments."""
+        return len(self.start_ms)
+
+    @classmethod
+    def from_metadata(cls, timing: TimingMetadata, clean_text: Callable[[str], str] = str) -> "TimingTable":
+        """Columns of a TimingMetadata, with each segment's text passed through clean_text."""
+        table = cls(total_duration=timing.total_duration, audio_files=list(timing.audio_files))
+        type_ids: dict[str, int] = {}
+        for segment in sorted(timing.text_segments, key=lambda s: s.start_time):
+            type_id = type_ids.setdefault(segment.segment_type, len(type_ids))
+            table.start_ms.append(round(segment.start_time * 1000))
+            table.duration_ms.append(round(segment.duration * 1000))
+            table.type_index.append(type_id)
+            table.chunk_index.append(segment.chunk_index)
+            table.sentence_index.append(segment.sentence_index)
+            table.text.append(clean_text(segment.text))
+        table.segment_types = list(type_ids)
+        return table
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "TimingTable":
+        """Table from a saved timing file, compact or in the former format 1."""
+        if payload.get("format") == TIMING_FORMAT:
+            return cls(
+                total_duration=payload["total_duration"],
+                audio_files=payload.get("audio_files", []),
+                start_ms=payload["start_ms"],
+                duration_ms=payload["duration_ms"],
+                type_index=payload["type_index"],
+                chunk_index=payload["chunk_index"],
+                sentence_index=payload["sentence_index"],
+                text=payload["text"],
+                segment_types=payload["segment_types"],
+            )
+
+        table = cls(total_duration=payload.get("total_duration", 0.0), audio_files=payload.get("audio_files", []))
+        type_ids: dict[str, int] = {}
+        for segment in sorted(payload.get("text_segments", []), key=lambda s: s["start_time"]):
+            table.start_ms.append(round(segment["start_time"] * 1000))
+            table.duration_ms.append(round(segment["duration"] * 1000))
+            table.type_index.append(type_ids.setdefault(segment.get("segment_type", "sentence"), len(type_ids)))
+            table.chunk_index.append(segment.get("chunk_index", 0))
+            table.sentence_index.append(segment.get("sentence_index", 0))
+            table.text.append(segment["text"])
+        table.segment_types = list(type_ids)
+        return table
+
+    def window(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        first: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> tuple[int, int]:
+        """Index range [lo, hi) of the segments in a window, found by binary search.
+
+        The window begins at segment first, or at the last segment to start by start
+        seconds, i.e. the one playing then (default: the first segment). It holds count
+        segments, or those starting before end seconds (default: all remaining).
+
+        Raises:
+            ValueError: When first or count is negative
+        """
+        if (first is not None and first < 0) or (count is not None and count < 0):
+            raise ValueError("first and count must not be negative")
+        if first is not None:
+            lo = min(first, len(self))
+        elif start is not None:
+            lo = max(bisect_right(self.start_ms, round(start * 1000)) - 1, 0)
+        else:
+            lo = 0
+
+        if count is not None:
+            hi = min(lo + count, len(self))
+        elif end is not None:
+            hi = max(bisect_left(self.start_ms, round(end * 1000)), lo)
+        else:
+            hi = len(self)
+        return lo, hi
+
+    def payload(self, lo: int = 0, hi: Optional[int] = None) -> dict[str, Any]:
+        """Compact JSON-serializable form of segments [lo, hi) (the whole table by default)."""
+        window = slice(lo, len(self) if hi is None else hi)
+        return {
+            "format": TIMING_FORMAT,
+            "total_duration": self.total_duration,
+            "audio_files": self.audio_files,
+            "segment_count": len(self),
+            "first": lo,
+            "segment_types": self.segment_types,
+            "start_ms": self.start_ms[window],
+            "duration_ms": self.duration_ms[window],
+            "type_index": self.type_index[window],
+            "chunk_index": self.chunk_index[window],
+            "sentence_index": self.sentence_index[window],
+            "text": self.text[window],
+        }
+
+    def segments(self, lo: int = 0, hi: Optional[int] = None) -> list[dict[str, Any]]:
+        """Segments [lo, hi) as one dict each, for rendering."""
+        return [
+            {
+                "text": self.text[i],
+                "start_time": self.start_ms[i] / 1000,
+                "duration": self.duration_ms[i] / 1000,
+                "segment_type": self.segment_types[self.type_index[i]],
+                "chunk_index": self.chunk_index[i],
+                "sentence_index": self.sentence_index[i],
+            }
+            for i in range(lo, len(self) if hi is None else hi)
+        ]
+
+
+class TimingStore:
+    """Saves and loads the timing tables of one output folder ({base}_timing.json and .json.gz)."""
+
+    def __init__(self, directory: str, max_cached: int = 32):
+        self.directory = os.path.abspath(directory)
+        self.max_cached = max_cached
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[tuple[str, int, int, int], TimingTable] = OrderedDict()
+
+    @staticmethod
+    def filename(base_filename: str, compressed: bool = False) -> str:
+        """Name of a document's timing file, or of its gzipped copy."""
+        return f"{base_filename}_timing.json" + (".gz" if compressed else "")
+
+    def path(self, base_filename: str, compressed: bool = False) -> Optional[str]:
+        """Path of a document's timing file (None for names that could leave the directory)."""
+        if not base_filename or base_filename != os.path.basename(base_filename) or base_filename.startswith("."):
+            return None
+        return os.path.join(self.directory, self.filename(base_filename, compressed))
+
+    def is_compact(self, base_filename: str) -> bool:
+        """Whether the timing file was saved in the compact format (which always has a gzipped copy)."""
+        path = self.path(base_filename, compressed=True)
+        return path is not None and os.path.isfile(path)
+
+    def save(self, base_filename: str, table: TimingTable) -> list[str]:
+        """Write the compact timing file and its gzipped copy; returns their file names."""
+        data = json.dumps(table.payload(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        written = []
+        for compressed, content in [(False, data), (True, gzip.compress(data, compresslevel=9, mtime=0))]:
+            name = self.filename(base_filename, compressed)
+            self._write_atomically(os.path.join(self.directory, name), content)
+            written.append(name)
+
+        path = os.path.join(self.directory, written[0])
+        with self._lock:
+            self._remember(self._key(path, os.stat(path)), table)
+        return written
+
+    def load(self, base_filename: str) -> Optional[TimingTable]:
+        """A document's timing table (None when it has none); parsed once per version of the file.
+
+        Raises:
+            ValueError: When the timing file is not valid timing JSON
+        """
+        path = self.path(base_filename)
+        try:
+            stat = os.stat(path) if path else None
+        except OSError:
+            stat = None
+        if path is None or stat is None:
+            return None
+
+        key = self._key(path, stat)
+        with self._lock:
+            table = self._cache.get(key)
+            if table is not None:
+                self._cache.move_to_end(key)
+                return table
+
+        with open(path, encoding="utf-8") as f:
+            try:
+                table = TimingTable.from_payload(json.load(f))
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Malformed timing data in {path}: {e}") from e
+        with self._lock:
+            self._remember(key, table)
+        return table
+
+    def _write_atomically(self, path: str, content: bytes) -> None:
+        """Write a hidden temporary file beside path and rename it over path, so readers never see part of it."""
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def _key(path: str, stat: os.stat_result) -> tuple[str, int, int, int]:
+        """Cache key of one version of a timing file (a rewrite changes its inode, size or mtime)."""
+        return (path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _remember(self, key: tuple[str, int, int, int], table: TimingTable) -> None:
+        """Cache a parsed table, evicting the least recently used (lock held)."""
+        self._cache[key] = table
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
@@ -0,0 +1,183 @@
+# infrastructure/llm/circuit_breaker_llm_provider.py
+"""Circuit breaker decorator for LLM providers.
+Stops calling a failing or slow LLM so text cleaning can fall back to local cleanup immediately.
+"""
+
+from enum import Enum
+import threading
+import time
+from typing import Callable
+
+from domain.errors import Result, llm_provider_error, llm_unavailable_error
+from domain.interfaces import ILLMProvider
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Calls flow through normally
+    OPEN = "open"  # Calls are rejected without reaching the provider
+    HALF_OPEN = "half_open"  # A single probe call is allowed through
+
+
+class _Admission(Enum):
+    """How a call was admitted by the circuit breaker."""
+
+    REJECTED = "rejected"
+    CALL = "call"  # An ordinary call while the circuit is closed
+    PROBE = "probe"  # The single half-open probe whose outcome closes or reopens the circuit
+
+
+class CircuitBreakerLLMProvider(ILLMProvider):
+    """Wraps an ILLMProvider and trips after consecutive failures or latency spikes.
+
+    While open, every call fails fast with an LLM provider error. After the reset timeout
+    one probe call is let through; its outcome decides whether the circuit closes again.
+    """
+
+    def __init__(
+        self,
+        provider: ILLMProvider,
+        failure_threshold: int = 3,
+        latency_threshold_seconds: float = 120.0,
+        reset_timeout_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            provider: The LLM provider to protect
+            failure_threshold: Consecutive failed or slow calls that open the circuit
+            latency_threshold_seconds: Calls slower than this count as failures even if they succeed
+            reset_timeout_seconds: How long the circuit stays open before a half-open probe
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.provider = provider
+        self.failure_threshold = max(1, failure_threshold)
+        self.latency_threshold_seconds = latency_threshold_seconds
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current circuit state (reports HALF_OPEN once the reset timeout has elapsed)."""
+        with self._lock:
+            if self._state == CircuitState.OPEN and self._reset_timeout_elapsed():
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def is_available(self) -> bool:
+        """Check whether a call would currently be let through to the provider."""
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.OPEN:
+                return self._reset_timeout_elapsed()
+            return not self._probe_in_flight
+
+    def process_text(self, text: str) -> Result[str]:
+        """Process and enhance text through the protected provider."""
+        return self.generate_content(text)
+
+    def generate_content(self, prompt: str) -> Result[str]:
+        """Generate content unless the circuit is open."""
+        admission = self._acquire_permission()
+        if admission == _Admission.REJECTED:
+            return Result.failure(llm_unavailable_error("Circuit breaker open - LLM calls suspended"))
+
+        start_time = self._clock()
+        try:
+            result = self.provider.generate_content(prompt)
+        except Exception as e:
+            self._record_outcome(admission, success=False, elapsed=self._clock() - start_time)
+            return Result.failure(llm_provider_error(f"Content generation failed: {e!s}"))
+
+        self._record_outcome(admission, success=result.is_success, elapsed=self._clock() - start_time)
+        return result
+
+    async def generate_content_async(self, prompt: str) -> Result[str]:
+        """Generate content asynchronously unless the circuit is open."""
+        admission = self._acquire_permission()
+        if admission == _Admission.REJECTED:
+            return Result.failure(llm_unavailable_error("Circuit breaker open - LLM calls suspended"))
+
+        start_time = self._clock()
+        try:
+            result = await self.provider.generate_content_async(prompt)
+        except Exception as e:
+            self._record_outcome(admission, success=False, elapsed=self._clock() - start_time)
+            return Result.failure(llm_provider_error(f"Async content generation failed: {e!s}"))
+        except BaseException:
+            if admission == _Admission.PROBE:
+                self._release_probe()  # A cancelled probe must not leave the circuit half-open for good
+            raise
+
+        self._record_outcome(admission, success=result.is_success, elapsed=self._clock() - start_time)
+        return result
+
+    def _reset_timeout_elapsed(self) -> bool:
+        """Check if the open circuit may be probed again (caller holds the lock)."""
+        return (self._clock() - self._opened_at) >= self.reset_timeout_seconds
+
+    def _acquire_permission(self) -> _Admission:
+        """Decide whether a call may proceed, moving OPEN → HALF_OPEN when due."""
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return _Admission.CALL
+
+            if self._state == CircuitState.OPEN:
+                if not self._reset_timeout_elapsed():
+                    return _Admission.REJECTED
+                print("🔌 LLM circuit breaker: half-open, sending probe request")
+                self._state = CircuitState.HALF_OPEN
+
+            # HALF_OPEN: only one probe at a time
+            if self._probe_in_flight:
+                return _Admission.REJECTED
+            self._probe_in_flight = True
+            return _Admission.PROBE
+
+    def _release_probe(self) -> None:
+        """Let another probe through after the current one ended without an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _record_outcome(self, admission: _Admission, success: bool, elapsed: float) -> None:
+        """Update circuit state from the outcome of a call.
+
+        Only the probe decides a half-open circuit; calls admitted while the circuit was
+        closed that finish after it tripped no longer affect it.
+        """
+        too_slow = elapsed > self.latency_threshold_seconds
+        healthy = success and not too_slow
+        was_probe = admission == _Admission.PROBE
+
+        with self._lock:
+            if was_probe:
+                self._probe_in_flight = False
+            elif self._state != CircuitState.CLOSED:
+                return
+
+            if healthy:
+                if was_probe:
+                    print("🔌 LLM circuit breaker: probe succeeded, closing circuit")
+                self._state = CircuitState.CLOSED
+                self._consecutive_failures = 0
+                return
+
+            self._consecutive_failures += 1
+            reason = f"slow call ({elapsed:.1f}s)" if success else "failed call"
+
+            if was_probe or self._consecutive_failures >= self.failure_threshold:
+                print(
+                    f"🔌 LLM circuit breaker: opening circuit after {reason} "
+                    f"({self._consecutive_failures} consecutive)"
+                )
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
@@ -4,13 +4,14 @@ Uses the unified Google Gen AI SDK for language model operations.
 """
 
 import asyncio
-import concurrent.futures
-from typing import Optional
+import contextlib
+import time
+from typing import Any, Optional
 
 from google import genai
 from google.genai import types
 
-from domain.errors import Result, llm_provider_error
+from domain.errors import Result, llm_provider_error, llm_unavailable_error
 from domain.interfaces import ILLMProvider
 
 
@@ -24,16 +25,25 @@ class GeminiLLMProvider(ILLMProvider):
         min_request_interval: float = 0.5,
         max_concurrent_requests: int = 3,
         requests_per_minute: int = 120,
+        request_timeout_seconds: float = 120.0,
+        base_url: Optional[str] = None,
     ):
         self.api_key = api_key
         self.model_name = model_name
+        self.request_timeout_seconds = request_timeout_seconds
+        self.base_url = base_url
+        # One client per provider: its sync and async HTTP connection pools are reused across calls
         self.client = self._init_client()
 
         # Rate limiting configuration
         self.min_request_interval = min_request_interval
         self.max_concurrent_requests = max_concurrent_requests
         self.requests_per_minute = requests_per_minute
-        self.request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        # asyncio primitives and async connection pools are bound to a loop, so they are created lazily inside it
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        self._async_client: Optional[genai.Client] = None
+        self._bound_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _init_client(self) -> Optional[genai.Client]:
         """Initialize the Gemini client with API key validation."""
@@ -41,10 +51,44 @@ class GeminiLLMProvider(ILLMProvider):
             return None
 
         try:
-            return genai.Client(api_key=self.api_key)
+            http_options = types.HttpOptions(
+                timeout=int(self.request_timeout_seconds * 1000),  # SDK expects milliseconds
+                base_url=self.base_url,
+            )
+            return genai.Client(api_key=self.api_key, http_options=http_options)
         except Exception:
             return None
 
+    async def _bind_to_running_loop(self) -> tuple[asyncio.Semaphore, Optional[genai.Client]]:
+        """Return the concurrency semaphore and async client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._bound_loop is not loop:
+            previous = self._async_client
+            self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            # Pooled async connections cannot outlive their loop; the first loop reuses the main client
+            self._async_client = self.client if self._bound_loop is None else self._init_client()
+            self._bound_loop = loop
+            if previous is not None and previous is not self.client:
+                await self._close_client(previous)
+        assert self._request_semaphore is not None
+        return self._request_semaphore, self._async_client
+
+    @staticmethod
+    async def _close_client(client: genai.Client) -> None:
+        """Release the connection pools of a client left behind by a previous event loop."""
+        # The loop its async connections belong to is usually closed; whatever cannot be closed is dropped
+        with contextlib.suppress(Exception):
+            await client.aio.aclose()
+        with contextlib.suppress(Exception):
+            client.close()
+
+    def _generation_config(self) -> types.GenerateContentConfig:
+        """Build the generation config shared by sync and async calls."""
+        return types.GenerateContentConfig(
+            max_output_tokens=30000,  # Increased from 8192 to avoid empty response bug
+            temperature=0.3,
+        )
+
     def process_text(self, text: str) -> Result[str]:
         """Process and enhance text using the language model."""
         return self.generate_content(text)
@@ -52,58 +96,22 @@ class GeminiLLMProvider(ILLMProvider):
     def generate_content(self, prompt: str) -> Result[str]:
         """Generate content based on a prompt."""
         if not self.client:
-            return Result.failure(llm_provider_error("Client not available"))
+            return Result.failure(llm_unavailable_error("Client not available"))
 
         prompt_preview = prompt[:100] + "..." if len(prompt) > 100 else prompt
         print(f"🔬 LLM API Call: Model={self.model_name}, prompt='{prompt_preview}' ({len(prompt)} chars)")
 
+        start_time = time.time()
         try:
-            import time
-
-            start_time = time.time()
-
             response = self.client.models.generate_content(
                 model=self.model_name,
                 contents=prompt,
-                config=types.GenerateContentConfig(
-                    max_output_tokens=30000,  # Increased from 8192 to avoid empty response bug
-                    temperature=0.3,
-                ),
+                config=self._generation_config(),
             )
 
             api_time = time.time() - start_time
             print(f"✅ LLM API Success: {api_time:.2f}s for '{prompt_preview}'")
-
-            # Inspect response structure for debugging
-            if response:
-                try:
-                    # Check if response has candidates
-                    if hasattr(response, "candidates") and response.candidates:
-                        candidate = response.candidates[0]
-                        finish_reason = getattr(candidate, "finish_reason", "UNKNOWN")
-                        print(f"📊 Response finish_reason: {finish_reason}")
-
-                        # Try to get text content
-                        if hasattr(candidate, "content") and hasattr(candidate.content, "parts"):
-                            parts = candidate.content.parts
-                            if parts and hasattr(parts[0], "text"):
-                                text_content = parts[0].text
-                                if text_content:
-                                    print(f"📝 LLM Response: {len(text_content)} chars returned")
-                                    return Result.success(text_content)
-                except Exception as e:
-                    print(f"⚠️ Error inspecting response structure: {e}")
-
-            # Try the simple .text accessor as fallback
-            if response and hasattr(response, "text") and response.text:
-                print(f"📝 LLM Response: {len(response.text)} chars returned (via .text accessor)")
-                return Result.success(response.text)
-            else:
-                print(f"❌ LLM API: No text in response for '{prompt_preview}'")
-                if response:
-                    print(f"🔍 Response object type: {type(response)}")
-                    print(f"🔍 Response attributes: {dir(response)[:10]}...")  # First 10 attributes
-                return Result.failure(llm_provider_error("Empty response from LLM"))
+            return self._extract_response_text(response, prompt_preview)
 
         except Exception as e:
             api_time = time.time() - start_time
@@ -112,20 +120,71 @@ class GeminiLLMProvider(ILLMProvider):
             return Result.failure(llm_provider_error(f"Content generation failed: {e!s}"))
 
     async def generate_content_async(self, prompt: str) -> Result[str]:
-        """Generate content asynchronously with rate limiting."""
+        """Generate content asynchronously with rate limiting.
+
+        Uses the SDK's native async client, so concurrent calls share one connection pool and
+        occupy no threads. Cancellation (e.g. an aborted job) propagates to the caller.
+        """
         if not self.client:
-            return Result.failure(llm_provider_error("Client not available"))
+            return Result.failure(llm_unavailable_error("Client not available"))
 
-        try:
-            async with self.request_semaphore:
-                # Execute in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    result = await loop.run_in_executor(executor, self.generate_content, prompt)
+        prompt_preview = prompt[:100] + "..." if len(prompt) > 100 else prompt
 
-                # Rate limiting delay
-                await asyncio.sleep(self.min_request_interval)
-                return result
+        semaphore, async_client = await self._bind_to_running_loop()
+        if not async_client:
+            return Result.failure(llm_unavailable_error("Client not available"))
 
-        except Exception as e:
-            return Result.failure(llm_provider_error(f"Async content generation failed: {e!s}"))
+        async with semaphore:
+            print(f"🔬 LLM API Call (async): Model={self.model_name}, prompt='{prompt_preview}'")
+            start_time = time.time()
+            try:
+                response = await async_client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=self._generation_config(),
+                )
+            except Exception as e:  # asyncio.CancelledError is not an Exception and propagates
+                api_time = time.time() - start_time
+                print(f"💥 LLM API Error ({api_time:.2f}s): {str(e)[:200]} for '{prompt_preview}'")
+                return Result.failure(llm_provider_error(f"Async content generation failed: {e!s}"))
+
+            api_time = time.time() - start_time
+            print(f"✅ LLM API Success: {api_time:.2f}s for '{prompt_preview}'")
+            result = self._extract_response_text(response, prompt_preview)
+
+            # Rate limiting delay
+            await asyncio.sleep(self.min_request_interval)
+            return result
+
+    def _extract_response_text(self, response: Any, prompt_preview: str) -> Result[str]:
+        """Pull the generated text out of an SDK response."""
+        # Inspect response structure for debugging
+        if response:
+            try:
+                # Check if response has candidates
+                if hasattr(response, "candidates") and response.candidates:
+                    candidate = response.candidates[0]
+                    finish_reason = getattr(candidate, "finish_reason", "UNKNOWN")
+                    print(f"📊 Response finish_reason: {finish_reason}")
+
+                    # Try to get text content
+                    if hasattr(candidate, "content") and hasattr(candidate.content, "parts"):
+                        parts = candidate.content.parts
+                        if parts and hasattr(parts[0], "text"):
+                            text_content = parts[0].text
+                            if text_content:
+                                print(f"📝 LLM Response: {len(text_content)} chars returned")
+                                return Result.success(text_content)
+            except Exception as e:
+                print(f"⚠️ Error inspecting response structure: {e}")
+
+        # Try the simple .text accessor as fallback
+        if response and hasattr(response, "text") and response.text:
+            print(f"📝 LLM Response: {len(response.text)} chars returned (via .text accessor)")
+            return Result.success(response.text)
+
+        print(f"❌ LLM API: No text in response for '{prompt_preview}'")
+        if response:
+            print(f"🔍 Response object type: {type(response)}")
+            print(f"🔍 Response attributes: {dir(response)[:10]}...")  # First 10 attributes
+        return Result.failure(llm_provider_error("Empty response from LLM"))
@@ -8,6 +8,7 @@ from pdf2image import convert_from_path
 import pdfplumber
 import pytesseract
 
+from domain.cancellation import check_cancelled, current_token
 from domain.errors import Result, text_extraction_error
 from domain.interfaces import IOCRProvider
 from domain.models import PageRange, PDFInfo
@@ -40,13 +41,21 @@ class TesseractOCRProvider(IOCRProvider):
     def perform_ocr(self, image_path: str) -> Result[str]:
         """Perform OCR on a single image file."""
         try:
-            text = pytesseract.image_to_string(image_path, lang=self.ocr_language)
+            check_cancelled()
+            text = pytesseract.image_to_string(image_path, lang=self.ocr_language, timeout=self._ocr_timeout())
             if not text.strip():
                 return Result.failure(text_extraction_error("OCR process yielded no text"))
             return Result.success(text)
         except Exception as e:
+            check_cancelled()  # Tesseract stopped at the job's deadline: cancel the job, not just this page
             return Result.failure(text_extraction_error(f"OCR failed on {image_path}: {e!s}"))
 
+    def _ocr_timeout(self) -> float:
+        """Seconds tesseract may run before pytesseract kills it: what is left of the job's deadline (0 = no limit)."""
+        token = current_token()
+        remaining = token.remaining_seconds() if token is not None else None
+        return max(remaining, 0.001) if remaining is not None else 0
+
     def extract_text(self, pdf_path: str, page_range: PageRange) -> str:
         """Extract text from PDF with optional page range."""
         if not page_range.is_full_document():
@@ -162,7 +171,10 @@ class TesseractOCRProvider(IOCRProvider):
             for i, image in enumerate(images):
                 processed_image = image.convert("L")
                 processed_image = processed_image.point(lambda p: 0 if p < self.ocr_threshold else 255)
-                page_text = pytesseract.image_to_string(processed_image, lang=self.ocr_language)
+                check_cancelled()
+                page_text = pytesseract.image_to_string(
+                    processed_image, lang=self.ocr_language, timeout=self._ocr_timeout()
+                )
                 actual_page_num = actual_start + i
                 full_text += page_text + f"\n\n--- Page {actual_page_num} End (OCR) ---\n\n"
 
@@ -183,7 +195,10 @@ class TesseractOCRProvider(IOCRProvider):
             for i, image in enumerate(images):
                 processed_image = image.convert("L")
                 processed_image = processed_image.point(lambda p: 0 if p < self.ocr_threshold else 255)
-                page_text = pytesseract.image_to_string(processed_image, lang=self.ocr_language)
+                check_cancelled()
+                page_text = pytesseract.image_to_string(
+                    processed_image, lang=self.ocr_language, timeout=self._ocr_timeout()
+                )
                 full_text += page_text + f"\n\n--- Page {i + 1} End (OCR) ---\n\n"
 
             return full_text if full_text.strip() else "OCR process yielded no text."
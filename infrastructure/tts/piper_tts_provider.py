@@ -1,13 +1,22 @@
 # infrastructure/tts/piper_tts_provider.py - Fixed imports
 import os
-import re
 import subprocess
 import tempfile
 import urllib.request
 
+from domain.cancellation import run_subprocess
 from domain.config import PiperConfig
 from domain.errors import Result, tts_engine_error
 from domain.interfaces import ITTSEngine  # FIXED: Removed ISSMLProcessor
+from domain.text.rewrite_rules import RewriteRule, RuleSet
+
+# Piper doesn't support any SSML: drop every tag (<break>, <emphasis>, <prosody>, ...),
+# then clean up the whitespace left behind
+PIPER_SSML_STRIP_RULES = RuleSet(
+    RewriteRule(r"<[^>]+>", ""),
+    RewriteRule(r"\s+", " "),
+    RewriteRule(r"\s+([.,;!?])", r"\1"),  # Fix space before punctuation
+)
 
 # Optional imports - handle gracefully at runtime
 try:
@@ -121,11 +130,14 @@ except ImportError:
             """
             import asyncio
             import concurrent.futures
+            import contextvars
 
-            # Run the sync method in a thread pool to avoid blocking
+            # Run the sync method in a thread pool to avoid blocking; the copied context carries
+            # the job's cancellation token, so cancelling the job kills the piper process
             loop = asyncio.get_event_loop()
+            context = contextvars.copy_context()
             with concurrent.futures.ThreadPoolExecutor() as executor:
-                result = await loop.run_in_executor(executor, self.generate_audio_data, text_to_speak)
+                result = await loop.run_in_executor(executor, context.run, self.generate_audio_data, text_to_speak)
             return result
 
         def get_output_format(self) -> str:
@@ -144,15 +156,7 @@ except ImportError:
             if "<" not in text:
                 return text
 
-            # Remove ALL SSML tags - Piper doesn't support any SSML processing
-            # This includes <break>, <emphasis>, <prosody>, etc.
-            clean_text = re.sub(r"<[^>]+>", "", text)
-
-            # Clean up any extra whitespace left after tag removal
-            clean_text = re.sub(r"\s+", " ", clean_text)
-            clean_text = re.sub(r"\s+([.,;!?])", r"\1", clean_text)  # Fix space before punctuation
-
-            return clean_text.strip()
+            return PIPER_SSML_STRIP_RULES.apply(text).strip()
 
         # === Setup Methods ===
 
@@ -255,7 +259,8 @@ except ImportError:
                 print(f"🔍 PIPER COMMAND: {' '.join(cmd)}")
                 print(f"🔍 PIPER ENV LD_LIBRARY_PATH: {env.get('LD_LIBRARY_PATH')}")
                 print(f"🔍 PIPER INPUT LENGTH: {len(text)} chars")
-                process = subprocess.run(cmd, input=text, capture_output=True, text=True, timeout=timeout, env=env)
+                # Killed as soon as the job is cancelled
+                process = run_subprocess(cmd, input=text, text=True, timeout=timeout, env=env)
 
                 if process.returncode != 0:
                     error_msg = (
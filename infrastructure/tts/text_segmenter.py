@@ -5,6 +5,9 @@ Only includes universal text processing that all TTS engines need.
 
 import re
 
+from domain.text.chunk_planner import pack_sentences
+from domain.text.sentence_tokenizer import split_sentences
+
 
 class TextSegmenter:
     """Universal text processing for TTS engines.
@@ -34,20 +37,7 @@ class TextSegmenter:
 
         Handles common abbreviations and edge cases that shouldn't trigger splits.
         """
-        if not text.strip():
-            return []
-
-        # Don't split on common abbreviations
-        text = re.sub(r"\b(?:Dr|Mr|Mrs|Ms|Prof|Sr|Jr)\.\s*", r"\g<0>@@@", text)
-
-        # Split on sentence boundaries (period, exclamation, question mark followed by space and capital)
-        sentences = re.split(r"(?<=[.!?])\s+(?=[A-Z])", text)
-
-        # Restore abbreviations
-        sentences = [s.replace("@@@", "") for s in sentences]
-
-        # Clean and filter
-        return [s.strip() for s in sentences if s.strip()]
+        return split_sentences(text)
 
     def calculate_duration(self, text: str) -> float:
         """Calculate estimated duration for text based on word count and punctuation.
@@ -84,43 +74,8 @@ class TextSegmenter:
         if len(text) <= max_chunk_size:
             return [text]
 
-        chunks = []
-        sentences = self.split_into_sentences(text)
-        current_chunk = ""
-
-        for sentence in sentences:
-            # If single sentence is too long, we'll have to break it
-            if len(sentence) > max_chunk_size:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = ""
-
-                # Split long sentence by words
-                words = sentence.split()
-                temp_chunk = ""
-                for word in words:
-                    if len(temp_chunk + " " + word) > max_chunk_size:
-                        if temp_chunk:
-                            chunks.append(temp_chunk.strip())
-                        temp_chunk = word
-                    else:
-                        temp_chunk = temp_chunk + " " + word if temp_chunk else word
-
-                if temp_chunk:
-                    chunks.append(temp_chunk.strip())
-                continue
-
-            # If adding this sentence would exceed limit, save current chunk
-            if len(current_chunk + " " + sentence) > max_chunk_size:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence
-            else:
-                current_chunk = current_chunk + " " + sentence if current_chunk else sentence
-
-        # Don't forget the last chunk
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        # Oversized sentences are split by words; chunk boundaries come from prefix sums
+        chunks = pack_sentences(self.split_into_sentences(text), max_chunk_size)
 
         return [chunk for chunk in chunks if chunk.strip()]
 
@@ -0,0 +1 @@
+# infrastructure/web/__init__.py
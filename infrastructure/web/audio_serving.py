@@ -0,0 +1,235 @@
+# infrastructure/web/audio_serving.py - Cacheable, Seekable Audio Responses
+"""Serves audio outputs with strong ETags, conditional GETs and byte ranges.
+A finished audiobook can be hundreds of MB. The player seeks with Range requests and
+revisits files it has already downloaded, so every response carries a strong ETag taken
+from a hash of the file's contents. A URL that carries that hash as ?v= names immutable
+content and may be cached for a year. Bodies are handed to the server's
+wsgi.file_wrapper where possible, which gunicorn turns into sendfile().
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+import hashlib
+import mimetypes
+import os
+import threading
+from typing import IO, Any, Optional
+from urllib.parse import parse_qs
+
+# Cache-Control for URLs pinned to a content hash, and for bare file names that may be rewritten
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+BLOCK_SIZE = 256 * 1024
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    """Inclusive byte range of a file."""
+
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        """Number of bytes in the range."""
+        return self.end - self.start + 1
+
+
+class UnsatisfiableRange(Exception):
+    """A Range header none of whose ranges overlap the file."""
+
+
+def parse_range(header: str, size: int) -> Optional[ByteRange]:
+    """The single byte range requested by a Range header (None = serve the whole file).
+
+    Multiple ranges are answered with the whole file, which RFC 9110 allows.
+
+    Raises:
+        UnsatisfiableRange: When the range starts beyond the end of the file
+    """
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    first, dash, last = (part.strip() for part in ranges.partition("-"))
+    if not dash or not (first or last) or (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+    if not first:  # Suffix range: the last N bytes
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise UnsatisfiableRange(header)
+        return ByteRange(max(0, size - suffix), size - 1)
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise UnsatisfiableRange(header)
+    return ByteRange(start, end)
+
+
+class ContentETags:
+    """Strong ETags from a hash of each file's contents, cached while its size and mtime are unchanged."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[tuple[str, int, int, int], str] = OrderedDict()
+
+    def etag(self, path: str, stat: Optional[os.stat_result] = None) -> str:
+        """Content hash of the file at path (hashed once per version of the file)."""
+        stat = stat or os.stat(path)
+        key = (path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(BLOCK_SIZE), b""):
+                digest.update(block)
+        etag = digest.hexdigest()
+
+        with self._lock:
+            self._cache[key] = etag
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return etag
+
+
+@dataclass(frozen=True)
+class AudioResponse:
+    """Status, headers and body of a WSGI response."""
+
+    status: int
+    headers: list[tuple[str, str]]
+    body: Iterable[bytes]
+
+
+class AudioFileServer:
+    """Builds responses for the files of one directory from the request's WSGI environ."""
+
+    def __init__(self, directory: str, etags: Optional[ContentETags] = None):
+        self.directory = os.path.abspath(directory)
+        self.etags = etags or ContentETags()
+
+    def version(self, filename: str) -> Optional[str]:
+        """Content hash to pin a URL to with ?v= (None when the file does not exist)."""
+        path = self._path(filename)
+        try:
+            return self.etags.etag(path) if path else None
+        except OSError:
+            return None
+
+    def respond(self, environ: dict[str, Any], filename: str) -> AudioResponse:
+        """200, 206, 304, 404 or 416 response for a GET or HEAD of filename."""
+        path = self._path(filename)
+        try:
+            stat = os.stat(path) if path else None
+        except OSError:
+            stat = None
+        if path is None or stat is None or not os.path.isfile(path):
+            return AudioResponse(404, [("Content-Type", "text/plain")], [b"Not found"])
+
+        etag = self.etags.etag(path, stat)
+        query = parse_qs(environ.get("QUERY_STRING", ""))
+        pinned = query.get("v", [None])[0] == etag
+        headers = [
+            ("ETag", f'"{etag}"'),
+            ("Last-Modified", formatdate(stat.st_mtime, usegmt=True)),
+            ("Cache-Control", IMMUTABLE_CACHE_CONTROL if pinned else REVALIDATE_CACHE_CONTROL),
+            ("Accept-Ranges", "bytes"),
+        ]
+        if _not_modified(environ, etag, stat.st_mtime):
+            return AudioResponse(304, headers, [])
+
+        content_type, content_encoding = mimetypes.guess_type(path)
+        headers.append(("Content-Type", content_type or "application/octet-stream"))
+        if content_encoding:  # Pre-compressed files, e.g. timing.json.gz
+            headers.append(("Content-Encoding", content_encoding))
+        byte_range = None
+        range_header = environ.get("HTTP_RANGE")
+        if range_header and _if_range_matches(environ.get("HTTP_IF_RANGE"), etag, stat.st_mtime):
+            try:
+                byte_range = parse_range(range_header, stat.st_size)
+            except UnsatisfiableRange:
+                headers.append(("Content-Range", f"bytes */{stat.st_size}"))
+                return AudioResponse(416, headers, [])
+
+        if byte_range is None or byte_range.length == stat.st_size:
+            headers.append(("Content-Length", str(stat.st_size)))
+            return AudioResponse(200, headers, self._body(environ, path, ByteRange(0, stat.st_size - 1), stat.st_size))
+
+        headers.append(("Content-Range", f"bytes {byte_range.start}-{byte_range.end}/{stat.st_size}"))
+        headers.append(("Content-Length", str(byte_range.length)))
+        return AudioResponse(206, headers, self._body(environ, path, byte_range, stat.st_size))
+
+    def _path(self, filename: str) -> Optional[str]:
+        """Path of filename inside the directory (None for names that could leave it)."""
+        if not filename or filename != os.path.basename(filename) or filename.startswith("."):
+            return None
+        return os.path.join(self.directory, filename)
+
+    @staticmethod
+    def _body(environ: dict[str, Any], path: str, byte_range: ByteRange, size: int) -> Iterable[bytes]:
+        """The bytes of byte_range, via the server's file wrapper (sendfile) when it can stop at the range's end."""
+        if environ.get("REQUEST_METHOD") == "HEAD" or size == 0:
+            return []
+        f = open(path, "rb")  # noqa: SIM115 - closed by the file wrapper or _read_range
+        f.seek(byte_range.start)
+        file_wrapper = environ.get("wsgi.file_wrapper")
+        # A file wrapper sends to the end of the file (or Content-Length, for gunicorn's sendfile);
+        # only a range that ends with the file is safe with every server
+        if file_wrapper is not None and byte_range.end == size - 1:
+            return file_wrapper(f, BLOCK_SIZE)  # type: ignore[no-any-return]
+        return _read_range(f, byte_range.length)
+
+
+def _read_range(f: IO[bytes], length: int) -> Iterator[bytes]:
+    """Read length bytes from f's position in blocks, then close it."""
+    try:
+        while length > 0:
+            block = f.read(min(BLOCK_SIZE, length))
+            if not block:
+                break
+            length -= len(block)
+            yield block
+    finally:
+        f.close()
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Whether an If-None-Match header lists etag (weak comparison) or is '*'."""
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == f'"{etag}"' for tag in header.split(","))
+
+
+def _not_modified(environ: dict[str, Any], etag: str, mtime: float) -> bool:
+    """Whether a conditional GET can be answered with 304 (If-None-Match takes precedence)."""
+    if_none_match = environ.get("HTTP_IF_NONE_MATCH")
+    if if_none_match:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = environ.get("HTTP_IF_MODIFIED_SINCE")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _if_range_matches(if_range: Optional[str], etag: str, mtime: float) -> bool:
+    """Whether a Range request may be honoured: no If-Range, or one naming the current version (strong comparison)."""
+    if not if_range:
+        return True
+    if if_range.startswith(('"', "W/")):
+        return if_range.strip() == f'"{etag}"'
+    try:
+        return int(mtime) == int(parsedate_to_datetime(if_range).timestamp())
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,50 @@
+# infrastructure/web/client_disconnect.py - Client Disconnect Detection
+"""Cancels a conversion when the browser that requested it goes away.
+A WSGI app only learns that a client disconnected when it writes the response, which for
+a conversion is minutes after the work it was waiting for became pointless. Servers that
+expose the request's socket in the environ let a watcher thread notice the closed
+connection as soon as it happens.
+"""
+
+import select
+import socket
+import threading
+from typing import Any, Callable
+
+from domain.cancellation import CancellationToken
+
+# environ keys under which WSGI servers expose the client connection
+SOCKET_ENVIRON_KEYS = ("werkzeug.socket", "gunicorn.socket")
+
+
+def watch_client_disconnect(
+    environ: dict[str, Any], token: CancellationToken, poll_seconds: float = 1.0
+) -> Callable[[], None]:
+    """Cancel token once the client of this request closes its connection; returns a function that stops watching.
+
+    Call it after the request body has been read: from then on the client sends nothing until
+    it has the response, so a readable socket that yields no data means the connection was
+    closed. If the client sends anything else, or the socket cannot be peeked at (TLS), the
+    watcher gives up rather than guess. Polling the token also enforces its deadline while
+    the job is stuck in a long blocking call.
+    """
+    sock = next((environ[key] for key in SOCKET_ENVIRON_KEYS if environ.get(key) is not None), None)
+    if sock is None:
+        return lambda: None
+
+    stopped = threading.Event()
+
+    def watch() -> None:
+        while not stopped.is_set() and not token.cancelled:
+            try:
+                readable, _, _ = select.select([sock], [], [], poll_seconds)
+                if not readable or stopped.is_set():
+                    continue
+                if sock.recv(1, socket.MSG_PEEK) == b"":
+                    token.cancel("client disconnected")
+                return
+            except (OSError, ValueError):
+                return
+
+    threading.Thread(target=watch, name="client-disconnect-watch", daemon=True).start()
+    return stopped.set
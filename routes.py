@@ -1,17 +1,23 @@
 # routes.py - All Flask route handlers extracted from app.py
 # Service context for dependency injection - NO GLOBAL STATE
+from collections.abc import Iterator
 import contextlib
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
-import json
 import os
-import time
 from typing import Any, Optional, Union
 
-from flask import Response, current_app, jsonify, render_template, request, send_from_directory, url_for
+from flask import Response, current_app, jsonify, render_template, request, url_for
 from werkzeug.utils import secure_filename
 
+from domain.cancellation import CancellationRegistry, CancellationToken, JobCancelledError
+from domain.document.admission_queue import AdmissionTicket, JobAdmissionQueue
 from domain.models import PageRange, ProcessingResult
+from infrastructure.file.cleanup_scheduler import FileCleanupScheduler
 from infrastructure.file.file_manager import FileManager
+from infrastructure.file.timing_store import DEFAULT_WINDOW_SEGMENTS, TimingStore, TimingTable, parse_window
+from infrastructure.web.audio_serving import AudioFileServer
+from infrastructure.web.client_disconnect import watch_client_disconnect
 from utils import (
     _get_retry_suggestion,
     _get_user_friendly_error_message,
@@ -73,6 +79,18 @@ def get_app_config() -> Any:
 
 def register_routes(app: Any) -> None:
     """Register all routes with the Flask app."""
+    # Content-hash ETags, conditional GETs and byte ranges for audio outputs
+    audio_server = AudioFileServer(app.config["AUDIO_FOLDER"])
+
+    @app.context_processor  # type: ignore[misc]
+    def inject_audio_url() -> dict[str, Any]:
+        """audio_url(filename): URL of an output pinned to its content hash, so browsers may cache it for good."""
+
+        def audio_url(filename: str) -> str:
+            version = audio_server.version(filename)
+            return url_for("serve_audio", filename=filename, v=version)  # type: ignore[no-any-return]
+
+        return {"audio_url": audio_url}
 
     @app.route("/")  # type: ignore[misc]
     def index() -> str:
@@ -86,7 +104,21 @@ def register_routes(app: Any) -> None:
 
     @app.route("/audio_outputs/<filename>")  # type: ignore[misc]
     def serve_audio(filename: str) -> Response:
-        return send_from_directory(app.config["AUDIO_FOLDER"], filename)
+        # Seeks are answered with 206 and just the requested bytes, revisits with 304
+        audio = audio_server.respond(request.environ, filename)
+        response = Response(audio.body, status=audio.status, headers=audio.headers, direct_passthrough=True)
+        if audio.status == 404:
+            return response
+        # Recently played outputs are the last to be evicted when the disk quota is exceeded
+        service = get_pdf_service()
+        served_path = os.path.join(app.config["AUDIO_FOLDER"], secure_filename(filename))
+        scheduler = _get_cleanup_scheduler(service) if service else None
+        if scheduler:
+            scheduler.touch(served_path)
+        file_manager = _get_file_manager(service) if service else None
+        if file_manager:
+            file_manager.record_access(served_path)
+        return response
 
     @app.route("/read-along/<filename>")  # type: ignore[misc]
     def read_along_view(filename: str) -> Union[str, tuple[str, int]]:
@@ -95,10 +127,12 @@ def register_routes(app: Any) -> None:
         base_filename = filename.replace("_combined.mp3", "").replace(".mp3", "").replace(".wav", "")
 
         # Check if timing data exists
-        timing_filename = f"{base_filename}_timing.json"
-        timing_path = os.path.join(app.config["AUDIO_FOLDER"], timing_filename)
-
-        if not os.path.exists(timing_path):
+        timing_store = _get_timing_store(get_pdf_service())
+        try:
+            timing_table = timing_store.load(base_filename)
+        except Exception as e:
+            return f"Error loading timing data: {e}", 500
+        if timing_table is None:
             return f"Timing data not found for {filename}. This file was not processed with read-along support.", 404
 
         # Check if audio file exists
@@ -106,41 +140,51 @@ def register_routes(app: Any) -> None:
         if not os.path.exists(audio_path):
             return f"Audio file {filename} not found.", 404
 
-        # Load timing data for template rendering
-        import json
-
-        try:
-            with open(timing_path) as f:
-                timing_json = json.load(f)
-                timing_segments = timing_json.get("text_segments", [])
-        except Exception as e:
-            return f"Error loading timing data: {e}", 500
-
+        # Only the opening window is rendered; the page fetches later windows as playback reaches them
+        first, end = timing_table.window(count=DEFAULT_WINDOW_SEGMENTS)
         return render_template(
             "read_along.html",
             audio_filename=filename,
             base_filename=base_filename,
-            timing_data=timing_segments,
+            timing_data=timing_table.segments(first, end),
+            timing_window={"first": first, "segment_count": len(timing_table), "size": DEFAULT_WINDOW_SEGMENTS},
             timing_api_url=url_for("get_timing_data", filename=base_filename),
         )
 
     @app.route("/api/timing/<filename>")  # type: ignore[misc]
     def get_timing_data(filename: str) -> Union[Response, tuple[Response, int]]:
-        """Serve timing metadata as JSON."""
-        timing_filename = f"{filename}_timing.json"
-        timing_path = os.path.join(app.config["AUDIO_FOLDER"], timing_filename)
-
-        if not os.path.exists(timing_path):
-            return jsonify({"error": "Timing data not found"}), 404
-
+        """Serve timing metadata as compact JSON: the whole file, or a window (?start=&end= seconds, ?first=&count=)."""
+        timing_store = _get_timing_store(get_pdf_service())
         try:
-            with open(timing_path, encoding="utf-8") as f:
-                timing_data = json.load(f)
+            window = parse_window(request.args)
+        except ValueError:
+            return jsonify({"error": "Timing window parameters must be numbers"}), 400
+
+        if not window and timing_store.is_compact(filename):
+            # The saved file is served as-is (gzipped when accepted), with ETags, 304s and ranges
+            compressed = request.accept_encodings["gzip"] > 0
+            timing = audio_server.respond(request.environ, timing_store.filename(filename, compressed))
+            response = Response(timing.body, status=timing.status, headers=timing.headers, direct_passthrough=True)
+            response.vary.add("Accept-Encoding")
+            return response
 
-            return jsonify(timing_data)
+        try:
+            timing_table = timing_store.load(filename)
         except Exception as e:
             print(f"Error serving timing data: {e}")
             return jsonify({"error": "Failed to load timing data"}), 500
+        if timing_table is None:
+            return jsonify({"error": "Timing data not found"}), 404
+
+        try:
+            lo, hi = timing_table.window(**window)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        response = jsonify(timing_table.payload(lo, hi))
+        response.set_etag(f"{audio_server.version(timing_store.filename(filename))}-{lo}-{hi}")
+        response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(request)  # type: ignore[no-any-return]
 
     @app.route("/get_pdf_info", methods=["POST"])  # type: ignore[misc]
     def get_pdf_info() -> Union[Response, tuple[Response, int]]:
@@ -164,12 +208,25 @@ def register_routes(app: Any) -> None:
             # Use document engine to get PDF info
             document_engine = service.get("IDocumentEngine")
             pdf_info = document_engine.get_pdf_info(temp_path)
+            info: dict[str, Any] = {
+                "total_pages": pdf_info.total_pages,
+                "title": pdf_info.title,
+                "author": pdf_info.author,
+            }
+
+            # Predict when a conversion of the requested pages would finish, given the current queue
+            admission_queue = _get_admission_queue(service)
+            if admission_queue is not None:
+                pages, scanned_pages = document_engine.estimate_page_mix(
+                    temp_path, parse_page_range_from_form(request.form)
+                )
+                info["eta"] = admission_queue.eta(admission_queue.estimate(pages, scanned_pages))
 
             # Clean up
             with contextlib.suppress(Exception):
                 os.remove(temp_path)
 
-            return jsonify({"total_pages": pdf_info.total_pages, "title": pdf_info.title, "author": pdf_info.author})
+            return jsonify(info)
 
         except Exception as e:
             return jsonify({"error": str(e)}), 500
@@ -242,31 +299,11 @@ def register_routes(app: Any) -> None:
             return jsonify({"error": "Service not available"}), 500
 
         try:
-            if hasattr(service, "file_manager") and service.file_manager:
-                # Use the FileManager's get_stats method if it exists
-                if hasattr(service.file_manager, "get_stats"):
-                    stats = service.file_manager.get_stats()
-                    return jsonify(stats)
-                else:
-                    # Fallback: create basic stats manually
-                    audio_dir = app.config["AUDIO_FOLDER"]
-                    if os.path.exists(audio_dir):
-                        files = os.listdir(audio_dir)
-                        total_size = sum(
-                            os.path.getsize(os.path.join(audio_dir, f))
-                            for f in files
-                            if os.path.isfile(os.path.join(audio_dir, f))
-                        )
-
-                        stats = {
-                            "total_files": len(files),
-                            "total_size_mb": total_size / (1024 * 1024),
-                            "directory": audio_dir,
-                            "cleanup_enabled": get_app_config().enable_file_cleanup,
-                        }
-                        return jsonify(stats)
-                    else:
-                        return jsonify({"error": "Audio directory not found"}), 404
+            # Served from the FileManager's output index, not a listdir/stat of every file
+            file_manager = _get_file_manager(service)
+            if file_manager:
+                stats = dict(file_manager.get_stats(), cleanup_enabled=get_app_config().enable_file_cleanup)
+                return jsonify(stats)
             else:
                 return jsonify({"error": "File management not available"}), 404
 
@@ -274,6 +311,52 @@ def register_routes(app: Any) -> None:
             print(f"Admin file_stats error: {e}")
             return jsonify({"error": str(e)}), 500
 
+    @app.route("/admin/tts_concurrency")  # type: ignore[misc]
+    def get_tts_concurrency() -> Union[Response, tuple[Response, int]]:
+        """Get the adaptive TTS concurrency limit and the signals driving it (admin endpoint)."""
+        service = get_pdf_service()
+        if not is_processor_available() or not service:
+            return jsonify({"error": "Service not available"}), 500
+
+        try:
+            audio_engine = service.get("IAudioEngine")
+            if not hasattr(audio_engine, "concurrency_metrics"):
+                return jsonify({"error": "Concurrency metrics not available"}), 404
+            return jsonify(audio_engine.concurrency_metrics())
+
+        except Exception as e:
+            print(f"Admin tts_concurrency error: {e}")
+            return jsonify({"error": str(e)}), 500
+
+    @app.route("/admin/job_queue")  # type: ignore[misc]
+    def get_job_queue() -> Union[Response, tuple[Response, int]]:
+        """Get running and waiting conversions and the learned per-page throughput (admin endpoint)."""
+        service = get_pdf_service()
+        if not is_processor_available() or not service:
+            return jsonify({"error": "Service not available"}), 500
+
+        try:
+            admission_queue = _get_admission_queue(service)
+            if admission_queue is None:
+                return jsonify({"error": "Job admission queue not enabled"}), 404
+            return jsonify(admission_queue.metrics())
+
+        except Exception as e:
+            print(f"Admin job_queue error: {e}")
+            return jsonify({"error": str(e)}), 500
+
+    @app.route("/cancel/<job_id>", methods=["POST"])  # type: ignore[misc]
+    def cancel_job(job_id: str) -> Union[Response, tuple[Response, int]]:
+        """Cancel a running or queued conversion by the job id its upload form was submitted with."""
+        service = get_pdf_service()
+        if not is_processor_available() or not service:
+            return jsonify({"error": "Service not available"}), 500
+
+        registry = _get_cancellation_registry(service)
+        if registry is None or not registry.cancel(job_id):
+            return jsonify({"error": f"No running job {job_id}"}), 404
+        return jsonify({"job_id": job_id, "cancelled": True})
+
     @app.route("/admin/cleanup", methods=["POST"])  # type: ignore[misc]
     def manual_cleanup() -> Union[Response, tuple[Response, int]]:
         """Trigger manual file cleanup (admin endpoint)."""
@@ -284,46 +367,10 @@ def register_routes(app: Any) -> None:
         try:
             max_age_hours = float(request.form.get("max_age_hours", 24.0))
 
-            if hasattr(service, "file_manager") and service.file_manager:
-                # Use direct file cleanup if method exists
-                if hasattr(service.file_manager, "cleanup_old_files"):
-                    result = service.file_manager.cleanup_old_files(max_age_hours)
-                    return jsonify(result)
-                else:
-                    # Fallback: manual cleanup logic
-                    audio_dir = app.config["AUDIO_FOLDER"]
-                    cutoff_time = time.time() - (max_age_hours * 3600)
-
-                    removed_files = 0
-                    bytes_freed = 0
-                    errors = []
-
-                    try:
-                        for filename in os.listdir(audio_dir):
-                            filepath = os.path.join(audio_dir, filename)
-                            if os.path.isfile(filepath):
-                                file_age = os.path.getmtime(filepath)
-                                if file_age < cutoff_time:
-                                    try:
-                                        file_size = os.path.getsize(filepath)
-                                        os.remove(filepath)
-                                        removed_files += 1
-                                        bytes_freed += file_size
-                                        print(f"Cleaned up old file: {filename}")
-                                    except Exception as e:
-                                        errors.append(f"Failed to remove {filename}: {e!s}")
-
-                        result = {
-                            "files_removed": removed_files,
-                            "bytes_freed": bytes_freed,
-                            "mb_freed": bytes_freed / (1024 * 1024),
-                            "errors": errors,
-                            "max_age_hours": max_age_hours,
-                        }
-                        return jsonify(result)
-
-                    except Exception as e:
-                        return jsonify({"error": f"Cleanup failed: {e!s}"}), 500
+            # The output index hands over just the expired files
+            file_manager = _get_file_manager(service)
+            if file_manager:
+                return jsonify(file_manager.cleanup_old_files(max_age_hours))
             else:
                 return jsonify({"error": "File management not available"}), 404
 
@@ -337,14 +384,10 @@ def register_routes(app: Any) -> None:
         try:
             service = get_pdf_service()
 
-            # The scheduler should be available through composition root
-            if hasattr(service, "cleanup_scheduler") and service.cleanup_scheduler:
-                # Trigger manual cleanup if method exists
-                if hasattr(service.cleanup_scheduler, "run_manual_cleanup"):
-                    result = service.cleanup_scheduler.run_manual_cleanup()
-                    return jsonify(result)
-                else:
-                    return jsonify({"error": "Manual cleanup not supported by scheduler"}), 404
+            # The scheduler is registered in the service container (None when file cleanup is disabled)
+            scheduler = _get_cleanup_scheduler(service) if service else None
+            if scheduler:
+                return jsonify(scheduler.run_manual_cleanup())
             else:
                 return jsonify({"error": "Cleanup scheduler not available"}), 500
 
@@ -373,12 +416,11 @@ def register_routes(app: Any) -> None:
                 "is_reloader_process": is_flask_reloader(),
             }
 
-            if service and hasattr(service, "file_manager") and service.file_manager:
-                info["file_manager_type"] = service.file_manager.__class__.__name__
+            file_manager = _get_file_manager(service) if service else None
+            if file_manager:
+                info["file_manager_type"] = file_manager.__class__.__name__
                 try:
-                    if hasattr(service.file_manager, "get_stats"):
-                        stats = service.file_manager.get_stats()
-                        info["file_stats"] = stats
+                    info["file_stats"] = file_manager.get_stats()
                 except Exception as e:
                     info["file_stats_error"] = str(e)
 
@@ -401,18 +443,33 @@ def process_upload_request(
         # Configure processing services
         services = _configure_processing_services()
 
-        # Execute document processing
-        processing_result = _execute_document_processing(
-            file_info.pdf_path, file_info.base_filename, file_info.page_range, services, enable_timing
-        )
-
-        # Clean up uploaded file
-        with contextlib.suppress(Exception):
-            os.remove(file_info.pdf_path)
+        # Wait for this job's turn (shortest estimated job first), then execute document processing
+        # with its intermediates in a scratch workspace removed when it ends;
+        # a client disconnect, POST /cancel/<job_id> or the job deadline stops the job wherever it is
+        job_id = str(request_form.get("job_id") or "").strip()[:64] or file_info.base_filename
+        try:
+            with _cancellable_job(job_id, services), _admit_job(file_info, services) as admission:
+                with _job_workspace(file_info, services):
+                    processing_result = _execute_document_processing(
+                        file_info.pdf_path, file_info.base_filename, file_info.page_range, services, enable_timing
+                    )
+                if admission is not None:
+                    admission.success = processing_result.success
+                    processing_result = _with_debug_info(processing_result, job_admission=admission.to_debug_info())
+        except JobCancelledError as e:
+            print(f"🛑 Conversion of {file_info.original_filename} cancelled: {e.reason}")
+            return None, file_info.original_filename, file_info.base_filename, f"Conversion cancelled: {e.reason}"
+        finally:
+            # Clean up uploaded file
+            with contextlib.suppress(Exception):
+                os.remove(file_info.pdf_path)
 
         if not processing_result.success or not processing_result.audio_files:
             return processing_result, file_info.original_filename, file_info.base_filename, None
 
+        # Index the new outputs under their job and track them for expiry and disk-quota eviction
+        _track_output_files(services.service_container, processing_result.audio_files, file_info.base_filename)
+
         # Handle timing data and finalize result
         final_result = _handle_timing_data(processing_result, file_info.base_filename, enable_timing, services)
 
@@ -461,6 +518,94 @@ def _process_uploaded_file(uploaded_file: Any, request_form: Any) -> FileProcess
     )
 
 
+def _get_admission_queue(service_container: Any) -> Optional[JobAdmissionQueue]:
+    """The conversion admission queue, or None when it is disabled or not registered."""
+    if not service_container.has(JobAdmissionQueue):
+        return None
+    return service_container.get(JobAdmissionQueue)  # type: ignore[no-any-return]
+
+
+def _admit_job(
+    file_info: FileProcessingInfo, services: ProcessingServices
+) -> AbstractContextManager[Optional[AdmissionTicket]]:
+    """Estimate the job from its page mix and wait in the admission queue (no-op when disabled)."""
+    admission_queue = _get_admission_queue(services.service_container)
+    if admission_queue is None:
+        return contextlib.nullcontext()
+    pages, scanned_pages = services.document_engine.estimate_page_mix(file_info.pdf_path, file_info.page_range)
+    return admission_queue.admit(file_info.base_filename, admission_queue.estimate(pages, scanned_pages))
+
+
+def _get_cleanup_scheduler(service_container: Any) -> Optional[FileCleanupScheduler]:
+    """The output folder's cleanup scheduler, or None when file cleanup is disabled or not registered."""
+    if not service_container.has(FileCleanupScheduler):
+        return None
+    return service_container.get(FileCleanupScheduler)  # type: ignore[no-any-return]
+
+
+def _get_file_manager(service_container: Any) -> Optional[FileManager]:
+    """The FileManager of the output folder, or None when it is not registered."""
+    if not service_container.has(FileManager):
+        return None
+    return service_container.get(FileManager)  # type: ignore[no-any-return]
+
+
+def _track_output_files(service_container: Any, filenames: list[str], job: str) -> None:
+    """Add new outputs to the output index and the cleanup scheduler."""
+    file_manager = _get_file_manager(service_container)
+    scheduler = _get_cleanup_scheduler(service_container)
+    for filename in filenames:
+        filepath = os.path.join(get_app_config().audio_folder, filename)
+        if file_manager:
+            file_manager.record_output(filepath, job)
+        if scheduler:
+            scheduler.schedule(filepath)
+
+
+def _get_timing_store(service_container: Any) -> TimingStore:
+    """The output folder's timing store (an uncached one when the container does not register it)."""
+    if service_container is None or not service_container.has(TimingStore):
+        return TimingStore(get_app_config().audio_folder)
+    return service_container.get(TimingStore)  # type: ignore[no-any-return]
+
+
+def _get_cancellation_registry(service_container: Any) -> Optional[CancellationRegistry]:
+    """The registry of running jobs' cancellation tokens, or None when it is not registered."""
+    if not service_container.has(CancellationRegistry):
+        return None
+    return service_container.get(CancellationRegistry)  # type: ignore[no-any-return]
+
+
+@contextlib.contextmanager
+def _cancellable_job(job_id: str, services: ProcessingServices) -> Iterator[Optional[CancellationToken]]:
+    """Run the job under a cancellation token registered as job_id, cancelled if the client disconnects."""
+    registry = _get_cancellation_registry(services.service_container)
+    if registry is None:
+        yield None
+        return
+    with registry.job(job_id) as token:
+        stop_watching = watch_client_disconnect(request.environ, token)
+        try:
+            yield token
+        finally:
+            stop_watching()
+
+
+def _job_workspace(file_info: FileProcessingInfo, services: ProcessingServices) -> AbstractContextManager[Any]:
+    """Scratch workspace for the job's intermediate files (no-op when no file manager is registered)."""
+    if not services.service_container.has(FileManager):
+        return contextlib.nullcontext()
+    file_manager = services.service_container.get(FileManager)
+    return file_manager.job_workspace(file_info.base_filename)  # type: ignore[no-any-return]
+
+
+def _with_debug_info(result: ProcessingResult, **entries: Any) -> ProcessingResult:
+    """Copy of the result with entries added to its debug info."""
+    from dataclasses import replace
+
+    return replace(result, debug_info=dict(result.debug_info or {}, **entries))
+
+
 def _configure_processing_services() -> ProcessingServices:
     """Configure and return all required processing services."""
     service = get_pdf_service()
@@ -592,41 +737,17 @@ def render_upload_result(
 
 
 def save_timing_data(base_filename: str, timing_metadata: Any) -> None:
-    """Save timing metadata as JSON file."""
-    # Convert to JSON-serializable format
-    timing_json = {
-        "total_duration": timing_metadata.total_duration,
-        "audio_files": timing_metadata.audio_files,
-        "text_segments": [
-            {
-                "text": clean_text_for_display(segment.text),  # Clean SSML markup
-                "start_time": segment.start_time,
-                "duration": segment.duration,
-                "segment_type": segment.segment_type,
-                "chunk_index": segment.chunk_index,
-                "sentence_index": segment.sentence_index,
-            }
-            for segment in timing_metadata.text_segments
-        ],
-    }
-
-    timing_filename = f"{base_filename}_timing.json"
-    timing_path = os.path.join(get_app_config().audio_folder, timing_filename)
-
+    """Save timing metadata in the compact timing format, with a gzipped copy to serve."""
+    service = get_pdf_service()
     try:
-        with open(timing_path, "w", encoding="utf-8") as f:
-            json.dump(timing_json, f, indent=2, ensure_ascii=False)
+        table = TimingTable.from_metadata(timing_metadata, clean_text=clean_text_for_display)  # Clean SSML markup
+        timing_filenames = _get_timing_store(service).save(base_filename, table)
 
-        print(f"Saved timing data: {timing_filename}")
+        print(f"Saved timing data: {', '.join(timing_filenames)}")
 
-        # Register timing file with file manager if available
-        service = get_pdf_service()
-        if hasattr(service, "file_manager") and service.file_manager:
-            try:
-                if hasattr(service.file_manager, "schedule_cleanup"):
-                    service.file_manager.schedule_cleanup(timing_filename, 2.0)  # Same cleanup as audio
-            except Exception:
-                pass
+        # Track the timing files for cleanup along with their audio
+        if service:
+            _track_output_files(service, timing_filenames, base_filename)
 
     except Exception as e:
         print(f"Failed to save timing data: {e}")
@@ -84,7 +84,7 @@ class EnhancedReadAlongPlayer {
             const timingData = await response.json();
             console.log('Timing data loaded:', timingData);
 
-            this.segments = this.processTimingData(timingData.text_segments || []);
+            this.segments = this.processTimingData(timingData.text_segments || this.decodeTimingColumns(timingData));
             this.renderText();
 
             console.log(`Enhanced player loaded ${this.segments.length} segments`);
@@ -98,6 +98,18 @@ class EnhancedReadAlongPlayer {
         }
     }
 
+    decodeTimingColumns(timingData) {
+        // Compact timing format: parallel arrays of millisecond starts/durations and texts
+        return (timingData.text || []).map((text, i) => ({
+            text,
+            start_time: timingData.start_ms[i] / 1000,
+            duration: timingData.duration_ms[i] / 1000,
+            segment_type: timingData.segment_types[timingData.type_index[i]],
+            chunk_index: timingData.chunk_index[i],
+            sentence_index: timingData.sentence_index[i]
+        }));
+    }
+
     processTimingData(segments) {
         // Enhance segments with additional metadata
         return segments.map((segment, index) => ({
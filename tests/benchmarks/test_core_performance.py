@@ -3,13 +3,39 @@
 Focuses on the key refactored components.
 """
 
+import asyncio
 from dataclasses import replace as dataclasses_replace
+import json
+import re
+import statistics
+import threading
+import time
 import types
+from typing import Callable
+from unittest.mock import Mock
 
 import pytest
 
-from domain.models import TextSegment
-from domain.text.chunking_strategy import SentenceBasedChunking, WordBasedChunking
+from domain.audio.audio_engine import AudioEngine
+from domain.audio.hedged_retry import ChunkRetryPolicy
+from domain.audio.synthesis_plan import plan_synthesis
+from domain.document.admission_queue import JobAdmissionQueue, PageThroughputModel
+from domain.errors import Result
+from domain.models import TextSegment, TimingMetadata
+from domain.text.chunk_planner import pack_pieces, simulate_makespan
+from domain.text.chunking_strategy import BalancedChunking, SentenceBasedChunking, WordBasedChunking
+from domain.text.sentence_tokenizer import iter_sentence_spans, split_sentences
+from domain.text.sharded_text import ShardedTextProcessor, sentence_seams, word_gap_seams
+from domain.text.text_artifact import TextStage
+from domain.text.text_pipeline import (
+    BASIC_CLEANUP_RULES,
+    NATURAL_FORMATTING_RULES,
+    TextPipeline,
+    apply_natural_formatting,
+)
+from infrastructure.file.cleanup_scheduler import FileCleanupScheduler
+from infrastructure.file.timing_store import DEFAULT_WINDOW_SEGMENTS, TimingStore, TimingTable
+from infrastructure.tts.text_segmenter import TextSegmenter
 
 
 # Test Data Setup
@@ -25,6 +51,17 @@ def large_text_chunks():
     ]
 
 
+@pytest.fixture(scope="module")
+def five_mb_text():
+    """Generate ~5MB of book-like prose with abbreviations, initials and decimals."""
+    paragraph = (
+        "Dr. Smith measured a value of 3.14 in the second trial. J. R. Tolkien wrote at length about it! "
+        "Was the result significant? The authors, e.g. Jones et al. in Fig. 4, thought so. "
+        "They moved on to the next experiment without delay.\n\n"
+    )
+    return paragraph * (5 * 1024 * 1024 // len(paragraph))
+
+
 @pytest.fixture
 def sample_text_segments():
     """Generate sample text segments for timing engine benchmarks."""
@@ -200,6 +237,563 @@ class TestMemoryEfficiency:
         assert len(result) == 10
 
 
+class TestSentenceTokenizerPerformance:
+    """Benchmark the unified single-pass sentence tokenizer on book-sized input."""
+
+    def test_sentence_spans_5mb(self, benchmark, five_mb_text):
+        """Benchmark offset-only tokenization (no sentence strings materialised)."""
+
+        def count_spans():
+            return sum(1 for _ in iter_sentence_spans(five_mb_text))
+
+        result = benchmark.pedantic(count_spans, rounds=3, iterations=1)
+        assert result == five_mb_text.count("next experiment") * 5
+
+    def test_split_sentences_5mb(self, benchmark, five_mb_text):
+        """Benchmark tokenization plus materialising each sentence once."""
+        result = benchmark.pedantic(split_sentences, args=(five_mb_text,), rounds=3, iterations=1)
+        assert result[0].startswith("Dr. Smith measured")
+
+    def test_legacy_lookbehind_regex_5mb(self, benchmark, five_mb_text):
+        """Baseline: the previous TextPipeline lookbehind regex split for comparison."""
+        import re
+
+        def legacy_split():
+            sentences = re.split(r"(?<!\bDr\.)(?<!\bMr\.)(?<!\bMs\.)(?<!\bProf\.)(?<=[.!?])\s+(?=[A-Z])", five_mb_text)
+            return [sentence.strip() for sentence in sentences if sentence.strip()]
+
+        result = benchmark.pedantic(legacy_split, rounds=3, iterations=1)
+        assert len(result) > 0
+
+
+class TestChunkPlannerPerformance:
+    """Benchmark prefix-sum chunk planning on book-sized input."""
+
+    def test_sentence_chunking_5mb(self, benchmark, five_mb_text):
+        """Benchmark SentenceBasedChunking over a whole 5MB book at TTS chunk size."""
+        chunker = SentenceBasedChunking()
+
+        result = benchmark.pedantic(chunker.chunk_text, args=([five_mb_text], 4000), rounds=3, iterations=1)
+        assert all(len(chunk) <= 4000 for chunk in result)
+
+    def test_word_chunking_5mb_large_chunks(self, benchmark, five_mb_text):
+        """Benchmark WordBasedChunking with LLM-sized chunks, where += growth hurt most."""
+        chunker = WordBasedChunking()
+
+        result = benchmark.pedantic(chunker.chunk_text, args=([five_mb_text], 200000), rounds=3, iterations=1)
+        assert all(len(chunk) <= 200000 for chunk in result)
+
+    def test_segmenter_chunks_5mb_large_chunks(self, benchmark, five_mb_text):
+        """Benchmark TextSegmenter.split_into_chunks with large chunks."""
+        segmenter = TextSegmenter()
+
+        result = benchmark.pedantic(segmenter.split_into_chunks, args=(five_mb_text, 200000), rounds=3, iterations=1)
+        assert len(result) >= len(five_mb_text) // 200000
+
+    def test_pack_pieces_5mb_words(self, benchmark, five_mb_text):
+        """Benchmark planning and joining alone, words already split."""
+        words = five_mb_text.split()
+
+        result = benchmark.pedantic(pack_pieces, args=(words, 200000), rounds=3, iterations=1)
+        assert sum(chunk.count(" ") + 1 for chunk in result) == len(words)
+
+    def test_legacy_concatenation_5mb_words(self, benchmark, five_mb_text):
+        """Baseline: the previous `current_chunk + " " + word` growth for comparison."""
+        words = five_mb_text.split()
+
+        def legacy_pack():
+            chunks = []
+            current_chunk = ""
+            for word in words:
+                if len(current_chunk + " " + word) > 200000:
+                    chunks.append(current_chunk)
+                    current_chunk = word
+                else:
+                    current_chunk = current_chunk + " " + word if current_chunk else word
+            chunks.append(current_chunk)
+            return chunks
+
+        result = benchmark.pedantic(legacy_pack, rounds=3, iterations=1)
+        assert len(result) > 0
+
+
+@pytest.fixture(scope="module")
+def tts_input_chunks(five_mb_text):
+    """DocumentEngine-style 4000-char sentence-aligned chunks from the first ~1MB of the book."""
+    return pack_pieces(split_sentences(five_mb_text[: 1024 * 1024]), 4000)
+
+
+class TestBalancedChunkingPerformance:
+    """Compare simulated TTS makespan of balanced and greedy chunk plans.
+
+    Synthesis cost is modelled as characters plus a fixed per-request overhead; makespan is
+    the finish time of in-order dispatch to AUDIO_WORKERS workers.
+    """
+
+    AUDIO_WORKERS = 4
+    REQUEST_OVERHEAD_CHARS = 250
+
+    def _makespan(self, chunks: list[str]) -> float:
+        return simulate_makespan([len(chunk) + self.REQUEST_OVERHEAD_CHARS for chunk in chunks], self.AUDIO_WORKERS)
+
+    def test_greedy_sentence_chunking_makespan(self, benchmark, tts_input_chunks):
+        """Baseline: greedy per-input packing at the audio target size."""
+        chunker = SentenceBasedChunking()
+
+        result = benchmark.pedantic(chunker.chunk_text, args=(tts_input_chunks, 3000), rounds=3, iterations=1)
+        benchmark.extra_info["simulated_makespan"] = self._makespan(result)
+        benchmark.extra_info["first_chunk_chars"] = len(result[0])
+
+    def test_balanced_chunking_makespan(self, benchmark, tts_input_chunks):
+        """Balanced planning should finish no later than greedy and start with a small chunk."""
+        chunker = BalancedChunking(request_overhead_chars=self.REQUEST_OVERHEAD_CHARS)
+
+        result = benchmark.pedantic(
+            chunker.chunk_text, args=(tts_input_chunks, 3000, self.AUDIO_WORKERS), rounds=3, iterations=1
+        )
+        greedy = SentenceBasedChunking().chunk_text(tts_input_chunks, 3000)
+        benchmark.extra_info["simulated_makespan"] = self._makespan(result)
+        benchmark.extra_info["first_chunk_chars"] = len(result[0])
+
+        assert self._makespan(result) < self._makespan(greedy)
+        assert len(result[0]) <= chunker.first_chunk_size
+
+
+@pytest.fixture(scope="module")
+def academic_book_text():
+    """~5MB of paper-like text exercising every cleanup and formatting rule."""
+    paragraph = (
+        "Abstract: In this study, we measure things.  1. Introduction to the problem. However, "
+        "results vary\f across runs.... First we look at café data -- then more --- data. "
+        "Finally the end...\n"
+        "In this paper, we propose a method. Therefore, it works! Second attempts fail.\n\n"
+    )
+    return paragraph * (5 * 1024 * 1024 // len(paragraph))
+
+
+def _legacy_basic_cleanup(text):
+    """Previous TextPipeline._basic_text_cleanup: one re.sub pass per rule."""
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\f", " ", text)
+    text = re.sub(r"[^\x00-\x7F]+", " ", text)
+    text = re.sub(r"\.{3,}", "...", text)
+    text = re.sub(r"-{2,}", "--", text)
+    return text.strip()
+
+
+def _legacy_natural_formatting(text):
+    """Previous academic formatting plus punctuation enhancement: one re.sub pass per rule."""
+    text = re.sub(r"(Abstract|Introduction|Conclusion|References)(\s*[:\.]?\s*)", r"\1\2... ", text, flags=re.I)
+    text = re.sub(r"(\d+\.\s*[A-Z][^.]*\.)", r"\1.. ", text)
+    text = re.sub(r"(However|Therefore|Furthermore|Moreover),", r"\n\1,", text, flags=re.I)
+    text = re.sub(r"^(In this paper|In this study|We present|We propose|This work),", r"\1,,", text, flags=re.I | re.M)
+    text = re.sub(r"(?<![.])\.(?![.])\s+(?=[A-Z])", r".. ", text)
+    text = re.sub(
+        r"\b(First|Second|Third|Fourth|Fifth|Finally|Additionally|Specifically)(?!,)\s", r"\1, ", text, flags=re.I
+    )
+    return re.sub(r"\.{3,}", "... ", text)
+
+
+class TestRewriteRulePerformance:
+    """Benchmark precompiled rule sets against the module-level re.sub chains they replaced.
+
+    Each benchmark asserts identical output and records throughput as extra_info["mb_per_s"].
+    """
+
+    def _record_throughput(self, benchmark, text):
+        benchmark.extra_info["mb_per_s"] = round(len(text) / (1024 * 1024) / benchmark.stats.stats.mean, 1)
+
+    def test_basic_cleanup_rules(self, benchmark, academic_book_text):
+        """Precompiled local cleanup on ~5MB."""
+        result = benchmark.pedantic(
+            lambda: BASIC_CLEANUP_RULES.apply(academic_book_text).strip(), rounds=3, iterations=1
+        )
+        self._record_throughput(benchmark, academic_book_text)
+        assert result == _legacy_basic_cleanup(academic_book_text)
+
+    def test_basic_cleanup_legacy(self, benchmark, academic_book_text):
+        """Baseline: five module-level re.sub calls."""
+        benchmark.pedantic(_legacy_basic_cleanup, args=(academic_book_text,), rounds=3, iterations=1)
+        self._record_throughput(benchmark, academic_book_text)
+
+    def test_natural_formatting_rules(self, benchmark, academic_book_text):
+        """Precompiled natural formatting on ~5MB."""
+        result = benchmark.pedantic(NATURAL_FORMATTING_RULES.apply, args=(academic_book_text,), rounds=3, iterations=1)
+        self._record_throughput(benchmark, academic_book_text)
+        assert result == _legacy_natural_formatting(academic_book_text)
+
+    def test_natural_formatting_legacy(self, benchmark, academic_book_text):
+        """Baseline: seven module-level re.sub calls."""
+        benchmark.pedantic(_legacy_natural_formatting, args=(academic_book_text,), rounds=3, iterations=1)
+        self._record_throughput(benchmark, academic_book_text)
+
+    def test_natural_formatting_streamed(self, benchmark, academic_book_text):
+        """Streaming 64KB slices through all passes gives the same output."""
+
+        def stream():
+            slices = (academic_book_text[i : i + 65536] for i in range(0, len(academic_book_text), 65536))
+            return "".join(NATURAL_FORMATTING_RULES.stream(slices))
+
+        result = benchmark.pedantic(stream, rounds=3, iterations=1)
+        self._record_throughput(benchmark, academic_book_text)
+        assert result == _legacy_natural_formatting(academic_book_text)
+
+
+@pytest.fixture(scope="module")
+def formatted_chunks(academic_book_text):
+    """A pipeline and ~5MB of formatted TTS chunks, as DocumentEngine hands them to the timing engine."""
+    pipeline = TextPipeline(enable_cleaning=False)
+    enhanced = pipeline.enhance_with_natural_formatting(academic_book_text)
+    return pipeline, [enhanced.derive(chunk) for chunk in pack_pieces(split_sentences(enhanced), 4000)]
+
+
+class TestStageMemoizationPerformance:
+    """Benchmark the timing engine's per-chunk formatting request on ~5MB of document chunks."""
+
+    def test_reformat_skipped_for_artifacts(self, benchmark, formatted_chunks):
+        """Chunks carrying the formatting stage are returned untouched."""
+        pipeline, chunks = formatted_chunks
+
+        def reformat():
+            with pipeline.track_transform_costs() as meter:
+                return [pipeline.enhance_with_natural_formatting(chunk) for chunk in chunks], meter
+
+        result, meter = benchmark(reformat)
+        assert result == chunks
+        assert meter.stages[TextStage.NATURAL_FORMATTING].skipped == len(chunks)
+
+    def test_reformat_plain_chunks_legacy(self, benchmark, formatted_chunks):
+        """Baseline: plain str chunks are formatted again (compounding pause markers)."""
+        pipeline, chunks = formatted_chunks
+        plain = [str(chunk) for chunk in chunks]
+
+        result = benchmark.pedantic(
+            lambda: [pipeline.enhance_with_natural_formatting(chunk) for chunk in plain], rounds=3, iterations=1
+        )
+        assert result != plain
+
+
+class TestShardedTextPerformance:
+    """Benchmark process-pool formatting and splitting against one process on ~5MB.
+
+    Speedup scales with the CPUs available; on a single CPU the numbers show the sharding overhead.
+    """
+
+    @staticmethod
+    def _processor():
+        return ShardedTextProcessor(threshold_chars=1, min_shard_chars=250_000)
+
+    def test_sharded_formatting(self, benchmark, academic_book_text):
+        """Natural formatting across worker processes, stitched at verified seams."""
+        processor = self._processor()
+        result = benchmark.pedantic(
+            lambda: "".join(processor.map_shards(academic_book_text, apply_natural_formatting, word_gap_seams)),
+            rounds=3,
+            iterations=1,
+        )
+        benchmark.extra_info["workers"] = processor.workers
+        assert result == apply_natural_formatting(academic_book_text)
+
+    def test_sequential_formatting(self, benchmark, academic_book_text):
+        """Baseline: natural formatting in this process."""
+        benchmark.pedantic(apply_natural_formatting, args=(academic_book_text,), rounds=3, iterations=1)
+
+    def test_sharded_sentence_splitting(self, benchmark, academic_book_text):
+        """Sentence splitting across worker processes keeps boundary sentences whole."""
+        processor = self._processor()
+        result = benchmark.pedantic(
+            lambda: processor.map_shards(academic_book_text, split_sentences, sentence_seams), rounds=3, iterations=1
+        )
+        assert [sentence for shard in result for sentence in shard] == split_sentences(academic_book_text)
+
+    def test_sequential_sentence_splitting(self, benchmark, academic_book_text):
+        """Baseline: sentence splitting in this process."""
+        benchmark.pedantic(split_sentences, args=(academic_book_text,), rounds=3, iterations=1)
+
+
+@pytest.fixture(scope="module")
+def paged_document_chunks():
+    """~1MB of TTS chunks, each opening with the same running header and closing with a footer."""
+    header = "Journal of Reproducible Results, Volume 12, Issue 3."
+    footer = "Copyright 2024 by the authors, all rights reserved."
+    return [
+        f"{header} "
+        + " ".join(f"Measurement {page}.{i} reports a value of {page * i} units." for i in range(60))
+        + f" {footer}"
+        for page in range(400)
+    ]
+
+
+class TestSynthesisPlanPerformance:
+    """Benchmark sentence dedup planning; chars_saved is the TTS work it removes."""
+
+    def test_plan_with_running_headers(self, benchmark, paged_document_chunks):
+        """Headers and footers become one unit each, replayed on every page."""
+        plan = benchmark.pedantic(plan_synthesis, args=(paged_document_chunks,), rounds=3, iterations=1)
+
+        total_chars = sum(len(chunk) for chunk in paged_document_chunks)
+        benchmark.extra_info["chars_saved_ratio"] = round(plan.chars_saved / total_chars, 4)
+        assert plan.reused_count == 2 * (len(paged_document_chunks) - 1)
+
+    def test_plan_without_repeats(self, benchmark, paged_document_chunks):
+        """Planning cost when nothing repeats (chunks are left as they are)."""
+        unique_chunks = [chunk.split(" ", 8)[-1].rsplit(" Copyright", 1)[0] for chunk in paged_document_chunks]
+
+        plan = benchmark.pedantic(plan_synthesis, args=(unique_chunks,), rounds=3, iterations=1)
+
+        assert plan.units == unique_chunks
+
+
+def _heavy_tail_engine(hedge_percentile: float) -> tuple[AudioEngine, list[str]]:
+    """AudioEngine over a fake TTS whose first call for every 25th chunk stalls for 0.5s."""
+    calls: list[str] = []
+
+    async def generate(text: str) -> Result[bytes]:
+        calls.append(text)
+        straggler = int(text.split()[1]) % 25 == 0 and calls.count(text) == 1
+        await asyncio.sleep(0.5 if straggler else 0.005)
+        return Result.success(text.encode())
+
+    tts_engine = Mock()
+    tts_engine.generate_audio_data_async = generate
+    engine = AudioEngine(
+        tts_engine=tts_engine,
+        file_manager=Mock(),
+        timing_engine=Mock(),
+        max_concurrent=8,
+        retry_policy=ChunkRetryPolicy(hedge_percentile=hedge_percentile),
+    )
+    engine.base_delay = 0
+    return engine, calls
+
+
+@pytest.fixture
+def heavy_tail_chunks():
+    """A 200-chunk job."""
+    return [f"Chunk {i} of the audiobook, read aloud." for i in range(200)]
+
+
+class TestHedgedRequestPerformance:
+    """Benchmark a 200-chunk job with a heavy latency tail, with and without hedged requests."""
+
+    def test_with_hedging(self, benchmark, heavy_tail_chunks):
+        """Stragglers get a duplicate request once they exceed the peers' p90."""
+        engine, calls = _heavy_tail_engine(hedge_percentile=90.0)
+
+        results = benchmark.pedantic(
+            engine._generate_chunks_with_new_async_interface, args=(heavy_tail_chunks,), rounds=3, iterations=1
+        )
+
+        benchmark.extra_info["tts_calls"] = len(calls)
+        assert all(result.audio for result in results)
+
+    def test_without_hedging(self, benchmark, heavy_tail_chunks):
+        """Baseline: every straggler is waited out."""
+        engine, _ = _heavy_tail_engine(hedge_percentile=0)
+
+        results = benchmark.pedantic(
+            engine._generate_chunks_with_new_async_interface, args=(heavy_tail_chunks,), rounds=3, iterations=1
+        )
+
+        assert all(result.audio for result in results)
+
+
+def _run_mixed_workload(aging_rate: float, page_counts: list[int]) -> tuple[float, float]:
+    """Submit all jobs at once to a one-slot queue; each sleeps 2ms per page. Returns mean and median completion."""
+    queue = JobAdmissionQueue(
+        PageThroughputModel(text_page_seconds=0.002), max_concurrent_jobs=1, aging_rate=aging_rate
+    )
+    completions: list[float] = []
+    start = time.monotonic()
+
+    def convert(name: str, pages: int) -> None:
+        with queue.admit(name, queue.estimate(pages)) as ticket:
+            ticket.success = False  # Keep the rates fixed across rounds
+            time.sleep(pages * 0.002)
+        completions.append(time.monotonic() - start)
+
+    threads = [threading.Thread(target=convert, args=(f"job {i}", pages)) for i, pages in enumerate(page_counts)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.001)  # Arrive in list order
+    for thread in threads:
+        thread.join()
+    return statistics.mean(completions), statistics.median(completions)
+
+
+@pytest.fixture
+def mixed_workload_pages():
+    """A short job running, then a 200-page book queued ahead of six 5-page papers."""
+    return [10, 200, 5, 5, 5, 5, 5, 5]
+
+
+class TestJobAdmissionPerformance:
+    """Benchmark mean/median completion of a mixed workload, shortest-job-first vs first come first served."""
+
+    def test_shortest_job_first(self, benchmark, mixed_workload_pages):
+        """Papers queued behind the book overtake it."""
+        mean, median = benchmark.pedantic(_run_mixed_workload, args=(0.0, mixed_workload_pages), rounds=3, iterations=1)
+
+        benchmark.extra_info["mean_completion_seconds"] = round(mean, 3)
+        benchmark.extra_info["median_completion_seconds"] = round(median, 3)
+        assert median < 0.2
+
+    def test_first_come_first_served(self, benchmark, mixed_workload_pages):
+        """Baseline: every paper waits for the book."""
+        mean, median = benchmark.pedantic(_run_mixed_workload, args=(1e9, mixed_workload_pages), rounds=3, iterations=1)
+
+        benchmark.extra_info["mean_completion_seconds"] = round(mean, 3)
+        benchmark.extra_info["median_completion_seconds"] = round(median, 3)
+        assert median > 0.3
+
+
+TRACKED_FILES = 100_000
+EXPIRING_PER_SWEEP = 1_000
+
+
+class _Clock:
+    """Settable wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _NullFileManager:
+    """File manager whose deletes are no-ops, so sweeps measure bookkeeping only."""
+
+    def delete_file(self, filepath: str) -> None:
+        pass
+
+
+def _tracked_scheduler(clock: _Clock) -> FileCleanupScheduler:
+    """Scheduler tracking 100k files, one scheduled per second, whose deletes are no-ops."""
+    scheduler = FileCleanupScheduler(
+        _NullFileManager(), max_file_age_seconds=TRACKED_FILES, check_interval_seconds=60, clock=clock
+    )
+    for i in range(TRACKED_FILES):
+        clock.now = float(i)
+        scheduler.schedule(f"/outputs/book_{i}.mp3", size=1024)
+    return scheduler
+
+
+def _legacy_sweep(scheduled: dict[str, float], now: float, max_age: float, delete: Callable[[str], None]) -> int:
+    """The former sweep: scan every tracked file, deleting expired ones while holding the lock."""
+    files_to_delete = [path for path, created in scheduled.items() if now - created > max_age]
+    for path in files_to_delete:
+        delete(path)
+        del scheduled[path]
+    return len(files_to_delete)
+
+
+class TestFileCleanupPerformance:
+    """Benchmark expiry sweeps and bookkeeping with 100k tracked output files."""
+
+    def test_heap_expiry_sweep(self, benchmark):
+        """Each sweep pops just the 1k expired files off the heap."""
+        clock = _Clock()
+        scheduler = _tracked_scheduler(clock)
+
+        def sweep() -> int:
+            clock.now += EXPIRING_PER_SWEEP
+            return scheduler._process_expired_files()[0]
+
+        removed = benchmark.pedantic(sweep, rounds=20, iterations=1)
+
+        assert removed == EXPIRING_PER_SWEEP
+        assert scheduler.stats()["tracked_files"] == TRACKED_FILES - 20 * EXPIRING_PER_SWEEP
+
+    def test_legacy_full_scan_sweep(self, benchmark):
+        """Baseline: each sweep scans all tracked files to find the same 1k."""
+        scheduled = {f"/outputs/book_{i}.mp3": float(i) for i in range(TRACKED_FILES)}
+        now = [float(TRACKED_FILES)]
+
+        def sweep() -> int:
+            now[0] += EXPIRING_PER_SWEEP
+            return _legacy_sweep(scheduled, now[0], TRACKED_FILES, lambda path: None)
+
+        removed = benchmark.pedantic(sweep, rounds=20, iterations=1)
+
+        assert removed == EXPIRING_PER_SWEEP
+
+    def test_touch_and_reschedule(self, benchmark):
+        """Recording a play or rescheduling a file stays O(log n) with 100k files tracked."""
+        clock = _Clock()
+        scheduler = _tracked_scheduler(clock)
+        paths = [f"/outputs/book_{i}.mp3" for i in range(0, TRACKED_FILES, 7)]
+
+        def churn() -> None:
+            for path in paths:
+                clock.now += 0.001
+                scheduler.touch(path)
+                scheduler.schedule(path, size=2048)
+
+        benchmark.pedantic(churn, rounds=3, iterations=1)
+
+        assert benchmark.stats.stats.mean / (2 * len(paths)) < 50e-6
+        assert scheduler.stats()["total_bytes"] == TRACKED_FILES * 1024 + len(paths) * 1024
+
+
+BOOK_SEGMENTS = 20_000
+
+
+def _book_timing() -> TimingMetadata:
+    """Timing of a long audiobook: 20k sentences of about 2.5s each."""
+    segments = [
+        TextSegment(
+            f"This is sentence {i} of a long audiobook, read aloud for the read-along view.",
+            i * 2.5,
+            2.4,
+            "sentence",
+            i // 20,
+            i % 20,
+        )
+        for i in range(BOOK_SEGMENTS)
+    ]
+    return TimingMetadata(total_duration=BOOK_SEGMENTS * 2.5, text_segments=segments, audio_files=["book.mp3"])
+
+
+class TestTimingDataPerformance:
+    """Benchmark serving timing data of a long book per request."""
+
+    def test_cached_window_around_playhead(self, benchmark, tmp_path):
+        """A timing window comes from the cached table by binary search, without re-reading the file."""
+        store = TimingStore(str(tmp_path))
+        store.save("book", TimingTable.from_metadata(_book_timing()))
+        playheads = [i * 97.3 for i in range(100)]
+
+        def serve_windows() -> int:
+            sizes = 0
+            for playhead in playheads:
+                table = store.load("book")
+                payload = table.payload(*table.window(start=playhead, count=DEFAULT_WINDOW_SEGMENTS))
+                sizes += len(json.dumps(payload, separators=(",", ":")))
+            return sizes
+
+        total = benchmark.pedantic(serve_windows, rounds=5, iterations=1)
+
+        assert total / len(playheads) < 25_000
+
+    def test_legacy_full_file_per_request(self, benchmark, tmp_path):
+        """Baseline: every request parses and re-serializes the whole indented file."""
+        timing = _book_timing()
+        path = tmp_path / "book_timing.json"
+        path.write_text(json.dumps({"text_segments": [vars(s) for s in timing.text_segments]}, indent=2))
+
+        def serve_full() -> int:
+            sizes = 0
+            for _ in range(100):
+                with path.open() as f:
+                    sizes += len(json.dumps(json.load(f)))
+            return sizes
+
+        total = benchmark.pedantic(serve_full, rounds=1, iterations=1)
+
+        assert total / 100 > 1_000_000
+
+
 if __name__ == "__main__":
     # Allow running benchmarks directly
     pytest.main([__file__, "--benchmark-only", "--benchmark-sort=mean"])
@@ -0,0 +1,164 @@
+# tests/integration/test_gemini_async_stub.py
+"""Integration tests for the native async Gemini LLM path against a local stub HTTP server."""
+
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("google.genai")
+
+from google.genai.client import AsyncClient
+
+from domain.errors import Result
+from infrastructure.llm.gemini_llm_provider import GeminiLLMProvider
+
+
+class _StubGeminiHandler(BaseHTTPRequestHandler):
+    """Answers every generateContent call with a canned response."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+
+    delay_seconds = 0.0
+    reply_text = "Cleaned text from stub"
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.server.request_paths.append(self.path)
+        self.server.client_ports.add(self.client_address[1])
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+
+        body = json.dumps(
+            {
+                "candidates": [
+                    {
+                        "content": {"role": "model", "parts": [{"text": self.reply_text}]},
+                        "finishReason": "STOP",
+                    }
+                ]
+            }
+        ).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Run a stub Gemini endpoint on an ephemeral local port."""
+    handler = type("Handler", (_StubGeminiHandler,), {})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.request_paths = []
+    server.client_ports = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _provider(server: ThreadingHTTPServer, **kwargs: float) -> GeminiLLMProvider:
+    return GeminiLLMProvider(
+        api_key="test-key",
+        model_name="test-model",
+        min_request_interval=0.0,
+        base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        **kwargs,
+    )
+
+
+def test_async_generation_uses_native_client(stub_server):
+    provider = _provider(stub_server)
+
+    result = asyncio.run(provider.generate_content_async("Clean this text"))
+
+    assert result.is_success
+    assert result.value == "Cleaned text from stub"
+    assert any("test-model:generateContent" in path for path in stub_server.request_paths)
+
+
+def test_concurrent_calls_share_connection_pool(stub_server):
+    provider = _provider(stub_server, max_concurrent_requests=2)
+
+    async def run_batch() -> list[Result[str]]:
+        return await asyncio.gather(*(provider.generate_content_async(f"chunk {i}") for i in range(6)))
+
+    results = asyncio.run(run_batch())
+
+    assert all(r.is_success for r in results)
+    assert len(stub_server.request_paths) == 6
+    # Keep-alive reuse: no more connections than the concurrency limit
+    assert len(stub_server.client_ports) <= 2
+
+
+def test_semaphore_works_across_event_loops(stub_server):
+    """Each request gets a fresh loop in the app; the semaphore must not be bound to the first one."""
+    provider = _provider(stub_server)
+
+    first = asyncio.run(provider.generate_content_async("first"))
+    second = asyncio.run(provider.generate_content_async("second"))
+
+    assert first.is_success
+    assert second.is_success
+
+
+def test_rebinding_closes_the_previous_loops_client(stub_server, monkeypatch):
+    """A client created for an earlier loop is closed when the next loop replaces it; the shared one is kept."""
+    provider = _provider(stub_server)
+    closed = []
+    real_aclose = AsyncClient.aclose
+
+    async def aclose(self: AsyncClient) -> None:
+        closed.append(self)
+        await real_aclose(self)
+
+    monkeypatch.setattr(AsyncClient, "aclose", aclose)
+    clients = []
+    for prompt in ["first", "second", "third"]:
+        assert asyncio.run(provider.generate_content_async(prompt)).is_success
+        clients.append(provider._async_client)
+
+    shared, second_loop, _ = clients
+    assert shared is provider.client
+    assert closed == [second_loop.aio]
+    assert provider.generate_content("sync call on the shared client").is_success
+
+
+def test_cancellation_propagates(stub_server):
+    stub_server.RequestHandlerClass.delay_seconds = 2.0
+    provider = _provider(stub_server)
+
+    async def cancel_midway() -> None:
+        task = asyncio.create_task(provider.generate_content_async("slow"))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        await task
+
+    start = time.monotonic()
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel_midway())
+    assert time.monotonic() - start < 1.5
+
+
+def test_request_timeout_returns_failure(stub_server):
+    stub_server.RequestHandlerClass.delay_seconds = 2.0
+    provider = _provider(stub_server, request_timeout_seconds=0.3)
+
+    result = asyncio.run(provider.generate_content_async("slow"))
+
+    assert result.is_failure
@@ -0,0 +1,149 @@
+# tests/unit/test_admission_queue_tdd.py
+"""TDD tests for shortest-job-first admission of conversions."""
+
+import threading
+import time
+
+import pytest
+
+from domain.document.admission_queue import JobAdmissionQueue, PageThroughputModel
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Current fake time."""
+        return self.now
+
+
+def _queue(clock: FakeClock, aging_rate: float = 1.0) -> JobAdmissionQueue:
+    """One job at a time, 1s per text page and 5s per scanned page."""
+    throughput = PageThroughputModel(text_page_seconds=1.0, scanned_page_seconds=5.0)
+    return JobAdmissionQueue(throughput, max_concurrent_jobs=1, aging_rate=aging_rate, clock=clock)
+
+
+def _run_in_thread(queue: JobAdmissionQueue, name: str, pages: int, order: list[str]) -> threading.Thread:
+    """Start a job that waits for admission in its own request thread."""
+
+    def convert() -> None:
+        with queue.admit(name, queue.estimate(pages)) as ticket:
+            ticket.success = False
+            order.append(name)
+
+    thread = threading.Thread(target=convert)
+    thread.start()
+    return thread
+
+
+def _wait_for_waiting(queue: JobAdmissionQueue, count: int) -> None:
+    """Block until count jobs are queued."""
+    deadline = time.monotonic() + 2
+    while len(queue.metrics()["waiting"]) < count:
+        assert time.monotonic() < deadline, "jobs never queued"
+        time.sleep(0.001)
+
+
+class TestJobAdmissionQueueTDD:
+    """Tests for admission order and ETAs."""
+
+    def test_short_job_overtakes_a_big_one_queued_just_before_it(self):
+        """When a slot frees up, the job estimated to finish soonest runs first."""
+        clock = FakeClock()
+        queue = _queue(clock)
+        order: list[str] = []
+
+        with queue.admit("running", queue.estimate(10)) as running:
+            running.success = False
+            threads = [_run_in_thread(queue, "900-page book", 900, order)]
+            _wait_for_waiting(queue, 1)
+            clock.now += 1
+            threads.append(_run_in_thread(queue, "5-page paper", 5, order))
+            _wait_for_waiting(queue, 2)
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert order == ["5-page paper", "900-page book"]
+        assert queue.metrics()["completed"] == 3
+
+    def test_waiting_job_ages_past_later_shorter_jobs(self):
+        """A big job that has waited longer than the size difference is no longer overtaken."""
+        clock = FakeClock()
+        queue = _queue(clock, aging_rate=1.0)
+        order: list[str] = []
+
+        with queue.admit("running", queue.estimate(10)) as running:
+            running.success = False
+            threads = [_run_in_thread(queue, "book", 100, order)]
+            _wait_for_waiting(queue, 1)
+            clock.now += 200
+            threads.append(_run_in_thread(queue, "paper", 5, order))
+            _wait_for_waiting(queue, 2)
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert order == ["book", "paper"]
+
+    def test_eta_counts_running_and_shorter_queued_jobs(self):
+        """The ETA is the remaining time of running jobs plus shorter queued jobs plus the job itself."""
+        clock = FakeClock()
+        queue = _queue(clock, aging_rate=0.0)
+        order: list[str] = []
+
+        with queue.admit("running", queue.estimate(60)) as running:
+            running.success = False
+            thread = _run_in_thread(queue, "paper", 5, order)
+            _wait_for_waiting(queue, 1)
+            clock.now = 20
+
+            eta = queue.eta(queue.estimate(10, scanned_pages=2))
+        thread.join(timeout=2)
+
+        assert eta == {"estimated_seconds": 18.0, "queue_position": 1, "wait_seconds": 45.0, "eta_seconds": 63.0}
+
+    def test_admitted_at_once_when_a_slot_is_free(self):
+        """With a free slot a job does not queue and its ETA is its own estimate."""
+        queue = _queue(FakeClock())
+
+        with queue.admit("paper", queue.estimate(5)) as ticket:
+            info = ticket.to_debug_info()
+
+        assert info["queue_position"] == 0
+        assert info["eta_seconds"] == 5.0
+        assert info["queue_wait_seconds"] == 0.0
+
+    def test_failed_job_frees_its_slot_without_teaching_throughput(self):
+        """A job that raises releases its slot and leaves the learned rates alone."""
+        clock = FakeClock()
+        queue = _queue(clock)
+
+        def convert() -> None:
+            with queue.admit("broken", queue.estimate(5)):
+                clock.now += 50
+                raise RuntimeError("conversion failed")
+
+        with pytest.raises(RuntimeError):
+            convert()
+
+        assert queue.metrics()["running"] == []
+        assert queue.throughput.rates()["text_page_seconds"] == 1.0
+
+
+class TestPageThroughputModelTDD:
+    """Tests for learning seconds per page."""
+
+    def test_rates_are_learned_per_page_kind(self, tmp_path):
+        """Text-only jobs set the text rate; the rest of a mixed job's time goes to its scanned pages."""
+        state_file = str(tmp_path / "throughput.json")
+        model = PageThroughputModel(state_file=state_file)
+
+        model.record(model.estimate(10), 20.0)
+        model.record(model.estimate(10, scanned_pages=5), 110.0)
+        reloaded = PageThroughputModel(state_file=state_file)
+
+        assert reloaded.rates()["text_page_seconds"] == 2.0
+        assert reloaded.rates()["scanned_page_seconds"] == 20.0
+        assert reloaded.estimate(3, scanned_pages=1).seconds == 24.0
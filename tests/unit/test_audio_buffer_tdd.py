@@ -0,0 +1,119 @@
+# tests/unit/test_audio_buffer_tdd.py
+"""TDD tests for the memory-budgeted chunk audio buffer."""
+
+import io
+import os
+import tracemalloc
+from unittest.mock import Mock
+import wave
+
+from domain.audio.audio_buffer import SpillingAudioBuffer
+from domain.audio.audio_engine import AudioEngine
+from domain.errors import Result
+from infrastructure.file.file_manager import FileManager
+
+CHUNK_FRAMES = 32_000  # 64KB of 16-bit mono audio per chunk
+
+
+def _wav(value: int, frames: int = CHUNK_FRAMES) -> bytes:
+    """A mono 16-bit WAV whose samples are all value."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(value.to_bytes(2, "little") * frames)
+    return buffer.getvalue()
+
+
+def _engine(tmp_path, memory_budget_bytes: int) -> AudioEngine:
+    """Synchronous AudioEngine whose TTS returns one 64KB WAV per chunk and whose MP3 step records the WAV."""
+    tts_engine = Mock()
+    tts_engine.generate_audio_data = lambda text: Result.success(_wav(int(text.split()[-1])))
+    chunking_service = Mock()
+    chunking_service.process_chunks.side_effect = lambda chunks, *args, **kwargs: chunks
+    engine = AudioEngine(
+        tts_engine=tts_engine,
+        file_manager=FileManager(str(tmp_path / "uploads"), str(tmp_path / "outputs")),
+        timing_engine=Mock(),
+        enable_async=False,
+        enable_sentence_dedup=False,
+        chunking_service=chunking_service,
+        audio_memory_budget_bytes=memory_budget_bytes,
+        audio_spill_dir=str(tmp_path / "spill"),
+    )
+    engine.base_delay = 0
+    return engine
+
+
+def _record_encoded_frames(engine: AudioEngine) -> list[int]:
+    """Replace ffmpeg with a stub that notes how many frames the WAV handed to it has."""
+    encoded: list[int] = []
+
+    def convert(wav_path: str, mp3_path: str) -> Result[str]:
+        with wave.open(wav_path, "rb") as wav_file:
+            encoded.append(wav_file.getnframes())
+        return Result.success(mp3_path)
+
+    engine._convert_wav_to_mp3 = convert
+    return encoded
+
+
+class TestSpillingAudioBufferTDD:
+    """Tests for keeping recent chunks in memory and the rest on disk."""
+
+    def test_oldest_chunks_are_spilled_once_over_budget(self, tmp_path):
+        """Only the newest chunks that fit the budget stay in memory; spilled ones read back unchanged."""
+        buffer = SpillingAudioBuffer(memory_budget_bytes=250, scratch_dir=str(tmp_path))
+        chunks = {index: bytes([index]) * 100 for index in range(5)}
+
+        for index, audio in chunks.items():
+            buffer.put(index, audio)
+
+        assert buffer.stats() == {
+            "memory_budget_bytes": 250,
+            "peak_memory_bytes": 200,
+            "spilled_chunks": 3,
+            "spilled_bytes": 300,
+        }
+        assert all(buffer.get(index) == audio for index, audio in chunks.items())
+        buffer.close()
+        assert os.listdir(tmp_path) == []
+
+    def test_wav_is_written_in_playback_order_including_replays(self, tmp_path):
+        """Chunks are joined into one WAV in the given order; a chunk may be played more than once."""
+        buffer = SpillingAudioBuffer(memory_budget_bytes=0, scratch_dir=str(tmp_path / "spill"))
+        buffer.put(0, _wav(1, frames=10))
+        buffer.put(1, _wav(2, frames=20))
+        output = str(tmp_path / "combined.wav")
+
+        buffer.write_wav(output, [0, 1, 0])
+        buffer.close()
+
+        with wave.open(output, "rb") as wav_file:
+            assert wav_file.getnframes() == 40
+            assert wav_file.readframes(40) == _wav(1, 10)[44:] + _wav(2, 20)[44:] + _wav(1, 10)[44:]
+
+
+class TestBoundedMemoryAudioTDD:
+    """AudioEngine keeps a job's audio within its memory budget."""
+
+    def test_peak_memory_stays_within_budget_for_a_long_document(self, tmp_path):
+        """A 40-chunk (2.5MB) job with a 128KB budget peaks far below its total audio, and encodes all of it."""
+        engine = _engine(tmp_path, memory_budget_bytes=128 * 1024)
+        encoded = _record_encoded_frames(engine)
+        chunks = [f"Chunk number {i}" for i in range(40)]
+        engine.generate_simple_audio(chunks[:2], "warmup")  # Imports and first-call allocations
+
+        tracemalloc.start()
+        try:
+            result = engine.generate_simple_audio(chunks, "book")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert result.combined_mp3 == "book_simple.mp3"
+        assert encoded[-1] == 40 * CHUNK_FRAMES
+        assert result.debug_info["audio_buffer"]["peak_memory_bytes"] <= 128 * 1024
+        assert peak < 1024 * 1024  # 40 chunks of audio alone would be 2.5MB, twice that with the combined copy
+        assert os.listdir(tmp_path / "spill") == []
@@ -0,0 +1,105 @@
+# tests/unit/test_audio_serving_tdd.py
+"""TDD tests for serving audio outputs with ETags, conditional GETs and byte ranges."""
+
+import os
+
+import pytest
+
+from infrastructure.web.audio_serving import (
+    IMMUTABLE_CACHE_CONTROL,
+    AudioFileServer,
+    AudioResponse,
+    ByteRange,
+    UnsatisfiableRange,
+    parse_range,
+)
+
+AUDIO = bytes(range(256)) * 40  # 10240 bytes
+
+
+class _FileWrapper:
+    """Stands in for the server's wsgi.file_wrapper (gunicorn's sends it with sendfile)."""
+
+    def __init__(self, f, block_size: int):
+        self.f = f
+        self.block_size = block_size
+
+    def __iter__(self):
+        try:
+            yield from iter(lambda: self.f.read(self.block_size), b"")
+        finally:
+            self.f.close()
+
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / "book_simple.mp3").write_bytes(AUDIO)
+    return AudioFileServer(str(tmp_path))
+
+
+def _get(
+    server: AudioFileServer, filename: str = "book_simple.mp3", **environ: str
+) -> tuple[AudioResponse, dict[str, str], bytes]:
+    response = server.respond(dict({"REQUEST_METHOD": "GET", "wsgi.file_wrapper": _FileWrapper}, **environ), filename)
+    return response, dict(response.headers), b"".join(response.body)
+
+
+class TestParseRangeTDD:
+    """Tests for reading the Range header."""
+
+    def test_range_forms(self):
+        """Closed, open-ended and suffix ranges; an end past the file is clamped."""
+        assert parse_range("bytes=0-99", 1000) == ByteRange(0, 99)
+        assert parse_range("bytes=900-", 1000) == ByteRange(900, 999)
+        assert parse_range("bytes=-100", 1000) == ByteRange(900, 999)
+        assert parse_range("bytes=990-5000", 1000) == ByteRange(990, 999)
+        assert parse_range("bytes=0-9,20-29", 1000) is None  # Multiple ranges: whole file
+        with pytest.raises(UnsatisfiableRange):
+            parse_range("bytes=1000-", 1000)
+
+
+class TestAudioFileServerTDD:
+    """Tests for the responses built for audio requests."""
+
+    def test_seek_transfers_only_the_requested_bytes(self, server):
+        """A Range request is answered with 206 and just those bytes; an open-ended one goes to the file wrapper."""
+        response, headers, body = _get(server, HTTP_RANGE="bytes=100-199")
+        assert response.status == 206
+        assert body == AUDIO[100:200]
+        assert headers["Content-Range"] == f"bytes 100-199/{len(AUDIO)}"
+        assert headers["Content-Length"] == "100"
+
+        response, headers, body = _get(server, HTTP_RANGE="bytes=10000-")
+        assert isinstance(response.body, _FileWrapper)
+        assert (response.status, body) == (206, AUDIO[10000:])
+
+    def test_conditional_requests(self, server):
+        """A matching If-None-Match gets 304; a stale If-Range gets the whole new file instead of a range."""
+        _, headers, _ = _get(server)
+        etag = headers["ETag"]
+
+        response, _, body = _get(server, HTTP_IF_NONE_MATCH=f'"stale", {etag}')
+        assert (response.status, body) == (304, b"")
+
+        response, _, body = _get(server, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"stale"')
+        assert (response.status, body) == (200, AUDIO)
+
+        response, headers, _ = _get(server, HTTP_RANGE=f"bytes={len(AUDIO)}-")
+        assert (response.status, headers["Content-Range"]) == (416, f"bytes */{len(AUDIO)}")
+
+    def test_content_hash_pins_immutable_urls(self, server, tmp_path):
+        """Only a URL carrying the current content hash may be cached for good; rewriting the file changes the ETag."""
+        version = server.version("book_simple.mp3")
+        _, pinned, _ = _get(server, QUERY_STRING=f"v={version}")
+        _, bare, _ = _get(server)
+        assert pinned["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+        assert bare["Cache-Control"] == "no-cache"
+
+        (tmp_path / "book_simple.mp3").write_bytes(AUDIO[::-1])
+        os.utime(tmp_path / "book_simple.mp3", ns=(0, 10**9))
+        assert server.version("book_simple.mp3") != version
+
+    def test_names_outside_the_directory_are_not_served(self, server):
+        """Paths and hidden files are 404, as are missing files."""
+        for filename in ["../book_simple.mp3", ".book_simple.mp3.partial", "missing.mp3"]:
+            assert _get(server, filename)[0].status == 404
@@ -0,0 +1,156 @@
+# tests/unit/test_cancellation_tdd.py
+"""TDD tests for cooperative cancellation of conversion jobs."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from domain.audio.audio_engine import AudioEngine
+from domain.cancellation import (
+    CancellationRegistry,
+    CancellationToken,
+    JobCancelledError,
+    cancellable_sleep,
+    cancellation_scope,
+    run_subprocess,
+)
+from domain.container.event_loop import BackgroundEventLoop
+from domain.document.admission_queue import JobAdmissionQueue, PageThroughputModel
+from domain.errors import Result
+
+
+def _cancel_later(token: CancellationToken, seconds: float = 0.05) -> threading.Timer:
+    """Cancel token from another thread, as a disconnect watcher or /cancel request would."""
+    timer = threading.Timer(seconds, token.cancel, args=("cancelled by user",))
+    timer.start()
+    return timer
+
+
+class TestCancellationTokenTDD:
+    """Tests for the per-job cancellation token."""
+
+    def test_deadline_cancels_the_token(self):
+        """Once the deadline passes the token reports itself cancelled, with the reason."""
+        now = [0.0]
+        token = CancellationToken(deadline_seconds=10, clock=lambda: now[0])
+
+        assert not token.cancelled
+        assert token.remaining_seconds() == 10
+        now[0] = 10.0
+
+        with pytest.raises(JobCancelledError, match="deadline exceeded"):
+            token.raise_if_cancelled()
+
+    def test_callback_registered_after_cancel_runs_at_once(self):
+        """Work started just after the job was cancelled is stopped too."""
+        token = CancellationToken()
+        token.cancel("client disconnected")
+        stop = Mock()
+
+        token.on_cancel(stop)
+
+        stop.assert_called_once()
+        assert not token.cancel("again")
+
+    def test_subprocess_is_killed_when_the_job_is_cancelled(self):
+        """A long-running child process (ffmpeg, piper) is killed instead of running to completion."""
+        token = CancellationToken()
+        timer = _cancel_later(token)
+        start = time.monotonic()
+
+        with cancellation_scope(token), pytest.raises(JobCancelledError):
+            run_subprocess(["sleep", "10"])
+        timer.join()
+
+        assert time.monotonic() - start < 5
+
+    def test_cancellable_sleep_wakes_early(self):
+        """Retry backoff and rate-limit pauses end as soon as the job is cancelled."""
+        token = CancellationToken()
+        timer = _cancel_later(token)
+        start = time.monotonic()
+
+        with cancellation_scope(token), pytest.raises(JobCancelledError):
+            cancellable_sleep(10)
+        timer.join()
+
+        assert time.monotonic() - start < 5
+
+
+class TestCancellationRegistryTDD:
+    """Tests for cancelling jobs by id."""
+
+    def test_running_job_is_cancelled_by_id(self):
+        """Only the named job is cancelled, and only while it runs."""
+        registry = CancellationRegistry()
+
+        with registry.job("book") as book, registry.job("paper") as paper:
+            assert sorted(registry.running_jobs()) == ["book", "paper"]
+            assert registry.cancel("book")
+
+        assert book.cancelled
+        assert book.reason == "cancelled by user"
+        assert not paper.cancelled
+        assert registry.running_jobs() == []
+        assert not registry.cancel("paper")
+
+
+class TestCancellationPropagationTDD:
+    """Cancellation reaches async TTS work, sync TTS loops and the admission queue."""
+
+    def test_event_loop_run_cancels_the_coroutine(self):
+        """A job blocked on the shared event loop stops waiting and its coroutine is cancelled."""
+        event_loop = BackgroundEventLoop()
+        coroutine_cancelled = threading.Event()
+
+        async def synthesize() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                coroutine_cancelled.set()
+                raise
+
+        token = CancellationToken()
+        timer = _cancel_later(token)
+        with cancellation_scope(token), pytest.raises(JobCancelledError):
+            event_loop.run(synthesize())
+        timer.join()
+
+        assert coroutine_cancelled.wait(timeout=2)
+        event_loop.stop()
+
+    def test_sync_tts_loop_stops_at_the_next_chunk(self):
+        """No further chunks are synthesized once the job is cancelled."""
+        token = CancellationToken()
+        tts_engine = Mock()
+
+        def generate(text: str) -> Result[bytes]:
+            token.cancel("cancelled by user")
+            return Result.success(text.encode())
+
+        tts_engine.generate_audio_data = Mock(side_effect=generate)
+        engine = AudioEngine(tts_engine=tts_engine, file_manager=Mock(), timing_engine=Mock(), enable_async=False)
+
+        with cancellation_scope(token), pytest.raises(JobCancelledError):
+            engine._generate_chunks_sync(["First chunk.", "Second chunk.", "Third chunk."])
+
+        assert tts_engine.generate_audio_data.call_count == 1
+
+    def test_queued_job_leaves_the_admission_queue(self):
+        """A job cancelled while waiting for a slot gives up its place without taking a slot."""
+        queue = JobAdmissionQueue(PageThroughputModel(), max_concurrent_jobs=1)
+        token = CancellationToken()
+
+        with queue.admit("running", queue.estimate(10)) as running:
+            running.success = False
+            timer = _cancel_later(token)
+            with cancellation_scope(token), pytest.raises(JobCancelledError), queue.admit("queued", queue.estimate(5)):
+                pass
+            timer.join()
+            assert queue.metrics()["waiting"] == []
+
+        assert queue.metrics()["running"] == []
+        assert queue.metrics()["completed"] == 1
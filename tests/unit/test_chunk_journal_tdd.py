@@ -0,0 +1,139 @@
+# tests/unit/test_chunk_journal_tdd.py
+"""TDD tests for the crash-safe TTS chunk journal and resuming interrupted jobs."""
+
+import io
+import json
+import os
+import time
+from unittest.mock import Mock
+import wave
+
+from domain.audio.audio_engine import AudioEngine
+from domain.audio.chunk_journal import ChunkJournalStore
+from domain.audio.hedged_retry import ChunkRetryPolicy
+from domain.errors import Result, audio_generation_error
+from infrastructure.file.file_manager import FileManager
+
+UNITS = ["First chunk of the book.", "Second chunk of the book.", "Third chunk of the book."]
+
+
+def _wav(text: str) -> bytes:
+    """A short valid WAV whose samples depend on the text."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(8000)
+        wav_file.writeframes(text.encode() * 10)
+    return buffer.getvalue()
+
+
+class TestChunkJournalTDD:
+    """Tests for recording, verifying and resuming chunk audio."""
+
+    def test_reopened_journal_returns_recorded_chunks(self, tmp_path):
+        """Chunks recorded before a restart are returned by index, with their synthesis time."""
+        store = ChunkJournalStore(str(tmp_path))
+        journal = store.open("book", UNITS, "piper:voice")
+        journal.record(0, b"audio-0", 1.5)
+        journal.record(2, b"audio-2", 2.5)
+
+        resumed = store.open("book", UNITS, "piper:voice")
+
+        assert resumed.completed() == {0: (b"audio-0", 1.5), 2: (b"audio-2", 2.5)}
+        assert resumed.progress() == {"job": "book", "completed_chunks": 2, "total_chunks": 3}
+
+    def test_chunks_are_matched_by_content_not_position(self, tmp_path):
+        """A changed plan reuses audio of identical chunks, but never audio from another voice."""
+        store = ChunkJournalStore(str(tmp_path))
+        store.open("book", UNITS, "piper:voice").record(1, b"audio-1", 1.0)
+
+        assert store.open("book", ["A new opening.", *UNITS], "piper:voice").completed() == {2: (b"audio-1", 1.0)}
+        assert store.open("book", UNITS, "piper:other-voice").completed() == {}
+
+    def test_partial_writes_are_ignored(self, tmp_path):
+        """A torn log line, a truncated audio file and leftover temp files do not break resume."""
+        store = ChunkJournalStore(str(tmp_path))
+        journal = store.open("book", UNITS, "piper:voice")
+        journal.record(0, b"audio-0", 1.0)
+        journal.record(1, b"audio-1", 1.0)
+
+        with open(os.path.join(journal.directory, "chunks", f"{journal.hashes[1]}.wav"), "wb") as f:
+            f.write(b"aud")
+        with open(os.path.join(journal.directory, "chunks.jsonl"), "a", encoding="utf-8") as f:
+            f.write('{"hash": "abc", "byt')
+        leftover = os.path.join(journal.directory, "chunks", "crashed.wav.tmp")
+        with open(leftover, "wb") as f:
+            f.write(b"half")
+
+        resumed = store.open("book", UNITS, "piper:voice")
+
+        assert resumed.completed() == {0: (b"audio-0", 1.0)}
+        assert not os.path.exists(leftover)
+
+    def test_recording_twice_is_idempotent(self, tmp_path):
+        """Re-recording a chunk (e.g. a retried job) neither duplicates nor changes it."""
+        journal = ChunkJournalStore(str(tmp_path)).open("book", UNITS, "piper:voice")
+        journal.record(0, b"audio-0", 1.0)
+        journal.record(0, b"audio-0", 1.0)
+
+        with open(os.path.join(journal.directory, "chunks.jsonl"), encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f]
+        with open(os.path.join(journal.directory, "plan.json"), encoding="utf-8") as f:
+            plan = json.load(f)
+
+        assert len(entries) == 1
+        assert plan["chunks"] == journal.hashes
+
+    def test_abandoned_journals_are_pruned(self, tmp_path):
+        """Journals of jobs nobody resumed are removed after max_age_hours."""
+        store = ChunkJournalStore(str(tmp_path), max_age_hours=1)
+        old = store.open("old book", UNITS, "piper:voice")
+        two_hours_ago = time.time() - 7200
+        os.utime(old.directory, (two_hours_ago, two_hours_ago))
+
+        store.open("new book", UNITS, "piper:voice")
+
+        assert not os.path.exists(old.directory)
+
+
+class TestAudioEngineResumeTDD:
+    """AudioEngine resumes interrupted jobs from the journal."""
+
+    def test_rerun_synthesizes_only_missing_chunks_and_finishes(self, tmp_path):
+        """After a failed run, the rerun calls TTS only for the chunk that failed, then encodes the job."""
+        calls = []
+        broken = {"Third chunk of the book."}
+
+        async def generate(text: str) -> Result[bytes]:
+            calls.append(text)
+            if text in broken:
+                return Result.failure(audio_generation_error("engine crashed"))
+            return Result.success(_wav(text))
+
+        tts_engine = Mock()
+        tts_engine.generate_audio_data_async = generate
+        chunking_service = Mock()
+        chunking_service.process_chunks.side_effect = lambda chunks, *args, **kwargs: chunks
+        store = ChunkJournalStore(str(tmp_path / "journals"))
+        engine = AudioEngine(
+            tts_engine=tts_engine,
+            file_manager=FileManager(str(tmp_path / "uploads"), str(tmp_path / "outputs")),
+            timing_engine=Mock(),
+            chunking_service=chunking_service,
+            retry_policy=ChunkRetryPolicy(max_attempts=1, hedge_percentile=0),
+            chunk_journal=store,
+        )
+        engine.base_delay = 0
+        engine._convert_wav_to_mp3 = Mock(return_value=Result.success("ok"))
+
+        first = engine.generate_simple_audio(UNITS, "book")
+        broken.clear()
+        calls.clear()
+        second = engine.generate_simple_audio(UNITS, "book")
+
+        assert first.debug_info == {"missing_chunks": [3]}
+        assert calls == ["Third chunk of the book."]
+        assert second.combined_mp3 == "book_simple.mp3"
+        assert second.debug_info["resumed_chunks"] == 2
+        assert os.listdir(store.root) == []
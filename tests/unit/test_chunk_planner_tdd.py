@@ -0,0 +1,145 @@
+# tests/unit/test_chunk_planner_tdd.py
+"""TDD tests for the offset-based chunk planner and the chunkers built on it."""
+
+from unittest.mock import Mock
+
+from domain.audio.audio_engine import AudioEngine, ChunkAudio
+from domain.text.chunk_planner import (
+    pack_pieces,
+    pack_sentences,
+    plan_balanced_bounds,
+    plan_chunk_bounds,
+    simulate_makespan,
+)
+from domain.text.chunking_strategy import BalancedChunking, ChunkingMode, ChunkingService, create_chunking_service
+from infrastructure.tts.text_segmenter import TextSegmenter
+
+
+class TestChunkPlannerTDD:
+    """Tests for greedy boundary planning over piece lengths."""
+
+    def test_plans_greedy_bounds_including_separators(self):
+        """Pieces of 3, 3, 3 with max 7 fit two per chunk ('aaa bbb' is 7 chars)."""
+        assert plan_chunk_bounds([3, 3, 3], max_size=7) == [(0, 2), (2, 3)]
+
+    def test_oversized_piece_gets_its_own_chunk(self):
+        """A piece longer than max_size cannot be merged but is never dropped."""
+        assert plan_chunk_bounds([2, 20, 2], max_size=10) == [(0, 1), (1, 2), (2, 3)]
+
+    def test_empty_input_plans_nothing(self):
+        """No pieces means no chunks."""
+        assert plan_chunk_bounds([], max_size=10) == []
+        assert pack_pieces([], max_size=10) == []
+
+    def test_packed_chunks_never_exceed_max_size(self):
+        """Joined chunks stay within max_size and preserve every word in order."""
+        words = [f"word{i}" for i in range(500)]
+
+        chunks = pack_pieces(words, max_size=64)
+
+        assert all(len(chunk) <= 64 for chunk in chunks)
+        assert " ".join(chunks).split() == words
+
+    def test_pack_sentences_splits_oversized_sentences_by_words(self):
+        """Short sentences are grouped; a too-long sentence is broken up on its own."""
+        sentences = ["Short one.", "Another.", "this sentence is far too long to fit in one chunk.", "End."]
+
+        chunks = pack_sentences(sentences, max_size=20)
+
+        assert chunks[0] == "Short one. Another."
+        assert chunks[-1] == "End."
+        assert all(len(chunk) <= 20 for chunk in chunks)
+
+
+class TestChunkerCompatibilityTDD:
+    """The ChunkingService API and TextSegmenter keep their behaviour on top of the planner."""
+
+    def test_chunking_service_respects_max_size(self):
+        """Sentence-based chunks should fit the limit and keep all the text."""
+        text = "The quick brown fox jumps. Over the lazy dog! Again and again? Yes. " * 50
+        service = create_chunking_service(ChunkingMode.SENTENCE_BASED)
+
+        chunks = service.process_chunks([text, "Tiny."], max_chunk_size=120)
+
+        assert chunks[-1] == "Tiny."
+        assert all(len(chunk) <= 120 for chunk in chunks)
+        assert " ".join(chunks).split() == (text + " Tiny.").split()
+
+    def test_word_based_chunking_matches_greedy_word_packing(self):
+        """Word-based chunking should fill each chunk as far as the limit allows."""
+        service = create_chunking_service(ChunkingMode.WORD_BASED)
+
+        assert service.process_chunks(["aa bb cc dd ee"], max_chunk_size=8) == ["aa bb cc", "dd ee"]
+
+    def test_segmenter_chunks_on_sentence_boundaries(self):
+        """TextSegmenter.split_into_chunks should not cut sentences that fit."""
+        text = "First sentence here. Second sentence here. Third sentence here."
+
+        assert TextSegmenter().split_into_chunks(text, max_chunk_size=45) == [
+            "First sentence here. Second sentence here.",
+            "Third sentence here.",
+        ]
+
+
+class TestBalancedChunkingTDD:
+    """Tests for straggler-aware chunk planning across parallel TTS workers."""
+
+    def test_simulates_in_order_dispatch_to_free_workers(self):
+        """Makespan is the finish time of the busiest worker under list scheduling."""
+        assert simulate_makespan([4, 1, 1, 1, 1], workers=2) == 4
+        assert simulate_makespan([], workers=4) == 0.0
+
+    def test_first_chunk_is_small(self):
+        """The leading chunk should respect first_chunk_size so audio starts quickly."""
+        lengths = [100] * 60
+
+        bounds = plan_balanced_bounds(lengths, max_size=3000, workers=4, first_chunk_size=250)
+
+        assert bounds[0] == (0, 2)  # "100 + 1 + 100" fits 250, a third piece would not
+
+    def test_balanced_plan_beats_greedy_tail(self):
+        """Greedy leaves one full wave plus a straggler; balancing spreads the work."""
+        lengths = [99] * 100  # 10,000 chars; greedy at 3000 makes 30-piece chunks plus a 10-piece tail
+
+        def cost(bounds):
+            return [sum(lengths[a:b]) + (b - a - 1) + 200 for a, b in bounds]
+
+        greedy = plan_chunk_bounds(lengths, 3000)
+        balanced = plan_balanced_bounds(lengths, 3000, workers=4, overhead=200)
+
+        assert simulate_makespan(cost(balanced), 4) < simulate_makespan(cost(greedy), 4)
+        assert max(cost(balanced)) - min(cost(balanced)) <= 200
+
+    def test_never_exceeds_max_size_and_keeps_text(self):
+        """Balanced chunks fit the limit and concatenate back to the same words."""
+        text = "A short one. " + "This sentence is of a moderate length for testing. " * 200
+        middle = text.index("This", 3000)  # Input chunks end on sentence boundaries
+        service = create_chunking_service(ChunkingMode.BALANCED)
+
+        chunks = service.process_chunks([text[:middle], text[middle:]], max_chunk_size=1000, concurrency=3)
+
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+    def test_audio_engine_passes_its_worker_count(self):
+        """AudioEngine should plan chunks for its own max_concurrent."""
+        strategy = Mock(wraps=BalancedChunking())
+        engine = AudioEngine(
+            tts_engine=Mock(),
+            file_manager=Mock(),
+            timing_engine=Mock(),
+            max_concurrent=6,
+            enable_async=False,
+            chunking_service=ChunkingService(strategy),
+        )
+        engine.tts_engine.generate_audio_data.return_value = Mock(is_success=False)
+
+        engine.generate_simple_audio(["Some text to speak."], "out")
+
+        assert strategy.chunk_text.call_args.args[2] == 1  # Sequential synthesis has one worker
+
+        engine.enable_async = True
+        engine._generate_chunks_with_new_async_interface = Mock(return_value=[ChunkAudio(None, 0.0)])
+        engine.generate_simple_audio(["Some text to speak."], "out")
+
+        assert strategy.chunk_text.call_args.args[2] == 6
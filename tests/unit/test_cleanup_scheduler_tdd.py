@@ -0,0 +1,107 @@
+# tests/unit/test_cleanup_scheduler_tdd.py
+"""TDD tests for heap-based expiry and disk-quota eviction of output files."""
+
+import os
+
+from infrastructure.file.cleanup_scheduler import FileCleanupScheduler
+from infrastructure.file.file_manager import FileManager
+
+
+class _Clock:
+    """Settable wall clock."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _write(directory, name: str, size: int, mtime: float) -> str:
+    path = directory / name
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+class TestFileCleanupSchedulerTDD:
+    """Tests for expiring and evicting tracked files."""
+
+    def test_expired_files_are_deleted_earliest_deadline_first_outside_the_lock(self, tmp_path):
+        """Only files past their max age are deleted, and never while the scheduler's lock is held."""
+        clock = _Clock()
+        file_manager = FileManager(str(tmp_path / "uploads"), str(tmp_path / "outputs"))
+        scheduler = FileCleanupScheduler(file_manager, 100, 3600, clock=clock)
+        deleted = []
+
+        def delete_file(filepath: str) -> None:
+            assert not scheduler._lock.locked()
+            deleted.append(os.path.basename(filepath))
+
+        file_manager.delete_file = delete_file
+        scheduler.schedule(str(tmp_path / "outputs" / "old.mp3"), size=10)
+        clock.now += 50
+        scheduler.schedule(str(tmp_path / "outputs" / "new.mp3"), size=10)
+        scheduler.schedule(str(tmp_path / "outputs" / "rescheduled.mp3"), size=10)
+        clock.now += 60
+        scheduler.schedule(str(tmp_path / "outputs" / "rescheduled.mp3"), size=10)
+
+        assert scheduler.run_manual_cleanup()["files_removed_now"] == 1
+        assert deleted == ["old.mp3"]
+        clock.now += 100
+        scheduler.run_manual_cleanup()
+        assert deleted == ["old.mp3", "new.mp3", "rescheduled.mp3"]
+        assert scheduler.stats()["tracked_files"] == 0
+
+    def test_tracked_files_are_rebuilt_from_a_directory_scan(self, tmp_path):
+        """After a restart the existing outputs are tracked again, with deadlines from their modification times."""
+        clock = _Clock()
+        outputs = tmp_path / "outputs"
+        file_manager = FileManager(str(tmp_path / "uploads"), str(outputs))
+        _write(outputs, "stale.mp3", 10, clock.now - 200)
+        _write(outputs, "fresh.mp3", 10, clock.now - 10)
+        scheduler = FileCleanupScheduler(file_manager, 100, 3600, watch_dir=str(outputs), clock=clock)
+
+        assert scheduler.rebuild_from_directory() == 2
+        scheduler.run_manual_cleanup()
+
+        assert os.listdir(outputs) == ["fresh.mp3"]
+
+    def test_least_recently_accessed_files_are_evicted_over_quota(self, tmp_path):
+        """Past the disk quota, files nobody has played for longest go first; a played file is kept."""
+        clock = _Clock()
+        outputs = tmp_path / "outputs"
+        file_manager = FileManager(str(tmp_path / "uploads"), str(outputs))
+        scheduler = FileCleanupScheduler(
+            file_manager, 3600, 3600, watch_dir=str(outputs), max_disk_usage_bytes=250, clock=clock
+        )
+        for i, name in enumerate(["a.mp3", "b.mp3", "c.mp3"]):
+            _write(outputs, name, 100, clock.now - 30 + i)
+        scheduler.rebuild_from_directory()
+        clock.now += 1
+        scheduler.touch(str(outputs / "a.mp3"))
+
+        result = scheduler.run_manual_cleanup()
+
+        assert sorted(os.listdir(outputs)) == ["a.mp3", "c.mp3"]
+        assert result["total_bytes"] == 200
+        assert result["bytes_freed_now"] == 100
+
+    def test_files_removed_by_an_admin_cleanup_stop_counting_towards_the_quota(self, tmp_path):
+        """After /admin/cleanup deletes outputs, the quota check does not evict live outputs to make room for them."""
+        clock = _Clock()
+        file_manager = FileManager(str(tmp_path / "uploads"), str(tmp_path / "outputs"))
+        scheduler = FileCleanupScheduler(file_manager, 3600, 3600, max_disk_usage_bytes=250, clock=clock)
+        file_manager.add_deletion_listener(scheduler.untrack)
+        for name in ["old_a.mp3", "old_b.mp3"]:
+            scheduler.schedule(file_manager.save_output_file(b"x" * 100, name))
+
+        assert file_manager.cleanup_old_files(max_age_hours=-1)["files_removed"] == 2
+        assert (scheduler.stats()["tracked_files"], scheduler.stats()["total_bytes"]) == (0, 0)
+        for name in ["live_a.mp3", "live_b.mp3"]:
+            scheduler.schedule(file_manager.save_output_file(b"x" * 100, name))
+        result = scheduler.run_manual_cleanup()
+
+        assert sorted(os.listdir(tmp_path / "outputs")) == ["live_a.mp3", "live_b.mp3"]
+        assert (result["tracked_files"], result["total_bytes"]) == (2, 200)
+        assert (result["files_removed_now"], result["bytes_freed_now"]) == (0, 0)  # Under quota: no eviction
@@ -0,0 +1,138 @@
+# tests/unit/test_concurrency_controller_tdd.py
+"""TDD tests for the adaptive (AIMD) TTS concurrency limiter."""
+
+import asyncio
+from unittest.mock import Mock
+
+from domain.audio.audio_engine import AudioEngine
+from domain.audio.concurrency_controller import AdaptiveConcurrencyLimiter
+from domain.errors import Result
+
+
+async def _finish(limiter: AdaptiveConcurrencyLimiter, calls: list[tuple[bool, float, float]]) -> None:
+    """Run calls of (success, latency, work) that all hold a slot at the same time."""
+    permits = [await limiter.acquire(work) for _, _, work in calls]
+    for permit, (success, latency, _) in zip(permits, calls):
+        permit.record(success, latency)
+        limiter.release(permit)
+
+
+class TestAdaptiveConcurrencyLimiterTDD:
+    """Tests for additive increase and multiplicative decrease."""
+
+    def test_limit_caps_calls_in_flight(self):
+        """No more calls run at once than the current limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        in_flight = []
+
+        async def call() -> None:
+            async with limiter.slot():
+                in_flight.append(limiter.metrics()["in_flight"])
+                await asyncio.sleep(0.001)
+
+        async def run() -> None:
+            await asyncio.gather(*(call() for _ in range(6)))
+
+        asyncio.run(run())
+
+        assert max(in_flight) == 2
+        assert limiter.metrics()["in_flight"] == 0
+
+    def test_fast_successful_calls_grow_the_limit_additively(self):
+        """Rounds of busy successful calls add slots one at a time, up to max_limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+        limits = []
+
+        for _ in range(6):
+            asyncio.run(_finish(limiter, [(True, 1.0, 100)] * limiter.limit))
+            limits.append(limiter.limit)
+
+        assert limits == sorted(limits)
+        assert all(b - a <= 1 for a, b in zip(limits, limits[1:]))
+        assert limiter.limit == 4
+        asyncio.run(_finish(limiter, [(True, 1.0, 100)] * 4))
+        assert limiter.limit == 4
+
+    def test_errors_halve_the_limit_once_per_round(self):
+        """Failures of calls that were already in flight together cut the limit only once."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8)
+
+        asyncio.run(_finish(limiter, [(False, 1.0, 100)] * 8))
+
+        assert limiter.limit == 4
+        assert limiter.metrics()["decreases"] == 1
+
+    def test_latency_is_judged_against_call_size(self):
+        """Bigger calls may take longer; a call far slower than expected for its size cuts the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=4)
+        for _ in range(10):
+            asyncio.run(_finish(limiter, [(True, 1.1, 100), (True, 2.0, 1000)]))
+
+        asyncio.run(_finish(limiter, [(True, 1.4, 400)]))
+        assert limiter.limit == 4
+
+        asyncio.run(_finish(limiter, [(True, 5.0, 400)]))
+        assert limiter.limit == 2
+
+    def test_cpu_load_gates_growth(self):
+        """Local engines back off when the CPUs are overloaded and grow while they have room."""
+        load = Mock(return_value=2.0)
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8, cpu_load_threshold=1.0, cpu_load=load)
+
+        asyncio.run(_finish(limiter, [(True, 1.0, 100)] * 4))
+        assert limiter.limit == 2
+
+        load.return_value = 0.5
+        for _ in range(3):
+            asyncio.run(_finish(limiter, [(True, 1.0, 100)] * limiter.limit))
+        assert limiter.limit == 3
+        assert limiter.metrics()["cpu_load"] == 0.5
+
+    def test_cancelled_call_frees_its_slot_without_counting_as_error(self):
+        """Cancelling a job must not shrink the limit for the jobs that follow."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+
+        async def run() -> None:
+            async def hold() -> None:
+                async with limiter.slot():
+                    await asyncio.sleep(10)
+
+            task = asyncio.create_task(hold())
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(limiter.acquire())
+            await asyncio.sleep(0)
+            task.cancel()
+            permit = await asyncio.wait_for(waiter, timeout=1)
+            limiter.release(permit)
+
+        asyncio.run(run())
+
+        assert limiter.metrics()["error_rate"] == 0.0
+        assert limiter.metrics()["in_flight"] == 0
+
+
+class TestAudioEngineConcurrencyTDD:
+    """AudioEngine dispatches TTS calls through its limiter."""
+
+    def test_async_chunks_respect_the_limit_and_report_it(self):
+        """Parallel synthesis never exceeds the limit, and the limit is exposed as a metric."""
+        active = []
+        peak = []
+
+        async def generate(text: str) -> Result[bytes]:
+            active.append(text)
+            peak.append(len(active))
+            await asyncio.sleep(0.001)
+            active.remove(text)
+            return Result.success(text.encode())
+
+        tts_engine = Mock()
+        tts_engine.generate_audio_data_async = generate
+        engine = AudioEngine(tts_engine=tts_engine, file_manager=Mock(), timing_engine=Mock(), max_concurrent=2)
+        engine.base_delay = 0
+
+        results = engine._generate_chunks_with_new_async_interface([f"Chunk number {i}." for i in range(6)])
+
+        assert [result.audio for result in results] == [f"Chunk number {i}.".encode() for i in range(6)]
+        assert max(peak) == 2
+        assert engine.concurrency_metrics()["limit"] == 2
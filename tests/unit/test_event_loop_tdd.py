@@ -0,0 +1,98 @@
+# tests/unit/test_event_loop_tdd.py
+"""TDD tests for the shared background event loop."""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from domain.audio.audio_engine import AudioEngine
+from domain.container.event_loop import BackgroundEventLoop
+from domain.errors import Result
+
+
+class TestBackgroundEventLoopTDD:
+    """Tests for running coroutines from sync code on one long-lived loop."""
+
+    def test_runs_every_coroutine_on_the_same_loop(self):
+        """Successive calls reuse one loop, running in its own thread."""
+        event_loop = BackgroundEventLoop()
+
+        async def current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        first = event_loop.run(current_loop())
+        second = event_loop.run(current_loop())
+
+        assert first is second is event_loop.loop
+        assert not first.is_closed()
+        event_loop.stop()
+
+    def test_timeout_cancels_the_coroutine(self):
+        """A caller that stops waiting does not leave the work running on the loop."""
+        event_loop = BackgroundEventLoop()
+        cancelled = threading.Event()
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            event_loop.run(slow(), timeout=0.05)
+
+        assert cancelled.wait(timeout=1)
+        event_loop.stop()
+
+    def test_run_from_the_loop_thread_is_refused(self):
+        """Blocking the loop on itself would deadlock, so it raises instead."""
+        event_loop = BackgroundEventLoop()
+
+        async def nested() -> None:
+            event_loop.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError):
+            event_loop.run(nested())
+        event_loop.stop()
+
+    def test_concurrent_jobs_share_one_concurrency_limit(self):
+        """Jobs submitted from several request threads are scheduled together under one limiter."""
+        active = []
+        peak = []
+
+        async def generate(text: str) -> Result[bytes]:
+            active.append(text)
+            peak.append(len(active))
+            await asyncio.sleep(0.005)
+            active.remove(text)
+            return Result.success(text.encode())
+
+        tts_engine = Mock()
+        tts_engine.generate_audio_data_async = generate
+        event_loop = BackgroundEventLoop()
+        engine = AudioEngine(
+            tts_engine=tts_engine,
+            file_manager=Mock(),
+            timing_engine=Mock(),
+            max_concurrent=2,
+            event_loop=event_loop,
+        )
+        engine.base_delay = 0
+        results = {}
+
+        def job(name: str) -> None:
+            results[name] = engine._generate_chunks_with_new_async_interface([f"{name} {i}." for i in range(5)])
+
+        threads = [threading.Thread(target=job, args=(f"Job {n}",)) for n in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert all(len([chunk for chunk in chunks if chunk.audio]) == 5 for chunks in results.values())
+        assert len(results) == 3
+        assert max(peak) == 2
+        event_loop.stop()
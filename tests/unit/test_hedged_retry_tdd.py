@@ -0,0 +1,120 @@
+# tests/unit/test_hedged_retry_tdd.py
+"""TDD tests for TTS chunk retries, deadlines and hedged requests."""
+
+import asyncio
+import random
+import time
+from unittest.mock import Mock
+
+from domain.audio.audio_engine import AudioEngine
+from domain.audio.hedged_retry import ChunkRetryPolicy, PeerLatencies
+from domain.errors import Result, audio_generation_error
+
+FAST_POLICY = ChunkRetryPolicy(backoff_seconds=0.001, deadline_seconds=5.0, min_hedge_peers=3)
+
+
+def _engine(generate, policy: ChunkRetryPolicy = FAST_POLICY, max_concurrent: int = 4) -> AudioEngine:
+    """AudioEngine over an async TTS function, without rate-limit delays."""
+    tts_engine = Mock()
+    tts_engine.generate_audio_data_async = generate
+    engine = AudioEngine(
+        tts_engine=tts_engine,
+        file_manager=Mock(),
+        timing_engine=Mock(),
+        max_concurrent=max_concurrent,
+        retry_policy=policy,
+    )
+    engine.base_delay = 0
+    return engine
+
+
+class TestChunkRetryPolicyTDD:
+    """Tests for backoff and straggler detection."""
+
+    def test_backoff_is_exponential_with_bounded_jitter(self):
+        """Each retry waits between half and all of base * 2^retry, capped at max_backoff_seconds."""
+        policy = ChunkRetryPolicy(backoff_seconds=1.0, max_backoff_seconds=5.0)
+        rng = random.Random(7)  # noqa: S311 - seeded jitter, not cryptography
+
+        for retry, ceiling in [(0, 1.0), (1, 2.0), (2, 4.0), (5, 5.0)]:
+            delays = [policy.backoff(retry, rng) for _ in range(50)]
+            assert all(ceiling / 2 <= delay <= ceiling for delay in delays)
+            assert len(set(delays)) > 1
+
+    def test_hedge_delay_scales_peer_percentile_by_chunk_size(self):
+        """Stragglers are judged per character, and only once enough peers have finished."""
+        peers = PeerLatencies(percentile=90, min_peers=3)
+        peers.record(1000, 1.0)
+        peers.record(1000, 2.0)
+        assert peers.hedge_delay(1000) is None
+
+        peers.record(1000, 3.0)
+        assert peers.hedge_delay(500) == 1.5
+
+
+class TestAudioEngineRetriesTDD:
+    """AudioEngine retries, hedges and never drops a chunk silently."""
+
+    def test_failed_chunk_is_retried(self):
+        """A transient failure is retried and the chunk keeps its place."""
+        calls = []
+
+        async def generate(text: str) -> Result[bytes]:
+            calls.append(text)
+            if calls.count(text) == 1 and text == "Chunk two.":
+                return Result.failure(audio_generation_error("rate limited"))
+            return Result.success(text.encode())
+
+        results = _engine(generate)._generate_chunks_with_new_async_interface(["Chunk one.", "Chunk two."])
+
+        assert [result.audio for result in results] == [b"Chunk one.", b"Chunk two."]
+        assert calls.count("Chunk two.") == 2
+
+    def test_straggler_is_hedged_and_first_result_wins(self):
+        """A chunk far slower than its peers gets a duplicate request instead of stalling the job."""
+        calls = []
+
+        async def generate(text: str) -> Result[bytes]:
+            calls.append(text)
+            if text == "Chunk 5 text." and calls.count(text) == 1:
+                await asyncio.sleep(10)
+            await asyncio.sleep(0.01)
+            return Result.success(text.encode())
+
+        engine = _engine(generate)
+        start = time.monotonic()
+        results = engine._generate_chunks_with_new_async_interface([f"Chunk {i} text." for i in range(8)])
+
+        assert time.monotonic() - start < 2
+        assert all(result.audio for result in results)
+        assert calls.count("Chunk 5 text.") == 2
+        assert engine.concurrency_metrics()["in_flight"] == 0
+
+    def test_deadline_cancels_hung_chunk(self):
+        """A chunk that never answers is given up on at its deadline rather than hanging the job."""
+
+        async def generate(text: str) -> Result[bytes]:
+            await asyncio.sleep(10)
+            return Result.success(b"late")
+
+        policy = ChunkRetryPolicy(backoff_seconds=0.001, deadline_seconds=0.05, hedge_percentile=0)
+        start = time.monotonic()
+        results = _engine(generate, policy)._generate_chunks_with_new_async_interface(["Never finishes."])
+
+        assert time.monotonic() - start < 2
+        assert results[0].audio is None
+
+    def test_permanent_failure_fails_the_job_instead_of_leaving_a_gap(self):
+        """Simple audio is not produced with a chunk missing; the missing chunks are reported."""
+
+        async def generate(text: str) -> Result[bytes]:
+            if "broken" in text:
+                return Result.failure(audio_generation_error("engine error"))
+            return Result.success(text.encode())
+
+        engine = _engine(generate)
+
+        result = engine.generate_simple_audio(["A fine first sentence.", "Then a broken one."], "out")
+
+        assert result.audio_files == []
+        assert result.debug_info == {"missing_chunks": [2]}
@@ -0,0 +1,104 @@
+# tests/unit/test_job_workspace_tdd.py
+"""TDD tests for job-scoped scratch workspaces."""
+
+import errno
+import os
+import subprocess
+from unittest.mock import Mock
+
+from domain.audio.audio_engine import AudioEngine
+from domain.errors import Result
+from domain.workspace import publish_file, scratch_path
+from infrastructure.file.file_manager import WORKSPACES_DIRNAME, FileManager
+
+
+def _file_manager(tmp_path) -> FileManager:
+    return FileManager(str(tmp_path / "uploads"), str(tmp_path / "outputs"), scratch_dir=str(tmp_path / "scratch"))
+
+
+class TestJobWorkspaceTDD:
+    """Tests for where a job's intermediates are written and when they are removed."""
+
+    def test_temp_files_go_to_the_workspace_and_are_removed_with_it(self, tmp_path):
+        """Inside a job temp files never touch the output folder; the workspace is removed in one go."""
+        file_manager = _file_manager(tmp_path)
+
+        with file_manager.job_workspace("my book.pdf") as workspace:
+            page_image = file_manager.save_temp_file(b"png", suffix=".png")
+            list_file = scratch_path("book.mp3.list", file_manager.get_output_dir())
+            assert os.path.dirname(page_image) == workspace.directory == os.path.dirname(list_file)
+            file_manager.delete_file(page_image)
+
+        assert not os.path.exists(workspace.directory)
+        assert os.listdir(tmp_path / "outputs") == []
+        assert os.path.dirname(file_manager.save_temp_file(b"wav")) == file_manager.get_output_dir()
+
+    def test_orphaned_workspaces_of_dead_processes_are_pruned(self, tmp_path):
+        """A workspace left by a crashed process is removed at startup; a live process's workspace is kept."""
+        exited = subprocess.Popen(["true"])
+        exited.wait()
+        root = tmp_path / "scratch" / WORKSPACES_DIRNAME
+        (root / f"{exited.pid}_crashed_abc").mkdir(parents=True)
+        (root / f"{os.getpid()}_running_def").mkdir()
+
+        _file_manager(tmp_path)
+
+        assert os.listdir(root) == [f"{os.getpid()}_running_def"]
+
+    def test_publish_across_filesystems_never_exposes_a_partial_file(self, tmp_path, monkeypatch):
+        """When a rename cannot cross filesystems the file is copied beside its destination, then renamed."""
+        real_replace = os.replace
+        scratch = tmp_path / "scratch"
+        scratch.mkdir()
+        (tmp_path / "outputs").mkdir()
+        source = scratch / "book_simple.mp3"
+        source.write_bytes(b"mp3 audio")
+
+        def replace(src: str, dst: str) -> None:
+            if str(src).startswith(str(scratch)):
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            assert os.path.basename(src).startswith(".book_simple.mp3.")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", replace)
+        destination = publish_file(str(source), str(tmp_path / "outputs" / "book_simple.mp3"))
+
+        assert os.listdir(tmp_path / "outputs") == ["book_simple.mp3"]
+        with open(destination, "rb") as f:
+            assert f.read() == b"mp3 audio"
+        assert not source.exists()
+
+
+class TestAudioEngineWorkspaceTDD:
+    """AudioEngine keeps the combined WAV and the MP3 being encoded out of the output folder."""
+
+    def test_only_the_finished_mp3_is_published(self, tmp_path):
+        """The ffmpeg steps read and write in the workspace; the output folder only ever sees the finished MP3."""
+        tts_engine = Mock()
+        tts_engine.generate_audio_data.return_value = Result.success(b"RIFF audio")
+        file_manager = _file_manager(tmp_path)
+        engine = AudioEngine(
+            tts_engine=tts_engine,
+            file_manager=file_manager,
+            timing_engine=Mock(),
+            enable_async=False,
+            enable_sentence_dedup=False,
+        )
+        encoded = []
+
+        def convert(wav_path: str, mp3_path: str) -> Result[str]:
+            encoded.append((wav_path, mp3_path, os.listdir(tmp_path / "outputs")))
+            with open(mp3_path, "wb") as f:
+                f.write(b"mp3 audio")
+            return Result.success(mp3_path)
+
+        engine._convert_wav_to_mp3 = convert
+        with file_manager.job_workspace("book") as workspace:
+            result = engine.generate_simple_audio(["Some text to read."], "book")
+
+        wav_path, mp3_path, outputs_while_encoding = encoded[0]
+        assert os.path.dirname(wav_path) == os.path.dirname(mp3_path) == workspace.directory
+        assert outputs_while_encoding == []
+        assert result.combined_mp3 == "book_simple.mp3"
+        assert os.listdir(tmp_path / "outputs") == ["book_simple.mp3"]
+        assert not os.path.exists(workspace.directory)
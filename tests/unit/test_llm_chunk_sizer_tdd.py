@@ -0,0 +1,131 @@
+# tests/unit/test_llm_chunk_sizer_tdd.py
+"""TDD tests for AdaptiveChunkSizer - learned LLM chunk sizing with persistence."""
+
+from unittest.mock import Mock
+
+from domain.errors import Result, llm_provider_error, llm_unavailable_error
+from domain.text import llm_chunk_sizer
+from domain.text.llm_chunk_sizer import DEFAULT_RETRY_CHUNK_CHARS, AdaptiveChunkSizer, estimate_tokens
+from domain.text.text_pipeline import TextPipeline
+
+
+class TestAdaptiveChunkSizerTDD:
+    """Tests for learning, size selection and persistence."""
+
+    def test_uses_default_until_something_is_learned(self):
+        """Should keep the configured chunk size for a fresh model."""
+        sizer = AdaptiveChunkSizer("test-model", default_chunk_chars=50000)
+
+        assert sizer.recommend_chunk_size(200000, concurrency=3) == 50000
+        assert sizer.retry_chunk_size(50000) == DEFAULT_RETRY_CHUNK_CHARS
+
+    def test_estimates_tokens_locally(self):
+        """Should estimate roughly four characters per token."""
+        assert estimate_tokens(4000) == 1000
+        assert estimate_tokens(0) == 1
+
+    def test_avoids_sizes_that_keep_failing(self):
+        """Should move to a smaller chunk size once large calls fail."""
+        sizer = AdaptiveChunkSizer(
+            "test-model", default_chunk_chars=64000, min_chunk_chars=4000, max_chunk_chars=128000
+        )
+        for _ in range(3):
+            sizer.record(60000, latency_seconds=90.0, success=False)
+            sizer.record(16000, latency_seconds=10.0, success=True)
+
+        assert sizer.is_reliable_size(60000) is False
+        assert sizer.recommend_chunk_size(120000, concurrency=1) <= 32000
+
+    def test_more_concurrency_favours_smaller_chunks(self):
+        """With parallel calls available, splitting finer should cut wall time."""
+        sizer = AdaptiveChunkSizer(
+            "test-model", default_chunk_chars=64000, min_chunk_chars=4000, max_chunk_chars=128000
+        )
+        # Latency grows with size, plus a fixed per-call overhead
+        for chars in (8000, 16000, 32000, 64000):
+            sizer.record(chars, latency_seconds=2.0 + chars / 2000, success=True)
+
+        sequential = sizer.recommend_chunk_size(128000, concurrency=1)
+        parallel = sizer.recommend_chunk_size(128000, concurrency=8)
+
+        assert parallel < sequential
+
+    def test_persists_learned_model_across_restarts(self, tmp_path):
+        """Should reload observations and choices from the state file."""
+        state_file = tmp_path / "sizing.json"
+        sizer = AdaptiveChunkSizer("test-model", state_file=str(state_file))
+        sizer.record(16000, latency_seconds=8.0, success=True)
+        sizer.record(60000, latency_seconds=90.0, success=False)
+        sizer.record(60000, latency_seconds=90.0, success=False)
+        first_choice = sizer.recommend_chunk_size(100000)
+
+        reloaded = AdaptiveChunkSizer("test-model", state_file=str(state_file))
+        other_model = AdaptiveChunkSizer("other-model", state_file=str(state_file))
+
+        assert reloaded.has_observations is True
+        assert reloaded.is_reliable_size(60000) is False
+        assert reloaded.recommend_chunk_size(100000) == first_choice
+        assert other_model.has_observations is False
+
+    def test_pipeline_splits_known_unreliable_sizes_up_front(self):
+        """TextPipeline should skip the doomed whole-text call and clean in learned sub-chunks."""
+        sizer = AdaptiveChunkSizer("test-model", default_chunk_chars=50000, min_chunk_chars=4000, max_chunk_chars=64000)
+        for _ in range(3):
+            sizer.record(40000, latency_seconds=60.0, success=False)
+            sizer.record(8000, latency_seconds=4.0, success=True)
+
+        mock_llm = Mock()
+        mock_llm.is_available.return_value = True
+        mock_llm.generate_content.side_effect = lambda prompt: Result.success("cleaned part")
+        pipeline = TextPipeline(llm_provider=mock_llm, enable_cleaning=True, chunk_sizer=sizer)
+
+        result = pipeline.clean_text("word " * 8000)  # 40,000 chars
+
+        prompts = [call.args[0] for call in mock_llm.generate_content.call_args_list]
+        assert all(len(prompt) < 20000 for prompt in prompts)
+        assert "cleaned part" in result
+
+    def test_pipeline_records_outcomes(self):
+        """Each LLM call the model ran (here, one that timed out) should feed the sizer."""
+        sizer = AdaptiveChunkSizer("test-model")
+        mock_llm = Mock()
+        mock_llm.is_available.return_value = True
+        mock_llm.generate_content.return_value = Result.failure(llm_provider_error("Deadline exceeded: timeout"))
+        pipeline = TextPipeline(llm_provider=mock_llm, enable_cleaning=True, chunk_sizer=sizer)
+
+        pipeline.clean_text("Short text that fails to clean.")
+
+        assert sizer.has_observations is True
+
+    def test_pipeline_ignores_calls_that_never_reached_the_model(self):
+        """Breaker rejections, a missing client and quick transport errors say nothing about the input size."""
+        sizer = AdaptiveChunkSizer("test-model")
+        mock_llm = Mock()
+        mock_llm.is_available.return_value = True
+        mock_llm.generate_content.side_effect = [
+            Result.failure(llm_unavailable_error("Circuit breaker open - LLM calls suspended")),
+            Result.failure(llm_unavailable_error("Client not available")),
+            Result.failure(llm_provider_error("Content generation failed: connection refused")),
+        ]
+        pipeline = TextPipeline(llm_provider=mock_llm, enable_cleaning=True, chunk_sizer=sizer)
+
+        for i in range(3):
+            pipeline.clean_text(f"Text {i} that could not be sent to the model.")
+
+        assert mock_llm.generate_content.call_count == 3
+        assert sizer.has_observations is False
+
+    def test_failure_memory_is_measured_from_the_last_failure(self, monkeypatch):
+        """Successes after the failures do not keep a failing size marked unreliable past a day."""
+        now = [1_000_000.0]
+        monkeypatch.setattr(llm_chunk_sizer.time, "time", lambda: now[0])
+        sizer = AdaptiveChunkSizer("test-model", default_chunk_chars=64000, min_chunk_chars=4000, max_chunk_chars=64000)
+        for _ in range(3):
+            sizer.record(60000, latency_seconds=90.0, success=False)
+        assert sizer.is_reliable_size(60000) is False
+
+        now[0] += 86400 - 60
+        sizer.record(60000, latency_seconds=30.0, success=True)
+        now[0] += 120
+
+        assert sizer.is_reliable_size(60000) is True
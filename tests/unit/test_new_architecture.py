@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 from application.config.system_config import SystemConfig, TTSEngine
 from domain.audio.audio_engine import AudioEngine, IAudioEngine
 from domain.audio.timing_engine import ITimingEngine, TimingEngine, TimingMode
+from domain.container.event_loop import BackgroundEventLoop
 from domain.container.service_container import ServiceContainer, create_service_container_builder
 from domain.errors import Result
 from domain.models import TextSegment, TimedAudioResult
@@ -255,6 +256,13 @@ class TestServiceContainer:
         assert isinstance(text_pipeline, TextPipeline)
         assert isinstance(text_pipeline, ITextPipeline)
 
+    def test_service_container_owns_one_event_loop(self):
+        """ServiceContainer should hand every service the same long-lived event loop."""
+        config = create_test_config("piper")
+        container = ServiceContainer(config)
+
+        assert container.get(BackgroundEventLoop) is container.get(BackgroundEventLoop)
+
 
 class TestArchitectureIntegration:
     """Test integration between the new architectural components."""
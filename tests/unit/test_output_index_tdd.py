@@ -0,0 +1,85 @@
+# tests/unit/test_output_index_tdd.py
+"""TDD tests for the in-memory index of the output folder."""
+
+import os
+
+from infrastructure.file.file_manager import FileManager
+from infrastructure.file.output_index import OutputIndex
+
+
+class _Clock:
+    """Settable wall clock."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestOutputIndexTDD:
+    """Tests for keeping output folder stats without rescanning it."""
+
+    def test_file_manager_writes_and_deletes_keep_the_index_current(self, tmp_path, monkeypatch):
+        """Stats reflect every write and delete, with the owning job, from a single scan."""
+        file_manager = FileManager(str(tmp_path / "uploads"), str(tmp_path / "outputs"))
+        scans = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+
+        with file_manager.job_workspace("book"):
+            chunk = file_manager.save_output_file(b"x" * 100, "book_chunk_0.mp3")
+            file_manager.save_output_file(b"x" * 50, "book_chunk_1.mp3")
+        file_manager.save_output_file(b"x" * 25, "paper.mp3")
+        file_manager.delete_file(chunk)
+
+        stats = file_manager.get_stats()
+        assert (stats["total_files"], stats["total_bytes"], stats["jobs"]) == (2, 75, 1)
+        assert file_manager.output_index.get("book_chunk_1.mp3").job == "book"
+        assert file_manager.get_stats()["total_files"] == 2
+        assert scans.count(file_manager.get_output_dir()) == 1
+
+    def test_reconcile_picks_up_changes_made_behind_the_index(self, tmp_path):
+        """Once the index is stale, a scan adds files written directly and drops files removed directly."""
+        clock = _Clock()
+        outputs = tmp_path / "outputs"
+        outputs.mkdir()
+        (outputs / "old.mp3").write_bytes(b"x" * 10)
+        index = OutputIndex(str(outputs), reconcile_interval_seconds=60, clock=clock)
+        assert index.stats()["total_files"] == 1
+
+        (outputs / "old.mp3").unlink()
+        (outputs / "book_timing.json").write_bytes(b"x" * 30)
+        assert index.stats()["total_files"] == 1  # Not stale yet
+        clock.now += 60
+
+        stats = index.stats()
+        assert (stats["total_files"], stats["total_bytes"]) == (1, 30)
+
+    def test_cleanup_takes_only_expired_files_oldest_first(self, tmp_path):
+        """Age-based cleanup pops expired files off the creation-time heap; newer files stay indexed."""
+        clock = _Clock()
+        outputs = tmp_path / "outputs"
+        outputs.mkdir()
+        index = OutputIndex(str(outputs), clock=clock)
+        index.reconcile()
+        for name in ["first.mp3", "second.mp3", "third.mp3"]:
+            (outputs / name).write_bytes(b"audio")
+            index.record(str(outputs / name), job="book")
+            clock.now += 100
+
+        expired = index.take_older_than(clock.now - 150)
+
+        assert [os.path.basename(path) for path, _ in expired] == ["first.mp3", "second.mp3"]
+        assert index.stats()["total_files"] == 1
+
+    def test_file_manager_cleanup_deletes_old_outputs(self, tmp_path):
+        """cleanup_old_files removes what the index reports as expired and frees its bytes."""
+        file_manager = FileManager(str(tmp_path / "uploads"), str(tmp_path / "outputs"))
+        file_manager.save_output_file(b"x" * 40, "book_simple.mp3")
+
+        result = file_manager.cleanup_old_files(max_age_hours=-1)
+
+        assert (result["files_removed"], result["bytes_freed"], result["errors"]) == (1, 40, [])
+        assert os.listdir(tmp_path / "outputs") == []
+        assert file_manager.get_stats()["total_files"] == 0
@@ -0,0 +1,82 @@
+# tests/unit/test_page_artifact_stripper_tdd.py
+"""TDD tests for PageArtifactStripper - local removal of cross-page PDF artifacts."""
+
+from domain.text.page_artifact_stripper import PageArtifactStripper
+
+
+def _page(number: int, body: str) -> str:
+    return f"Journal of Audio Studies, Vol. 7\nChapter {number % 2 + 1}: Methods\n{body}\n{number}"
+
+
+class TestPageArtifactStripperTDD:
+    """Tests for header/footer, page number, reference marker and hyphenation removal."""
+
+    def test_removes_repeating_header_with_changing_digits(self):
+        """Should treat running headers that only differ by numbers as the same line."""
+        pages = [
+            f"Proceedings 2024 - Page {n}\nBody text number {n} talks about something different."
+            for n in range(1, 6)
+        ]
+
+        result = PageArtifactStripper().strip(pages)
+
+        assert all("Proceedings" not in page for page in result.pages)
+        assert result.pages[2] == "Body text number 3 talks about something different."
+        assert result.headers_removed == 5
+
+    def test_removes_standalone_page_numbers_at_page_edges(self):
+        """Should drop bare page numbers and 'Page N of M' footers."""
+        pages = ["First page body.\n1", "Second page body.\nPage 2 of 3", "- 3 -\nThird page body."]
+
+        result = PageArtifactStripper().strip(pages)
+
+        assert result.pages == ["First page body.", "Second page body.", "Third page body."]
+        assert result.page_numbers_removed == 3
+
+    def test_keeps_numbers_inside_body_text(self):
+        """Should only strip page numbers at the top or bottom of a page."""
+        pages = ["Intro line here.\n42\nThe answer was given above.\nEnd of page."]
+
+        result = PageArtifactStripper().strip(pages)
+
+        assert "42" in result.pages[0]
+
+    def test_does_not_strip_lines_that_repeat_on_few_pages(self):
+        """Should require a line to recur on a large share of pages."""
+        pages = ["Summary\nAlpha body."] + [f"Unique heading {chr(65 + i)}\nBody {chr(65 + i)}." for i in range(5)]
+        pages.append("Summary\nOmega body.")
+
+        result = PageArtifactStripper().strip(pages)
+
+        assert result.pages[0].startswith("Summary")
+        assert result.headers_removed == 0
+
+    def test_removes_reference_markers_and_joins_hyphenation(self):
+        """Should remove [12]-style citations and rejoin words split across lines."""
+        pages = ["Prior work [12] showed compu-\ntation is costly [3, 7] and fast [4-6]."]
+
+        result = PageArtifactStripper().strip(pages)
+
+        assert result.pages == ["Prior work showed computation is costly and fast."]
+        assert result.reference_markers_removed == 3
+        assert result.hyphenations_joined == 1
+
+    def test_full_document_shrinks_and_reports_debug_info(self):
+        """Should drop header, chapter line and footer numbers across a realistic document."""
+        pages = [_page(n, f"Paragraph {n} of real content that should survive.") for n in range(1, 9)]
+
+        result = PageArtifactStripper().strip(pages)
+
+        assert result.pages == [f"Paragraph {n} of real content that should survive." for n in range(1, 9)]
+        info = result.to_debug_info()
+        assert info["headers_removed"] == 16
+        assert info["page_numbers_removed"] == 8
+        assert info["chars_removed"] > 0
+
+    def test_drops_pages_left_empty(self):
+        """Should not emit empty pages once furniture is removed."""
+        pages = ["Running Header\nBody one.", "Running Header\n2", "Running Header\nBody three."]
+
+        result = PageArtifactStripper().strip(pages)
+
+        assert result.pages == ["Body one.", "Body three."]
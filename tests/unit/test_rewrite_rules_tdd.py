@@ -0,0 +1,76 @@
+# tests/unit/test_rewrite_rules_tdd.py
+"""TDD tests for the precompiled rewrite rule engine and the rule sets built on it."""
+
+import re
+
+import pytest
+
+from domain.audio.timing_engine import SSML_STRIP_RULES
+from domain.text.rewrite_rules import RewriteRule, RuleSet
+from domain.text.text_pipeline import NATURAL_FORMATTING_RULES, TextPipeline
+
+
+class TestRewriteRulesTDD:
+    """Tests for ordering, guards and streaming."""
+
+    def test_matches_sequential_re_sub(self):
+        """A rule set gives the same result as the equivalent chain of re.sub calls."""
+        text = "Wait.... -- what?  café --- ok....."
+        rules = RuleSet(
+            RewriteRule(r"[^\x00-\x7F]+", " "),
+            RewriteRule(r"\.{3,}", "...", requires="..."),
+            RewriteRule(r"-{2,}", "--", requires="--"),
+        )
+
+        expected = re.sub(r"-{2,}", "--", re.sub(r"\.{3,}", "...", re.sub(r"[^\x00-\x7F]+", " ", text)))
+
+        assert rules.apply(text) == expected
+
+    def test_templates_callables_and_flags(self):
+        """Replacements can use backreferences or callables; flags apply per rule."""
+        rules = RuleSet(
+            RewriteRule(r"(however),", r"\n\1,", re.IGNORECASE),
+            RewriteRule(r"<(\w+)>", lambda match: match.group(1).upper()),
+        )
+
+        assert rules.apply("HOWEVER, <b> text") == "\nHOWEVER, B text"
+
+    def test_rules_run_in_order(self):
+        """Later rules see the output of earlier ones."""
+        rules = RuleSet(RewriteRule(r"<[^>]+>", ""), RewriteRule(r"\(\s*\)", ""))
+
+        assert rules.apply("(<break/>) done") == " done"
+
+    def test_missing_required_literal_skips_the_scan(self):
+        """A rule whose trigger literal is absent returns the very same string."""
+        text = "No tags in here at all."
+
+        assert RuleSet(RewriteRule(r"<[^>]+>", "", requires="<")).apply(text) is text
+
+    @pytest.mark.parametrize("slice_size", [1, 7, 100, 5000])
+    def test_streaming_slices_match_whole_text(self, slice_size):
+        """Streaming output joined together equals applying the rules to the whole text."""
+        text = "1. Introduction to the topic. However, we present results.... First we look. " * 200
+        slices = (text[i : i + slice_size] for i in range(0, len(text), slice_size))
+
+        assert "".join(NATURAL_FORMATTING_RULES.stream(slices)) == NATURAL_FORMATTING_RULES.apply(text)
+
+
+class TestRuleSetCallSitesTDD:
+    """The rule sets reproduce the previous regex chains."""
+
+    def test_basic_cleanup(self):
+        """Whitespace, non-ASCII, dot and dash runs are normalised."""
+        assert TextPipeline()._basic_text_cleanup("  Café\f text.....  and ---- more ") == "Caf  text... and -- more"
+
+    def test_natural_formatting(self):
+        """Headers, transitions, sentence gaps and ordinals get pause punctuation."""
+        pipeline = TextPipeline(enable_natural_formatting=True)
+
+        assert pipeline.enhance_with_natural_formatting("Results are in, however, we wait. First we start.") == (
+            "Results are in, \nhowever, we wait.. First, we start."
+        )
+
+    def test_strip_ssml(self):
+        """SSML tags are removed and whitespace collapsed."""
+        assert SSML_STRIP_RULES.apply('<speak>Hello <break time="1s"/>  world</speak>').strip() == "Hello world"
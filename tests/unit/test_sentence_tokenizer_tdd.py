@@ -0,0 +1,70 @@
+# tests/unit/test_sentence_tokenizer_tdd.py
+"""TDD tests for the unified sentence tokenizer and its call sites."""
+
+from domain.text.chunking_strategy import SentenceBasedChunking
+from domain.text.sentence_tokenizer import iter_sentence_spans, split_sentences
+from infrastructure.tts.text_segmenter import TextSegmenter
+
+
+class TestSentenceTokenizerTDD:
+    """Tests for boundary detection and offsets."""
+
+    def test_spans_index_into_original_string(self):
+        """Offsets should slice stripped sentences straight out of the input."""
+        text = "  First sentence.   Second one!  "
+
+        spans = list(iter_sentence_spans(text))
+
+        assert [text[s:e] for s, e in spans] == ["First sentence.", "Second one!"]
+
+    def test_does_not_split_abbreviations_initials_or_decimals(self):
+        """Abbreviations, initials and decimal numbers are not sentence ends."""
+        text = "Dr. Smith met J. R. Tolkien. The value was 3.14 e.g. Fig. 2 shows it. Done."
+
+        assert split_sentences(text) == [
+            "Dr. Smith met J. R. Tolkien.",
+            "The value was 3.14 e.g. Fig. 2 shows it.",
+            "Done.",
+        ]
+
+    def test_lowercase_word_before_period_still_ends_sentence(self):
+        """Only case-sensitive abbreviations suppress a split ('said no.' vs 'No. 5')."""
+        assert split_sentences("He said no. Then No. 5 arrived.") == ["He said no.", "Then No. 5 arrived."]
+
+    def test_handles_quotes_ellipses_and_trailing_text(self):
+        """Closing quotes stay with their sentence and text after the last period is kept."""
+        text = 'She said "Stop." Then silence... Nothing followed and no period'
+
+        assert split_sentences(text) == ['She said "Stop."', "Then silence...", "Nothing followed and no period"]
+
+    def test_respects_start_and_end_bounds(self):
+        """Tokenizing a slice should yield offsets in the full string's coordinates."""
+        text = "Skip this. Take this one. And this. Not this."
+        start = text.index("Take")
+        end = text.index("Not")
+
+        assert [text[s:e] for s, e in iter_sentence_spans(text, start, end)] == ["Take this one.", "And this."]
+
+    def test_min_length_filters_fragments(self):
+        """Fragments shorter than min_length should be dropped."""
+        assert split_sentences("Normal sentence here. Yes. Another normal sentence.", min_length=11) == [
+            "Normal sentence here.",
+            "Another normal sentence.",
+        ]
+
+    def test_is_lazy(self):
+        """Spans should be produced incrementally."""
+        spans = iter_sentence_spans("One sentence. " * 1000)
+
+        assert next(spans) == (0, 13)
+
+
+class TestSentenceTokenizerCallSitesTDD:
+    """The former ad-hoc splitters now agree on boundaries."""
+
+    def test_segmenter_and_chunker_agree(self):
+        """TextSegmenter and SentenceBasedChunking should see the same sentences."""
+        text = "Dr. Jones arrived. Prof. Lee left at 4.30 today! Why? Nobody knows."
+
+        assert TextSegmenter().split_into_sentences(text) == SentenceBasedChunking()._split_sentences(text)
+        assert TextSegmenter().split_into_sentences(text)[0] == "Dr. Jones arrived."
@@ -0,0 +1,76 @@
+# tests/unit/test_sharded_text_tdd.py
+"""TDD tests for sharded parallel formatting and sentence splitting of very large texts."""
+
+from unittest.mock import patch
+
+from domain.text.sentence_tokenizer import split_sentences
+from domain.text.sharded_text import ShardedTextProcessor, sentence_seams, word_gap_seams
+from domain.text.text_pipeline import TextPipeline, apply_natural_formatting
+
+PARAGRAPH = (
+    "Abstract: In this study, we measure the results of many runs. 2. Methods are described here in detail. "
+    "However, the results vary across runs... First we look at the data, then Dr. Smith checks e.g. the "
+    "figures. Finally the end is near. Why? Nobody knows! In this paper, we propose a method. "
+)
+LARGE_TEXT = PARAGRAPH * 600  # ~170,000 chars
+
+
+def _processor() -> ShardedTextProcessor:
+    return ShardedTextProcessor(threshold_chars=100_000, workers=2, min_shard_chars=20_000)
+
+
+class TestShardedTextProcessorTDD:
+    """Tests for seam planning and stitching."""
+
+    def test_formatting_shards_stitch_to_sequential_result(self):
+        """Joined shard outputs must equal formatting the whole text in one process."""
+        shards = _processor().map_shards(LARGE_TEXT, apply_natural_formatting, word_gap_seams)
+
+        assert len(shards) > 1
+        assert "".join(shards) == apply_natural_formatting(LARGE_TEXT)
+
+    def test_sentence_shards_keep_boundary_sentences_whole(self):
+        """No sentence is cut in two at a shard seam."""
+        formatted = apply_natural_formatting(LARGE_TEXT)
+
+        shards = _processor().map_shards(formatted, split_sentences, sentence_seams)
+
+        assert [sentence for shard in shards for sentence in shard] == split_sentences(formatted)
+
+    def test_seams_are_rejected_when_the_stage_looks_across_them(self):
+        """A stage whose output depends on text across every seam is never sharded."""
+
+        def reverse(text: str) -> str:
+            return text[::-1]
+
+        assert _processor().plan_shards(LARGE_TEXT, reverse, word_gap_seams) == [(0, len(LARGE_TEXT))]
+
+    def test_small_text_is_not_sharded(self):
+        """Below the threshold, or with a single worker, the text stays in one piece."""
+        assert not _processor().should_shard(PARAGRAPH)
+        assert not ShardedTextProcessor(threshold_chars=1, workers=1).should_shard(LARGE_TEXT)
+        assert not ShardedTextProcessor(threshold_chars=0, workers=4).should_shard(LARGE_TEXT)
+
+    def test_falls_back_to_in_process_when_pool_fails(self):
+        """A broken process pool degrades to sequential processing with the same result."""
+        with patch("domain.text.sharded_text.ProcessPoolExecutor", side_effect=OSError("no processes")):
+            shards = _processor().map_shards(LARGE_TEXT, apply_natural_formatting, word_gap_seams)
+
+        assert "".join(shards) == apply_natural_formatting(LARGE_TEXT)
+
+
+class TestShardedTextPipelineTDD:
+    """TextPipeline switches to the sharded mode above the threshold."""
+
+    def test_pipeline_formats_and_splits_large_text_in_shards(self):
+        """Results match the single-process pipeline exactly."""
+        sharded = TextPipeline(enable_cleaning=False, sharded_processor=_processor())
+        sequential = TextPipeline(enable_cleaning=False)
+
+        with patch.object(ShardedTextProcessor, "map_shards", wraps=sharded.sharded_processor.map_shards) as spy:
+            formatted = sharded.enhance_with_natural_formatting(LARGE_TEXT)
+            sentences = sharded.split_into_tts_sentences(formatted)
+
+        assert spy.call_count == 2
+        assert formatted == sequential.enhance_with_natural_formatting(LARGE_TEXT)
+        assert sentences == split_sentences(formatted)
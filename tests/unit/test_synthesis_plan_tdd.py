@@ -0,0 +1,118 @@
+# tests/unit/test_synthesis_plan_tdd.py
+"""TDD tests for sentence-level synthesis deduplication."""
+
+from unittest.mock import Mock, patch
+
+from domain.audio.audio_engine import AudioEngine
+from domain.audio.synthesis_plan import SynthesisPlan, normalize_sentence, plan_synthesis
+from domain.audio.timing_engine import TimingEngine, TimingMode
+from domain.errors import Result
+from domain.models import TextSegment
+from domain.text.text_artifact import TextArtifact, TextStage, text_stages
+from domain.text.text_pipeline import TextPipeline
+
+HEADER = "Chapter One: The Beginning of Everything."
+CHUNKS = [f"{HEADER} First body sentence here.", f"{HEADER} Second body text follows."]
+
+
+class TestSynthesisPlanTDD:
+    """Tests for planning which texts to synthesize."""
+
+    def test_repeated_sentence_is_synthesized_once(self):
+        """The header becomes one unit, played before each body sentence."""
+        plan = plan_synthesis(CHUNKS)
+
+        assert plan.units == [HEADER, "First body sentence here.", "Second body text follows."]
+        assert plan.order == [0, 1, 0, 2]
+        assert plan.reused_count == 1
+        assert plan.chars_saved == len(HEADER)
+
+    def test_chunks_without_repeats_are_unchanged(self):
+        """Without repeated sentences the plan is the identity, so requests are not split up."""
+        chunks = ["One sentence is here. Another follows it.", "A different chunk entirely."]
+
+        assert plan_synthesis(chunks) == SynthesisPlan.identity(chunks)
+
+    def test_short_and_near_duplicate_sentences(self):
+        """Short repeats stay inline; typography, pause dots and case do not hide a repeat."""
+        assert plan_synthesis(["Yes. It works.", "Yes. It fails."]).reused_count == 0
+        assert normalize_sentence("It\u2019s the END.. ") == normalize_sentence("it's the end.")
+
+    def test_units_keep_the_stage_record(self):
+        """Units cut from a formatted chunk are not formatted again downstream."""
+        chunks = [TextArtifact(chunk, [TextStage.NATURAL_FORMATTING]) for chunk in CHUNKS]
+
+        plan = plan_synthesis(chunks)
+
+        assert all(text_stages(unit) == {TextStage.NATURAL_FORMATTING} for unit in plan.units)
+
+    def test_debug_info_reports_time_saved(self):
+        """Each replay saves the synthesis time of its unit."""
+        info = plan_synthesis(CHUNKS).to_debug_info([1.5, 1.0, 1.0])
+
+        assert info["synthesis_units"] == 3
+        assert info["playback_segments"] == 4
+        assert info["synthesis_seconds_saved"] == 1.5
+
+
+class TestSentenceDedupEnginesTDD:
+    """Engines synthesize each unit once and splice the audio in playback order."""
+
+    def test_audio_engine_splices_reused_audio(self):
+        """The header audio is requested once but appears twice in the output."""
+        tts_engine = Mock()
+        tts_engine.generate_audio_data.side_effect = lambda text: Result.success(text.encode())
+        engine = AudioEngine(tts_engine=tts_engine, file_manager=Mock(), timing_engine=Mock(), enable_async=False)
+        plan = engine._plan_synthesis(CHUNKS)
+
+        audio = [chunk.audio for chunk in plan.splice(engine._generate_chunks_sync(plan.units))]
+
+        assert tts_engine.generate_audio_data.call_count == 3
+        assert audio == [HEADER.encode(), b"First body sentence here.", HEADER.encode(), b"Second body text follows."]
+
+    def test_estimation_timestamps_follow_playback_order(self):
+        """A replayed unit reuses its audio file and its segments move to where it is played."""
+        tts_engine = Mock(spec=["generate_audio_data", "get_output_format", "generate_audio_with_timestamps"])
+        tts_engine.generate_audio_with_timestamps.side_effect = lambda text: Result.success(
+            (b"audio", [TextSegment(text, 0.0, 2.0, "sentence", 0, 0)])
+        )
+        engine = TimingEngine(tts_engine, Mock(), text_pipeline=TextPipeline(), mode=TimingMode.ESTIMATION)
+
+        result = engine.generate_with_timing(CHUNKS, "out")
+
+        segments = result.timing_data.text_segments
+        assert tts_engine.generate_audio_with_timestamps.call_count == 3
+        assert result.audio_files == ["out_chunk_0.mp3", "out_chunk_1.mp3", "out_chunk_0.mp3", "out_chunk_2.mp3"]
+        assert [segment.start_time for segment in segments] == [0.0, 2.0, 4.0, 6.0]
+        assert segments[2].text == HEADER
+        assert result.debug_info["sentence_dedup"]["reused_segments"] == 1
+
+    def test_measurement_timestamps_follow_playback_order(self, tmp_path):
+        """Measured segments of a replay are shifted in time and assigned to its playback position."""
+        tts_engine = Mock(spec=["generate_audio_data", "get_output_format"])
+        tts_engine.generate_audio_data.return_value = Result.success(b"audio")
+        file_manager = Mock()
+        file_manager.get_output_dir.return_value = str(tmp_path)
+        file_manager.save_temp_file.side_effect = lambda data, suffix: f"unit_{file_manager.save_temp_file.call_count}"
+        engine = TimingEngine(
+            tts_engine,
+            file_manager,
+            text_pipeline=TextPipeline(enable_natural_formatting=False),
+            mode=TimingMode.MEASUREMENT,
+            measurement_interval=0,
+        )
+
+        with patch.object(TimingEngine, "_combine_audio_files", return_value=True) as combine:
+            result = engine.generate_with_timing(CHUNKS, "out")
+
+        segments = result.timing_data.text_segments
+        assert tts_engine.generate_audio_data.call_count == 3
+        assert combine.call_args.args[0] == ["unit_1", "unit_2", "unit_1", "unit_3"]
+        assert [segment.text for segment in segments] == [
+            HEADER,
+            CHUNKS[0][len(HEADER) + 1 :],
+            HEADER,
+            CHUNKS[1][len(HEADER) + 1 :],
+        ]
+        assert [segment.chunk_index for segment in segments] == [0, 1, 2, 3]
+        assert all(a.start_time + a.duration == b.start_time for a, b in zip(segments, segments[1:]))
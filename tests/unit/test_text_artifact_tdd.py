@@ -0,0 +1,96 @@
+# tests/unit/test_text_artifact_tdd.py
+"""TDD tests for stage-tracking text artifacts and per-job transform costs."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from domain.audio.timing_engine import TimingEngine, TimingMode
+from domain.text.text_artifact import TextArtifact, TextStage, TransformCostMeter, text_stages
+from domain.text.text_pipeline import TextPipeline
+
+
+class TestTextArtifactTDD:
+    """Tests for the typed text artifact."""
+
+    def test_artifact_is_a_string_with_a_stage_record(self):
+        """Artifacts compare and behave like the text they wrap."""
+        artifact = TextArtifact("Hello world.", [TextStage.CLEANED])
+
+        assert artifact == "Hello world."
+        assert artifact.has_stage(TextStage.CLEANED)
+        assert not artifact.has_stage(TextStage.NATURAL_FORMATTING)
+
+    def test_string_operations_drop_the_record(self):
+        """Edited text is a plain str, so stages are never trusted on text they were not made for."""
+        artifact = TextArtifact("Hello world.", [TextStage.CLEANED])
+
+        assert text_stages(artifact + " More.") == frozenset()
+        assert text_stages(artifact[:5]) == frozenset()
+        assert text_stages(artifact.derive(artifact[:5])) == {TextStage.CLEANED}
+
+    def test_meter_summarises_runs_and_skips(self):
+        """The debug summary reports each stage's counters and the total time."""
+        meter = TransformCostMeter()
+        meter.record(TextStage.CLEANED, chars=100, seconds=0.5)
+        meter.record_skip(TextStage.CLEANED, chars=40)
+
+        info = meter.to_debug_info()
+
+        assert info["cleaned"] == {"runs": 1, "skipped": 1, "chars": 100, "chars_skipped": 40, "seconds": 0.5}
+        assert info["total_seconds"] == 0.5
+
+
+class TestStageMemoizationTDD:
+    """TextPipeline skips stages the text has already been through."""
+
+    def test_natural_formatting_is_not_compounded(self):
+        """Formatting formatted text again must not turn '..' pauses into '...'."""
+        pipeline = TextPipeline(enable_natural_formatting=True)
+
+        once = pipeline.enhance_with_natural_formatting("The results hold. Then we stop.")
+        twice = pipeline.enhance_with_natural_formatting(once)
+
+        assert once == "The results hold.. Then we stop."
+        assert twice is once
+
+    def test_cleaning_records_its_stage(self):
+        """Cleaned text is returned as an artifact and not cleaned again."""
+        pipeline = TextPipeline(enable_cleaning=False)
+
+        cleaned = pipeline.clean_text_locally("Some   spaced   text")
+
+        assert text_stages(cleaned) == {TextStage.CLEANED}
+        assert pipeline.clean_text(cleaned) is cleaned
+
+    def test_costs_are_counted_per_job(self):
+        """Runs and skips inside track_transform_costs are recorded in that job's meter only."""
+        pipeline = TextPipeline(enable_cleaning=False)
+
+        with pipeline.track_transform_costs() as meter:
+            enhanced = pipeline.enhance_with_natural_formatting("First we start. Then we stop.")
+            pipeline.enhance_with_natural_formatting(enhanced)
+        pipeline.enhance_with_natural_formatting("Outside any job.")
+
+        cost = meter.stages[TextStage.NATURAL_FORMATTING]
+        assert (cost.runs, cost.skipped) == (1, 1)
+        assert cost.chars == len("First we start. Then we stop.")
+
+    def test_timing_engine_does_not_reformat_document_chunks(self):
+        """Chunks cut from formatted text reach the TTS engine exactly as DocumentEngine formatted them."""
+        pytest.importorskip("pdfplumber")
+        from domain.document.document_engine import DocumentEngine
+
+        pipeline = TextPipeline(enable_cleaning=False)
+        enhanced = pipeline.enhance_with_natural_formatting("Results are in. We stop here.")
+        chunks = DocumentEngine(ocr_provider=Mock(), file_manager=Mock())._split_for_tts(enhanced)
+
+        tts_engine = Mock(spec=["generate_audio_data", "get_output_format", "generate_audio_with_timestamps"])
+        tts_engine.generate_audio_with_timestamps.return_value = Mock(is_failure=True, error="stop")
+        engine = TimingEngine(tts_engine, Mock(), text_pipeline=pipeline, mode=TimingMode.ESTIMATION)
+
+        with pipeline.track_transform_costs() as meter:
+            engine.generate_with_timing(chunks, "out")
+
+        tts_engine.generate_audio_with_timestamps.assert_called_once_with(enhanced)
+        assert meter.stages[TextStage.NATURAL_FORMATTING].skipped == 1
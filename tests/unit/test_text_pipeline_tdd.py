@@ -3,7 +3,11 @@
 Tests pure text processing logic without external dependencies.
 """
 
-from unittest.mock import Mock
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
 
 from domain.errors import Result
 from domain.text.text_pipeline import ITextPipeline, TextPipeline
@@ -449,3 +453,160 @@ class TestTextPipelineEdgeCasesTDD:
 
         # Should handle different cases of section headers with natural formatting
         assert "..." in result  # Natural formatting uses dots instead of SSML
+
+
+class TestLLMResilienceTDD:
+    """TDD tests for the LLM circuit breaker and per-job time budget."""
+
+    def test_circuit_opens_after_consecutive_failures(self):
+        """Should stop calling the provider once the failure threshold is reached."""
+        from infrastructure.llm.circuit_breaker_llm_provider import CircuitBreakerLLMProvider, CircuitState
+
+        mock_llm = Mock()
+        mock_llm.generate_content.return_value = Result.failure(Mock())
+        breaker = CircuitBreakerLLMProvider(mock_llm, failure_threshold=2, reset_timeout_seconds=60.0)
+
+        breaker.generate_content("one")
+        breaker.generate_content("two")
+        result = breaker.generate_content("three")
+
+        assert result.is_failure
+        assert breaker.state == CircuitState.OPEN
+        assert mock_llm.generate_content.call_count == 2
+
+    def test_slow_successful_calls_trip_the_circuit(self):
+        """Should treat latency spikes as failures."""
+        from infrastructure.llm.circuit_breaker_llm_provider import CircuitBreakerLLMProvider, CircuitState
+
+        now = [0.0]
+
+        def slow_call(prompt):
+            now[0] += 10.0
+            return Result.success("cleaned")
+
+        mock_llm = Mock()
+        mock_llm.generate_content.side_effect = slow_call
+        breaker = CircuitBreakerLLMProvider(
+            mock_llm, failure_threshold=1, latency_threshold_seconds=5.0, clock=lambda: now[0]
+        )
+
+        assert breaker.generate_content("prompt").is_success
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.is_available()
+
+    def test_half_open_probe_closes_circuit_on_success(self):
+        """Should allow a single probe after the reset timeout and close on success."""
+        from infrastructure.llm.circuit_breaker_llm_provider import CircuitBreakerLLMProvider, CircuitState
+
+        now = [0.0]
+        mock_llm = Mock()
+        mock_llm.generate_content.return_value = Result.failure(Mock())
+        breaker = CircuitBreakerLLMProvider(
+            mock_llm, failure_threshold=1, reset_timeout_seconds=30.0, clock=lambda: now[0]
+        )
+
+        breaker.generate_content("fails")
+        assert breaker.state == CircuitState.OPEN
+
+        now[0] = 31.0
+        assert breaker.state == CircuitState.HALF_OPEN
+        mock_llm.generate_content.return_value = Result.success("ok")
+        assert breaker.generate_content("probe").is_success
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_only_the_probe_decides_a_half_open_circuit(self):
+        """A call admitted while closed that ends during the probe neither closes the circuit nor frees the probe."""
+        from infrastructure.llm.circuit_breaker_llm_provider import CircuitBreakerLLMProvider, CircuitState
+
+        now = [0.0]
+        entered = {"straggler": threading.Event(), "probe": threading.Event()}
+        release = {"straggler": threading.Event(), "probe": threading.Event()}
+
+        def call(prompt: str) -> Result[str]:
+            if prompt == "fails":
+                return Result.failure(Mock())
+            entered[prompt].set()
+            release[prompt].wait(5)
+            return Result.success(prompt)
+
+        mock_llm = Mock()
+        mock_llm.generate_content.side_effect = call
+        breaker = CircuitBreakerLLMProvider(
+            mock_llm, failure_threshold=1, reset_timeout_seconds=30.0, clock=lambda: now[0]
+        )
+
+        straggler = threading.Thread(target=breaker.generate_content, args=("straggler",))
+        straggler.start()
+        entered["straggler"].wait(5)
+        breaker.generate_content("fails")
+        now[0] = 31.0
+        probe = threading.Thread(target=breaker.generate_content, args=("probe",))
+        probe.start()
+        entered["probe"].wait(5)
+
+        release["straggler"].set()
+        straggler.join(5)
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.generate_content("second probe").is_failure
+        assert mock_llm.generate_content.call_count == 3
+
+        release["probe"].set()
+        probe.join(5)
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_cancelled_async_probe_lets_the_next_probe_through(self):
+        """A probe cancelled before it finishes must not leave the circuit half-open for good."""
+        from infrastructure.llm.circuit_breaker_llm_provider import CircuitBreakerLLMProvider, CircuitState
+
+        now = [0.0]
+        mock_llm = Mock()
+        mock_llm.generate_content.return_value = Result.failure(Mock())
+        mock_llm.generate_content_async = AsyncMock(side_effect=asyncio.CancelledError)
+        breaker = CircuitBreakerLLMProvider(
+            mock_llm, failure_threshold=1, reset_timeout_seconds=30.0, clock=lambda: now[0]
+        )
+        breaker.generate_content("fails")
+        now[0] = 31.0
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(breaker.generate_content_async("cancelled probe"))
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.is_available()
+
+    def test_open_circuit_sends_sub_chunks_to_basic_cleanup(self):
+        """Should not retry sub-chunks against an LLM whose circuit has opened."""
+        from infrastructure.llm.circuit_breaker_llm_provider import CircuitBreakerLLMProvider
+
+        mock_llm = Mock()
+        mock_llm.generate_content.return_value = Result.failure(Mock())
+        breaker = CircuitBreakerLLMProvider(mock_llm, failure_threshold=2, reset_timeout_seconds=60.0)
+        pipeline = TextPipeline(llm_provider=breaker, enable_cleaning=True)
+
+        raw_text = "Word   " * 8000  # > 15K chars forces the sub-chunk retry path
+        result = pipeline.clean_text(raw_text)
+
+        # Initial call + one sub-chunk trip the breaker; remaining sub-chunks never reach the LLM
+        assert mock_llm.generate_content.call_count == 2
+        assert result.startswith("Word Word")
+
+    def test_exhausted_time_budget_skips_llm(self):
+        """Should use local cleanup once the job's LLM time budget is spent."""
+        from domain.text.text_pipeline import LLMTimeBudget
+
+        mock_llm = Mock()
+        pipeline = TextPipeline(llm_provider=mock_llm, enable_cleaning=True)
+
+        result = pipeline.clean_text("Raw   text.", LLMTimeBudget(deadline=0.0))
+
+        mock_llm.generate_content.assert_not_called()
+        assert result == "Raw text."
+
+    def test_create_llm_budget_respects_configuration(self):
+        """Should only create a budget when a positive allowance is configured."""
+        assert TextPipeline().create_llm_budget() is None
+
+        budget = TextPipeline(llm_time_budget_seconds=30.0).create_llm_budget()
+        assert budget is not None
+        assert 0 < budget.remaining_seconds <= 30.0
+        assert not budget.is_exhausted
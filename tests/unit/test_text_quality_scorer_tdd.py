@@ -0,0 +1,108 @@
+# tests/unit/test_text_quality_scorer_tdd.py
+"""TDD tests for TextQualityScorer and quality-based LLM routing."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from domain.text.text_pipeline import TextPipeline
+from domain.text.text_quality_scorer import TextQualityScorer
+
+CLEAN_TEXT = """The quick development of speech synthesis has changed how people consume
+written material. Researchers found that listeners retain information better
+when the narration follows natural sentence rhythm, and the effect was strongest
+for long technical documents such as reports and academic papers in 2021.
+Modern systems can therefore produce audio that sounds pleasant to most people."""
+
+NOISY_TEXT = """Th3 qu1ck dev-
+elopment 0f sp33ch synth€sis h@s chngd hw ppl cnsme
+wr1tten m~terial. R§searchers f0und th@t
+l1steners ret@in inf0rmati0n b3tter whn thx narrat-
+ion fllws natrl sntnce rhythm ,, and thh efect wsss strngst
+fr lng tchncl dcmnts sch s rprts nd acdmc pprs."""
+
+
+class TestTextQualityScorerTDD:
+    """Tests for the local text-quality score components and routing decision."""
+
+    def test_clean_prose_scores_high(self):
+        """Born-digital prose should bypass the LLM."""
+        scorer = TextQualityScorer()
+
+        result = scorer.score(CLEAN_TEXT)
+
+        assert result.score >= 0.95
+        assert scorer.needs_llm(CLEAN_TEXT) is False
+
+    def test_ocr_noise_scores_low(self):
+        """Garbled tokens, digit substitutions and broken hyphenation should route to the LLM."""
+        scorer = TextQualityScorer()
+
+        result = scorer.score(NOISY_TEXT)
+
+        assert result.score < 0.5
+        assert result.word_likeness < 0.5
+        assert result.hyphenation < 1.0
+        assert result.digit_noise < 0.5
+        assert scorer.needs_llm(NOISY_TEXT) is True
+
+    def test_erratic_line_lengths_lower_the_score(self):
+        """Broken layouts with wildly varying line lengths should be penalized."""
+        ragged = "\n".join(
+            ["Introduction", "The method we propose", CLEAN_TEXT.replace("\n", " "), "scores", "then decide routing"]
+        )
+
+        result = TextQualityScorer().score(ragged)
+
+        assert result.line_regularity < 0.5
+
+    def test_low_ocr_confidence_pulls_score_down(self):
+        """OCR confidence, when available, should contribute to the score."""
+        scorer = TextQualityScorer()
+
+        assert scorer.score(CLEAN_TEXT, ocr_confidence=0.2).score < scorer.score(CLEAN_TEXT).score
+        assert scorer.score(CLEAN_TEXT, ocr_confidence=0.2).ocr_confidence == 0.2
+
+    def test_too_short_spans_go_to_llm(self):
+        """Spans too short to judge should not be trusted as clean."""
+        assert TextQualityScorer().needs_llm("Only a few words here.") is True
+
+    def test_clean_text_locally_never_calls_llm(self):
+        """The local-only cleaning entry point should not touch the LLM provider."""
+        mock_llm = Mock()
+        pipeline = TextPipeline(llm_provider=mock_llm, enable_cleaning=True)
+
+        result = pipeline.clean_text_locally("Some   spaced\n\ntext")
+
+        assert result == "Some spaced text"
+        mock_llm.generate_content.assert_not_called()
+
+
+class TestQualityRoutingTDD:
+    """Tests for DocumentEngine page routing between LLM and local cleanup."""
+
+    def _engine(self, scorer):
+        pytest.importorskip("pdfplumber")
+        from domain.document.document_engine import DocumentEngine
+
+        return DocumentEngine(ocr_provider=Mock(), file_manager=Mock(), quality_scorer=scorer)
+
+    def test_groups_consecutive_pages_by_route(self):
+        """Should keep document order and batch neighbouring pages with the same route."""
+        engine = self._engine(TextQualityScorer())
+
+        runs, debug = engine._route_pages_by_quality([CLEAN_TEXT, CLEAN_TEXT, NOISY_TEXT, CLEAN_TEXT])
+
+        assert [(needs_llm, len(pages)) for needs_llm, pages in runs] == [(False, 2), (True, 1), (False, 1)]
+        assert debug["llm_pages"] == 1
+        assert debug["local_pages"] == 3
+        assert len(debug["page_scores"]) == 4
+
+    def test_without_scorer_everything_goes_to_llm(self):
+        """Routing disabled should preserve the original all-LLM behaviour."""
+        engine = self._engine(None)
+
+        runs, debug = engine._route_pages_by_quality([CLEAN_TEXT, NOISY_TEXT])
+
+        assert runs == [(True, [CLEAN_TEXT, NOISY_TEXT])]
+        assert debug == {}
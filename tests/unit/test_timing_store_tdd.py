@@ -0,0 +1,130 @@
+# tests/unit/test_timing_store_tdd.py
+"""TDD tests for the compact, windowed timing data format."""
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from domain.models import TextSegment, TimingMetadata
+from infrastructure.file import timing_store as timing_store_module
+from infrastructure.file.timing_store import TimingStore, TimingTable, parse_window
+from infrastructure.web.audio_serving import AudioFileServer
+
+
+def _book(segment_count: int) -> TimingMetadata:
+    """Timing of a book whose segments each last 2s, with a 1s pause after every tenth."""
+    segments = []
+    start = 0.0
+    for i in range(segment_count):
+        segments.append(TextSegment(f"<p>Sentence number {i}.</p>", start, 2.0, "sentence", i // 10, i % 10))
+        start += 3.0 if i % 10 == 9 else 2.0
+    return TimingMetadata(total_duration=start, text_segments=segments, audio_files=["book_combined.mp3"])
+
+
+class TestTimingStoreTDD:
+    """Tests for saving, loading and windowing timing data."""
+
+    def test_saved_timing_is_compact_and_precompressed(self, tmp_path):
+        """The saved file holds columns of millisecond ints, is a fraction of the former size, and has a gzip twin."""
+        timing = _book(1000)
+        store = TimingStore(str(tmp_path))
+        table = TimingTable.from_metadata(timing, clean_text=lambda text: text.replace("<p>", "").replace("</p>", ""))
+
+        written = store.save("book", table)
+
+        data = (tmp_path / "book_timing.json").read_bytes()
+        assert written == ["book_timing.json", "book_timing.json.gz"]
+        assert gzip.decompress((tmp_path / "book_timing.json.gz").read_bytes()) == data
+        payload = json.loads(data)
+        assert payload["start_ms"][:3] == [0, 2000, 4000]
+        assert (payload["duration_ms"][0], payload["segment_types"]) == (2000, ["sentence"])
+        assert payload["text"][1] == "Sentence number 1."
+        legacy = json.dumps({"text_segments": [vars(s) for s in timing.text_segments]}, indent=2)
+        assert len(data) < len(legacy) / 2
+        assert store.is_compact("book")
+
+    def test_rewrites_never_expose_partial_files(self, tmp_path, monkeypatch):
+        """A re-conversion renames finished files into place; a failed write leaves the old files intact."""
+        store = TimingStore(str(tmp_path))
+        store.save("book", TimingTable.from_metadata(_book(50)))
+        old = {name: (tmp_path / name).read_bytes() for name in ["book_timing.json", "book_timing.json.gz"]}
+        replaced = []
+        real_replace = os.replace
+
+        def replace(source: str, destination: str) -> None:
+            # Until the rename, readers of the destination still get the complete old file
+            assert Path(source).name.startswith(".")
+            assert (tmp_path / Path(destination).name).read_bytes() == old[Path(destination).name]
+            replaced.append(Path(destination).name)
+            real_replace(source, destination)
+
+        monkeypatch.setattr(timing_store_module.os, "replace", replace)
+        store.save("book", TimingTable.from_metadata(_book(500)))
+        assert replaced == ["book_timing.json", "book_timing.json.gz"]
+        assert json.loads(gzip.decompress((tmp_path / "book_timing.json.gz").read_bytes()))["segment_count"] == 500
+
+        def failing_replace(source: str, destination: str) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(timing_store_module.os, "replace", failing_replace)
+        with pytest.raises(OSError, match="disk full"):
+            store.save("book", TimingTable.from_metadata(_book(5)))
+        assert store.load("book").segments()[-1]["text"] == "<p>Sentence number 499.</p>"
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["book_timing.json", "book_timing.json.gz"]
+
+    def test_windows_by_time_and_by_index(self):
+        """Windows are found by binary search: by playhead time, time range, or index range."""
+        table = TimingTable.from_metadata(_book(100))
+
+        assert table.window(start=5.0, count=3) == (2, 5)  # 5s falls in segment 2 (4-6s)
+        assert table.window(start=20.5, end=25.0) == (9, 12)  # In the pause after segment 9, which is included
+        assert table.window(first=98, count=10) == (98, 100)
+        assert table.window(start=1e6) == (99, 100)
+        payload = table.payload(*table.window(first=10, count=2))
+        assert (payload["first"], payload["segment_count"], payload["start_ms"]) == (10, 100, [21000, 23000])
+        with pytest.raises(ValueError, match="negative"):
+            table.window(first=-1)
+        with pytest.raises(ValueError, match="soon"):
+            parse_window({"start": "soon"})
+        assert parse_window({"start": "1.5", "count": "20", "v": "x"}) == {"start": 1.5, "count": 20}
+
+    def test_loads_are_cached_per_file_version_and_read_the_former_format(self, tmp_path, monkeypatch):
+        """Format 1 files still load; each version of a file is parsed once."""
+        legacy = {
+            "total_duration": 4.0,
+            "audio_files": ["paper.mp3"],
+            "text_segments": [
+                {"text": "Two.", "start_time": 1.5, "duration": 2.5, "segment_type": "heading"},
+                {"text": "One.", "start_time": 0.0, "duration": 1.5, "segment_type": "sentence"},
+            ],
+        }
+        (tmp_path / "paper_timing.json").write_text(json.dumps(legacy, indent=2))
+        store = TimingStore(str(tmp_path))
+        parses = []
+        real_load = json.load
+        monkeypatch.setattr(timing_store_module.json, "load", lambda f: parses.append(f) or real_load(f))
+
+        table = store.load("paper")
+        assert store.load("paper") is table
+        assert len(parses) == 1
+        segments = table.segments()
+        assert [(s["text"], s["start_time"], s["segment_type"]) for s in segments] == [
+            ("One.", 0.0, "sentence"),
+            ("Two.", 1.5, "heading"),
+        ]
+        assert not store.is_compact("paper")
+        assert store.load("missing") is None
+        assert store.load("../paper") is None
+
+    def test_gzipped_copy_is_served_with_content_encoding(self, tmp_path):
+        """The precompressed file goes out as gzip-encoded JSON."""
+        TimingStore(str(tmp_path)).save("book", TimingTable.from_metadata(_book(20)))
+
+        response = AudioFileServer(str(tmp_path)).respond({"REQUEST_METHOD": "GET"}, "book_timing.json.gz")
+
+        headers = dict(response.headers)
+        assert (headers["Content-Type"], headers["Content-Encoding"]) == ("application/json", "gzip")
+        assert json.loads(gzip.decompress(b"".join(response.body)))["segment_count"] == 20
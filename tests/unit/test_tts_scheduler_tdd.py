@@ -0,0 +1,145 @@
+# tests/unit/test_tts_scheduler_tdd.py
+"""TDD tests for the process-wide fair-share TTS scheduler."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+from domain.audio.concurrency_controller import AdaptiveConcurrencyLimiter
+from domain.audio.timing_engine import TimingEngine
+from domain.audio.tts_scheduler import FairShareScheduler
+from domain.cancellation import CancellationToken, JobCancelledError, cancellation_scope
+from domain.errors import Result
+
+
+def _scheduler(limit: int = 1, priority_chunks: int = 1) -> FairShareScheduler:
+    """Scheduler with a fixed concurrency budget."""
+    return FairShareScheduler(AdaptiveConcurrencyLimiter(limit, limit, limit), priority_chunks=priority_chunks)
+
+
+async def _call(scheduler: FairShareScheduler, order: list[str], tag: str) -> None:
+    """One TTS call that notes when it got its slot."""
+    async with scheduler.slot(work=100):
+        order.append(tag)
+        await asyncio.sleep(0.001)
+
+
+class TestFairShareSchedulerTDD:
+    """Tests for fair queuing across jobs."""
+
+    def test_small_job_is_not_starved_by_a_big_backlog(self):
+        """A job arriving behind a big backlog gets its first chunk next and then alternates fairly."""
+        scheduler = _scheduler()
+        order: list[str] = []
+
+        async def run() -> None:
+            with scheduler.job("big book"):
+                big = [asyncio.create_task(_call(scheduler, order, "big")) for _ in range(8)]
+            await asyncio.sleep(0)
+            with scheduler.job("pamphlet"):
+                small = [asyncio.create_task(_call(scheduler, order, "small")) for _ in range(2)]
+            await asyncio.gather(*big, *small)
+
+        asyncio.run(run())
+
+        assert order[:4] == ["big", "small", "big", "small"]
+        assert scheduler.metrics()["in_flight"] == 0
+
+    def test_queue_wait_is_reported_per_job(self):
+        """Each job's chunks and time spent queued are available after it finishes."""
+        scheduler = _scheduler()
+        order: list[str] = []
+
+        async def run() -> None:
+            with scheduler.job("book"):
+                await asyncio.gather(*(_call(scheduler, order, "book") for _ in range(4)))
+
+        asyncio.run(run())
+        stats = scheduler.job_stats("book")
+
+        assert stats["chunks"] == 4
+        assert stats["max_queue_wait_seconds"] > 0
+        assert scheduler.metrics()["recent_jobs"] == [stats]
+
+    def test_threads_and_coroutines_share_one_budget(self):
+        """A blocking call from a worker thread holds a slot that async callers must wait for."""
+        scheduler = _scheduler()
+        holding = threading.Event()
+
+        def blocking_call() -> None:
+            with scheduler.slot_sync(work=10):
+                holding.set()
+                time.sleep(0.05)
+
+        thread = threading.Thread(target=blocking_call)
+        thread.start()
+        holding.wait(timeout=1)
+        start = time.monotonic()
+        asyncio.run(_call(scheduler, [], "async"))
+        thread.join(timeout=1)
+
+        assert time.monotonic() - start >= 0.03
+        assert scheduler.metrics()["in_flight"] == 0
+
+    def test_cancelled_waiter_passes_its_slot_on(self):
+        """Cancelling a queued call neither loses a slot nor blocks the calls behind it."""
+        scheduler = _scheduler()
+        order: list[str] = []
+
+        async def run() -> None:
+            permit = await scheduler.acquire()
+            cancelled = asyncio.create_task(_call(scheduler, order, "cancelled"))
+            waiting = asyncio.create_task(_call(scheduler, order, "waiting"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            scheduler.release(permit)
+            await asyncio.wait_for(waiting, timeout=1)
+
+        asyncio.run(run())
+
+        assert order == ["waiting"]
+        assert scheduler.metrics()["in_flight"] == 0
+
+    def test_cancelled_job_stops_waiting_for_a_thread_slot(self):
+        """A worker thread queued for a slot leaves the queue once its job is cancelled, without losing the slot."""
+        scheduler = _scheduler()
+        token = CancellationToken()
+        outcome: list[str] = []
+
+        def queued_call() -> None:
+            with cancellation_scope(token):
+                try:
+                    with scheduler.slot_sync(work=10):
+                        outcome.append("ran")
+                except JobCancelledError:
+                    outcome.append("cancelled")
+
+        permit = asyncio.run(scheduler.acquire())
+        thread = threading.Thread(target=queued_call, daemon=True)
+        thread.start()
+        time.sleep(0.05)
+        token.cancel()
+        thread.join(timeout=1)
+
+        assert outcome == ["cancelled"]
+        assert scheduler.metrics()["waiting"] == 0
+        scheduler.release(permit)
+        asyncio.run(_call(scheduler, outcome, "next"))
+        assert outcome == ["cancelled", "next"]
+        assert scheduler.metrics()["in_flight"] == 0
+
+
+class TestTimingEngineSchedulingTDD:
+    """TimingEngine synthesizes through the shared scheduler."""
+
+    def test_timing_engine_calls_are_charged_to_the_job(self):
+        """Blocking TTS calls made by TimingEngine count against the job's share of the budget."""
+        scheduler = _scheduler()
+        engine = TimingEngine(tts_engine=Mock(), file_manager=Mock(), scheduler=scheduler)
+
+        with scheduler.job("book"):
+            result = engine._call_tts(lambda text: Result.success(text.encode()), "Hello there.")
+
+        assert result.value == b"Hello there."
+        assert scheduler.job_stats("book")["chunks"] == 1
@@ -1,10 +1,18 @@
 # utils.py - Pure utility functions extracted from app.py
-import re
 from typing import Any
 
 from application.config.system_config import SystemConfig
 from domain.errors import ApplicationError, ErrorCode
 from domain.models import PageRange
+from domain.text.rewrite_rules import RewriteRule, RuleSet
+
+# Order matters: each step can create matches for the next (e.g. "(...)" -> "()")
+DISPLAY_CLEANUP_RULES = RuleSet(
+    RewriteRule(r"<[^>]+>", "", requires="<"),  # SSML tags
+    RewriteRule(r"\.{3,}", "", requires="..."),  # Pause markers: ... sequences
+    RewriteRule(r"\(\s*\)", "", requires="("),  # Pause markers: ( ) sequences
+    RewriteRule(r"\s+", " "),  # Multiple spaces
+)
 
 
 def allowed_file(filename: str) -> bool:
@@ -35,15 +43,7 @@ def parse_page_range_from_form(form: Any) -> PageRange:
 
 def clean_text_for_display(text: str) -> str:
     """Remove SSML markup and pause markers from text for display."""
-    # Remove SSML tags
-    text = re.sub(r"<[^>]+>", "", text)
-
-    # Remove pause markers
-    text = re.sub(r"\.{3,}", "", text)  # Remove ... sequences
-    text = re.sub(r"\(\s*\)", "", text)  # Remove ( ) sequences
-    text = re.sub(r"\s+", " ", text)  # Clean up multiple spaces
-
-    return text.strip()
+    return DISPLAY_CLEANUP_RULES.apply(text).strip()
 
 
 def _get_user_friendly_error_message(error: ApplicationError) -> str: